@@ -1,7 +1,37 @@
-"""CLI command implementations."""
+"""CLI command implementations.
 
-from .info_command import InfoCommand
-from .list_command import ListCommand
-from .run_command import RunCommand
+Commands are imported on first access so the runner only loads the one it
+dispatches to.
+"""
 
-__all__ = ["ListCommand", "InfoCommand", "RunCommand"]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache_command import CacheCommand
+    from .daemon_command import DaemonCommand
+    from .index_command import IndexCommand
+    from .info_command import InfoCommand
+    from .list_command import ListCommand
+    from .run_command import RunCommand
+
+# Exported name -> defining submodule
+_EXPORTS = {
+    "ListCommand": "list_command",
+    "InfoCommand": "info_command",
+    "RunCommand": "run_command",
+    "IndexCommand": "index_command",
+    "DaemonCommand": "daemon_command",
+    "CacheCommand": "cache_command",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,144 @@
+"""Cache command implementation."""
+
+from typing import Any
+
+from src.cli.utils.output import (
+    format_key_value_pairs,
+    print_error,
+    print_info,
+    print_success,
+)
+from src.core.config import Config
+from src.providers.audio.pronunciation_cache import (
+    DEFAULT_NEGATIVE_TTL_DAYS,
+    DEFAULT_TTL_DAYS,
+    PronunciationCache,
+    resolve_cache_path,
+)
+from src.utils.logging_config import get_logger
+
+
+class CacheCommand:
+    """Inspect and clear the Forvo pronunciation caches."""
+
+    def __init__(self, config: Config):
+        """Initialize command.
+
+        Args:
+            config: CLI configuration
+        """
+        self.config = config
+        self.logger = get_logger("cli.commands.cache")
+
+    def execute(self, args: Any) -> int:
+        """Execute cache command.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        caches = self._get_caches()
+        if not caches:
+            print_info("No Forvo audio providers with a pronunciation cache configured")
+            return 0
+
+        try:
+            if args.cache_command == "stats":
+                return self._stats(caches)
+            if args.cache_command == "clear":
+                return self._clear(caches, args.expired)
+        finally:
+            for cache in caches.values():
+                cache.close()
+
+        print_error(f"Unknown cache command: {args.cache_command}")
+        return 1
+
+    def _get_caches(self) -> dict[str, PronunciationCache]:
+        """Pronunciation cache of each configured Forvo provider, by name.
+
+        Returns:
+            Provider name -> cache (providers sharing a file are listed once)
+        """
+        caches: dict[str, PronunciationCache] = {}
+        seen = set()
+        audio_configs = self.config.get("providers.audio", {}) or {}
+        for name, provider_config in audio_configs.items():
+            if not isinstance(provider_config, dict):
+                continue
+            if provider_config.get("type", name) != "forvo":
+                continue
+            if not provider_config.get("cache_enabled", True):
+                continue
+            path = resolve_cache_path(provider_config.get("cache_path"))
+            if path in seen:
+                continue
+            seen.add(path)
+            caches[name] = PronunciationCache(
+                path,
+                ttl_days=float(provider_config.get("cache_ttl_days", DEFAULT_TTL_DAYS)),
+                negative_ttl_days=float(
+                    provider_config.get(
+                        "negative_cache_ttl_days", DEFAULT_NEGATIVE_TTL_DAYS
+                    )
+                ),
+            )
+        return caches
+
+    def _stats(self, caches: dict[str, PronunciationCache]) -> int:
+        """Print entry counts and size of each cache.
+
+        Args:
+            caches: Caches by provider name
+
+        Returns:
+            Exit code
+        """
+        for name, cache in caches.items():
+            print(f"Forvo pronunciation cache '{name}' ({cache.path})")
+            if not cache.path.exists():
+                print("  Empty")
+                continue
+            summary = cache.summary()
+            ttl_days = cache.ttl / 86400
+            negative_ttl_days = cache.negative_ttl / 86400
+            print(
+                format_key_value_pairs(
+                    [
+                        ("Entries", summary["entries"]),
+                        ("With pronunciations", summary["found"]),
+                        ("Not found", summary["not_found"]),
+                        ("Expired", summary["expired"]),
+                        ("Size", f"{summary['size_bytes'] / 1024:.1f} KB"),
+                        (
+                            "TTL",
+                            f"{ttl_days:g} days (not found: {negative_ttl_days:g} days)",
+                        ),
+                    ],
+                    indent="  ",
+                )
+            )
+        return 0
+
+    def _clear(self, caches: dict[str, PronunciationCache], expired: bool) -> int:
+        """Delete cached entries.
+
+        Args:
+            caches: Caches by provider name
+            expired: Only delete expired entries
+
+        Returns:
+            Exit code
+        """
+        for name, cache in caches.items():
+            if not cache.path.exists():
+                continue
+            deleted = cache.clear(expired_only=expired)
+            kind = "expired " if expired else ""
+            self.logger.info(f"Cleared {deleted} {kind}entries from {cache.path}")
+            print_success(
+                f"Removed {deleted} {kind}entries from pronunciation cache '{name}'"
+            )
+        return 0
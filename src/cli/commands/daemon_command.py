@@ -0,0 +1,97 @@
+"""Daemon command implementation."""
+
+from typing import Any
+
+from src.cli.daemon import PipelineDaemon, get_socket_path, request_daemon
+from src.cli.utils.output import format_key_value_pairs, print_error, print_success
+from src.utils.logging_config import get_logger
+
+
+class DaemonCommand:
+    """Start, stop and inspect the pipeline daemon."""
+
+    def __init__(self) -> None:
+        """Initialize command."""
+        self.logger = get_logger("cli.commands.daemon")
+
+    def execute(self, args: Any) -> int:
+        """Execute daemon command.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        if args.daemon_command == "start":
+            return self._start(args)
+        if args.daemon_command == "stop":
+            return self._stop(args)
+        if args.daemon_command == "status":
+            return self._status(args)
+
+        print_error(f"Unknown daemon command: {args.daemon_command}")
+        return 1
+
+    def _start(self, args: Any) -> int:
+        """Serve jobs in the foreground until stopped.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        daemon = PipelineDaemon(args.socket)
+        try:
+            daemon.serve()
+        except (RuntimeError, OSError) as e:
+            print_error(f"Could not start daemon: {e}")
+            return 1
+        return 0
+
+    def _stop(self, args: Any) -> int:
+        """Ask a running daemon to stop.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        for event in request_daemon({"command": "stop"}, args.socket):
+            if event.get("event") == "stopping":
+                print_success(
+                    f"Pipeline daemon stopping after {event['jobs_run']} job(s)"
+                )
+                return 0
+        print_error(f"No daemon listening on {get_socket_path(args.socket)}")
+        return 1
+
+    def _status(self, args: Any) -> int:
+        """Print a running daemon's status.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        for event in request_daemon({"command": "status"}, args.socket):
+            if event.get("event") == "status":
+                print(
+                    format_key_value_pairs(
+                        [
+                            ("Socket", get_socket_path(args.socket)),
+                            ("PID", event["pid"]),
+                            ("Uptime", f"{event['uptime']:.0f}s"),
+                            ("Jobs run", event["jobs_run"]),
+                            ("Jobs queued", event["queued"]),
+                            ("Working directory", event["working_dir"]),
+                            ("Configurations", ", ".join(event["configs"]) or "-"),
+                        ]
+                    )
+                )
+                return 0
+        print_error(f"No daemon listening on {get_socket_path(args.socket)}")
+        return 1
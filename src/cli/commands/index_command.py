@@ -0,0 +1,166 @@
+"""Index command implementation."""
+
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from src.cli.utils.output import format_key_value_pairs, print_error, print_success
+from src.cli.utils.validation import validate_arguments
+from src.core.config import Config
+from src.pipelines.vocabulary.stages.word_processing import BOGOTA
+from src.providers.data.jsonl_provider import JSONLDataProvider
+from src.utils.logging_config import ICONS, get_logger
+
+
+class IndexCommand:
+    """Build JSONL dictionary indexes and projection sidecars."""
+
+    def __init__(self, config: Config):
+        """Initialize command.
+
+        Args:
+            config: CLI configuration
+        """
+        self.config = config
+        self.logger = get_logger("cli.commands.index")
+
+    def execute(self, args: Any) -> int:
+        """Execute index command.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        validation_errors = validate_arguments("index", args)
+        if validation_errors:
+            for error in validation_errors:
+                print_error(error)
+            return 1
+
+        if args.index_command == "build":
+            return self._build(args)
+        if args.index_command == "project":
+            return self._project(args)
+
+        print_error(f"Unknown index command: {args.index_command}")
+        return 1
+
+    def _build(self, args: Any) -> int:
+        """Build the word index for a dictionary file.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        file_path = Path(args.file)
+        workers = args.workers or os.cpu_count() or 1
+        provider = JSONLDataProvider(
+            file_path,
+            index_path=Path(args.index_path) if args.index_path else None,
+        )
+
+        self.logger.info(
+            f"{ICONS['gear']} Building index for {file_path} with {workers} worker(s)"
+        )
+        print(f"Indexing {file_path} with {workers} worker(s)...")
+
+        start = time.perf_counter()
+        try:
+            _, result = provider.rebuild_index(
+                workers=workers, progress=self._print_progress
+            )
+        except (OSError, ValueError) as e:
+            print()
+            self.logger.error(f"{ICONS['cross']} Index build failed: {e}")
+            print_error(f"Index build failed: {e}")
+            return 1
+        finally:
+            provider.close()
+        total = time.perf_counter() - start
+        print()
+
+        pairs = [
+            ("Dictionary", file_path),
+            ("Index", provider.index_path),
+            ("Workers", f"{result.workers} ({result.ranges} ranges)"),
+            ("Lines", f"{result.lines:,}"),
+            ("Headwords", f"{len(result.index):,}"),
+            ("Skipped", f"{result.skipped:,}"),
+            ("Scan time", f"{result.duration:.2f}s"),
+            ("Write time", f"{total - result.duration:.2f}s"),
+            ("Total time", f"{total:.2f}s"),
+        ]
+        print(format_key_value_pairs(pairs, indent="  "))
+
+        if not provider.index_path.exists():
+            print_error(f"Index could not be written to {provider.index_path}")
+            return 1
+
+        print_success(f"Indexed {len(result.index):,} headwords")
+        return 0
+
+    def _project(self, args: Any) -> int:
+        """Write the card-ready projection sidecar for a dictionary file.
+
+        Args:
+            args: Command arguments
+
+        Returns:
+            Exit code
+        """
+        file_path = Path(args.file)
+        workers = args.workers or os.cpu_count() or 1
+        # The sidecar serves vocabulary word processing, so its IPA
+        # candidates are ranked for that pipeline's accent
+        provider = JSONLDataProvider(
+            file_path,
+            projection_path=Path(args.output) if args.output else None,
+            pronunciation_scorer=BOGOTA.score_raw_tags,
+        )
+
+        self.logger.info(
+            f"{ICONS['gear']} Projecting {file_path} with {workers} worker(s)"
+        )
+        print(f"Projecting {file_path} with {workers} worker(s)...")
+
+        try:
+            result = provider.build_projection(
+                workers=workers, progress=self._print_progress
+            )
+        except (OSError, ValueError) as e:
+            print()
+            self.logger.error(f"{ICONS['cross']} Projection failed: {e}")
+            print_error(f"Projection failed: {e}")
+            return 1
+        finally:
+            provider.close()
+        print()
+
+        ratio = result.size / result.source_size * 100 if result.source_size else 0.0
+        pairs = [
+            ("Dictionary", file_path),
+            ("Sidecar", result.path),
+            ("Records", f"{result.records:,}"),
+            ("Headwords", f"{result.words:,}"),
+            ("Skipped", f"{result.skipped:,}"),
+            ("Size", f"{result.size / 1_048_576:,.1f} MB ({ratio:.1f}% of source)"),
+            ("Total time", f"{result.duration:.2f}s"),
+        ]
+        print(format_key_value_pairs(pairs, indent="  "))
+        print_success(f"Projected {result.records:,} entries")
+        return 0
+
+    @staticmethod
+    def _print_progress(done: int, total: int) -> None:
+        """Print scan progress on a single line."""
+        percent = done / total * 100 if total else 100.0
+        print(
+            f"\r  Scanned {done / 1_048_576:,.0f}/{total / 1_048_576:,.0f} MB ({percent:.0f}%)",
+            end="",
+            flush=True,
+        )
@@ -1,16 +1,26 @@
 """Run command implementation."""
 
+import contextlib
 from pathlib import Path
 from typing import Any
 
 from src.cli.utils.output import print_error, print_success, print_warning
 from src.cli.utils.validation import validate_arguments
+from src.core.checkpoint import DEFAULT_CHECKPOINT_DIR, CheckpointStore
 from src.core.config import Config
 from src.core.context import PipelineContext
+from src.core.exceptions import CheckpointError
 from src.core.pipeline import Pipeline
 from src.core.registry import PipelineRegistry
+from src.core.scheduler import PHASE_REPORT_KEY, PhaseReport, run_event_loop
+from src.core.stage_cache import DEFAULT_CACHE_DIR, DEFAULT_CACHE_MAX_MB, StageCache
 from src.providers.registry import ProviderRegistry
 from src.utils.logging_config import ICONS, get_logger
+from src.utils.profiler import DEFAULT_TOP_SPANS, RunProfiler
+from src.utils.rate_limiter import get_rate_limiter_registry
+
+# Lower bound for the event loop's thread pool in --async mode
+ASYNC_MIN_THREADS = 8
 
 
 class RunCommand:
@@ -88,6 +98,14 @@ class RunCommand:
         # Let pipeline populate context from CLI arguments
         pipeline.populate_context_from_cli(context, args)
 
+        # Restore completed stages and data of the run being resumed
+        if getattr(args, "resume", None):
+            try:
+                self._restore_checkpoint(context, args.resume)
+            except CheckpointError as e:
+                print_error(str(e))
+                return 1
+
         # Handle dry-run
         if getattr(args, "dry_run", False):
             self.logger.info(
@@ -99,12 +117,46 @@ class RunCommand:
             pipeline.show_cli_execution_plan(context, args)
             return 0
 
-        # Execute stage or phase
+        # Record a span tree of the execution when --profile is given
+        profiler = (
+            RunProfiler(
+                f"{args.pipeline} {execution_type} {execution_target}",
+                pipeline=args.pipeline,
+                run_id=context.run_id,
+            )
+            if getattr(args, "profile", None)
+            else None
+        )
+        with profiler.activate() if profiler else contextlib.nullcontext():
+            result = self._execute_target(args, pipeline, context)
+
+        self._finish_run(context, result)
+        if profiler is not None:
+            self._write_profile(
+                profiler, Path(args.profile), getattr(args, "profile_top", None)
+            )
+        return result
+
+    def _execute_target(
+        self, args: Any, pipeline: Pipeline, context: PipelineContext
+    ) -> int:
+        """Execute the requested stage or phase.
+
+        Args:
+            args: Command arguments
+            pipeline: Pipeline instance
+            context: Prepared pipeline context
+
+        Returns:
+            Exit code
+        """
         if args.stage:
             self.logger.info(
                 f"{ICONS['gear']} Starting stage '{args.stage}' execution..."
             )
-            result = self._execute_pipeline_stage(pipeline, args.stage, context)
+            result = self._execute_pipeline_stage(
+                pipeline, args.stage, context, getattr(args, "use_async", False)
+            )
             if result == 0:
                 self.logger.info(
                     f"{ICONS['check']} Stage '{args.stage}' completed successfully"
@@ -113,14 +165,61 @@ class RunCommand:
             self.logger.info(
                 f"{ICONS['gear']} Starting phase '{args.phase}' execution..."
             )
-            result = self._execute_pipeline_phase(pipeline, args.phase, context)
+            result = self._execute_pipeline_phase(
+                pipeline, args.phase, context, getattr(args, "use_async", False)
+            )
             if result == 0:
                 self.logger.info(
                     f"{ICONS['check']} Phase '{args.phase}' completed successfully"
                 )
-
         return result
 
+    def _write_profile(
+        self, profiler: RunProfiler, path: Path, top: int | None = None
+    ) -> None:
+        """Write the span tree and print the slowest spans.
+
+        Args:
+            profiler: Profiler of the finished run
+            path: JSON output file
+            top: Number of spans to print (default DEFAULT_TOP_SPANS)
+        """
+        spans = profiler.top_spans(top or DEFAULT_TOP_SPANS)
+        if spans:
+            width = max(len(span.name) for span in spans)
+            print(f"Slowest spans (run {profiler.root.wall_time:.2f}s):")
+            for span in spans:
+                details = f"  {span.kind:<8} {span.name:<{width}}  "
+                details += f"{span.wall_time:8.3f}s wall  {span.cpu_time:8.3f}s cpu"
+                if span.items:
+                    details += f"  {span.items} item(s)"
+                if span.bytes:
+                    details += f"  {span.bytes} bytes"
+                print(details)
+
+        # Process-wide totals, so a daemon's counts span all of its jobs
+        rate_limits = {
+            service: metrics
+            for service, metrics in get_rate_limiter_registry().metrics().items()
+            if metrics["requests"]
+        }
+        if rate_limits:
+            profiler.root.attributes["rate_limits"] = rate_limits
+            print("Rate limits:")
+            for service, metrics in rate_limits.items():
+                print(
+                    f"  {service:<12} {metrics['requests']} request(s), "
+                    f"{metrics['delayed']} delayed ({metrics['wait_time']:.3f}s), "
+                    f"{metrics['throttled']} throttled"
+                )
+
+        try:
+            profiler.write(path)
+        except OSError as e:
+            print_error(f"Could not write profile to {path}: {e}")
+            return
+        print(f"Profile written to {path}")
+
     def _create_context(self, args: Any) -> PipelineContext:
         """Create pipeline context with providers and basic configuration.
 
@@ -143,10 +242,106 @@ class RunCommand:
         )
         context.set("providers", filtered_providers)
 
+        # Replay cached outputs of stages whose inputs are unchanged
+        if not getattr(args, "dry_run", False) and not getattr(args, "no_cache", False):
+            context.stage_cache = self._create_stage_cache()
+
+        # Checkpoint after each successful stage so failed runs can resume
+        if not getattr(args, "dry_run", False):
+            context.checkpoint_store = CheckpointStore(self._get_checkpoint_dir())
+            context.run_id = getattr(
+                args, "resume", None
+            ) or CheckpointStore.new_run_id(args.pipeline)
+
         return context
 
+    def _create_stage_cache(self) -> StageCache | None:
+        """Stage output cache from system settings.
+
+        Caching is enabled by system.cache_enabled; system.cache_dir
+        (default .cache/stages), system.cache_max_mb (default 256) and
+        system.cache_file_hash ("mtime" or "content") configure it.
+
+        Returns:
+            Stage cache, or None when caching is disabled
+        """
+        if not self.config.get("system.cache_enabled", False):
+            return None
+        directory = Path(self.config.get("system.cache_dir", DEFAULT_CACHE_DIR))
+        if not directory.is_absolute():
+            directory = self.project_root / directory
+        max_mb = float(self.config.get("system.cache_max_mb", DEFAULT_CACHE_MAX_MB))
+        return StageCache(
+            directory,
+            max_bytes=int(max_mb * 1024 * 1024),
+            file_hash=self.config.get("system.cache_file_hash", "mtime"),
+        )
+
+    def _get_checkpoint_dir(self) -> Path:
+        """Checkpoint directory from system.checkpoint_dir.
+
+        Returns:
+            Absolute directory, relative paths resolved against the project root
+        """
+        directory = Path(
+            self.config.get("system.checkpoint_dir", DEFAULT_CHECKPOINT_DIR)
+        )
+        return directory if directory.is_absolute() else self.project_root / directory
+
+    def _restore_checkpoint(self, context: PipelineContext, run_id: str) -> None:
+        """Apply a run's checkpoint to a new context.
+
+        Args:
+            context: Context with providers and CLI data already populated
+            run_id: Run to resume
+
+        Raises:
+            CheckpointError: If the checkpoint is missing, invalid or belongs
+                to another pipeline
+        """
+        store = CheckpointStore(self._get_checkpoint_dir())
+        checkpoint = store.load(run_id)
+        store.restore(checkpoint, context)
+        target = (
+            f"stage '{checkpoint.stage}'"
+            if checkpoint.stage
+            else f"phase '{checkpoint.phase}'"
+        )
+        print_success(
+            f"Resuming run '{run_id}' ({target}): "
+            f"{len(checkpoint.completed_stages)} stage(s) already completed"
+        )
+
+    def _finish_run(self, context: PipelineContext, result: int) -> None:
+        """Print cache counters, then settle the run's checkpoint.
+
+        A successful run's checkpoint is deleted; for a failed run the resume
+        command is printed.
+
+        Args:
+            context: Executed context
+            result: Exit code of the execution
+        """
+        cache = context.stage_cache
+        if cache is not None and cache.stats.lookups:
+            print(
+                f"Stage cache: {cache.stats.hits} hit(s), {cache.stats.misses} miss(es)"
+            )
+
+        store = context.checkpoint_store
+        if store is None or not context.run_id:
+            return
+        if result == 0:
+            store.delete(context.run_id)
+        elif store.exists(context.run_id):
+            print(f"Resume with: --resume {context.run_id}")
+
     def _execute_pipeline_stage(
-        self, pipeline: Pipeline, stage_name: str, context: PipelineContext
+        self,
+        pipeline: Pipeline,
+        stage_name: str,
+        context: PipelineContext,
+        use_async: bool = False,
     ) -> int:
         """Execute pipeline stage and handle results.
 
@@ -154,12 +349,19 @@ class RunCommand:
             pipeline: Pipeline instance
             stage_name: Stage to execute
             context: Pipeline context
+            use_async: Run the stage on an event loop
 
         Returns:
             Exit code
         """
         try:
-            result = pipeline.execute_stage(stage_name, context)
+            if use_async:
+                result = run_event_loop(
+                    pipeline.execute_stage_async(stage_name, context),
+                    self._get_async_threads(),
+                )
+            else:
+                result = pipeline.execute_stage(stage_name, context)
 
             if result.status.value == "success":
                 print_success(result.message)
@@ -184,7 +386,11 @@ class RunCommand:
             return 1
 
     def _execute_pipeline_phase(
-        self, pipeline: Pipeline, phase_name: str, context: PipelineContext
+        self,
+        pipeline: Pipeline,
+        phase_name: str,
+        context: PipelineContext,
+        use_async: bool = False,
     ) -> int:
         """Execute pipeline phase (multiple stages) and handle results.
 
@@ -192,12 +398,24 @@ class RunCommand:
             pipeline: Pipeline instance
             phase_name: Phase to execute
             context: Pipeline context
+            use_async: Run the phase on an event loop
 
         Returns:
             Exit code
         """
         try:
-            results = pipeline.execute_phase(phase_name, context)
+            if use_async:
+                results = run_event_loop(
+                    pipeline.execute_phase_async(phase_name, context),
+                    self._get_async_threads(),
+                )
+            else:
+                results = pipeline.execute_phase(phase_name, context)
+            report = context.get(PHASE_REPORT_KEY)
+            stage_names = None
+            if isinstance(report, PhaseReport):
+                self._print_phase_report(report)
+                stage_names = [timing.name for timing in report.timings]
 
             # Analyze results
             success_count = sum(1 for r in results if r.status.value == "success")
@@ -205,27 +423,31 @@ class RunCommand:
             failure_count = sum(
                 1 for r in results if r.status.value in ["failure", "error"]
             )
+            skipped_count = sum(1 for r in results if r.status.value == "skipped")
 
             total_count = len(results)
 
             # Report overall phase results
             if failure_count == 0:
                 if partial_count == 0:
+                    resumed = (
+                        f", {skipped_count} already completed" if skipped_count else ""
+                    )
                     print_success(
-                        f"Phase '{phase_name}' completed successfully ({success_count}/{total_count} stages)"
+                        f"Phase '{phase_name}' completed successfully ({success_count}/{total_count} stages{resumed})"
                     )
                     return 0
                 else:
                     print_warning(
                         f"Phase '{phase_name}' completed with warnings ({success_count} success, {partial_count} partial)"
                     )
-                    self._print_phase_errors(results)
+                    self._print_phase_errors(results, stage_names)
                     return 0
             else:
                 print_error(
                     f"Phase '{phase_name}' failed ({success_count} success, {partial_count} partial, {failure_count} failed)"
                 )
-                self._print_phase_errors(results)
+                self._print_phase_errors(results, stage_names)
                 return 1
 
         except ValueError as e:
@@ -236,15 +458,52 @@ class RunCommand:
             print_error(f"Unexpected error executing phase '{phase_name}': {e}")
             return 1
 
-    def _print_phase_errors(self, results: list) -> None:
+    def _get_async_threads(self) -> int:
+        """Worker threads for sync stages and blocking provider calls.
+
+        Sized so every stage allowed by system.max_concurrent_requests can
+        hold a thread while as many provider requests run beside it.
+
+        Returns:
+            Size of the event loop's default executor
+        """
+        requests = max(1, int(self.config.get("system.max_concurrent_requests", 1)))
+        return max(ASYNC_MIN_THREADS, requests * 2)
+
+    def _print_phase_report(self, report: PhaseReport) -> None:
+        """Print per-stage wall time and the critical path of a phase.
+
+        Args:
+            report: Phase report stored in the context by execute_phase
+        """
+        if not report.timings:
+            return
+        width = max(len(timing.name) for timing in report.timings)
+        print(f"Stage timings ({report.max_workers} worker(s)):")
+        for timing in report.timings:
+            print(
+                f"  {timing.name:<{width}}  {timing.duration:8.2f}s  "
+                f"(+{timing.start:.2f}s)  {timing.status}"
+            )
+        print(
+            f"Critical path: {' -> '.join(report.critical_path)} "
+            f"({report.critical_path_time:.2f}s of {report.wall_time:.2f}s wall time)"
+        )
+
+    def _print_phase_errors(
+        self, results: list, stage_names: list[str] | None = None
+    ) -> None:
         """Print errors from phase execution results.
 
         Args:
             results: List of StageResult objects
+            stage_names: Names of the executed stages, in result order
         """
-        for result in results:
+        for index, result in enumerate(results):
             if result.errors:
                 stage_name = getattr(result, "stage_name", "unknown")
+                if stage_names and index < len(stage_names):
+                    stage_name = stage_names[index]
                 print(f"Errors in stage '{stage_name}':")
                 for error in result.errors:
                     print(f"  - {error}")
@@ -0,0 +1,441 @@
+"""
+Pipeline Daemon
+
+Long-running process that keeps the configuration, pipeline and provider
+registries warm (HTTP sessions, data-provider caches, mmap'd dictionary
+indexes) and executes ``run`` jobs sent over a Unix socket.
+
+Protocol: one JSON request line per connection, answered by JSON event
+lines::
+
+    -> {"argv": ["run", "vocabulary", "--stage", "prepare"], "cwd": "/proj",
+        "env": {...}}
+    <- {"event": "output", "text": "..."}        (any number, streamed)
+    <- {"event": "exit", "code": 0}
+
+A job the daemon cannot run as the local CLI would (another command, or a
+different working directory) is answered with ``{"event": "rejected"}``
+before any output, and the client runs it locally instead. Jobs run one at
+a time under the client's environment (``env``), so configuration values
+such as API keys and ``FLUENT_FOREVER_DEBUG`` come from the submitting
+shell rather than the daemon's; ``{"command": "status"}`` and
+``{"command": "stop"}`` are answered immediately.
+
+The client half (``forward_to_daemon``, ``request_daemon``) does not import
+the pipeline engine or providers, so forwarding stays cheap for the runner.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from src.utils.logging_config import (
+    DEFAULT_LOG_LEVELS,
+    ICONS,
+    ColoredFormatter,
+    get_logger,
+    setup_module_log_levels,
+)
+
+if TYPE_CHECKING:
+    from src.core.config import Config
+    from src.providers.registry import ProviderRegistry
+
+PROJECT_ROOT = Path(__file__).parents[2]
+
+# Relative paths resolve against the project root
+DEFAULT_SOCKET_PATH = ".cache/daemon.sock"
+
+# Environment overrides: socket path, and "1" to never forward
+SOCKET_ENV = "FLUENT_FOREVER_DAEMON_SOCKET"
+DISABLE_ENV = "FLUENT_FOREVER_NO_DAEMON"
+
+# Commands the daemon executes; the rest are cheap enough to run locally
+FORWARDED_COMMANDS = ("run",)
+
+CONNECT_TIMEOUT = 1.0
+
+
+def get_socket_path(socket_path: str | Path | None = None) -> Path:
+    """Daemon socket path from an explicit value, the environment or the default
+
+    Args:
+        socket_path: Explicit path (e.g. ``daemon --socket``)
+
+    Returns:
+        Absolute socket path
+    """
+    path = Path(socket_path or os.getenv(SOCKET_ENV) or DEFAULT_SOCKET_PATH)
+    return path if path.is_absolute() else PROJECT_ROOT / path
+
+
+def _send(conn: socket.socket, message: dict[str, Any]) -> None:
+    conn.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _connect(socket_path: Path) -> socket.socket | None:
+    """Connect to a daemon, or None when none is listening"""
+    if not hasattr(socket, "AF_UNIX") or not socket_path.exists():
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    conn.settimeout(CONNECT_TIMEOUT)
+    try:
+        conn.connect(str(socket_path))
+    except OSError:
+        conn.close()
+        return None
+    # Jobs may run for a long time between output lines
+    conn.settimeout(None)
+    return conn
+
+
+def request_daemon(
+    request: dict[str, Any], socket_path: str | Path | None = None
+) -> Iterator[dict[str, Any]]:
+    """Send one request to the daemon and yield its events until it hangs up
+
+    Yields nothing when no daemon is listening.
+    """
+    conn = _connect(get_socket_path(socket_path))
+    if conn is None:
+        return
+    with conn, conn.makefile("r", encoding="utf-8") as replies:
+        _send(conn, request)
+        for line in replies:
+            yield json.loads(line)
+
+
+def forward_to_daemon(
+    argv: list[str],
+    command: str | None,
+    socket_path: str | Path | None = None,
+    output: TextIO | None = None,
+) -> int | None:
+    """Run a CLI invocation on the daemon, streaming its output
+
+    Args:
+        argv: Runner arguments, as passed to ``main``
+        command: Parsed command name
+        socket_path: Daemon socket (default from the environment)
+        output: Stream receiving job output (default sys.stdout)
+
+    Returns:
+        The job's exit code, or None when the invocation should run locally
+        (forwarding disabled, no daemon, or the daemon rejected the job)
+    """
+    if command not in FORWARDED_COMMANDS or os.getenv(DISABLE_ENV) == "1":
+        return None
+
+    import sys
+
+    stream = output or sys.stdout
+    request = {"argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+    started = False
+    try:
+        for event in request_daemon(request, socket_path):
+            if event["event"] == "rejected":
+                return None
+            started = True
+            if event["event"] == "output":
+                stream.write(event["text"])
+                stream.flush()
+            elif event["event"] == "exit":
+                return int(event["code"])
+    except (OSError, ValueError):
+        pass
+    # A daemon that died before starting the job is as good as none
+    if not started:
+        return None
+    stream.write("Lost connection to the pipeline daemon\n")
+    return 1
+
+
+@contextlib.contextmanager
+def _client_environment(env: dict[str, str] | None) -> Iterator[None]:
+    """Run a job under the submitting client's environment variables
+
+    Jobs run one at a time, so swapping the process environment is safe.
+    """
+    if env is None:
+        yield
+        return
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+class _EventWriter:
+    """Text stream that forwards writes to a client as output events"""
+
+    def __init__(self, conn: socket.socket):
+        self.conn = conn
+        self.closed = False
+
+    def write(self, text: str) -> int:
+        if text and not self.closed:
+            try:
+                _send(self.conn, {"event": "output", "text": text})
+            except OSError:
+                # Client went away; keep running the job to completion
+                self.closed = True
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str, daemon: "PipelineDaemon"):
+        self.pipeline_daemon = daemon
+        super().__init__(path, _Handler)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        daemon: PipelineDaemon = self.server.pipeline_daemon  # type: ignore[attr-defined]
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            _send(self.request, {"event": "rejected", "reason": "invalid request"})
+            return
+        daemon.handle(request, self.request)
+
+
+class PipelineDaemon:
+    """Warm registries and a serial job queue behind a Unix socket"""
+
+    def __init__(
+        self,
+        socket_path: str | Path | None = None,
+        project_root: Path = PROJECT_ROOT,
+    ):
+        """
+        Initialize daemon
+
+        Jobs must be submitted from the daemon's working directory, since
+        configuration, data and output paths resolve against it.
+
+        Args:
+            socket_path: Socket to listen on (default from the environment)
+            project_root: Project root handed to run commands
+        """
+        self.socket_path = get_socket_path(socket_path)
+        self.project_root = project_root
+        self.working_dir = Path.cwd().resolve()
+        self.logger = get_logger("cli.daemon")
+        self.started = time.time()
+        self.jobs_run = 0
+        self.queued = 0
+        # Jobs share registries and redirect stdout, so they run one at a time
+        self._job_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        # Config path -> (mtime and environment key, Config, ProviderRegistry)
+        self._states: dict[str, tuple[tuple[int, int], Config, ProviderRegistry]] = {}
+        self._server: _Server | None = None
+
+    def serve(self) -> None:
+        """Listen until stopped by a stop request, SIGTERM or Ctrl-C
+
+        Raises:
+            RuntimeError: If another daemon is listening on the socket
+        """
+        existing = _connect(self.socket_path)
+        if existing is not None:
+            existing.close()
+            raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+
+        self._server = _Server(str(self.socket_path), self)
+        os.chmod(self.socket_path, 0o600)
+        previous = signal.getsignal(signal.SIGTERM)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._on_sigterm)
+        self.logger.info(f"Pipeline daemon listening on {self.socket_path}")
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            if threading.current_thread() is threading.main_thread():
+                signal.signal(signal.SIGTERM, previous)
+            self.logger.info(f"Pipeline daemon stopped after {self.jobs_run} job(s)")
+
+    def stop(self) -> None:
+        """Stop serving (safe to call from any thread but the serving one)"""
+        if self._server is not None:
+            self._server.shutdown()
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "event": "status",
+            "pid": os.getpid(),
+            "uptime": round(time.time() - self.started, 3),
+            "jobs_run": self.jobs_run,
+            "queued": self.queued,
+            "working_dir": str(self.working_dir),
+            "configs": sorted(self._states),
+        }
+
+    def handle(self, request: dict[str, Any], conn: socket.socket) -> None:
+        """Answer one request on a client connection"""
+        command = request.get("command")
+        if command == "status":
+            _send(conn, self.status())
+            return
+        if command == "stop":
+            _send(conn, {"event": "stopping", "jobs_run": self.jobs_run})
+            self.stop()
+            return
+
+        argv: Any = request.get("argv")
+        reason = self._reject_reason(argv, request.get("cwd"), request.get("env"))
+        if reason:
+            _send(conn, {"event": "rejected", "reason": reason})
+            return
+
+        with self._counter_lock:
+            self.queued += 1
+        try:
+            with self._job_lock:
+                with self._counter_lock:
+                    self.queued -= 1
+                code = self._run_job(argv, _EventWriter(conn), request.get("env"))
+        except Exception as e:
+            self.logger.exception(f"Daemon job failed: {e}")
+            code = 1
+        with self._counter_lock:
+            self.jobs_run += 1
+        with contextlib.suppress(OSError):
+            _send(conn, {"event": "exit", "code": code})
+
+    def _reject_reason(self, argv: Any, cwd: Any, env: Any = None) -> str | None:
+        if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+            return "argv must be a list of strings"
+        if env is not None and not (
+            isinstance(env, dict)
+            and all(isinstance(k, str) and isinstance(v, str) for k, v in env.items())
+        ):
+            return "env must map strings to strings"
+        if not any(arg in FORWARDED_COMMANDS for arg in argv):
+            return f"only {', '.join(FORWARDED_COMMANDS)} jobs are accepted"
+        if not cwd or Path(cwd).resolve() != self.working_dir:
+            return f"jobs must be submitted from {self.working_dir}"
+        return None
+
+    def _run_job(
+        self,
+        argv: list[str],
+        writer: _EventWriter,
+        env: dict[str, str] | None = None,
+    ) -> int:
+        """Parse and execute one run invocation, streaming output to the client
+
+        Args:
+            argv: Runner arguments
+            writer: Stream forwarding output to the client
+            env: Client environment to run under (default: the daemon's)
+        """
+        from src.cli.commands import RunCommand
+        from src.cli.pipeline_runner import create_parser
+        from src.cli.utils.validation import validate_arguments
+        from src.core.registry import get_pipeline_registry
+
+        handler = logging.StreamHandler(writer)
+        handler.setFormatter(ColoredFormatter("%(levelname)s %(message)s"))
+        root_logger = logging.getLogger("fluent_forever")
+        loggers = [root_logger, *map(logging.getLogger, DEFAULT_LOG_LEVELS)]
+        levels = [logger.level for logger in loggers]
+        root_logger.addHandler(handler)
+        try:
+            with (
+                _client_environment(env),
+                contextlib.redirect_stdout(writer),
+                contextlib.redirect_stderr(writer),
+            ):
+                try:
+                    args = create_parser().parse_args(argv)
+                except SystemExit as e:
+                    return e.code if isinstance(e.code, int) else 1
+                if args.command not in FORWARDED_COMMANDS:
+                    print(f"Daemon does not run '{args.command}' commands")
+                    return 1
+
+                # Same levels main() would set up for a local run
+                verbose = getattr(args, "verbose", False)
+                debug = verbose or os.getenv("FLUENT_FOREVER_DEBUG")
+                root_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+                setup_module_log_levels()
+
+                errors = validate_arguments(args.command, args)
+                if errors:
+                    for error in errors:
+                        self.logger.error(f"{ICONS['cross']} {error}")
+                    return 1
+
+                config, provider_registry = self._warm_state(
+                    getattr(args, "config", None)
+                )
+                return RunCommand(
+                    get_pipeline_registry(),
+                    provider_registry,
+                    self.project_root,
+                    config,
+                ).execute(args)
+        finally:
+            root_logger.removeHandler(handler)
+            for logger, level in zip(loggers, levels, strict=True):
+                logger.setLevel(level)
+
+    def _warm_state(
+        self, config_path: str | None
+    ) -> tuple["Config", "ProviderRegistry"]:
+        """Config and provider registry, rebuilt when the file or environment changes
+
+        Configuration values are substituted from the environment, so jobs
+        from shells with different variables (API keys, ...) get their own
+        Config and providers.
+        """
+        from src.core.config import Config
+        from src.providers.registry import ProviderRegistry
+
+        path = self.working_dir / (config_path or "config.json")
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        version = (mtime, hash(frozenset(os.environ.items())))
+        key = str(path)
+        cached = self._states.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1], cached[2]
+
+        config = Config.load(str(path))
+        registry = ProviderRegistry.from_config(config)
+        self._states[key] = (version, config, registry)
+        self.logger.info(f"Loaded configuration {path}")
+        return config, registry
+
+    def _on_sigterm(self, signum: int, frame: Any) -> None:
+        raise KeyboardInterrupt
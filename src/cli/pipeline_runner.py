@@ -9,15 +9,16 @@ Replaces all hardcoded CLI scripts with unified command structure.
 import argparse
 import logging
 import os
+import sys
 from pathlib import Path
 
-# Import command classes
-from src.cli.commands import InfoCommand, ListCommand, RunCommand
+# Command classes and providers are imported when dispatched, so discovery
+# commands skip the pipeline engine, provider clients and requests
+from src.cli.daemon import forward_to_daemon
 from src.cli.utils.validation import validate_arguments
 from src.core.config import Config
 from src.core.exceptions import PipelineError
 from src.core.registry import get_pipeline_registry
-from src.providers.registry import ProviderRegistry
 from src.utils.logging_config import ICONS, get_logger, setup_logging
 
 
@@ -39,6 +40,20 @@ Examples:
   # Phase execution (multiple stages)
   %(prog)s run vocabulary --phase preparation
   %(prog)s run vocabulary --phase full --dry-run
+  %(prog)s run vocabulary --phase full --resume <run-id>
+  %(prog)s run vocabulary --phase full --profile profile.json
+
+  # Dictionary index
+  %(prog)s index build Español.jsonl --workers 8
+  %(prog)s index project Español.jsonl
+
+  # Warm daemon (later run commands are forwarded to it)
+  %(prog)s daemon start
+  %(prog)s daemon status
+
+  # Forvo pronunciation cache
+  %(prog)s cache stats
+  %(prog)s cache clear --expired
 
         """,
     )
@@ -77,6 +92,94 @@ Examples:
     run_parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be done"
     )
+    run_parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="Resume a failed run, skipping stages it already completed",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Execute every stage even if a cached output matches its inputs",
+    )
+    run_parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        help="Write a timing tree of the run (phases, stages, provider calls) as JSON",
+    )
+    run_parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="Slowest spans to print with --profile (default: 10)",
+    )
+    run_parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run stages on an event loop so async stages overlap their requests",
+    )
+
+    # Index command
+    index_parser = subparsers.add_parser("index", help="Manage dictionary indexes")
+    index_subparsers = index_parser.add_subparsers(
+        dest="index_command", required=True, help="Index operations"
+    )
+    build_parser = index_subparsers.add_parser(
+        "build", help="Build the word index for a JSONL dictionary"
+    )
+    build_parser.add_argument("file", help="JSONL dictionary file")
+    build_parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: CPU count)"
+    )
+    build_parser.add_argument(
+        "--index-path", help="Index output path (default: beside the dictionary)"
+    )
+    project_parser = index_subparsers.add_parser(
+        "project", help="Write the card-ready projection sidecar for a dictionary"
+    )
+    project_parser.add_argument("file", help="JSONL dictionary file")
+    project_parser.add_argument(
+        "--workers", type=int, help="Worker processes (default: CPU count)"
+    )
+    project_parser.add_argument(
+        "--output", help="Sidecar output path (default: beside the dictionary)"
+    )
+
+    # Daemon command
+    daemon_parser = subparsers.add_parser(
+        "daemon", help="Serve run commands from a warm background process"
+    )
+    daemon_subparsers = daemon_parser.add_subparsers(
+        dest="daemon_command", required=True, help="Daemon operations"
+    )
+    socket_parser = argparse.ArgumentParser(add_help=False)
+    socket_parser.add_argument(
+        "--socket", help="Unix socket path (default: .cache/daemon.sock)"
+    )
+    daemon_subparsers.add_parser(
+        "start", parents=[socket_parser], help="Run the daemon in the foreground"
+    )
+    daemon_subparsers.add_parser(
+        "stop", parents=[socket_parser], help="Stop a running daemon"
+    )
+    daemon_subparsers.add_parser(
+        "status", parents=[socket_parser], help="Show a running daemon's status"
+    )
+
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache", help="Inspect or clear the Forvo pronunciation cache"
+    )
+    cache_subparsers = cache_parser.add_subparsers(
+        dest="cache_command", required=True, help="Cache operations"
+    )
+    cache_subparsers.add_parser("stats", help="Show cached lookups and size")
+    clear_parser = cache_subparsers.add_parser("clear", help="Delete cached lookups")
+    clear_parser.add_argument(
+        "--expired", action="store_true", help="Only delete expired lookups"
+    )
 
     return parser
 
@@ -87,6 +190,11 @@ def main(argv: list[str] | None = None) -> int:
     parser = create_parser()
     args = parser.parse_args(argv)
 
+    # Hand runs to a warm daemon when one is listening
+    forwarded = forward_to_daemon(sys.argv[1:] if argv is None else argv, args.command)
+    if forwarded is not None:
+        return forwarded
+
     # Setup logging with verbose mode
     if getattr(args, "verbose", False) or os.getenv("FLUENT_FOREVER_DEBUG"):
         # Only enable file logging in verbose mode if not in test environment
@@ -117,7 +225,6 @@ def main(argv: list[str] | None = None) -> int:
         # Setup registries
         logger.info(f"{ICONS['gear']} Initializing registries...")
         pipeline_registry = get_pipeline_registry()
-        provider_registry = ProviderRegistry.from_config(config)
         logger.info(f"{ICONS['check']} Registries initialized")
 
         # Register pipelines using centralized system
@@ -133,16 +240,38 @@ def main(argv: list[str] | None = None) -> int:
         # Execute command
         logger.info(f"{ICONS['gear']} Executing {args.command} command...")
         if args.command == "list":
+            from src.cli.commands import ListCommand
+
             command = ListCommand(pipeline_registry, config)
             result = command.execute(args)
         elif args.command == "info":
+            from src.cli.commands import InfoCommand
+
             info_command = InfoCommand(pipeline_registry, config)
             result = info_command.execute(args)
         elif args.command == "run":
+            from src.cli.commands import RunCommand
+            from src.providers.registry import ProviderRegistry
+
+            # Only runs need providers; media clients are created on first use
+            provider_registry = ProviderRegistry.from_config(config)
             run_command = RunCommand(
                 pipeline_registry, provider_registry, project_root, config
             )
             result = run_command.execute(args)
+        elif args.command == "index":
+            from src.cli.commands import IndexCommand
+
+            index_command = IndexCommand(config)
+            result = index_command.execute(args)
+        elif args.command == "daemon":
+            from src.cli.commands import DaemonCommand
+
+            result = DaemonCommand().execute(args)
+        elif args.command == "cache":
+            from src.cli.commands import CacheCommand
+
+            result = CacheCommand(config).execute(args)
         else:
             logger.error(f"Unknown command: {args.command}")
             return 1
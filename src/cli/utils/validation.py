@@ -25,6 +25,9 @@ def validate_arguments(command: str, args: Any) -> list[str]:
             errors.append("Pipeline name is required for run command")
         if not args.stage and not args.phase:
             errors.append("Either --stage or --phase is required for run command")
+        profile_top = getattr(args, "profile_top", None)
+        if isinstance(profile_top, int) and profile_top < 1:
+            errors.append(f"--profile-top must be at least 1, got {profile_top}")
 
         # Validate stage-specific arguments (skip for dry-run and phase execution)
         # Note: Some arguments may not be implemented in the parser yet
@@ -35,6 +38,16 @@ def validate_arguments(command: str, args: Any) -> list[str]:
             elif hasattr(args, "cards") and args.stage == "media" and not args.cards:
                 errors.append("--cards is required for media stage")
 
+    elif command == "index" and getattr(args, "index_command", None) in (
+        "build",
+        "project",
+    ):
+        file_error = validate_file_path(args.file)
+        if file_error:
+            errors.append(file_error)
+        if args.workers is not None and args.workers < 1:
+            errors.append("--workers must be at least 1")
+
     return errors
 
 
@@ -1,30 +1,59 @@
-"""Core pipeline architecture components."""
+"""Core pipeline architecture components.
 
-from .context import PipelineContext
-from .exceptions import (
-    ContextValidationError,
-    PipelineAlreadyRegisteredError,
-    PipelineError,
-    PipelineNotFoundError,
-    StageError,
-    StageNotFoundError,
-)
-from .pipeline import Pipeline
-from .registry import PipelineRegistry, get_pipeline_registry
-from .stages import Stage, StageResult, StageStatus
+Exports are imported on first access, so light modules such as
+``src.core.config`` can be used without loading the pipeline engine.
+"""
 
-__all__ = [
-    "Pipeline",
-    "Stage",
-    "StageResult",
-    "StageStatus",
-    "PipelineContext",
-    "PipelineRegistry",
-    "get_pipeline_registry",
-    "PipelineError",
-    "PipelineNotFoundError",
-    "PipelineAlreadyRegisteredError",
-    "StageError",
-    "StageNotFoundError",
-    "ContextValidationError",
-]
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .checkpoint import CheckpointStore
+    from .context import PipelineContext
+    from .exceptions import (
+        CheckpointError,
+        ContextValidationError,
+        PipelineAlreadyRegisteredError,
+        PipelineError,
+        PipelineNotFoundError,
+        StageDependencyError,
+        StageError,
+        StageNotFoundError,
+    )
+    from .pipeline import Pipeline
+    from .registry import PipelineRegistry, get_pipeline_registry
+    from .stage_cache import StageCache
+    from .stages import AsyncStage, Stage, StageResult, StageStatus
+
+# Exported name -> defining submodule
+_EXPORTS = {
+    "Pipeline": "pipeline",
+    "Stage": "stages",
+    "AsyncStage": "stages",
+    "StageResult": "stages",
+    "StageStatus": "stages",
+    "PipelineContext": "context",
+    "PipelineRegistry": "registry",
+    "get_pipeline_registry": "registry",
+    "PipelineError": "exceptions",
+    "PipelineNotFoundError": "exceptions",
+    "PipelineAlreadyRegisteredError": "exceptions",
+    "StageError": "exceptions",
+    "StageNotFoundError": "exceptions",
+    "StageDependencyError": "exceptions",
+    "ContextValidationError": "exceptions",
+    "CheckpointError": "exceptions",
+    "CheckpointStore": "checkpoint",
+    "StageCache": "stage_cache",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,203 @@
+"""Run checkpoints for resuming interrupted pipeline executions."""
+
+import json
+import os
+import re
+import secrets
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.utils.logging_config import ICONS, get_logger
+
+from .exceptions import CheckpointError
+
+if TYPE_CHECKING:
+    from .context import PipelineContext
+
+CHECKPOINT_VERSION = 1
+
+# Default checkpoint directory, relative to the project root
+DEFAULT_CHECKPOINT_DIR = ".cache/checkpoints"
+
+# Context keys rebuilt by the caller on resume instead of being persisted
+REINJECTED_KEYS = frozenset({"providers"})
+
+_RUN_ID_PATTERN = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
+
+
+@dataclass
+class Checkpoint:
+    """Persisted state of a run after its last successful stage."""
+
+    run_id: str
+    pipeline_name: str
+    completed_stages: list[str]
+    data: dict[str, Any]
+    phase: str | None = None
+    stage: str | None = None
+    skipped_keys: list[str] = field(default_factory=list)
+    updated: str = ""
+    version: int = CHECKPOINT_VERSION
+
+
+class CheckpointStore:
+    """Directory of JSON checkpoints, one file per run id."""
+
+    def __init__(self, directory: Path):
+        """Initialize store.
+
+        Args:
+            directory: Directory holding {run_id}.json files (created on save)
+        """
+        self.directory = Path(directory)
+        self.logger = get_logger("core.checkpoint")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_run_id(pipeline_name: str) -> str:
+        """Create a unique, file-name safe run id for a pipeline."""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", pipeline_name) or "run"
+        return f"{safe_name}-{stamp}-{secrets.token_hex(3)}"
+
+    def get_path(self, run_id: str) -> Path:
+        """Checkpoint file of a run.
+
+        Raises:
+            CheckpointError: If run_id is not a plain file name
+        """
+        if not _RUN_ID_PATTERN.match(run_id):
+            raise CheckpointError(f"Invalid run id: {run_id!r}")
+        return self.directory / f"{run_id}.json"
+
+    def exists(self, run_id: str) -> bool:
+        return self.get_path(run_id).exists()
+
+    def list_runs(self) -> list[str]:
+        """Run ids with a checkpoint, oldest first."""
+        if not self.directory.exists():
+            return []
+        files = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        return [path.stem for path in files]
+
+    def save(self, context: "PipelineContext") -> Checkpoint:
+        """Write the context's completed stages and JSON-serializable data.
+
+        Entries in REINJECTED_KEYS and values json cannot encode are left
+        out (their keys are listed in skipped_keys). The file is replaced
+        atomically, so a crash leaves the previous checkpoint intact.
+
+        Args:
+            context: Context with run_id set
+
+        Returns:
+            The checkpoint written
+
+        Raises:
+            CheckpointError: If the context has no run id
+            OSError: If the checkpoint file cannot be written
+        """
+        if not context.run_id:
+            raise CheckpointError("Cannot checkpoint a context without a run id")
+
+        data: dict[str, Any] = {}
+        skipped: list[str] = []
+        for key, value in list(context.data.items()):
+            if key in REINJECTED_KEYS:
+                continue
+            try:
+                json.dumps(value)
+            except (TypeError, ValueError):
+                skipped.append(key)
+                continue
+            data[key] = value
+
+        checkpoint = Checkpoint(
+            run_id=context.run_id,
+            pipeline_name=context.pipeline_name,
+            completed_stages=list(context.completed_stages),
+            data=data,
+            phase=context.args.get("phase"),
+            stage=context.args.get("stage"),
+            skipped_keys=skipped,
+            updated=datetime.now().isoformat(),
+        )
+
+        path = self.get_path(context.run_id)
+        with self._lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".json.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(checkpoint), f, ensure_ascii=False)
+            os.replace(temp_path, path)
+
+        if skipped:
+            self.logger.debug(f"Checkpoint skipped non-serializable keys: {skipped}")
+        self.logger.debug(
+            f"Checkpointed run '{checkpoint.run_id}' after "
+            f"{len(checkpoint.completed_stages)} stage(s)"
+        )
+        return checkpoint
+
+    def load(self, run_id: str) -> Checkpoint:
+        """Read the checkpoint of a run.
+
+        Raises:
+            CheckpointError: If the checkpoint does not exist or is invalid
+        """
+        path = self.get_path(run_id)
+        try:
+            with open(path, encoding="utf-8") as f:
+                raw = json.load(f)
+            checkpoint = Checkpoint(**raw)
+        except FileNotFoundError as e:
+            raise CheckpointError(f"No checkpoint for run '{run_id}'") from e
+        except (OSError, TypeError, ValueError) as e:
+            raise CheckpointError(f"Invalid checkpoint for run '{run_id}': {e}") from e
+
+        if checkpoint.version != CHECKPOINT_VERSION:
+            raise CheckpointError(
+                f"Checkpoint for run '{run_id}' has unsupported version "
+                f"{checkpoint.version}"
+            )
+        return checkpoint
+
+    def restore(self, checkpoint: Checkpoint, context: "PipelineContext") -> None:
+        """Apply a checkpoint to a freshly created context.
+
+        Persisted data overrides what the context already holds; keys that
+        were not persisted (providers) keep the caller's values. Completed
+        stages are marked as resumed so they are skipped.
+
+        Raises:
+            CheckpointError: If the checkpoint belongs to another pipeline
+        """
+        if checkpoint.pipeline_name != context.pipeline_name:
+            raise CheckpointError(
+                f"Run '{checkpoint.run_id}' belongs to pipeline "
+                f"'{checkpoint.pipeline_name}', not '{context.pipeline_name}'"
+            )
+
+        context.data.update(checkpoint.data)
+        context.run_id = checkpoint.run_id
+        for stage_name in checkpoint.completed_stages:
+            if stage_name not in context.completed_stages:
+                context.completed_stages.append(stage_name)
+        context.resumed_stages = list(checkpoint.completed_stages)
+
+        self.logger.info(
+            f"{ICONS['info']} Resuming run '{checkpoint.run_id}' with completed "
+            f"stages: {checkpoint.completed_stages}"
+        )
+        if checkpoint.skipped_keys:
+            self.logger.warning(
+                f"{ICONS['warning']} Context keys not restored (not serializable): "
+                f"{checkpoint.skipped_keys}"
+            )
+
+    def delete(self, run_id: str) -> None:
+        """Remove a run's checkpoint if present."""
+        self.get_path(run_id).unlink(missing_ok=True)
@@ -2,10 +2,14 @@
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.utils.logging_config import ICONS, get_context_logger
 
+if TYPE_CHECKING:
+    from .checkpoint import CheckpointStore
+    from .stage_cache import StageCache
+
 
 @dataclass
 class PipelineContext:
@@ -28,6 +32,14 @@ class PipelineContext:
     # Command arguments
     args: dict[str, Any] = field(default_factory=dict)
 
+    # Checkpointing (saved after each successful stage when a store is set)
+    run_id: str | None = None
+    checkpoint_store: "CheckpointStore | None" = field(default=None, repr=False)
+    resumed_stages: list[str] = field(default_factory=list)
+
+    # Stage output cache (None disables caching)
+    stage_cache: "StageCache | None" = field(default=None, repr=False)
+
     def __post_init__(self) -> None:
         self.logger = get_context_logger("core.context", self.pipeline_name)
         self.logger.debug(f"Created context for pipeline '{self.pipeline_name}'")
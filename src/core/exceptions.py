@@ -31,7 +31,19 @@ class StageNotFoundError(StageError):
     pass
 
 
+class StageDependencyError(StageError):
+    """Stage dependencies within a phase form a cycle."""
+
+    pass
+
+
 class ContextValidationError(PipelineError):
     """Pipeline context validation error."""
 
     pass
+
+
+class CheckpointError(PipelineError):
+    """Run checkpoint missing, unreadable or for another pipeline."""
+
+    pass
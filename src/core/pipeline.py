@@ -1,13 +1,19 @@
 """Abstract pipeline definition and base classes."""
 
+import asyncio
+import logging
+import time
 from abc import ABC, abstractmethod
 from typing import Any
 
 from src.utils.logging_config import ICONS, get_context_logger, log_performance
+from src.utils.profiler import Span, current_span, profile_span
 
 from .context import PipelineContext
-from .exceptions import StageNotFoundError
-from .stages import Stage, StageResult
+from .exceptions import PipelineError, StageNotFoundError
+from .scheduler import PHASE_REPORT_KEY, PhaseScheduler, StageGraph, StageTiming
+from .stage_cache import ContextSnapshot
+from .stages import AsyncStage, Stage, StageResult
 
 
 class Pipeline(ABC):
@@ -45,24 +51,55 @@ class Pipeline(ABC):
         """
         return {}
 
-    @log_performance("fluent_forever.core.pipeline")
-    def execute_phase(
-        self, phase_name: str, context: PipelineContext
-    ) -> list[StageResult]:
-        """Execute all stages in a phase sequentially.
+    @property
+    def supports_parallel_stages(self) -> bool:
+        """Whether independent stages of a phase may run concurrently.
+
+        Opt in only when stages that do not depend on each other also do not
+        read or write the same context keys or files.
+        """
+        return False
+
+    def get_stage_workers(self, context: PipelineContext) -> int:
+        """Number of stages of a phase allowed to run at the same time.
 
         Args:
-            phase_name: Name of phase to execute
-            context: Pipeline context shared between stages
+            context: Pipeline context (reads system.max_concurrent_requests)
 
         Returns:
-            List of stage results from executed stages
+            1 unless the pipeline supports parallel stages
+        """
+        if not self.supports_parallel_stages:
+            return 1
+        system = context.config.get("system", {})
+        return max(1, int(system.get("max_concurrent_requests", 1)))
+
+    def build_stage_graph(self, stage_names: list[str]) -> StageGraph:
+        """Build the dependency graph of a list of stages.
+
+        Args:
+            stage_names: Stages in declaration order
+
+        Returns:
+            Stage graph
 
         Raises:
-            ValueError: If phase_name is not found in phases
+            StageDependencyError: If the dependencies form a cycle
         """
-        logger = get_context_logger("core.pipeline", context.pipeline_name)
+        dependencies: dict[str, list[str]] = {}
+        for stage_name in stage_names:
+            try:
+                declared = self.get_stage(stage_name).dependencies
+            except Exception:
+                # Reported as a stage failure when the stage is executed
+                declared = []
+            dependencies[stage_name] = (
+                list(declared) if isinstance(declared, list | tuple) else []
+            )
+        return StageGraph(stage_names, dependencies)
 
+    def _get_phase_stages(self, phase_name: str, logger: logging.Logger) -> list[str]:
+        """Stage names of a phase, raising ValueError for unknown phases."""
         if phase_name not in self.phases:
             available_phases = list(self.phases.keys())
             error_msg = f"Phase '{phase_name}' not found in pipeline '{self.name}'. Available phases: {available_phases}"
@@ -73,36 +110,230 @@ class Pipeline(ABC):
         logger.info(
             f"{ICONS['gear']} Executing phase '{phase_name}' with stages: {stage_names}"
         )
+        return stage_names
 
-        results = []
-        for stage_name in stage_names:
+    @log_performance("fluent_forever.core.pipeline")
+    def execute_phase(
+        self, phase_name: str, context: PipelineContext
+    ) -> list[StageResult]:
+        """Execute all stages in a phase.
+
+        Stages run sequentially in declaration order unless the pipeline
+        supports parallel stages, in which case independent stages run
+        concurrently (see PhaseScheduler). Either way execution stops after
+        the first failed stage, and a PhaseReport with per-stage timings and
+        the critical path is stored in the context under "phase_report".
+
+        Args:
+            phase_name: Name of phase to execute
+            context: Pipeline context shared between stages
+
+        Returns:
+            List of stage results from executed stages, in declaration order
+
+        Raises:
+            ValueError: If phase_name is not found in phases
+            StageDependencyError: If the phase's stage dependencies form a cycle
+        """
+        with profile_span(phase_name, "phase") as span:
+            results = self._execute_phase(phase_name, context)
+            if span is not None:
+                span.add(items=len(results))
+        return results
+
+    def _execute_phase(
+        self, phase_name: str, context: PipelineContext
+    ) -> list[StageResult]:
+        """Execute all stages in a phase (see execute_phase)."""
+        logger = get_context_logger("core.pipeline", context.pipeline_name)
+        stage_names = self._get_phase_stages(phase_name, logger)
+
+        graph = self.build_stage_graph(stage_names)
+        workers = self.get_stage_workers(context)
+        if workers > 1:
             logger.info(
-                f"{ICONS['gear']} Executing stage '{stage_name}' in phase '{phase_name}'"
+                f"{ICONS['gear']} Scheduling phase '{phase_name}' on {workers} workers"
             )
-            result = self.execute_stage(stage_name, context)
-            results.append(result)
-
-            # Stop execution if stage fails (unless partial success)
-            if result.status.value not in ["success", "partial"]:
-                logger.error(
-                    f"{ICONS['cross']} Stage '{stage_name}' failed, stopping phase execution"
+            results, report = PhaseScheduler(workers).run(
+                phase_name,
+                graph,
+                lambda stage_name: self.execute_stage(stage_name, context),
+            )
+        else:
+            results = []
+            timings = []
+            phase_start = time.perf_counter()
+            for stage_name in stage_names:
+                logger.info(
+                    f"{ICONS['gear']} Executing stage '{stage_name}' in phase '{phase_name}'"
+                )
+                stage_start = time.perf_counter()
+                result = self.execute_stage(stage_name, context)
+                results.append(result)
+                timings.append(
+                    StageTiming(
+                        stage_name,
+                        result.status.value,
+                        stage_start - phase_start,
+                        time.perf_counter() - stage_start,
+                    )
                 )
-                break
 
+                # Stop execution if stage fails (unless partial success or skipped)
+                if result.status.value not in ["success", "partial", "skipped"]:
+                    logger.error(
+                        f"{ICONS['cross']} Stage '{stage_name}' failed, stopping phase execution"
+                    )
+                    break
+            report = graph.report(
+                phase_name, 1, timings, time.perf_counter() - phase_start
+            )
+
+        context.set(PHASE_REPORT_KEY, report)
+        logger.info(
+            f"{ICONS['check']} Phase '{phase_name}' completed with {len(results)} stage results"
+        )
+        return results
+
+    async def execute_phase_async(
+        self, phase_name: str, context: PipelineContext
+    ) -> list[StageResult]:
+        """Execute all stages in a phase on the running event loop.
+
+        Same ordering, fail-fast and phase report as execute_phase. Stages
+        run through execute_stage_async, so AsyncStages overlap their own
+        requests even when the pipeline runs one stage at a time.
+
+        Args:
+            phase_name: Name of phase to execute
+            context: Pipeline context shared between stages
+
+        Returns:
+            List of stage results from executed stages, in declaration order
+
+        Raises:
+            ValueError: If phase_name is not found in phases
+            StageDependencyError: If the phase's stage dependencies form a cycle
+        """
+        with profile_span(phase_name, "phase") as span:
+            results = await self._execute_phase_async(phase_name, context)
+            if span is not None:
+                span.add(items=len(results))
+        return results
+
+    async def _execute_phase_async(
+        self, phase_name: str, context: PipelineContext
+    ) -> list[StageResult]:
+        """Execute a phase on the running event loop (see execute_phase_async)."""
+        logger = get_context_logger("core.pipeline", context.pipeline_name)
+        stage_names = self._get_phase_stages(phase_name, logger)
+
+        graph = self.build_stage_graph(stage_names)
+        workers = self.get_stage_workers(context)
+        logger.info(
+            f"{ICONS['gear']} Running phase '{phase_name}' on the event loop "
+            f"({workers} stage(s) at a time)"
+        )
+        results, report = await PhaseScheduler(workers).run_async(
+            phase_name,
+            graph,
+            lambda stage_name: self.execute_stage_async(stage_name, context),
+        )
+
+        context.set(PHASE_REPORT_KEY, report)
         logger.info(
             f"{ICONS['check']} Phase '{phase_name}' completed with {len(results)} stage results"
         )
         return results
 
+    async def execute_stage_async(
+        self, stage_name: str, context: PipelineContext
+    ) -> StageResult:
+        """Execute a specific stage from an event loop.
+
+        AsyncStages are awaited on the running loop; any other stage goes
+        through execute_stage in a worker thread.
+        """
+        with profile_span(stage_name, "stage") as span:
+            result = await self._execute_stage_async(stage_name, context)
+            _record_stage_result(span, result)
+        return result
+
+    async def _execute_stage_async(
+        self, stage_name: str, context: PipelineContext
+    ) -> StageResult:
+        """Execute a stage from an event loop (see execute_stage_async)."""
+        logger = get_context_logger("core.pipeline", context.pipeline_name)
+
+        if stage_name in context.resumed_stages:
+            return self._skip_resumed_stage(stage_name, context, logger)
+
+        try:
+            stage = self.get_stage(stage_name)
+            if not isinstance(stage, AsyncStage):
+                return await asyncio.to_thread(self._execute_stage, stage_name, context)
+
+            logger.info(
+                f"{ICONS['gear']} Executing async stage '{stage_name}' in pipeline '{self.name}'"
+            )
+            validation_errors = stage.validate_context(context)
+            if validation_errors:
+                logger.error(
+                    f"{ICONS['cross']} Context validation failed for stage '{stage_name}': {validation_errors}"
+                )
+                return StageResult.failure(
+                    f"Context validation failed for stage '{stage_name}'",
+                    validation_errors,
+                )
+
+            cache_key, result, before = self._lookup_cache(stage, context, logger)
+            if result is None:
+                result = await stage.execute_async(context)
+                self._store_cache(cache_key, stage_name, result, before, context)
+
+            if result.status.value == "success":
+                logger.info(
+                    f"{ICONS['check']} Stage '{stage_name}' completed successfully"
+                )
+                context.mark_stage_complete(stage_name)
+                self._save_checkpoint(context, logger)
+            else:
+                logger.error(
+                    f"{ICONS['cross']} Stage '{stage_name}' failed: {result.message}"
+                )
+
+            return result
+
+        except StageNotFoundError as e:
+            logger.error(f"{ICONS['cross']} Stage '{stage_name}' not found: {str(e)}")
+            return StageResult.failure(str(e))
+        except Exception as e:
+            logger.error(
+                f"{ICONS['cross']} Unexpected error in stage '{stage_name}': {str(e)}"
+            )
+            return StageResult.failure(
+                f"Unexpected error in stage '{stage_name}': {str(e)}"
+            )
+
     @log_performance("fluent_forever.core.pipeline")
     def execute_stage(self, stage_name: str, context: PipelineContext) -> StageResult:
         """Execute a specific stage with context."""
+        with profile_span(stage_name, "stage") as span:
+            result = self._execute_stage(stage_name, context)
+            _record_stage_result(span, result)
+        return result
+
+    def _execute_stage(self, stage_name: str, context: PipelineContext) -> StageResult:
+        """Execute a stage (see execute_stage)."""
         logger = get_context_logger("core.pipeline", context.pipeline_name)
 
         logger.info(
             f"{ICONS['gear']} Executing stage '{stage_name}' in pipeline '{self.name}'"
         )
 
+        if stage_name in context.resumed_stages:
+            return self._skip_resumed_stage(stage_name, context, logger)
+
         try:
             # Before stage retrieval
             logger.debug(f"Retrieving stage '{stage_name}'...")
@@ -127,7 +358,14 @@ class Pipeline(ABC):
 
             # Execute the stage
             logger.info(f"{ICONS['gear']} Starting stage '{stage_name}' execution...")
-            result = stage.execute(pipeline_context)
+            cache_key, result, before = self._lookup_cache(
+                stage, pipeline_context, logger
+            )
+            if result is None:
+                result = stage.execute(pipeline_context)
+                self._store_cache(
+                    cache_key, stage_name, result, before, pipeline_context
+                )
 
             # Mark stage as complete if successful
             if result.status.value == "success":
@@ -135,6 +373,7 @@ class Pipeline(ABC):
                     f"{ICONS['check']} Stage '{stage_name}' completed successfully"
                 )
                 pipeline_context.mark_stage_complete(stage_name)
+                self._save_checkpoint(pipeline_context, logger)
             else:
                 logger.error(
                     f"{ICONS['cross']} Stage '{stage_name}' failed: {result.message}"
@@ -153,6 +392,80 @@ class Pipeline(ABC):
                 f"Unexpected error in stage '{stage_name}': {str(e)}"
             )
 
+    def _lookup_cache(
+        self, stage: Stage, context: PipelineContext, logger: logging.Logger
+    ) -> tuple[str | None, StageResult | None, ContextSnapshot | None]:
+        """Replay a stage's cached output if its inputs are unchanged.
+
+        Returns:
+            Cache key (None if the stage is not cached), the replayed result
+            on a hit, and on a miss the context snapshot for _store_cache()
+        """
+        cache = context.stage_cache
+        if cache is None:
+            return None, None, None
+        try:
+            key = cache.get_key(stage, context)
+            if key is None:
+                return None, None, None
+            result = cache.replay(key, context)
+        except OSError as e:
+            logger.warning(
+                f"{ICONS['warning']} Stage cache unavailable for '{stage.name}': {e}"
+            )
+            return None, None, None
+
+        if result is not None:
+            logger.info(
+                f"{ICONS['check']} Stage '{stage.name}' inputs unchanged, replayed cached output"
+            )
+            span = current_span()
+            if span is not None:
+                span.attributes["cache"] = "hit"
+            return key, result, None
+        return key, None, cache.snapshot(context)
+
+    def _store_cache(
+        self,
+        key: str | None,
+        stage_name: str,
+        result: StageResult,
+        before: ContextSnapshot | None,
+        context: PipelineContext,
+    ) -> None:
+        """Cache a freshly executed stage's output (see _lookup_cache)."""
+        if key is None or before is None or context.stage_cache is None:
+            return
+        context.stage_cache.store(key, stage_name, result, before, context)
+
+    def _skip_resumed_stage(
+        self, stage_name: str, context: PipelineContext, logger: logging.Logger
+    ) -> StageResult:
+        """Result for a stage already completed by the resumed run."""
+        logger.info(
+            f"{ICONS['info']} Stage '{stage_name}' already completed in run '{context.run_id}', skipping"
+        )
+        return StageResult.skipped(
+            f"Stage '{stage_name}' already completed in run '{context.run_id}'"
+        )
+
+    def _save_checkpoint(
+        self, context: PipelineContext, logger: logging.Logger
+    ) -> None:
+        """Checkpoint the context if checkpointing is enabled for the run.
+
+        A checkpoint that cannot be written is logged but does not fail the
+        stage that just succeeded.
+        """
+        if context.checkpoint_store is None or not context.run_id:
+            return
+        try:
+            context.checkpoint_store.save(context)
+        except (OSError, PipelineError) as e:
+            logger.warning(
+                f"{ICONS['warning']} Could not checkpoint run '{context.run_id}': {e}"
+            )
+
     @property
     @abstractmethod
     def data_file(self) -> str:
@@ -225,3 +538,13 @@ class Pipeline(ABC):
             args: CLI arguments
         """
         pass
+
+
+def _record_stage_result(span: Span | None, result: StageResult) -> None:
+    """Store a stage's status and item count on its profiler span."""
+    if span is None:
+        return
+    span.attributes["status"] = result.status.value
+    stats = result.data.get("stats") if isinstance(result.data, dict) else None
+    if isinstance(stats, dict) and isinstance(stats.get("total"), int):
+        span.add(items=stats["total"])
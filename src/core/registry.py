@@ -1,11 +1,13 @@
 """Pipeline registry system for managing pipeline implementations."""
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from src.utils.logging_config import ICONS, get_logger
 
 from .exceptions import PipelineAlreadyRegisteredError, PipelineNotFoundError
-from .pipeline import Pipeline
+
+if TYPE_CHECKING:
+    from .pipeline import Pipeline
 
 
 class PipelineRegistry:
@@ -15,7 +17,7 @@ class PipelineRegistry:
         self._pipelines: dict[str, Pipeline] = {}
         self.logger = get_logger("core.registry")
 
-    def register(self, pipeline: Pipeline) -> None:
+    def register(self, pipeline: "Pipeline") -> None:
         """Register a pipeline."""
         self.logger.info(f"{ICONS['gear']} Registering pipeline '{pipeline.name}'")
 
@@ -32,7 +34,7 @@ class PipelineRegistry:
             f"{ICONS['check']} Pipeline '{pipeline.name}' registered successfully"
         )
 
-    def get(self, name: str) -> Pipeline:
+    def get(self, name: str) -> "Pipeline":
         """Get pipeline by name."""
         self.logger.debug(f"Retrieving pipeline '{name}'")
 
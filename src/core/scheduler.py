@@ -0,0 +1,392 @@
+"""Dependency-graph scheduling for pipeline phases."""
+
+import asyncio
+import contextvars
+import heapq
+import logging
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+from src.utils.logging_config import ICONS, get_logger
+
+from .exceptions import StageDependencyError
+from .stages import StageResult
+
+# Context key holding the PhaseReport of the last executed phase
+PHASE_REPORT_KEY = "phase_report"
+
+_T = TypeVar("_T")
+
+
+@dataclass
+class StageTiming:
+    """Wall-clock timing of one stage within a phase."""
+
+    name: str
+    status: str
+    start: float  # Seconds since the phase started
+    duration: float
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+
+@dataclass
+class PhaseReport:
+    """Per-stage timings and critical path of one phase execution."""
+
+    phase_name: str
+    max_workers: int
+    wall_time: float = 0.0
+    timings: list[StageTiming] = field(default_factory=list)
+    critical_path: list[str] = field(default_factory=list)
+    critical_path_time: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "phase_name": self.phase_name,
+            "max_workers": self.max_workers,
+            "wall_time": self.wall_time,
+            "timings": [
+                {
+                    "name": t.name,
+                    "status": t.status,
+                    "start": t.start,
+                    "duration": t.duration,
+                }
+                for t in self.timings
+            ],
+            "critical_path": self.critical_path,
+            "critical_path_time": self.critical_path_time,
+        }
+
+
+class StageGraph:
+    """Dependency graph of the stages in one phase.
+
+    Only dependencies on stages of the same phase are edges; dependencies on
+    stages outside the phase are expected to have run in an earlier phase.
+    """
+
+    def __init__(self, stage_names: list[str], dependencies: dict[str, list[str]]):
+        """Build the graph.
+
+        Args:
+            stage_names: Stages of the phase in declaration order
+            dependencies: Declared dependencies of each stage
+
+        Raises:
+            StageDependencyError: If the dependencies form a cycle
+        """
+        self.order = list(dict.fromkeys(stage_names))
+        self.index = {name: i for i, name in enumerate(self.order)}
+        self.dependencies = {
+            name: [
+                dep
+                for dep in dict.fromkeys(dependencies.get(name, []))
+                if dep in self.index and dep != name
+            ]
+            for name in self.order
+        }
+        self.dependents: dict[str, list[str]] = {name: [] for name in self.order}
+        for name in self.order:
+            for dep in self.dependencies[name]:
+                self.dependents[dep].append(name)
+        self._check_cycles()
+
+    def _check_cycles(self) -> None:
+        """Raise with the offending path (each stage depends on the next)."""
+        visiting: list[str] = []
+        done: set[str] = set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                cycle = visiting[visiting.index(name) :] + [name]
+                raise StageDependencyError(
+                    f"Stage dependency cycle: {' -> '.join(cycle)}"
+                )
+            visiting.append(name)
+            for dep in self.dependencies[name]:
+                visit(dep)
+            visiting.pop()
+            done.add(name)
+
+        for name in self.order:
+            visit(name)
+
+    def topological_order(self) -> list[str]:
+        """Stages in dependency order, ties broken by declaration order."""
+        remaining = {name: len(deps) for name, deps in self.dependencies.items()}
+        ready = [self.index[name] for name, count in remaining.items() if not count]
+        heapq.heapify(ready)
+        order: list[str] = []
+        while ready:
+            name = self.order[heapq.heappop(ready)]
+            order.append(name)
+            for dependent in self.dependents[name]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    heapq.heappush(ready, self.index[dependent])
+        return order
+
+    def critical_path(self, durations: dict[str, float]) -> tuple[list[str], float]:
+        """Longest chain of dependent stages by measured duration.
+
+        Args:
+            durations: Wall time of each executed stage (others count as 0)
+
+        Returns:
+            Stage names along the path and their total duration
+        """
+        finish: dict[str, float] = {}
+        previous: dict[str, str | None] = {}
+        for name in self.topological_order():
+            before = max(
+                self.dependencies[name], key=lambda dep: finish[dep], default=None
+            )
+            previous[name] = before
+            finish[name] = durations.get(name, 0.0) + (
+                finish[before] if before else 0.0
+            )
+
+        executed = [name for name in self.order if name in durations]
+        if not executed:
+            return [], 0.0
+        last: str | None = max(executed, key=lambda name: finish[name])
+        total = finish[last] if last else 0.0
+        path: list[str] = []
+        while last is not None:
+            path.append(last)
+            last = previous[last]
+        return path[::-1], total
+
+    def report(
+        self,
+        phase_name: str,
+        max_workers: int,
+        timings: list[StageTiming],
+        wall_time: float,
+    ) -> PhaseReport:
+        """Build a phase report, with timings in declaration order."""
+        timings = sorted(timings, key=lambda t: self.index.get(t.name, len(self.order)))
+        path, path_time = self.critical_path({t.name: t.duration for t in timings})
+        return PhaseReport(
+            phase_name=phase_name,
+            max_workers=max_workers,
+            wall_time=wall_time,
+            timings=timings,
+            critical_path=path,
+            critical_path_time=path_time,
+        )
+
+
+class _PhaseRun:
+    """Ready queue, results and timings of one scheduled phase execution."""
+
+    def __init__(self, graph: StageGraph, logger: logging.Logger):
+        self.graph = graph
+        self.logger = logger
+        self.remaining = {name: len(deps) for name, deps in graph.dependencies.items()}
+        self.ready = [
+            graph.index[name] for name, count in self.remaining.items() if not count
+        ]
+        heapq.heapify(self.ready)
+        self.results: dict[str, StageResult] = {}
+        self.timings: list[StageTiming] = []
+        self.failed = False
+        self.start = time.perf_counter()
+
+    def can_start(self, running: int, max_workers: int) -> bool:
+        return bool(self.ready) and not self.failed and running < max_workers
+
+    def pop_ready(self) -> str:
+        """Earliest declared stage whose dependencies have all finished."""
+        return self.graph.order[heapq.heappop(self.ready)]
+
+    def finish(
+        self,
+        name: str,
+        result: StageResult,
+        start: float,
+        duration: float,
+    ) -> None:
+        """Record a finished stage and release its dependents on success."""
+        self.results[name] = result
+        self.timings.append(StageTiming(name, result.status.value, start, duration))
+        if result.status.value not in ["success", "partial", "skipped"]:
+            if not self.failed:
+                self.logger.error(
+                    f"{ICONS['cross']} Stage '{name}' failed, "
+                    "not starting further stages"
+                )
+            self.failed = True
+            return
+        for dependent in self.graph.dependents[name]:
+            self.remaining[dependent] -= 1
+            if not self.remaining[dependent]:
+                heapq.heappush(self.ready, self.graph.index[dependent])
+
+    def outcome(
+        self, phase_name: str, max_workers: int
+    ) -> tuple[list[StageResult], PhaseReport]:
+        """Results in declaration order and the phase report."""
+        report = self.graph.report(
+            phase_name,
+            max_workers,
+            self.timings,
+            time.perf_counter() - self.start,
+        )
+        ordered = [
+            self.results[name] for name in self.graph.order if name in self.results
+        ]
+        return ordered, report
+
+
+class PhaseScheduler:
+    """Run the stages of a phase concurrently as their dependencies finish."""
+
+    def __init__(self, max_workers: int = 1):
+        """Initialize scheduler.
+
+        Args:
+            max_workers: Stages allowed to run at the same time
+
+        Raises:
+            ValueError: If max_workers is not positive
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        self.max_workers = max_workers
+        self.logger = get_logger("core.scheduler")
+
+    def run(
+        self,
+        phase_name: str,
+        graph: StageGraph,
+        execute: Callable[[str], StageResult],
+    ) -> tuple[list[StageResult], PhaseReport]:
+        """Execute every stage of a graph.
+
+        A stage starts once all of its dependencies finished with success,
+        partial or skipped status; among ready stages, earlier declared ones start first.
+        After a failure no further stages are started (fail-fast), but stages
+        already running are allowed to finish.
+
+        Args:
+            phase_name: Phase being executed (for the report)
+            graph: Stage dependency graph
+            execute: Runs one stage by name
+
+        Returns:
+            Results of the executed stages in declaration order, and the
+            phase report
+        """
+        phase = _PhaseRun(graph, self.logger)
+
+        def timed(name: str) -> tuple[StageResult, float, float]:
+            start = time.perf_counter()
+            try:
+                result = execute(name)
+            except Exception as e:
+                result = StageResult.failure(
+                    f"Unexpected error in stage '{name}': {str(e)}"
+                )
+            return result, start - phase.start, time.perf_counter() - start
+
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix=f"phase-{phase_name}"
+        ) as pool:
+            running: dict[Future, str] = {}
+            while phase.ready or running:
+                while phase.can_start(len(running), self.max_workers):
+                    name = phase.pop_ready()
+                    self.logger.debug(f"Starting stage '{name}'")
+                    # Each stage thread inherits the caller's profiler span
+                    running[
+                        pool.submit(contextvars.copy_context().run, timed, name)
+                    ] = name
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    phase.finish(running.pop(future), *future.result())
+
+        return phase.outcome(phase_name, self.max_workers)
+
+    async def run_async(
+        self,
+        phase_name: str,
+        graph: StageGraph,
+        execute: Callable[[str], Awaitable[StageResult]],
+    ) -> tuple[list[StageResult], PhaseReport]:
+        """Execute every stage of a graph as tasks on the running event loop.
+
+        Ordering, fail-fast and results are the same as for run().
+
+        Args:
+            phase_name: Phase being executed (for the report)
+            graph: Stage dependency graph
+            execute: Coroutine function running one stage by name
+
+        Returns:
+            Results of the executed stages in declaration order, and the
+            phase report
+        """
+        phase = _PhaseRun(graph, self.logger)
+
+        async def timed(name: str) -> tuple[StageResult, float, float]:
+            start = time.perf_counter()
+            try:
+                result = await execute(name)
+            except Exception as e:
+                result = StageResult.failure(
+                    f"Unexpected error in stage '{name}': {str(e)}"
+                )
+            return result, start - phase.start, time.perf_counter() - start
+
+        running: dict[asyncio.Task, str] = {}
+        while phase.ready or running:
+            while phase.can_start(len(running), self.max_workers):
+                name = phase.pop_ready()
+                self.logger.debug(f"Starting stage '{name}'")
+                running[asyncio.create_task(timed(name), name=name)] = name
+            if not running:
+                break
+
+            finished, _ = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in finished:
+                phase.finish(running.pop(task), *task.result())
+
+        return phase.outcome(phase_name, self.max_workers)
+
+
+def run_event_loop(main: Coroutine[Any, Any, _T], max_threads: int | None = None) -> _T:
+    """Run a coroutine on a new event loop.
+
+    Args:
+        main: Coroutine to run, e.g. Pipeline.execute_phase_async(...)
+        max_threads: Size of the loop's default executor, which runs sync
+            stages and asyncio.to_thread calls (defaults to asyncio's own)
+
+    Returns:
+        The coroutine's result
+    """
+    if max_threads is None:
+        return asyncio.run(main)
+
+    async def with_executor() -> _T:
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=max_threads, thread_name_prefix="async")
+        )
+        return await main
+
+    return asyncio.run(with_executor())
@@ -0,0 +1,295 @@
+"""Content-addressed cache of stage outputs keyed by input fingerprints."""
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from src.utils.logging_config import ICONS, get_logger
+
+from .stages import Stage, StageResult, StageStatus
+
+if TYPE_CHECKING:
+    from .context import PipelineContext
+
+CACHE_FORMAT_VERSION = 1
+
+# Default cache directory, relative to the project root
+DEFAULT_CACHE_DIR = ".cache/stages"
+DEFAULT_CACHE_MAX_MB = 256
+
+FILE_HASH_MODES = ("mtime", "content")
+
+# Context keys holding live objects; never fingerprinted, diffed or replayed
+UNCACHED_KEYS = frozenset({"providers"})
+
+# Encoded context values captured before a stage runs (key -> JSON or None)
+ContextSnapshot = dict[str, str | None]
+
+
+def _encode(value: Any) -> str | None:
+    """Canonical JSON of a value, or None if json cannot encode it."""
+    try:
+        return json.dumps(value, sort_keys=True, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters of one StageCache."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+
+class StageCache:
+    """On-disk stage output cache with least-recently-used size eviction.
+
+    A stage takes part by declaring ``cache_inputs`` (context keys it reads)
+    and optionally ``get_cache_files()``. Its fingerprint hashes the stage's
+    identity and ``cache_version``, the pipeline config, the declared keys'
+    values and each file's size and mtime (or content). A successful run is
+    stored with its result data and the context keys it set or deleted; a
+    later run with the same fingerprint replays both instead of executing.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_CACHE_MAX_MB * 1024 * 1024,
+        file_hash: str = "mtime",
+    ):
+        """Initialize cache.
+
+        Args:
+            directory: Directory holding cache entries (created on store)
+            max_bytes: Total entry size kept after eviction
+            file_hash: "mtime" (size + mtime) or "content" (SHA-256 of bytes)
+
+        Raises:
+            ValueError: If file_hash is not a known mode
+        """
+        if file_hash not in FILE_HASH_MODES:
+            raise ValueError(
+                f"Invalid file_hash '{file_hash}', expected one of {FILE_HASH_MODES}"
+            )
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.file_hash = file_hash
+        self.stats = CacheStats()
+        self.logger = get_logger("core.stage_cache")
+        self._lock = threading.Lock()
+
+    def get_key(self, stage: Stage, context: "PipelineContext") -> str | None:
+        """Fingerprint of a stage's inputs.
+
+        Returns:
+            Hex digest, or None if the stage does not declare cache inputs or
+            one of its inputs cannot be encoded
+        """
+        input_keys = stage.cache_inputs
+        if input_keys is None:
+            return None
+
+        inputs: dict[str, Any] = {}
+        for key in sorted(set(input_keys) - UNCACHED_KEYS):
+            encoded = _encode(context.data.get(key))
+            if encoded is None:
+                self.logger.debug(
+                    f"Stage '{stage.name}' not cached: input '{key}' is not serializable"
+                )
+                return None
+            inputs[key] = encoded
+
+        config = _encode(context.config)
+        if config is None:
+            return None
+
+        files = [
+            self._fingerprint_file(context.project_root / path)
+            for path in stage.get_cache_files(context)
+        ]
+        material = {
+            "format": CACHE_FORMAT_VERSION,
+            "pipeline": context.pipeline_name,
+            "stage": stage.name,
+            "class": f"{type(stage).__module__}.{type(stage).__qualname__}",
+            "version": stage.cache_version,
+            "config": config,
+            "inputs": inputs,
+            "files": files,
+        }
+        return hashlib.sha256(
+            json.dumps(material, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _fingerprint_file(self, path: Path) -> list[Any]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return [str(path), None]
+        if self.file_hash == "mtime":
+            return [str(path), stat.st_size, stat.st_mtime_ns]
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+        return [str(path), stat.st_size, digest.hexdigest()]
+
+    def get_path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def snapshot(self, context: "PipelineContext") -> ContextSnapshot:
+        """Encode the context data, to diff against after the stage runs."""
+        return {
+            key: _encode(value)
+            for key, value in list(context.data.items())
+            if key not in UNCACHED_KEYS
+        }
+
+    def replay(self, key: str, context: "PipelineContext") -> StageResult | None:
+        """Apply a cached entry to the context.
+
+        Args:
+            key: Fingerprint from get_key()
+            context: Context to receive the cached mutations
+
+        Returns:
+            The cached result on a hit, None on a miss
+        """
+        path = self.get_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+            result = StageResult(
+                status=StageStatus(entry["status"]),
+                message=entry["message"],
+                data=entry["data"],
+                errors=entry["errors"],
+            )
+            set_keys = entry["context_set"]
+            deleted_keys = entry["context_deleted"]
+        except (OSError, KeyError, TypeError, ValueError):
+            with self._lock:
+                self.stats.misses += 1
+            return None
+
+        for context_key, value in set_keys.items():
+            context.set(context_key, value)
+        for context_key in deleted_keys:
+            context.data.pop(context_key, None)
+
+        # Refresh the entry's mtime, which orders eviction
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        with self._lock:
+            self.stats.hits += 1
+        return result
+
+    def store(
+        self,
+        key: str,
+        stage_name: str,
+        result: StageResult,
+        before: ContextSnapshot,
+        context: "PipelineContext",
+    ) -> bool:
+        """Cache a successful result and the context changes since before.
+
+        Args:
+            key: Fingerprint from get_key()
+            stage_name: Stage that produced the result
+            result: Stage result (only successes are cached)
+            before: Snapshot taken before the stage ran
+            context: Context after the stage ran
+
+        Returns:
+            True if an entry was written
+        """
+        if result.status != StageStatus.SUCCESS:
+            return False
+
+        after = self.snapshot(context)
+        changed = [k for k, encoded in after.items() if before.get(k, "") != encoded]
+        if any(after[k] is None for k in changed):
+            self.logger.debug(
+                f"Stage '{stage_name}' not cached: it set non-serializable context data"
+            )
+            return False
+        entry = {
+            "stage": stage_name,
+            "created": datetime.now().isoformat(),
+            "status": result.status.value,
+            "message": result.message,
+            "data": result.data,
+            "errors": result.errors,
+            "context_set": {k: context.data[k] for k in changed},
+            "context_deleted": [k for k in before if k not in after],
+        }
+        encoded = _encode(entry)
+        if encoded is None:
+            self.logger.debug(
+                f"Stage '{stage_name}' not cached: result data is not serializable"
+            )
+            return False
+
+        path = self.get_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            temp_path.write_text(encoded, encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError as e:
+            self.logger.warning(
+                f"{ICONS['warning']} Could not cache stage '{stage_name}': {e}"
+            )
+            return False
+
+        with self._lock:
+            self.stats.stores += 1
+            self._evict()
+        return True
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under max_bytes."""
+        entries = []
+        total = 0
+        for path in self.directory.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+            total += stat.st_size
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+        self.logger.debug(f"Stage cache evicted down to {total} bytes")
+
+    def get_size(self) -> int:
+        """Total bytes of cached entries."""
+        return sum(path.stat().st_size for path in self.directory.glob("*/*.json"))
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        for path in self.directory.glob("*/*.json"):
+            path.unlink(missing_ok=True)
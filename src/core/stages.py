@@ -1,9 +1,11 @@
 """Stage base classes and interfaces for pipeline execution."""
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -137,6 +139,14 @@ class Stage(ABC):
             )
             raise
 
+    async def execute_async(self, context: "PipelineContext") -> StageResult:
+        """Execute this stage from an event loop.
+
+        Synchronous stages run in a worker thread so they do not block other
+        stages awaiting on the same loop.
+        """
+        return await asyncio.to_thread(self.execute, context)
+
     @abstractmethod
     def _execute_impl(self, context: "PipelineContext") -> StageResult:
         """Actual stage implementation to be overridden by subclasses."""
@@ -150,3 +160,77 @@ class Stage(ABC):
     def validate_context(self, context: "PipelineContext") -> list[str]:
         """Validate context has required data. Return list of errors."""
         return []
+
+    @property
+    def cache_inputs(self) -> list[str] | None:
+        """Context keys this stage reads, making its output cacheable.
+
+        None (the default) keeps the stage out of the stage output cache.
+        Only declare inputs for stages whose effects are their result data
+        and context changes, since cache hits skip execution entirely.
+        """
+        return None
+
+    def get_cache_files(self, context: "PipelineContext") -> list[Path]:
+        """Files this stage reads, relative to the project root."""
+        return []
+
+    @property
+    def cache_version(self) -> str:
+        """Bump to invalidate cached outputs after changing the stage."""
+        return "1"
+
+
+class AsyncStage(Stage):
+    """Base class for stages implemented as coroutines.
+
+    Subclasses implement ``async _execute_impl`` and can await many provider
+    calls at once. Run through Pipeline.execute_phase_async they share the
+    phase's event loop; the synchronous execute() runs them on a new loop and
+    therefore must not be called from a running loop.
+    """
+
+    def execute(self, context: "PipelineContext") -> StageResult:
+        """Execute this stage on a new event loop."""
+        return asyncio.run(self.execute_async(context))
+
+    async def execute_async(self, context: "PipelineContext") -> StageResult:
+        """Execute this stage on the running event loop."""
+        self.logger.info(f"{ICONS['gear']} Executing stage '{self.name}'")
+
+        validation_errors = self.validate_context(context)
+        if validation_errors:
+            self.logger.error(
+                f"{ICONS['cross']} Stage '{self.name}' validation failed: {validation_errors}"
+            )
+            return StageResult.failure("Context validation failed", validation_errors)
+
+        start_time = time.time()
+
+        try:
+            result = await self._execute_impl(context)
+            duration = time.time() - start_time
+
+            if result.success:
+                self.logger.info(
+                    f"{ICONS['check']} Stage '{self.name}' completed",
+                    extra={"duration": duration},
+                )
+            else:
+                self.logger.error(
+                    f"{ICONS['cross']} Stage '{self.name}' failed: {result.message}"
+                )
+
+            return result
+        except Exception as e:
+            duration = time.time() - start_time
+            self.logger.error(
+                f"{ICONS['cross']} Stage '{self.name}' error: {e}",
+                extra={"duration": duration},
+            )
+            raise
+
+    @abstractmethod
+    async def _execute_impl(self, context: "PipelineContext") -> StageResult:  # type: ignore[override]
+        """Actual stage implementation to be overridden by subclasses."""
+        pass
@@ -0,0 +1 @@
+"""Vocabulary pipeline components."""
@@ -0,0 +1 @@
+"""Vocabulary pipeline stages."""
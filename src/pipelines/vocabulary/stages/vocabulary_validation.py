@@ -0,0 +1,101 @@
+"""
+Vocabulary Validation Stage
+
+Checks every meaning in vocabulary.json against the configured
+``validation.vocabulary_schema.meaning_entry.required_fields`` and
+``validation.field_patterns``. Meanings are validated on a process pool;
+each worker compiles the pattern table once.
+"""
+
+import re
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from src.core.context import PipelineContext
+from src.providers.base.data_provider import DataProvider
+from src.stages.base.process_stage import (
+    DEFAULT_CHUNK_SIZE,
+    ProcessStage,
+    ResourceLoader,
+    worker_resource,
+)
+
+VOCABULARY_PROVIDER = "vocabulary_data"
+VOCABULARY_ID = "vocabulary"
+
+
+def compile_field_patterns(patterns: dict[str, str]) -> dict[str, re.Pattern[str]]:
+    """Compile field name -> regex pattern strings"""
+    return {field: re.compile(pattern) for field, pattern in patterns.items()}
+
+
+def validate_meaning(meaning: dict[str, Any]) -> str | None:
+    """Validate one meaning entry in a worker
+
+    Returns:
+        The meaning's CardID
+
+    Raises:
+        ValueError: Listing every missing field and pattern mismatch
+    """
+    patterns: dict[str, re.Pattern[str]] = worker_resource("field_patterns")
+    required: frozenset[str] = worker_resource("required_fields")
+
+    issues = [f"missing {field}" for field in sorted(required - meaning.keys())]
+    for field, pattern in patterns.items():
+        value = meaning.get(field)
+        if isinstance(value, str) and value and not pattern.match(value):
+            issues.append(f"{field} '{value}' does not match {pattern.pattern}")
+    if issues:
+        raise ValueError("; ".join(issues))
+    return meaning.get("CardID")
+
+
+class VocabularyValidationStage(ProcessStage):
+    """Validate vocabulary.json meanings against the configured schema"""
+
+    def __init__(
+        self, workers: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        super().__init__(workers, chunk_size, output_key="validated_card_ids")
+
+    @property
+    def name(self) -> str:
+        return "validate_vocabulary"
+
+    @property
+    def display_name(self) -> str:
+        return "Validate Vocabulary"
+
+    def validate_context(self, context: PipelineContext) -> list[str]:
+        if self._provider(context) is None:
+            return [f"{VOCABULARY_PROVIDER} provider not configured"]
+        return []
+
+    def iter_items(self, context: PipelineContext) -> Iterator[dict[str, Any]]:
+        provider = self._provider(context)
+        vocabulary = provider.load_data(VOCABULARY_ID) if provider else {}
+        for word_data in (vocabulary.get("words") or {}).values():
+            yield from word_data.get("meanings") or []
+
+    def item_function(self, context: PipelineContext) -> Callable[[Any], Any]:
+        return validate_meaning
+
+    def worker_resources(self, context: PipelineContext) -> dict[str, ResourceLoader]:
+        validation = context.config.get("validation", {})
+        schema = validation.get("vocabulary_schema", {}).get("meaning_entry", {})
+        return {
+            "field_patterns": (
+                compile_field_patterns,
+                (validation.get("field_patterns", {}),),
+            ),
+            "required_fields": (frozenset, (schema.get("required_fields", []),)),
+        }
+
+    def item_label(self, item: Any) -> str:
+        return str(item.get("CardID") or "<no CardID>")
+
+    def _provider(self, context: PipelineContext) -> DataProvider | None:
+        providers = context.get("providers", {}) or {}
+        data_providers: dict[str, DataProvider] = providers.get("data", {}) or {}
+        return data_providers.get(VOCABULARY_PROVIDER)
@@ -0,0 +1,25 @@
+"""
+Word Processing (Stage 2)
+
+Components turning dictionary data for selected words into word queue
+entries: sense grouping, IPA selection and card generation.
+"""
+
+from .card_generator import CardGenerator, generate_card_id, generate_meaning_id
+from .ipa_selector import ACCENT_PROFILES, BOGOTA, AccentProfile, IPASelector
+from .sense_processor import SenseGroup, SenseGroupingResult, SenseProcessor
+from .word_processing_stage import WordProcessingStage
+
+__all__ = [
+    "ACCENT_PROFILES",
+    "BOGOTA",
+    "AccentProfile",
+    "CardGenerator",
+    "IPASelector",
+    "SenseGroup",
+    "SenseGroupingResult",
+    "SenseProcessor",
+    "WordProcessingStage",
+    "generate_card_id",
+    "generate_meaning_id",
+]
@@ -0,0 +1,132 @@
+"""
+Card Generator
+
+Builds word queue entries from grouped senses and filters CardIDs that
+already exist in vocabulary.json or the word queue (see
+stage2_technical_implementation.md, section 3).
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+from .sense_processor import SenseGroup
+
+GAP = "_____"
+
+
+def generate_meaning_id(translations: Iterable[str]) -> str:
+    """MeaningID: translations lowercased, commas removed, spaces as underscores"""
+    joined = ", ".join(translations).lower().replace(",", "")
+    return "_".join(joined.split())
+
+
+def generate_card_id(word: str, meaning_id: str) -> str:
+    """CardID: spanish word and meaning id joined by an underscore"""
+    return f"{word}_{meaning_id}"
+
+
+def gap_sentence(text: str, offsets: Any) -> str:
+    """Replace the bold spans of an example sentence with a gap
+
+    Args:
+        text: Example sentence
+        offsets: ``bold_text_offsets`` pairs of [start, end] character offsets
+
+    Returns:
+        Sentence with each valid span replaced by ``_____``
+    """
+    spans = []
+    for pair in offsets if isinstance(offsets, list) else []:
+        if (
+            isinstance(pair, list)
+            and len(pair) == 2
+            and isinstance(pair[0], int)
+            and isinstance(pair[1], int)
+            and 0 <= pair[0] < pair[1]
+        ):
+            spans.append((pair[0], pair[1]))
+    spans.sort()
+
+    parts = []
+    position = 0
+    for start, end in spans:
+        if start < position or end > len(text):
+            continue
+        parts.append(text[position:start])
+        parts.append(GAP)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def collect_card_ids(vocabulary: dict[str, Any], queue: dict[str, Any]) -> set[str]:
+    """CardIDs present in vocabulary.json and word_queue.json data"""
+    card_ids: set[str] = set()
+    for word_data in (vocabulary.get("words") or {}).values():
+        for meaning in word_data.get("meanings") or []:
+            if meaning.get("CardID"):
+                card_ids.add(meaning["CardID"])
+    for entry in queue.get("queue") or []:
+        if entry.get("CardID"):
+            card_ids.add(entry["CardID"])
+    return card_ids
+
+
+class CardGenerator:
+    """Create queue entries for new CardIDs"""
+
+    def __init__(self, existing_card_ids: set[str] | None = None):
+        """Initialize generator
+
+        Args:
+            existing_card_ids: CardIDs already in vocabulary.json or the queue
+        """
+        self.card_ids = set(existing_card_ids or ())
+
+    def build_entry(
+        self, word: str, record: dict[str, Any], group: SenseGroup, ipa: str
+    ) -> dict[str, Any] | None:
+        """Build the queue entry for one sense group
+
+        Args:
+            word: Headword
+            record: Projected dictionary record the group was formed from
+            group: Sense group to turn into a card
+            ipa: Selected pronunciation
+
+        Returns:
+            Queue entry, or None when its CardID already exists
+        """
+        meaning_id = generate_meaning_id(group.translations)
+        card_id = generate_card_id(word, meaning_id)
+        if card_id in self.card_ids:
+            return None
+        self.card_ids.add(card_id)
+
+        sense: dict[str, Any] = next(
+            (
+                sense
+                for sense in record.get("senses") or []
+                if sense.get("sense_index") == group.selected_sense
+            ),
+            {},
+        )
+        example = sense.get("example") or {}
+        text = example.get("text", "")
+        return {
+            "CardID": card_id,
+            "SpanishWord": word,
+            "MeaningID": meaning_id,
+            "Translations": group.meaning,
+            "MonolingualDef": "; ".join(sense.get("glosses") or []),
+            "ExampleSentence": text,
+            "GappedSentence": gap_sentence(text, example.get("bold_text_offsets")),
+            "IPA": ipa,
+            "Type": record.get("pos") or "",
+            "Gender": (record.get("gender") or [""])[0],
+            "SenseID": sense.get("id") or "",
+            "ImageFile": f"{card_id}.png",
+            "WordAudio": f"{word}.mp3",
+            "Prompt": "",
+            "status": "pending_prompts",
+        }
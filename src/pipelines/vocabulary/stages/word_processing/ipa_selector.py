@@ -0,0 +1,292 @@
+"""
+IPA Selector
+
+Chooses the pronunciation that best matches a target accent from the
+``sounds`` of dictionary entries (see stage2_technical_implementation.md,
+section 4).
+
+Only a few dozen distinct ``raw_tags`` combinations occur in Español.jsonl
+(IPA_tags.md), so each accent profile is compiled once into a frozen
+table of normalized tag tuple -> score. Selectors memoize raw ``raw_tags``
+values to their score, so repeated combinations are never parsed again.
+"""
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any
+
+from src.utils.logging_config import ICONS, get_logger
+
+# IPA scores for an upper-class Bogotá accent (see stage 2 design doc)
+SHEISTA_TAGS = frozenset({"sheísta", "zheísta"})
+NO_SESEANTE_SCORE = -2
+SHEISTA_SCORE = -5
+UNTAGGED_SCORE = 4
+
+# raw_tags combinations documented in IPA_tags.md, normalized and sorted
+KNOWN_TAG_COMBINATIONS: tuple[tuple[str, ...], ...] = (
+    (),
+    ("no seseante",),
+    ("seseante",),
+    ("sheísta",),
+    ("zheísta",),
+    ("yeísta",),
+    ("no yeísta",),
+    ("no sheísta",),
+    ("seseante", "sheísta"),
+    ("seseante", "zheísta"),
+    ("no seseante", "no yeísta"),
+    ("no seseante", "yeísta"),
+    ("no yeísta", "seseante"),
+    ("seseante", "yeísta"),
+)
+
+
+def normalize_raw_tags(raw_tags: Any) -> tuple[str, ...]:
+    """Split and normalize pronunciation raw_tags
+
+    raw_tags are usually a list of strings, but single strings may hold
+    several comma-joined tags (e.g. "no seseante, no yeísta").
+
+    Args:
+        raw_tags: raw_tags value from a sounds entry
+
+    Returns:
+        Tuple of lowercase, stripped tags
+    """
+    if isinstance(raw_tags, str):
+        raw_tags = [raw_tags]
+    if not isinstance(raw_tags, list):
+        return ()
+
+    tags: list[str] = []
+    for raw in raw_tags:
+        if isinstance(raw, str):
+            tags.extend(tag.strip().lower() for tag in raw.split(",") if tag.strip())
+    return tuple(tags)
+
+
+def score_pronunciation(tags: tuple[str, ...]) -> int:
+    """Score a pronunciation for the Bogotá accent by its normalized raw_tags
+
+    Returns:
+        10 seseante+yeísta, 8 seseante, 6 yeísta, 4 untagged,
+        -2 no seseante, -5 sheísta/zheísta
+    """
+    tag_set = set(tags)
+    if tag_set & SHEISTA_TAGS:
+        return SHEISTA_SCORE
+    if "no seseante" in tag_set:
+        return NO_SESEANTE_SCORE
+    seseante = "seseante" in tag_set
+    yeista = "yeísta" in tag_set
+    if seseante and yeista:
+        return 10
+    if seseante:
+        return 8
+    if yeista:
+        return 6
+    return UNTAGGED_SCORE
+
+
+@dataclass(frozen=True)
+class AccentProfile:
+    """Scoring rule for a target accent
+
+    Attributes:
+        name: Profile identifier
+        scorer: Score for a normalized, sorted tag tuple
+        min_score: Lowest score a pronunciation may have to be selected
+    """
+
+    name: str
+    scorer: Callable[[tuple[str, ...]], int]
+    min_score: int = 1
+
+    def score_raw_tags(self, raw_tags: Any) -> tuple[int, tuple[str, ...]]:
+        """Score and normalized tags of a raw_tags value
+
+        Used as the dictionary projection's pronunciation scorer, e.g.
+        ``JSONLDataProvider(path, pronunciation_scorer=BOGOTA.score_raw_tags)``.
+        """
+        tags = normalize_raw_tags(raw_tags)
+        return self.scorer(tags), tags
+
+
+BOGOTA = AccentProfile(name="bogota", scorer=score_pronunciation)
+
+ACCENT_PROFILES: dict[str, AccentProfile] = {BOGOTA.name: BOGOTA}
+
+# Compiled tables are shared by every selector using an equal profile
+_compiled_tables: dict[AccentProfile, Mapping[tuple[str, ...], int]] = {}
+
+
+def compile_profile(profile: AccentProfile) -> Mapping[tuple[str, ...], int]:
+    """Precompute scores for every known tag combination
+
+    Args:
+        profile: Accent profile to compile
+
+    Returns:
+        Read-only mapping of normalized tag tuple to score
+    """
+    table = _compiled_tables.get(profile)
+    if table is None:
+        table = MappingProxyType(
+            {tags: profile.scorer(tags) for tags in KNOWN_TAG_COMBINATIONS}
+        )
+        _compiled_tables[profile] = table
+    return table
+
+
+class IPASelector:
+    """Select the best IPA transcription for an accent profile"""
+
+    def __init__(self, profile: AccentProfile | str = BOGOTA):
+        """Initialize selector
+
+        Args:
+            profile: AccentProfile or name of a registered profile
+
+        Raises:
+            ValueError: If the profile name is not registered
+        """
+        if isinstance(profile, str):
+            if profile not in ACCENT_PROFILES:
+                raise ValueError(
+                    f"Unknown accent profile: {profile}. "
+                    f"Available profiles: {list(ACCENT_PROFILES.keys())}"
+                )
+            profile = ACCENT_PROFILES[profile]
+        self.profile = profile
+        self.table = compile_profile(profile)
+        self.logger = get_logger("pipelines.vocabulary.ipa_selector")
+        # raw_tags exactly as stored in the entry -> score
+        self._memo: dict[tuple[Any, ...], int] = {}
+
+    def score(self, raw_tags: Any) -> int:
+        """Score a raw_tags value (list, comma-joined string or missing)"""
+        if isinstance(raw_tags, list | tuple):
+            key = tuple(raw_tags)
+        elif isinstance(raw_tags, str):
+            key = (raw_tags,)
+        else:
+            key = ()
+        try:
+            score = self._memo.get(key)
+        except TypeError:
+            # Unhashable tag values; treat as malformed and score uncached
+            return self._score_normalized(normalize_raw_tags(raw_tags))
+        if score is None:
+            score = self._score_normalized(normalize_raw_tags(raw_tags))
+            self._memo[key] = score
+        return score
+
+    def _score_normalized(self, tags: tuple[str, ...]) -> int:
+        key = tuple(sorted(tags))
+        score = self.table.get(key)
+        if score is None:
+            # Combination not seen in the survey; score it with the profile rule
+            self.logger.debug(f"Unlisted raw_tags combination {key}")
+            score = self.profile.scorer(key)
+        return score
+
+    def select_best_ipa(self, sounds: Any, word: str = "") -> str | None:
+        """Select the best pronunciation from an entry's sounds
+
+        Highest score wins, ties keep the first occurrence. When nothing
+        reaches the profile's minimum score an untagged IPA is used instead.
+
+        Args:
+            sounds: ``sounds`` list of a raw dictionary entry
+            word: Headword, used in log messages
+
+        Returns:
+            Selected IPA string, or None when no usable IPA exists
+        """
+        if not isinstance(sounds, list) or not sounds:
+            self.logger.error(f"{ICONS['cross']} {word}: sounds missing or empty")
+            return None
+
+        best: str | None = None
+        best_score = 0
+        untagged: str | None = None
+        for sound in sounds:
+            if not isinstance(sound, dict):
+                continue
+            ipa = sound.get("ipa")
+            if not isinstance(ipa, str) or not ipa:
+                continue
+            raw_tags = sound.get("raw_tags")
+            if untagged is None and not raw_tags:
+                untagged = ipa
+            score = self.score(raw_tags)
+            if best is None or score > best_score:
+                best, best_score = ipa, score
+
+        return self._resolve(best, best_score, untagged, word)
+
+    def select_from_candidates(
+        self, candidates: list[list[Any]], word: str = ""
+    ) -> str | None:
+        """Select from projected ``[ipa, score, tags]`` candidates
+
+        Candidates from the projection sidecar carry normalized tags, so they
+        are rescored for this selector's profile without re-reading sounds.
+        """
+        best: str | None = None
+        best_score = 0
+        untagged: str | None = None
+        for ipa, _, tags in candidates:
+            if untagged is None and not tags:
+                untagged = ipa
+            score = self.score(tags)
+            if best is None or score > best_score:
+                best, best_score = ipa, score
+
+        return self._resolve(best, best_score, untagged, word)
+
+    def select_batch(
+        self, entries: Mapping[str, Any] | Iterable[tuple[str, Any]]
+    ) -> dict[str, str | None]:
+        """Select pronunciations for many words in one pass
+
+        Args:
+            entries: Mapping (or pairs) of word to a raw entry with ``sounds``,
+                a projection record with ``ipa`` candidates, or a bare
+                ``sounds`` list
+
+        Returns:
+            Mapping of word to selected IPA (None when unavailable)
+        """
+        items = entries.items() if isinstance(entries, Mapping) else entries
+        selected: dict[str, str | None] = {}
+        for word, entry in items:
+            if isinstance(entry, dict) and "ipa" in entry and "sounds" not in entry:
+                selected[word] = self.select_from_candidates(entry["ipa"], word)
+            elif isinstance(entry, dict):
+                selected[word] = self.select_best_ipa(entry.get("sounds"), word)
+            else:
+                selected[word] = self.select_best_ipa(entry, word)
+        return selected
+
+    def _resolve(
+        self, best: str | None, best_score: int, untagged: str | None, word: str
+    ) -> str | None:
+        """Apply the minimum score and untagged fallback"""
+        if best is None:
+            self.logger.error(f"{ICONS['cross']} {word}: no valid IPA pronunciations")
+            return None
+        if best_score >= self.profile.min_score:
+            return best
+        if untagged is not None:
+            self.logger.warning(
+                f"{ICONS['warning']} {word}: no {self.profile.name} pronunciation, "
+                "using untagged IPA"
+            )
+            return untagged
+        self.logger.warning(
+            f"{ICONS['warning']} {word}: no pronunciation reaches the minimum score"
+        )
+        return None
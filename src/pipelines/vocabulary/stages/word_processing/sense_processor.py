@@ -0,0 +1,170 @@
+"""
+Sense Processor
+
+Groups dictionary senses by their English translations and keeps one sense
+per unique meaning (see stage2_technical_implementation.md, section 1).
+
+Translations are interned to small integer IDs per word so each group is a
+bitmask. Identical translation sets collapse to the same mask, and a group
+is a subset of another exactly when ``mask & other == mask``. Groups are
+checked in descending popcount order, so each mask is only compared with
+the larger groups already kept.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.utils.logging_config import ICONS, get_logger
+
+
+@dataclass
+class SenseGroup:
+    """Senses sharing one normalized translation set"""
+
+    translations: tuple[str, ...]
+    sense_indexes: list[str]
+    selected_sense: str
+    has_example: bool
+
+    @property
+    def meaning(self) -> str:
+        """Translations joined for display and MeaningID generation"""
+        return ", ".join(self.translations)
+
+
+@dataclass
+class SenseGroupingResult:
+    """Groups kept for a word plus non-fatal data warnings"""
+
+    groups: list[SenseGroup]
+    warnings: list[str] = field(default_factory=list)
+
+
+class SenseProcessor:
+    """Group senses by translation set and eliminate subset groups
+
+    Senses are expected in the projected form served by
+    ``JSONLDataProvider.get_projection()``: dictionaries with
+    ``sense_index``, ``translations`` (English) and ``example``.
+    """
+
+    def __init__(self) -> None:
+        self.logger = get_logger("pipelines.vocabulary.sense_processor")
+        # Normalized translation strings, shared across words in a batch
+        self._normalized: dict[str, str] = {}
+
+    def normalize_translation(self, translation: str) -> str:
+        """Lowercase and trim a translation (cached per distinct string)"""
+        normalized = self._normalized.get(translation)
+        if normalized is None:
+            normalized = " ".join(translation.lower().split())
+            self._normalized[translation] = normalized
+        return normalized
+
+    def process_senses(self, senses: list[Any], word: str = "") -> SenseGroupingResult:
+        """Group, de-duplicate and select senses for one word
+
+        Args:
+            senses: Projected senses of the word (all parts of speech);
+                malformed items are skipped with a warning
+            word: Headword, used in warnings
+
+        Returns:
+            SenseGroupingResult with groups in order of first appearance
+        """
+        warnings: list[str] = []
+        normalized = self._normalized
+        ids: dict[str, int] = {}
+        # mask -> [sense indexes, first sense with example, translations]
+        groups: dict[int, list[Any]] = {}
+
+        for position, sense in enumerate(senses):
+            if not isinstance(sense, dict):
+                warnings.append(f"{word}: malformed sense at position {position}")
+                continue
+            sense_index = sense.get("sense_index") or str(position + 1)
+            translations = sense.get("translations")
+            if not isinstance(translations, list) or not translations:
+                warnings.append(f"{word}: sense {sense_index} has no translations")
+                continue
+
+            mask = 0
+            keys = []
+            for translation in translations:
+                if not isinstance(translation, str):
+                    warnings.append(
+                        f"{word}: sense {sense_index} has a malformed translation"
+                    )
+                    continue
+                key = normalized.get(translation)
+                if key is None:
+                    key = self.normalize_translation(translation)
+                if key:
+                    keys.append(key)
+                    mask |= 1 << ids.setdefault(key, len(ids))
+            if not mask:
+                warnings.append(f"{word}: sense {sense_index} has no translations")
+                continue
+
+            group = groups.get(mask)
+            if group is None:
+                group = groups[mask] = [[], None, keys]
+            group[0].append(sense_index)
+            if group[1] is None and sense.get("example"):
+                group[1] = sense_index
+
+        kept = self._eliminate_subsets(list(groups))
+
+        result: list[SenseGroup] = []
+        for mask in groups:
+            if mask not in kept:
+                continue
+            sense_indexes, with_example, keys = groups[mask]
+            if with_example is None:
+                warnings.append(
+                    f"{word}: no example in senses {', '.join(sense_indexes)}, "
+                    f"using sense {sense_indexes[0]}"
+                )
+            result.append(
+                SenseGroup(
+                    translations=tuple(sorted(set(keys))),
+                    sense_indexes=sense_indexes,
+                    selected_sense=with_example or sense_indexes[0],
+                    has_example=with_example is not None,
+                )
+            )
+
+        for warning in warnings:
+            self.logger.warning(f"{ICONS['warning']} {warning}")
+        return SenseGroupingResult(groups=result, warnings=warnings)
+
+    def process_batch(
+        self, words: dict[str, list[Any]]
+    ) -> dict[str, SenseGroupingResult]:
+        """Group senses for many words in one pass
+
+        Args:
+            words: Mapping of headword to its projected senses
+
+        Returns:
+            Mapping of headword to its grouping result
+        """
+        return {
+            word: self.process_senses(senses, word) for word, senses in words.items()
+        }
+
+    @staticmethod
+    def _eliminate_subsets(masks: list[int]) -> set[int]:
+        """Keep masks that are not a subset of another mask
+
+        Masks are unique, so a subset always has a strictly smaller popcount
+        and only needs checking against masks kept before it.
+        """
+        kept: list[int] = []
+        for mask in sorted(masks, key=int.bit_count, reverse=True):
+            for other in kept:
+                if mask & other == mask:
+                    break
+            else:
+                kept.append(mask)
+        return set(kept)
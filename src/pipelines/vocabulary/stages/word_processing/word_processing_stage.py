@@ -0,0 +1,245 @@
+"""
+Word Processing Stage
+
+Streams selected words through fetch -> sense grouping -> IPA selection ->
+card generation and appends the resulting entries to word_queue.json
+(see stage2_technical_implementation.md).
+
+Each word is fully processed before the next is fetched, and queue entries
+are flushed to the stage spool every ``chunk_size`` entries, so large
+``--count`` runs hold one chunk in memory and an interrupted run resumes
+after the last flushed word. The queue file itself is rewritten once, when
+the spool is committed.
+"""
+
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from src.core.context import PipelineContext
+from src.providers.base.data_provider import DataProvider
+from src.providers.data.sqlite_provider import SQLiteDataProvider
+from src.stages.base.streaming_stage import (
+    StreamingStage,
+    StreamItemError,
+    StreamStats,
+    StreamStep,
+)
+
+from .card_generator import CardGenerator, collect_card_ids
+from .ipa_selector import IPASelector
+from .sense_processor import SenseGroup, SenseProcessor
+
+DICTIONARY_PROVIDER = "spanish_dictionary"
+VOCABULARY_PROVIDER = "vocabulary_data"
+QUEUE_PROVIDER = "word_queue_data"
+
+QUEUE_ID = "word_queue"
+STAGING_ID = "prompts_staging"
+VOCABULARY_ID = "vocabulary"
+
+
+@dataclass
+class WordItem:
+    """A word moving through the streaming steps"""
+
+    word: str
+    records: list[dict[str, Any]]
+    groups: list[tuple[dict[str, Any], SenseGroup]] = field(default_factory=list)
+    ipa: str | None = None
+
+
+def _data_providers(context: PipelineContext) -> dict[str, DataProvider]:
+    providers = context.get("providers", {}) or {}
+    data_providers: dict[str, DataProvider] = providers.get("data", {}) or {}
+    return data_providers
+
+
+class FetchStep(StreamStep):
+    """Look up a word's projected dictionary records"""
+
+    @property
+    def name(self) -> str:
+        return "fetch"
+
+    def __init__(self, dictionary: Any):
+        """
+        Args:
+            dictionary: JSONLDataProvider serving ``get_projection``
+        """
+        super().__init__()
+        self.dictionary = dictionary
+
+    def process(self, item: Any) -> Iterator[WordItem]:
+        records = self.dictionary.get_projection(item)
+        if not records:
+            raise StreamItemError(f"{item}: not found in dictionary")
+        yield WordItem(word=item, records=records)
+
+
+class SenseGroupingStep(StreamStep):
+    """Group each record's senses by translation set"""
+
+    @property
+    def name(self) -> str:
+        return "group_senses"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.processor = SenseProcessor()
+
+    def process(self, item: WordItem) -> Iterator[WordItem]:
+        for record in item.records:
+            result = self.processor.process_senses(
+                record.get("senses") or [], item.word
+            )
+            self.warnings.extend(result.warnings)
+            item.groups.extend((record, group) for group in result.groups)
+        if not item.groups:
+            raise StreamItemError(f"{item.word}: no senses with translations")
+        yield item
+
+
+class IPAStep(StreamStep):
+    """Select the word's pronunciation from its IPA candidates"""
+
+    @property
+    def name(self) -> str:
+        return "select_ipa"
+
+    def __init__(self, selector: IPASelector | None = None):
+        super().__init__()
+        self.selector = selector or IPASelector()
+
+    def process(self, item: WordItem) -> Iterator[WordItem]:
+        candidates = [
+            candidate
+            for record in item.records
+            for candidate in record.get("ipa") or []
+        ]
+        item.ipa = self.selector.select_from_candidates(candidates, item.word)
+        if item.ipa is None:
+            raise StreamItemError(f"{item.word}: no usable IPA pronunciation")
+        yield item
+
+
+class CardGenerationStep(StreamStep):
+    """Yield one queue entry per sense group with a new CardID"""
+
+    @property
+    def name(self) -> str:
+        return "generate_cards"
+
+    def __init__(self, vocabulary: DataProvider | None, queue: DataProvider):
+        super().__init__()
+        self.vocabulary = vocabulary
+        self.queue = queue
+        self.generator = CardGenerator()
+
+    def open(self, context: PipelineContext) -> None:
+        card_ids = collect_card_ids({}, self.queue.load_data(QUEUE_ID))
+        if isinstance(self.vocabulary, SQLiteDataProvider):
+            # Index-only scan instead of parsing every completed card
+            card_ids |= self.vocabulary.get_card_ids(VOCABULARY_ID)
+        elif self.vocabulary:
+            card_ids |= collect_card_ids(self.vocabulary.load_data(VOCABULARY_ID), {})
+        self.generator = CardGenerator(card_ids)
+
+    def process(self, item: WordItem) -> Iterator[dict[str, Any]]:
+        if item.ipa is None:
+            return
+        duplicates = 0
+        for record, group in item.groups:
+            entry = self.generator.build_entry(item.word, record, group, item.ipa)
+            if entry is None:
+                duplicates += 1
+            else:
+                yield entry
+        if duplicates:
+            self.warnings.append(
+                f"{item.word}: {duplicates} existing CardID(s) filtered"
+            )
+
+
+class WordProcessingStage(StreamingStage):
+    """Stage 2: Process dictionary data for selected words"""
+
+    @property
+    def name(self) -> str:
+        return "word_processing"
+
+    @property
+    def display_name(self) -> str:
+        return "Word Processing"
+
+    @property
+    def dependencies(self) -> list[str]:
+        return ["word_selection"]
+
+    def validate_context(self, context: PipelineContext) -> list[str]:
+        errors = []
+        selected_words = context.get("selected_words")
+        if not selected_words:
+            errors.append("No selected_words found in context")
+        elif not isinstance(selected_words, list):
+            errors.append("selected_words must be a list")
+
+        data_providers = _data_providers(context)
+        for provider_name in (DICTIONARY_PROVIDER, QUEUE_PROVIDER):
+            if provider_name not in data_providers:
+                errors.append(f"{provider_name} provider not configured")
+        return errors
+
+    def source(self, context: PipelineContext) -> Sequence[str]:
+        words: list[str] = context.get("selected_words", [])
+        return words
+
+    def build_steps(self, context: PipelineContext) -> list[StreamStep]:
+        data_providers = _data_providers(context)
+        return [
+            FetchStep(data_providers[DICTIONARY_PROVIDER]),
+            SenseGroupingStep(),
+            IPAStep(),
+            CardGenerationStep(
+                data_providers.get(VOCABULARY_PROVIDER),
+                data_providers[QUEUE_PROVIDER],
+            ),
+        ]
+
+    def commit(self, context: PipelineContext, entries: Iterator[Any]) -> int:
+        """Append spooled entries to the queue and staging files
+
+        Entries whose CardID is already queued (from an earlier, interrupted
+        commit) are skipped. Staging keys are written first, so a crash
+        between the two saves only leaves harmless empty staging prompts.
+
+        Raises:
+            ValueError: If the queue or staging file cannot be saved
+        """
+        provider = _data_providers(context)[QUEUE_PROVIDER]
+        queue = provider.load_data(QUEUE_ID)
+        entries_list = queue.setdefault("queue", [])
+        queued = {entry.get("CardID") for entry in entries_list}
+        added = [entry for entry in entries if entry["CardID"] not in queued]
+        if not added:
+            return 0
+
+        if not provider.managed_files or STAGING_ID in provider.managed_files:
+            staging = provider.load_data(STAGING_ID)
+            for entry in added:
+                staging.setdefault(entry["CardID"], "")
+            if not provider.save_data(STAGING_ID, staging):
+                raise ValueError(f"Could not save {STAGING_ID}")
+
+        entries_list.extend(added)
+        metadata = queue.setdefault("metadata", {})
+        metadata["last_updated"] = datetime.now().isoformat()
+        metadata["total_entries"] = len(entries_list)
+        if not provider.save_data(QUEUE_ID, queue):
+            raise ValueError(f"Could not save {QUEUE_ID}")
+        return len(added)
+
+    def on_complete(self, context: PipelineContext, stats: StreamStats) -> None:
+        context.set("word_queue_updated", stats.emitted > 0)
+        context.set("processing_stats", stats.to_dict())
@@ -4,16 +4,37 @@ Clean Forvo Media Provider
 Handles pronunciation audio downloads with config injection and no fallback logic
 """
 
+import math
+import sqlite3
 from pathlib import Path
 from typing import Any, cast
+from urllib.parse import urlsplit
 
 import requests
-
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.providers.audio.pronunciation_cache import (
+    DEFAULT_NEGATIVE_TTL_DAYS,
+    DEFAULT_TTL_DAYS,
+    PronunciationCache,
+    resolve_cache_path,
+)
+from src.providers.base.api_client import APIResponse
 from src.providers.base.media_provider import MediaProvider, MediaRequest, MediaResult
 from src.utils.logging_config import ICONS, get_logger
+from src.utils.profiler import profile_span
+from src.utils.rate_limiter import parse_retry_after
 
 logger = get_logger("providers.media.forvo")
 
+# Transient server errors retried by the session (429s go to the rate limiter)
+RETRY_STATUSES = (500, 502, 503, 504)
+
+# "single": one unfiltered lookup per word, ranked locally by country priority
+# "country_first": a country-filtered lookup, then an unfiltered one on a miss
+LOOKUP_MODES = ("single", "country_first")
+
 
 class APIError(Exception):
     """API error for Forvo provider"""
@@ -24,6 +45,10 @@ class APIError(Exception):
 class ForvoProvider(MediaProvider):
     """Clean Forvo media provider for Spanish pronunciation audio"""
 
+    # Each API lookup takes its own token; cached lookups and audio
+    # downloads from the CDN take none
+    paces_own_requests = True
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize provider with config injection"""
         super().__init__(config)
@@ -47,6 +72,13 @@ class ForvoProvider(MediaProvider):
         if not config["country_priorities"] or len(config["country_priorities"]) == 0:
             raise ValueError("country_priorities cannot be empty")
 
+        lookup_mode = config.get("lookup_mode", "single")
+        if lookup_mode not in LOOKUP_MODES:
+            raise ValueError(
+                f"lookup_mode must be one of {', '.join(LOOKUP_MODES)}, "
+                f"got {lookup_mode!r}"
+            )
+
     def _setup_from_config(self) -> None:
         """Setup provider from validated configuration"""
         self.api_key = self.config["api_key"]
@@ -77,28 +109,115 @@ class ForvoProvider(MediaProvider):
 
         self.group1, self.group2, self.group3 = groups[:3]
 
+        # Country -> priority rank (lower is better); countries in no group
+        # rank after all groups
+        self.country_ranks: dict[str, int] = {}
+        for rank, group in enumerate(groups[:3]):
+            for country in group:
+                self.country_ranks.setdefault(country, rank)
+        self.lookup_mode = self.config.get("lookup_mode", "single")
+
         # Rate limiting configuration
         self._rate_limit_delay = self.config.get(
             "rate_limit_delay", 0.5
         )  # Default 0.5s for Forvo
 
-    def _make_request(self, method: str, url: str, **kwargs: Any) -> Any:
-        """Make HTTP request with basic error handling"""
+        self.timeout = self.config.get("timeout", 30)
+        self.session = self._create_session()
+        self.cache = self._create_cache()
+
+    def _create_cache(self) -> PronunciationCache | None:
+        """Persistent lookup cache, unless cache_enabled is false"""
+        if not self.config.get("cache_enabled", True):
+            return None
+        return PronunciationCache(
+            resolve_cache_path(self.config.get("cache_path")),
+            ttl_days=float(self.config.get("cache_ttl_days", DEFAULT_TTL_DAYS)),
+            negative_ttl_days=float(
+                self.config.get("negative_cache_ttl_days", DEFAULT_NEGATIVE_TTL_DAYS)
+            ),
+        )
+
+    def _create_session(self) -> requests.Session:
+        """Pooled keep-alive session shared by lookups and downloads
+
+        Each host (the API and the audio CDN) keeps up to one connection per
+        batch worker open between requests, so a batch reuses a handful of
+        connections instead of handshaking for every lookup and download.
+        Idempotent GETs are retried on connection errors and 5xx answers
+        with exponential backoff.
+        """
+        retries = Retry(
+            total=int(self.config.get("max_retries", 3)),
+            backoff_factor=0.5,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=frozenset({"GET"}),
+            # Retry-After answers pause the shared rate limiter instead
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=max(1, self.max_concurrent_requests), max_retries=retries
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept": "application/json"})
+        return session
+
+    def _make_request(self, method: str, url: str, **kwargs: Any) -> APIResponse:
+        """Make HTTP request on the pooled session with basic error handling
+
+        Every call waits for a token from the shared Forvo rate limiter, and a
+        429 pauses it for its Retry-After.
+        """
+        self.rate_limiter.acquire()
         try:
-            response = requests.request(method, url, timeout=30, **kwargs)
-            response.raise_for_status()
-
-            # Return a simple object with success and data
-            result = type("APIResponse", (), {})()
-            result.success = True
-            result.data = response.json() if response.content else {}
-            return result
-        except Exception as e:
-            result = type("APIResponse", (), {})()
-            result.success = False
-            result.data = {}
-            result.error = str(e)
-            return result
+            with profile_span(
+                f"{method} {urlsplit(url).netloc}", "http", service="forvo"
+            ) as span:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+                if span is not None:
+                    span.attributes["status_code"] = response.status_code
+                    span.add(bytes=len(response.content))
+        except requests.RequestException as e:
+            return APIResponse(success=False, data={}, error_message=str(e))
+
+        if response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is None:
+                retry_after = self._rate_limit_delay
+            self.rate_limiter.pause(retry_after)
+            logger.warning(
+                f"{ICONS['warning']} Rate limited by Forvo. Pausing requests for {retry_after:g}s..."
+            )
+            return APIResponse(
+                success=False,
+                data={},
+                error_message="Rate limited by Forvo",
+                status_code=429,
+                retry_after=math.ceil(retry_after),
+            )
+        if response.status_code >= 400:
+            return APIResponse(
+                success=False,
+                data={},
+                error_message=f"Forvo API error (HTTP {response.status_code})",
+                status_code=response.status_code,
+            )
+
+        try:
+            data = response.json() if response.content else {}
+        except ValueError as e:
+            return APIResponse(
+                success=False,
+                data={},
+                error_message=f"Invalid JSON from Forvo: {e}",
+                status_code=response.status_code,
+            )
+        return APIResponse(success=True, data=data, status_code=response.status_code)
 
     def test_connection(self) -> bool:
         """Test Forvo API connection"""
@@ -108,7 +227,7 @@ class ForvoProvider(MediaProvider):
                 "GET",
                 f"{self.base_url}/key/{self.api_key}/format/json/action/word-pronunciations/word/hola/language/es/country/MX",
             )
-            return response.success  # type: ignore[no-any-return]
+            return response.success
         except Exception as e:
             logger.error(f"{ICONS['cross']} Forvo connection test failed: {e}")
             return False
@@ -165,7 +284,9 @@ class ForvoProvider(MediaProvider):
                 )
 
             # Select best pronunciation based on country priorities
-            best_pronunciation = self._select_best_pronunciation(pronunciations)
+            best_pronunciation = self._select_best_pronunciation(
+                pronunciations, preferred_country
+            )
 
             # Download the audio file
             file_path = self._download_audio(best_pronunciation, request.output_path)
@@ -212,61 +333,89 @@ class ForvoProvider(MediaProvider):
     def _get_pronunciations(
         self, word: str, language: str = "es", preferred_country: str | None = None
     ) -> list[dict[str, Any]]:
-        """Get pronunciations for a word"""
+        """Get pronunciations for a word
+
+        In "single" lookup mode the full list is fetched once and the
+        preferred country is applied when ranking; "country_first" asks for
+        the preferred country's pronunciations before the full list.
+        """
         # Try specific country first if provided
-        if preferred_country:
-            response = self._make_request(
-                "GET",
-                f"{self.base_url}/key/{self.api_key}/format/json/action/word-pronunciations/word/{word}/language/{language}/country/{preferred_country}",
-            )
-            if response.success and response.data.get("items"):
-                return cast("list[dict[str, Any]]", response.data["items"])
+        if preferred_country and self.lookup_mode == "country_first":
+            items = self._lookup_pronunciations(word, language, preferred_country)
+            if items:
+                return items
 
         # Try without country filter to get all pronunciations
-        response = self._make_request(
-            "GET",
-            f"{self.base_url}/key/{self.api_key}/format/json/action/word-pronunciations/word/{word}/language/{language}",
-        )
+        return self._lookup_pronunciations(word, language)
 
-        if response.success and response.data.get("items"):
-            return cast("list[dict[str, Any]]", response.data["items"])
+    def _lookup_pronunciations(
+        self, word: str, language: str, country: str | None = None
+    ) -> list[dict[str, Any]]:
+        """One word-pronunciations lookup, answered from the cache when fresh
 
-        return []
+        Successful responses are cached, including empty ones; failed
+        requests are not, so they are retried on the next run. A cache that
+        cannot be read or written is skipped rather than failing the lookup.
+        """
+        if self.cache is not None:
+            try:
+                cached = self.cache.get(word, language, country)
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"{ICONS['warning']} Forvo cache unavailable ({self.cache.path}): {e}"
+                )
+                cached = None
+            if cached is not None:
+                logger.debug(f"Cached Forvo lookup: {word} ({country or 'any'})")
+                return cached
+
+        url = f"{self.base_url}/key/{self.api_key}/format/json/action/word-pronunciations/word/{word}/language/{language}"
+        if country:
+            url += f"/country/{country}"
+        response = self._make_request("GET", url)
+        if not response.success:
+            return []
+
+        items = cast("list[dict[str, Any]]", response.data.get("items") or [])
+        if self.cache is not None:
+            try:
+                self.cache.put(word, language, country, items)
+            except sqlite3.Error as e:
+                logger.warning(
+                    f"{ICONS['warning']} Could not cache Forvo lookup for '{word}': {e}"
+                )
+        return items
 
     def _select_best_pronunciation(
-        self, pronunciations: list[dict[str, Any]]
+        self,
+        pronunciations: list[dict[str, Any]],
+        preferred_country: str | None = None,
     ) -> dict[str, Any]:
         """Select best pronunciation based on country priorities and votes"""
-        # Group by priority levels
-        group1_pronunciations = [
-            p for p in pronunciations if p.get("country") in self.group1
-        ]
-        group2_pronunciations = [
-            p for p in pronunciations if p.get("country") in self.group2
-        ]
-        group3_pronunciations = [
-            p for p in pronunciations if p.get("country") in self.group3
-        ]
-        other_pronunciations = [
-            p
-            for p in pronunciations
-            if p.get("country") not in (self.group1 + self.group2 + self.group3)
-        ]
-
-        # Try each group in priority order
-        for group in [
-            group1_pronunciations,
-            group2_pronunciations,
-            group3_pronunciations,
-            other_pronunciations,
-        ]:
-            if group:
-                # Sort by votes (descending) and return the best
-                group.sort(key=lambda x: x.get("votes", 0), reverse=True)
-                return group[0]
-
-        # Fallback to first pronunciation if no matches
-        return pronunciations[0] if pronunciations else {}
+        ranked = self._rank_pronunciations(pronunciations, preferred_country)
+        return ranked[0] if ranked else {}
+
+    def _rank_pronunciations(
+        self,
+        pronunciations: list[dict[str, Any]],
+        preferred_country: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Pronunciations best first: by country priority, then by votes
+
+        The preferred country ranks ahead of every priority group. Ties keep
+        the API's order.
+        """
+        unranked = 3
+
+        def sort_key(pronunciation: dict[str, Any]) -> tuple[int, int]:
+            country = pronunciation.get("country") or ""
+            if preferred_country and country == preferred_country:
+                rank = -1
+            else:
+                rank = self.country_ranks.get(country, unranked)
+            return rank, -(pronunciation.get("votes") or 0)
+
+        return sorted(pronunciations, key=sort_key)
 
     def _download_audio(self, pronunciation: dict[str, Any], output_path: Path) -> Path:
         """Download audio file for pronunciation"""
@@ -277,14 +426,21 @@ class ForvoProvider(MediaProvider):
         # Ensure directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Download the file
+        # Download the file; closing the response returns its connection
         logger.debug(f"Downloading audio from {audio_url}")
-        response = requests.get(audio_url, stream=True, timeout=30)
-        response.raise_for_status()
-
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        with profile_span(
+            f"GET {urlsplit(audio_url).netloc}", "http", service="forvo"
+        ) as span:
+            response = self.session.get(audio_url, stream=True, timeout=self.timeout)
+            with response:
+                if span is not None:
+                    span.attributes["status_code"] = response.status_code
+                response.raise_for_status()
+                with open(output_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                        if span is not None:
+                            span.add(bytes=len(chunk))
 
         logger.debug(f"{ICONS['check']} Audio downloaded to {output_path}")
         return output_path
@@ -0,0 +1,210 @@
+"""
+Pronunciation Cache
+
+Persistent cache of Forvo word-pronunciations responses keyed by
+(word, language, country), so reruns and regenerations do not spend the
+free tier's daily quota on lookups already made. Empty responses are cached
+too, with a shorter TTL, so words without recordings are not re-queried on
+every run.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+PROJECT_ROOT = Path(__file__).parents[3]
+
+# Relative paths resolve against the project root
+DEFAULT_CACHE_PATH = ".cache/forvo.sqlite"
+DEFAULT_TTL_DAYS = 30.0
+DEFAULT_NEGATIVE_TTL_DAYS = 7.0
+
+SECONDS_PER_DAY = 86400
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pronunciations (
+    word TEXT NOT NULL,
+    language TEXT NOT NULL,
+    country TEXT NOT NULL,
+    items TEXT NOT NULL,
+    found INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (word, language, country)
+);
+"""
+
+
+def resolve_cache_path(path: str | Path | None = None) -> Path:
+    """Absolute cache path from a configured value (default DEFAULT_CACHE_PATH)"""
+    resolved = Path(path or DEFAULT_CACHE_PATH)
+    return resolved if resolved.is_absolute() else PROJECT_ROOT / resolved
+
+
+@dataclass
+class PronunciationCacheStats:
+    """Lookup counters of one PronunciationCache."""
+
+    hits: int = 0
+    negative_hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    stores: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.negative_hits + self.misses
+
+
+class PronunciationCache:
+    """SQLite store of pronunciation lists with per-entry expiry"""
+
+    def __init__(
+        self,
+        path: Path,
+        ttl_days: float = DEFAULT_TTL_DAYS,
+        negative_ttl_days: float = DEFAULT_NEGATIVE_TTL_DAYS,
+    ):
+        """
+        Initialize cache
+
+        Args:
+            path: Database file (created on first use)
+            ttl_days: Days a response with pronunciations stays fresh
+            negative_ttl_days: Days a "no pronunciations found" response
+                stays fresh
+        """
+        self.path = Path(path)
+        self.ttl = ttl_days * SECONDS_PER_DAY
+        self.negative_ttl = negative_ttl_days * SECONDS_PER_DAY
+        self.stats = PronunciationCacheStats()
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        with self._lock:
+            if self._connection is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(self.path, check_same_thread=False)
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+                connection.executescript(SCHEMA)
+                self._connection = connection
+            return self._connection
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def get(
+        self, word: str, language: str, country: str | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Cached pronunciations of a word
+
+        Args:
+            word: Word looked up
+            language: Forvo language code
+            country: Country filter of the lookup (None for unfiltered)
+
+        Returns:
+            The cached list (empty for a cached miss), or None when the
+            lookup is not cached or has expired
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT items, found, fetched_at FROM pronunciations "
+                "WHERE word = ? AND language = ? AND country = ?",
+                (word, language, country or ""),
+            ).fetchone()
+            if row is None:
+                self.stats.misses += 1
+                return None
+            items, found, fetched_at = row
+            ttl = self.ttl if found else self.negative_ttl
+            if time.time() - fetched_at > ttl:
+                self.stats.misses += 1
+                self.stats.expired += 1
+                return None
+            if found:
+                self.stats.hits += 1
+            else:
+                self.stats.negative_hits += 1
+        return json.loads(items)  # type: ignore[no-any-return]
+
+    def put(
+        self,
+        word: str,
+        language: str,
+        country: str | None,
+        items: list[dict[str, Any]],
+    ) -> None:
+        """Store a lookup's pronunciations (an empty list caches a miss)"""
+        with self._lock, self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO pronunciations "
+                "(word, language, country, items, found, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    word,
+                    language,
+                    country or "",
+                    json.dumps(items, ensure_ascii=False),
+                    1 if items else 0,
+                    time.time(),
+                ),
+            )
+            self.stats.stores += 1
+
+    def summary(self) -> dict[str, Any]:
+        """Entry counts by kind and freshness, and the size on disk"""
+        now = time.time()
+        with self._lock:
+            found, not_found, expired = self.connection.execute(
+                "SELECT "
+                "COALESCE(SUM(found), 0), "
+                "COALESCE(SUM(1 - found), 0), "
+                "COALESCE(SUM(CASE WHEN ? - fetched_at > "
+                "CASE WHEN found THEN ? ELSE ? END THEN 1 ELSE 0 END), 0) "
+                "FROM pronunciations",
+                (now, self.ttl, self.negative_ttl),
+            ).fetchone()
+        size = sum(
+            path.stat().st_size
+            for path in (self.path, Path(f"{self.path}-wal"))
+            if path.exists()
+        )
+        return {
+            "entries": found + not_found,
+            "found": found,
+            "not_found": not_found,
+            "expired": expired,
+            "size_bytes": size,
+        }
+
+    def clear(self, expired_only: bool = False) -> int:
+        """Delete cached entries
+
+        Args:
+            expired_only: Keep entries that are still fresh
+
+        Returns:
+            Number of entries deleted
+        """
+        with self._lock, self.connection as connection:
+            if expired_only:
+                cursor = connection.execute(
+                    "DELETE FROM pronunciations WHERE ? - fetched_at > "
+                    "CASE WHEN found THEN ? ELSE ? END",
+                    (time.time(), self.ttl, self.negative_ttl),
+                )
+            else:
+                cursor = connection.execute("DELETE FROM pronunciations")
+            return cursor.rowcount
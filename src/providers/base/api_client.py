@@ -5,17 +5,22 @@ Provides shared utilities and patterns for all external API integrations
 Migrated from src/apis/base_client.py to new provider structure
 """
 
+import asyncio
 import json
+import math
 import os
 import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 
 from src.utils.logging_config import ICONS, get_logger
+from src.utils.profiler import profile_span
+from src.utils.rate_limiter import get_rate_limiter_registry, parse_retry_after
 
 logger = get_logger("providers.base")
 
@@ -78,13 +83,30 @@ class BaseAPIClient(ABC):
 
         return cls._shared_config or {}
 
-    def __init__(self, service_name: str):
+    def __init__(self, service_name: str, rate_limit_service: str | None = None):
+        """
+        Initialize client
+
+        Args:
+            service_name: Display name of the API
+            rate_limit_service: Key of the service's shared rate limit and its
+                ``apis`` config section (defaults to service_name lowercased)
+        """
         self.config = self.load_config()
         self.service_name = service_name
         self.logger = get_logger(f"providers.{service_name.lower()}")
         self.session = requests.Session()
         self._setup_session()
 
+        # Requests share the service's budget with every other client of it
+        key = rate_limit_service or service_name.lower()
+        api_config = self.config.get("apis", {}).get(key, {})
+        self.rate_limiter = get_rate_limiter_registry().get(
+            key,
+            api_config.get("requests_per_second"),
+            int(api_config.get("rate_limit_burst", 1)),
+        )
+
     def _setup_session(self) -> None:
         """Configure the requests session with common settings"""
         # Handle both old and new config structure during migration
@@ -150,31 +172,45 @@ class BaseAPIClient(ABC):
         last_exception = None
 
         for attempt in range(max_retries):
+            self.rate_limiter.acquire()
             try:
                 self.logger.debug(
                     f"Making {method} request to {url} (attempt {attempt + 1}/{max_retries})"
                 )
 
-                response = self.session.request(
-                    method, url, timeout=self.timeout, **kwargs
-                )
+                with profile_span(
+                    f"{method} {urlsplit(url).netloc}",
+                    "http",
+                    service=self.service_name,
+                    attempt=attempt + 1,
+                ) as span:
+                    response = self.session.request(
+                        method, url, timeout=self.timeout, **kwargs
+                    )
+                    if span is not None:
+                        span.attributes["status_code"] = response.status_code
+                        if isinstance(response.content, bytes):
+                            span.add(bytes=len(response.content))
 
-                # Handle rate limiting
+                # Handle rate limiting: pause every caller of the service,
+                # not just this one, until the server's Retry-After
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 60))
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    if retry_after is None:
+                        retry_after = float(2**attempt)
+                    self.rate_limiter.pause(retry_after)
                     self.logger.warning(
-                        f"{ICONS['warning']} Rate limited by {self.service_name}. Waiting {retry_after}s..."
+                        f"{ICONS['warning']} Rate limited by {self.service_name}. Pausing requests for {retry_after:g}s..."
                     )
 
-                    if attempt < max_retries - 1:  # Don't wait on last attempt
-                        time.sleep(retry_after)
+                    if attempt < max_retries - 1:
                         continue
 
                     return APIResponse(
                         success=False,
                         error_message=f"Rate limited by {self.service_name}",
                         status_code=429,
-                        retry_after=retry_after,
+                        retry_after=math.ceil(retry_after),
                     )
 
                 # Handle successful responses
@@ -251,6 +287,28 @@ class BaseAPIClient(ABC):
         self.logger.error(f"{ICONS['cross']} {final_error}")
         return APIResponse(success=False, error_message=final_error)
 
+    async def _make_request_async(
+        self, method: str, url: str, max_retries: int | None = None, **kwargs: Any
+    ) -> APIResponse:
+        """
+        Make HTTP request from an event loop without blocking it
+
+        Runs _make_request (including its retry waits) in a worker thread;
+        the pooled session is shared by concurrent calls.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            max_retries: Maximum number of retry attempts (defaults to config value)
+            **kwargs: Additional arguments passed to requests
+
+        Returns:
+            APIResponse object with success status and data/error info
+        """
+        return await asyncio.to_thread(
+            self._make_request, method, url, max_retries, **kwargs
+        )
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test if the API service is available and authentication works"""
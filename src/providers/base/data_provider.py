@@ -8,6 +8,7 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from src.utils.logging_config import ICONS, get_logger
+from src.utils.profiler import profile_span
 
 
 class DataProvider(ABC):
@@ -34,7 +35,12 @@ class DataProvider(ABC):
 
         try:
             self.validate_file_access(identifier)
-            data = self._load_data_impl(identifier)
+            with profile_span(
+                f"{self.__class__.__name__}.load_data", "data", identifier=identifier
+            ) as span:
+                data = self._load_data_impl(identifier)
+                if span is not None and isinstance(data, dict):
+                    span.add(items=len(data))
             record_count = len(data) if isinstance(data, dict) else "unknown"
             self.logger.debug(f"Loaded {record_count} records from {identifier}")
             return data
@@ -64,7 +70,12 @@ class DataProvider(ABC):
         try:
             self._check_write_permission(identifier)
             self.validate_file_access(identifier)
-            result = self._save_data_impl(identifier, data)
+            with profile_span(
+                f"{self.__class__.__name__}.save_data", "data", identifier=identifier
+            ) as span:
+                result = self._save_data_impl(identifier, data)
+                if span is not None and isinstance(data, dict):
+                    span.add(items=len(data))
             record_count = len(data) if isinstance(data, dict) else "unknown"
             self.logger.debug(f"Saved {record_count} records to {identifier}")
 
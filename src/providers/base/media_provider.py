@@ -4,12 +4,26 @@ Media Provider Interface
 Abstract interface for media generation (images, audio, etc.)
 """
 
+import asyncio
+import contextvars
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 from src.utils.logging_config import ICONS, get_logger
+from src.utils.profiler import profile_span
+from src.utils.rate_limiter import (
+    TokenBucket,
+    get_rate_limiter_registry,
+    interval_to_rate,
+)
+
+# Requests in flight per provider batch unless configured
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
 
 
 @dataclass
@@ -43,6 +57,14 @@ class MediaResult:
         pass
 
 
+def _file_size(file_path: Path | None) -> int:
+    """Size of a generated media file, 0 if it is missing"""
+    try:
+        return Path(file_path).stat().st_size if file_path else 0
+    except OSError:
+        return 0
+
+
 class MediaProvider(ABC):
     """Abstract interface for media generation with configuration injection.
 
@@ -63,6 +85,10 @@ class MediaProvider(ABC):
     - get_cost_estimate(): Cost estimation for batch requests
     """
 
+    # Providers that take a rate limit token for each of their own API calls
+    # set this, so batches do not charge a second token per request
+    paces_own_requests = False
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize provider with configuration injection.
 
@@ -77,6 +103,11 @@ class MediaProvider(ABC):
         self.config = config or {}
         self.logger = get_logger(f"providers.media.{self.__class__.__name__.lower()}")
 
+        # Batch engine state, created on first batch
+        self._batch_lock = threading.Lock()
+        self._batch_pool: ThreadPoolExecutor | None = None
+        self._rate_limiter: TokenBucket | None = None
+
         # Fail-fast validation pattern - validate config before proceeding
         self.validate_config(self.config)
 
@@ -120,7 +151,14 @@ class MediaProvider(ABC):
         try:
             # Before API call
             self.logger.debug(f"Making API request for {request.type}...")
-            result = self._generate_media_impl(request)
+            with profile_span(
+                f"{self.__class__.__name__}.generate_media",
+                "provider",
+                media_type=request.type,
+            ) as span:
+                result = self._generate_media_impl(request)
+                if span is not None and result.success:
+                    span.add(bytes=_file_size(result.file_path), items=1)
 
             if result.success:
                 self.logger.info(
@@ -136,6 +174,20 @@ class MediaProvider(ABC):
             self.logger.error(f"{ICONS['cross']} Media request failed: {e}")
             return MediaResult(success=False, file_path=None, metadata={}, error=str(e))
 
+    async def generate_media_async(self, request: MediaRequest) -> MediaResult:
+        """Generate media from request without blocking the event loop
+
+        The default implementation runs generate_media in a worker thread.
+        Providers with a native async client can override this method.
+
+        Args:
+            request: MediaRequest specifying what to generate
+
+        Returns:
+            MediaResult with success status and file path if successful
+        """
+        return await asyncio.to_thread(self.generate_media, request)
+
     @abstractmethod
     def validate_config(self, config: dict[str, Any]) -> None:
         """Validate provider-specific configuration (fail-fast pattern).
@@ -207,11 +259,11 @@ class MediaProvider(ABC):
         """Generate media for batch requests with rate limiting
 
         This method processes multiple media requests efficiently, applying rate limiting
-        and error handling. The default implementation processes requests sequentially
-        with rate limiting between requests.
+        and error handling. The default implementation runs requests concurrently on the
+        provider's worker pool, see _default_batch_implementation.
 
         Concrete providers can override this method to implement more efficient
-        batch processing (e.g., parallel processing, bulk API calls).
+        batch processing (e.g., bulk API calls).
 
         Args:
             requests: List of MediaRequest objects to process
@@ -219,18 +271,106 @@ class MediaProvider(ABC):
         Returns:
             List of MediaResult objects corresponding to each request
         """
-        return self._default_batch_implementation(requests)
+        with profile_span(
+            f"{self.__class__.__name__}.generate_batch", "provider"
+        ) as span:
+            results = self._default_batch_implementation(requests)
+            if span is not None:
+                span.attributes["requests"] = len(requests)
+        return results
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Requests in flight per batch (max_concurrent_requests config)"""
+        return int(
+            self.config.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)
+        )
+
+    @property
+    def request_timeout(self) -> float | None:
+        """Seconds a batched request may run (request_timeout config, or None)"""
+        timeout = self.config.get("request_timeout")
+        return float(timeout) if timeout else None
+
+    @property
+    def rate_limit_service(self) -> str:
+        """Service whose shared rate limit this provider draws on
+
+        Defaults to the class name without its Provider suffix ("forvo"),
+        matching the service's section in config.json ``apis``.
+        """
+        return self.__class__.__name__.removesuffix("Provider").lower()
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        """Token bucket shared by every caller of this provider's service
+
+        requests_per_second (or rate_limit_delay) and rate_limit_burst in the
+        provider config set the service's limits. Otherwise limits from
+        config.json ``apis`` apply, falling back to one request per
+        _rate_limit_delay seconds.
+        """
+        with self._batch_lock:
+            if self._rate_limiter is None:
+                limiters = get_rate_limiter_registry()
+                service = self.rate_limit_service
+                burst = int(self.config.get("rate_limit_burst", 1))
+                if "requests_per_second" in self.config:
+                    rate: float | None = float(self.config["requests_per_second"])
+                    self._rate_limiter = limiters.configure(service, rate, burst)
+                elif "rate_limit_delay" in self.config:
+                    rate = interval_to_rate(self.config["rate_limit_delay"])
+                    self._rate_limiter = limiters.configure(service, rate, burst)
+                else:
+                    rate = interval_to_rate(getattr(self, "_rate_limit_delay", 0))
+                    self._rate_limiter = limiters.get(service, rate, burst)
+            return self._rate_limiter
+
+    def _get_batch_pool(self) -> ThreadPoolExecutor:
+        """Worker pool shared by this provider's batches, created on first use"""
+        with self._batch_lock:
+            if self._batch_pool is None:
+                workers = self.max_concurrent_requests
+                if workers < 1:
+                    raise ValueError(
+                        f"max_concurrent_requests must be positive, got {workers}"
+                    )
+                self._batch_pool = ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix=f"{self.__class__.__name__}-batch",
+                )
+            return self._batch_pool
+
+    def _timeout_result(self, request: MediaRequest, timeout: float) -> MediaResult:
+        self.logger.error(
+            f"{ICONS['cross']} {request.type.capitalize()} request timed out "
+            f"after {timeout:g}s: {request.content}"
+        )
+        return MediaResult(
+            success=False,
+            file_path=None,
+            metadata={},
+            error=f"Request timed out after {timeout:g}s",
+        )
 
     def _default_batch_implementation(
         self, requests: list[MediaRequest]
     ) -> list[MediaResult]:
-        """Default sequential batch processing with rate limiting
+        """Default concurrent batch processing with rate limiting
 
         This method provides a default implementation for batch processing that:
-        1. Processes requests sequentially to maintain order
-        2. Applies rate limiting between requests if configured
-        3. Handles individual failures gracefully
-        4. Preserves request-to-result correspondence
+        1. Runs up to max_concurrent_requests requests at once on a worker pool
+           kept for the provider's lifetime
+        2. Starts requests no faster than the provider's rate limiter allows,
+           unless the provider paces its own API calls
+        3. Fails requests still running request_timeout seconds after they
+           started, without waiting for them, and fails queued requests no
+           worker picks up within request_timeout seconds
+        4. Handles individual failures gracefully
+        5. Preserves request-to-result correspondence
+
+        A timed-out request cannot be interrupted: its worker finishes it in
+        the background, so the API call still counts against the rate limit.
 
         Args:
             requests: List of MediaRequest objects to process
@@ -238,24 +378,106 @@ class MediaProvider(ABC):
         Returns:
             List of MediaResult objects, one for each input request
         """
-        import time
+        if not requests:
+            return []
+
+        pool = self._get_batch_pool()
+        limiter = None if self.paces_own_requests else self.rate_limiter
+        timeout = self.request_timeout
+        picked_up = [threading.Event() for _ in requests]
+        started = [threading.Event() for _ in requests]
+        start_times = [0.0] * len(requests)
+
+        def generate(index: int, request: MediaRequest) -> MediaResult:
+            picked_up[index].set()
+            try:
+                if limiter is not None:
+                    limiter.acquire()
+            finally:
+                start_times[index] = time.monotonic()
+                started[index].set()
+            return self.generate_media(request)
+
+        # Copy the caller's context so profiler spans nest under the batch
+        futures: list[Future[MediaResult]] = [
+            pool.submit(contextvars.copy_context().run, generate, i, request)
+            for i, request in enumerate(requests)
+        ]
 
         results = []
-        for i, request in enumerate(requests):
-            # Apply rate limiting (skip delay for first request)
-            if (
-                i > 0
-                and hasattr(self, "_rate_limit_delay")
-                and self._rate_limit_delay > 0
-            ):
-                time.sleep(self._rate_limit_delay)
-
-            # Process individual request
-            result = self.generate_media(request)
-            results.append(result)
-
+        stalled = False
+        for i, (request, future) in enumerate(zip(requests, futures, strict=True)):
+            if timeout is None:
+                results.append(future.result())
+                continue
+            # Earlier requests are settled here, so a worker that stays busy
+            # for a whole timeout is stuck on an abandoned call: stop waiting
+            # on the pool and fail whatever it has not picked up yet
+            if stalled or not picked_up[i].wait(timeout):
+                stalled = True
+                if future.cancel():
+                    results.append(self._timeout_result(request, timeout))
+                    continue
+            started[i].wait()
+            remaining = start_times[i] + timeout - time.monotonic()
+            try:
+                results.append(future.result(timeout=max(0.0, remaining)))
+            except TimeoutError:
+                results.append(self._timeout_result(request, timeout))
         return results
 
+    async def generate_batch_async(
+        self, requests: list[MediaRequest], max_concurrency: int | None = None
+    ) -> list[MediaResult]:
+        """Generate media for batch requests concurrently
+
+        Up to max_concurrency requests are in flight at once. Request starts
+        share the provider's rate limiter with generate_batch, and requests
+        still running after request_timeout seconds fail.
+
+        Args:
+            requests: List of MediaRequest objects to process
+            max_concurrency: Requests in flight at once (defaults to the
+                provider's max_concurrent_requests config, else 4)
+
+        Returns:
+            List of MediaResult objects, one for each input request, in order
+
+        Raises:
+            ValueError: If max_concurrency is not positive
+        """
+        limit = max_concurrency or self.max_concurrent_requests
+        if limit < 1:
+            raise ValueError(f"max_concurrency must be positive, got {limit}")
+
+        semaphore = asyncio.Semaphore(limit)
+        limiter = None if self.paces_own_requests else self.rate_limiter
+        timeout = self.request_timeout
+
+        async def generate(request: MediaRequest) -> MediaResult:
+            async with semaphore:
+                if limiter is not None:
+                    await limiter.acquire_async()
+                if timeout is None:
+                    return await self.generate_media_async(request)
+                try:
+                    return await asyncio.wait_for(
+                        self.generate_media_async(request), timeout
+                    )
+                except TimeoutError:
+                    return self._timeout_result(request, timeout)
+
+        self.logger.debug(
+            f"Generating {len(requests)} media requests, {limit} at a time"
+        )
+        with profile_span(
+            f"{self.__class__.__name__}.generate_batch_async",
+            "provider",
+            requests=len(requests),
+            max_concurrency=limit,
+        ):
+            return list(await asyncio.gather(*(generate(r) for r in requests)))
+
     def supports_type(self, media_type: str) -> bool:
         """Check if provider supports media type
 
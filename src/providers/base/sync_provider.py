@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any
 
 from src.utils.logging_config import ICONS, get_logger
+from src.utils.profiler import profile_span
 
 
 @dataclass
@@ -116,7 +117,12 @@ class SyncProvider(ABC):
         self.logger.info(f"{ICONS['gear']} Syncing {card_count} cards...")
 
         try:
-            result = self._sync_cards_impl(cards)
+            with profile_span(
+                f"{self.__class__.__name__}.sync_cards", "provider", cards=card_count
+            ) as span:
+                result = self._sync_cards_impl(cards)
+                if span is not None:
+                    span.add(items=result.processed_count)
 
             if result.success:
                 self.logger.info(
@@ -2,6 +2,14 @@
 Data providers for different data sources.
 """
 
+from .journaled_provider import JournaledDataProvider
 from .json_provider import JSONDataProvider
+from .jsonl_provider import JSONLDataProvider
+from .sqlite_provider import SQLiteDataProvider
 
-__all__ = ["JSONDataProvider"]
+__all__ = [
+    "JSONDataProvider",
+    "JSONLDataProvider",
+    "JournaledDataProvider",
+    "SQLiteDataProvider",
+]
@@ -0,0 +1,483 @@
+"""
+Journaled Data Provider
+
+JSON documents stored as a snapshot plus an append-only journal of changes.
+
+``{identifier}.json`` is a snapshot in the same format JSONDataProvider
+writes, so existing files are picked up unchanged and compacted files stay
+readable by hand. Each save appends one line to
+``{identifier}.journal.jsonl`` holding the operations that turn the last
+saved document into the new one, so updating one queue entry writes a few
+hundred bytes instead of re-serializing the whole file.
+
+Journal layout (one JSON value per line):
+
+    {"snapshot": "<hash of the snapshot bytes>"}     header
+    [{"op": "set", "path": [...], "value": ...}, ...] one line per save
+
+Operations are ``set`` (replace or add a value), ``del`` (remove a key or
+index) and ``splice`` (replace ``delete`` items of a list from ``start``
+with ``values``). On load the snapshot is read and journal lines are
+replayed in order. A torn final line from a crash mid-append, including one
+missing only its newline, is ignored (and trimmed before the next append). A journal whose header names a
+different snapshot was already folded into it by a compaction that crashed
+before resetting the journal, so it is discarded.
+
+When the journal grows past the snapshot size (``compact_ratio``) the
+current document is written to a new snapshot atomically and the journal
+is reset.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.providers.base.data_provider import DataProvider
+from src.utils.logging_config import ICONS
+
+# Journals smaller than this are never compacted
+MIN_COMPACT_BYTES = 64 * 1024
+
+
+def _same(old: Any, new: Any) -> bool:
+    """Equality that keeps booleans and numbers apart (True == 1 in Python)
+
+    Types are compared at every level, so ``{"flag": 1}`` and
+    ``{"flag": True}`` differ too.
+    """
+    if type(old) is not type(new):
+        return False
+    if isinstance(old, dict):
+        return old.keys() == new.keys() and all(
+            _same(value, new[key]) for key, value in old.items()
+        )
+    if isinstance(old, list):
+        return len(old) == len(new) and all(map(_same, old, new))
+    return bool(old == new)
+
+
+def diff_documents(
+    old: Any, new: Any, path: list[Any] | None = None
+) -> list[dict[str, Any]]:
+    """Compute journal operations turning ``old`` into ``new``
+
+    Dictionaries are compared key by key and lists by their common prefix
+    and suffix, so appending to or editing one item of a list produces a
+    single small operation.
+
+    Args:
+        old: Previous JSON value
+        new: New JSON value
+        path: Location of the values inside the document
+
+    Returns:
+        List of operations (empty when the values are equal)
+    """
+    path = path or []
+    ops: list[dict[str, Any]] = []
+    if type(old) is not type(new):
+        ops.append({"op": "set", "path": path, "value": new})
+    elif isinstance(old, dict):
+        for key in old:
+            if key not in new:
+                ops.append({"op": "del", "path": [*path, key]})
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "set", "path": [*path, key], "value": value})
+            elif not _same(old[key], value):
+                ops.extend(diff_documents(old[key], value, [*path, key]))
+    elif isinstance(old, list):
+        if _same(old, new):
+            return ops
+        limit = min(len(old), len(new))
+        prefix = 0
+        while prefix < limit and _same(old[prefix], new[prefix]):
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and _same(
+            old[len(old) - 1 - suffix], new[len(new) - 1 - suffix]
+        ):
+            suffix += 1
+
+        if len(old) == len(new):
+            for index in range(prefix, len(new) - suffix):
+                if not _same(old[index], new[index]):
+                    ops.extend(diff_documents(old[index], new[index], [*path, index]))
+        else:
+            ops.append(
+                {
+                    "op": "splice",
+                    "path": path,
+                    "start": prefix,
+                    "delete": len(old) - prefix - suffix,
+                    "values": new[prefix : len(new) - suffix],
+                }
+            )
+    elif old != new:
+        ops.append({"op": "set", "path": path, "value": new})
+    return ops
+
+
+def apply_operations(document: Any, ops: list[dict[str, Any]]) -> Any:
+    """Apply journal operations to a document in place
+
+    Args:
+        document: JSON document to modify
+        ops: Operations produced by diff_documents
+
+    Returns:
+        The updated document (a new object when the root is replaced)
+
+    Raises:
+        ValueError: If an operation is malformed or its path does not exist
+    """
+    for op in ops:
+        try:
+            kind = op["op"]
+            path = op["path"]
+            if kind == "splice":
+                target = document
+                for key in path:
+                    target = target[key]
+                start = op["start"]
+                target[start : start + op["delete"]] = op["values"]
+                continue
+            if not path:
+                if kind != "set":
+                    raise ValueError(f"Cannot apply '{kind}' to the document root")
+                document = op["value"]
+                continue
+
+            parent = document
+            for key in path[:-1]:
+                parent = parent[key]
+            if kind == "set":
+                if isinstance(parent, list) and path[-1] == len(parent):
+                    parent.append(op["value"])
+                else:
+                    parent[path[-1]] = op["value"]
+            elif kind == "del":
+                del parent[path[-1]]
+            else:
+                raise ValueError(f"Unknown journal operation: {kind}")
+        except (KeyError, IndexError, TypeError) as e:
+            raise ValueError(f"Cannot apply journal operation {op}: {e}") from e
+    return document
+
+
+class JournaledDataProvider(DataProvider):
+    """Provide JSON documents persisted as snapshot plus append-only journal"""
+
+    def __init__(
+        self,
+        base_path: Path,
+        read_only: bool = False,
+        managed_files: list[str] | None = None,
+        compact_ratio: float = 1.0,
+    ):
+        """Initialize journaled data provider
+
+        Args:
+            base_path: Directory containing snapshots and journals
+            read_only: Whether provider is read-only
+            managed_files: List of file identifiers this provider manages (None = all files)
+            compact_ratio: Compact once the journal exceeds this multiple of
+                the snapshot size (and MIN_COMPACT_BYTES)
+        """
+        super().__init__()
+        self.base_path = Path(base_path)
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        self.compact_ratio = compact_ratio
+
+        # identifier -> (replayed document, file signature it was read at)
+        self._documents: dict[str, tuple[dict[str, Any], tuple[int, ...]]] = {}
+        # identifier -> journal byte offset after the last complete line
+        self._journal_ends: dict[str, int] = {}
+
+        self.set_read_only(read_only)
+        if managed_files is not None:
+            self.set_managed_files(managed_files)
+
+    def snapshot_path(self, identifier: str) -> Path:
+        return self.base_path / f"{identifier}.json"
+
+    def journal_path(self, identifier: str) -> Path:
+        return self.base_path / f"{identifier}.journal.jsonl"
+
+    def _signature(self, identifier: str) -> tuple[int, ...]:
+        """Sizes and modification times of the snapshot and journal"""
+        signature: list[int] = []
+        for path in (self.snapshot_path(identifier), self.journal_path(identifier)):
+            try:
+                stat = path.stat()
+                signature.extend((stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                signature.extend((-1, -1))
+        return tuple(signature)
+
+    def _document(self, identifier: str) -> dict[str, Any]:
+        """Last saved document, replayed from disk when the files changed"""
+        signature = self._signature(identifier)
+        cached = self._documents.get(identifier)
+        if cached is not None and cached[1] == signature:
+            return cached[0]
+
+        document = self._read(identifier)
+        self._documents[identifier] = (document, signature)
+        return document
+
+    def _read(self, identifier: str) -> dict[str, Any]:
+        """Read the snapshot and replay the journal on top of it"""
+        snapshot_path = self.snapshot_path(identifier)
+        raw = snapshot_path.read_bytes() if snapshot_path.exists() else b""
+        try:
+            document = json.loads(raw) if raw.strip() else {}
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Error loading {identifier}: {e}") from e
+        if not isinstance(document, dict):
+            raise ValueError(f"Error loading {identifier}: snapshot is not an object")
+
+        return self._replay(identifier, document, self._snapshot_hash(raw))
+
+    def _replay(
+        self, identifier: str, document: dict[str, Any], snapshot_hash: str
+    ) -> dict[str, Any]:
+        """Apply the journal on top of a snapshot"""
+        journal_path = self.journal_path(identifier)
+        self._journal_ends[identifier] = 0
+        if not journal_path.exists():
+            return document
+
+        with open(journal_path, "rb") as f:
+            try:
+                header_line = f.readline()
+                if not header_line.endswith(b"\n"):
+                    raise ValueError("torn header")
+                header = json.loads(header_line)
+                journal_snapshot = header["snapshot"]
+            except (ValueError, KeyError, TypeError):
+                self.logger.warning(
+                    f"{ICONS['warning']} Ignoring journal without header: {journal_path}"
+                )
+                return document
+            if journal_snapshot != snapshot_hash:
+                self.logger.warning(
+                    f"{ICONS['warning']} Discarding journal for {identifier}: "
+                    "snapshot was rewritten after it was started"
+                )
+                return document
+
+            end = f.tell()
+            replayed = 0
+            for line in f:
+                try:
+                    # A line is only complete once its newline is written
+                    if not line.endswith(b"\n"):
+                        raise ValueError("journal line is torn")
+                    ops = json.loads(line)
+                    if not isinstance(ops, list):
+                        raise ValueError("journal line is not a list")
+                    document = apply_operations(document, ops)
+                except ValueError as e:
+                    # Torn or corrupt line: keep the state up to the last good line
+                    self.logger.warning(
+                        f"{ICONS['warning']} Stopping replay of {identifier} "
+                        f"after {replayed} saves: {e}"
+                    )
+                    break
+                end += len(line)
+                replayed += 1
+
+        self._journal_ends[identifier] = end
+        self.logger.debug(f"Replayed {replayed} journal saves for {identifier}")
+        return document
+
+    @staticmethod
+    def _snapshot_hash(raw: bytes) -> str:
+        return hashlib.sha256(raw).hexdigest()[:16]
+
+    def _load_data_impl(self, identifier: str) -> dict[str, Any]:
+        """Load a document by replaying its journal
+
+        Args:
+            identifier: Document name without extension
+
+        Returns:
+            Current document (empty if it does not exist), freshly parsed
+            so callers never share the save cache (parsing is cheaper than
+            deep-copying it)
+
+        Raises:
+            ValueError: If the snapshot contains invalid JSON
+        """
+        return self._read(identifier)
+
+    def _save_data_impl(self, identifier: str, data: dict[str, Any]) -> bool:
+        """Append the changes since the last save to the journal
+
+        Args:
+            identifier: Document name without extension
+            data: Complete new document
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+        try:
+            current = self._document(identifier)
+            ops = diff_documents(current, data)
+            if not ops:
+                return True
+
+            line = json.dumps(ops, ensure_ascii=False, separators=(",", ":"))
+            self._append(identifier, line)
+            # Apply the serialized form so the cache never aliases caller data
+            document = apply_operations(current, json.loads(line))
+            self._documents[identifier] = (document, self._signature(identifier))
+
+            if self._needs_compaction(identifier):
+                self.compact(identifier)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            # TypeError can occur if data contains non-serializable objects
+            self.logger.error(f"Error saving {identifier}: {e}")
+            self._documents.pop(identifier, None)
+            return False
+
+    def _append(self, identifier: str, line: str) -> None:
+        """Append one journal line, starting a journal if needed"""
+        journal_path = self.journal_path(identifier)
+        end = self._journal_ends.get(identifier, 0)
+        with open(journal_path, "ab") as f:
+            if end == 0:
+                f.truncate(0)
+                raw = (
+                    self.snapshot_path(identifier).read_bytes()
+                    if self.snapshot_path(identifier).exists()
+                    else b""
+                )
+                header = {"snapshot": self._snapshot_hash(raw)}
+                f.write(json.dumps(header).encode("utf-8") + b"\n")
+            elif f.tell() != end:
+                # Drop a torn line left by a crash
+                f.truncate(end)
+            f.write(line.encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+            self._journal_ends[identifier] = f.tell()
+
+    def _needs_compaction(self, identifier: str) -> bool:
+        journal_size = self._journal_ends.get(identifier, 0)
+        if journal_size < MIN_COMPACT_BYTES:
+            return False
+        snapshot_path = self.snapshot_path(identifier)
+        snapshot_size = snapshot_path.stat().st_size if snapshot_path.exists() else 0
+        return journal_size > snapshot_size * self.compact_ratio
+
+    def compact(self, identifier: str) -> bool:
+        """Fold the journal into a new snapshot
+
+        The snapshot is replaced atomically before the journal is removed; a
+        crash in between leaves a journal whose header no longer matches and
+        is discarded on the next load.
+
+        Args:
+            identifier: Document name without extension
+
+        Returns:
+            True if the snapshot was written
+        """
+        self._check_write_permission(identifier)
+        self.validate_file_access(identifier)
+        document = self._document(identifier)
+        snapshot_path = self.snapshot_path(identifier)
+        tmp_path = snapshot_path.with_name(snapshot_path.name + ".tmp")
+        try:
+            content = json.dumps(document, indent=2, ensure_ascii=False, sort_keys=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, snapshot_path)
+            self.journal_path(identifier).unlink(missing_ok=True)
+        except (OSError, TypeError) as e:
+            self.logger.error(
+                f"{ICONS['cross']} Compaction of {identifier} failed: {e}"
+            )
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self._journal_ends[identifier] = 0
+        self._documents[identifier] = (document, self._signature(identifier))
+        self.logger.info(f"{ICONS['check']} Compacted journal for {identifier}")
+        return True
+
+    def exists(self, identifier: str) -> bool:
+        """Check if a snapshot or journal exists
+
+        Args:
+            identifier: Document name without extension
+
+        Returns:
+            True if data exists, False otherwise
+        """
+        self.validate_file_access(identifier)
+        return (
+            self.snapshot_path(identifier).exists()
+            or self.journal_path(identifier).exists()
+        )
+
+    def list_identifiers(self) -> list[str]:
+        """List all documents with a snapshot or journal
+
+        Returns:
+            List of identifiers (filtered by managed files if set)
+        """
+        if not self.base_path.exists():
+            return []
+
+        identifiers = {f.stem for f in self.base_path.glob("*.json")}
+        identifiers.update(
+            f.name.removesuffix(".journal.jsonl")
+            for f in self.base_path.glob("*.journal.jsonl")
+        )
+
+        if self._managed_files:
+            return sorted(f for f in identifiers if f in self._managed_files)
+        return sorted(identifiers)
+
+    def backup_data(self, identifier: str) -> str | None:
+        """Write the current document to a timestamped JSON backup
+
+        Args:
+            identifier: Document name without extension
+
+        Returns:
+            Backup identifier if successful, None if failed
+        """
+        if not self.exists(identifier):
+            return None
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"{identifier}_backup_{timestamp}"
+        try:
+            content = json.dumps(
+                self._document(identifier), indent=2, ensure_ascii=False, sort_keys=True
+            )
+            self.snapshot_path(backup_name).write_text(content + "\n", encoding="utf-8")
+            return backup_name
+        except (OSError, ValueError):
+            return None
+
+    def get_journal_stats(self, identifier: str) -> dict[str, Any]:
+        """Sizes of the snapshot and journal for a document"""
+        self._document(identifier)
+        snapshot_path = self.snapshot_path(identifier)
+        return {
+            "snapshot_bytes": (
+                snapshot_path.stat().st_size if snapshot_path.exists() else 0
+            ),
+            "journal_bytes": self._journal_ends.get(identifier, 0),
+        }
@@ -0,0 +1,203 @@
+"""
+Lazy JSONL Entry
+
+Decode-on-demand view over a single dictionary line held in a memory map.
+"""
+
+import json
+import re
+from collections.abc import Iterator
+from typing import Any
+
+# Keys read by the vocabulary word processing stages
+CARD_KEYS = ("word", "pos", "tags", "senses", "sounds", "translations")
+
+_decoder = json.JSONDecoder()
+
+# A complete JSON string; UTF-8 continuation bytes never match '"' or '\\'
+_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+
+# Nesting depth of containers skipped by a single regex match; deeper values
+# fall back to a bracket-counting token scan
+_REGEX_NESTING = 8
+
+
+def _container_pattern(nesting: int) -> re.Pattern[bytes]:
+    """Compile a pattern matching one array or object nested up to a depth"""
+    body = rb"(?:" + _STRING + rb'|[^"\[\]{}]++)*+'
+    for _ in range(nesting - 1):
+        body = rb"(?:" + _STRING + rb'|[^"\[\]{}]++|[\[{]' + body + rb"[\]}])*+"
+    return re.compile(rb"[\[{]" + body + rb"[\]}]", re.DOTALL)
+
+
+_CONTAINER = _container_pattern(_REGEX_NESTING)
+_MEMBER = re.compile(rb"[\s,{]*+(" + _STRING + rb")\s*+:\s*+", re.DOTALL)
+_STRING_VALUE = re.compile(_STRING, re.DOTALL)
+_SCALAR = re.compile(rb"[^,}\s]++")
+_TOKEN = re.compile(_STRING + rb"|[\[\]{}]", re.DOTALL)
+_MISSING = object()
+
+
+def _skip_value(raw: bytes, start: int) -> int:
+    """End offset of the JSON value starting at ``start``, or -1 if malformed"""
+    first = raw[start : start + 1]
+    if first and first in b"[{":
+        match = _CONTAINER.match(raw, start)
+        if match:
+            return match.end()
+        depth = 0
+        for token in _TOKEN.finditer(raw, start):
+            if token[0] in b"[{":
+                depth += 1
+            elif token[0] in b"]}":
+                depth -= 1
+                if depth == 0:
+                    return token.end()
+        return -1
+    match = (_STRING_VALUE if first == b'"' else _SCALAR).match(raw, start)
+    return match.end() if match else -1
+
+
+def _scan_members(raw: bytes) -> Iterator[tuple[str, int, int]]:
+    """Yield (key, value start, value end) for each top-level member in order
+
+    Strings are matched whole, escapes included, so brackets and key-like
+    text inside them or inside nested values are never taken for members.
+    """
+    position = 0
+    while member := _MEMBER.match(raw, position):
+        string = member[1]
+        key = string[1:-1].decode("utf-8")
+        if "\\" in key:
+            key = json.loads(string)
+        start = member.end()
+        position = _skip_value(raw, start)
+        if position < 0:
+            return
+        yield key, start, position
+
+
+class LazyEntry:
+    """Read-only mapping over one JSONL line that decodes keys on access
+
+    Only the requested top-level values are parsed; large arrays such as
+    ``forms``, ``descendants`` and ``derived`` are never materialized unless a
+    caller asks for them. Decoded values are cached on the entry.
+
+    Top-level members are located by one left-to-right scan of the line that
+    skips nested values with a regex and stops at the requested key. The value
+    offsets it passes are kept, so a later lookup is a dictionary hit and a
+    decode of the value's bytes only.
+    """
+
+    __slots__ = ("_view", "_raw", "_values", "_full", "_members", "_scanner")
+
+    def __init__(self, view: memoryview):
+        """Wrap a line view
+
+        Args:
+            view: Memoryview of one JSON object line (trailing newline optional)
+        """
+        self._view = view
+        self._raw: bytes | None = None
+        self._values: dict[str, Any] = {}
+        self._full: dict[str, Any] | None = None
+        self._members: dict[str, tuple[int, int]] = {}
+        self._scanner: Iterator[tuple[str, int, int]] | None = None
+
+    @property
+    def raw(self) -> memoryview:
+        """Zero-copy view of the underlying line"""
+        return self._view
+
+    @property
+    def size(self) -> int:
+        """Size of the underlying line in bytes"""
+        return len(self._view)
+
+    @property
+    def word(self) -> str | None:
+        """Headword of the entry"""
+        value = self.get("word")
+        return value if isinstance(value, str) else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a top-level value, decoding it on first access"""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self._lookup(key) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.to_dict())
+
+    def project(self, keys: tuple[str, ...] = CARD_KEYS) -> dict[str, Any]:
+        """Decode only the given keys into a plain dictionary
+
+        Args:
+            keys: Top-level keys to include (missing keys are omitted)
+
+        Returns:
+            Dictionary with the decoded values
+        """
+        projected = {}
+        for key in keys:
+            value = self._lookup(key)
+            if value is not _MISSING:
+                projected[key] = value
+        return projected
+
+    def to_dict(self) -> dict[str, Any]:
+        """Parse the complete entry"""
+        if self._full is None:
+            self._full = json.loads(str(self._view, "utf-8"))
+        return self._full
+
+    def release(self) -> None:
+        """Release the underlying buffer view (cached values stay available)"""
+        self._view.release()
+
+    def _lookup(self, key: str) -> Any:
+        if self._full is not None:
+            return self._full.get(key, _MISSING)
+        if key in self._values:
+            return self._values[key]
+
+        value = self._decode_key(key)
+        self._values[key] = value
+        return value
+
+    def _decode_key(self, key: str) -> Any:
+        """Locate and decode a single top-level value"""
+        raw = self._raw
+        if raw is None:
+            raw = self._raw = self._view.tobytes()
+            self._scanner = _scan_members(raw)
+        if key not in self._members and self._scanner is not None:
+            # Resume the scan where the previous lookup stopped
+            for name, start, end in self._scanner:
+                self._members[name] = (start, end)
+                if name == key:
+                    break
+        if key not in self._members:
+            return _MISSING
+
+        start, end = self._members[key]
+        try:
+            return _decoder.raw_decode(raw[start:end].decode("utf-8"))[0]
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            # Malformed line: let the full parse report or recover it
+            return self.to_dict().get(key, _MISSING)
+
+    def __repr__(self) -> str:
+        return f"LazyEntry(word={self.word!r}, size={self.size})"
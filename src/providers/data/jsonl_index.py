@@ -0,0 +1,403 @@
+"""
+Binary Word Index
+
+Compact on-disk word -> line offsets index for large JSONL dictionaries.
+
+File layout (native byte order, all integers unsigned 64-bit):
+
+    magic (8 bytes) | header length (8 bytes) | JSON header (padded to 8)
+    key_offsets[n + 1]   start of each key in the key blob
+    entry_starts[n + 1]  start of each key's run in line_offsets
+    line_offsets[m]      byte offset of every indexed line
+    key blob             sorted UTF-8 keys, concatenated
+
+The file is memory-mapped and the arrays are exposed as ``memoryview``
+casts, so opening costs O(1) and no per-key Python object exists until a
+word is looked up by binary search over the sorted keys.
+
+Building scans newline-aligned byte ranges of the dictionary, optionally
+in parallel worker processes, and reads only the ``word`` field of each
+line.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+MAGIC = b"FFWIDX\x00\x01"
+BINARY_INDEX_VERSION = "2.0"
+
+_HEADER_LENGTH = struct.Struct("Q")
+
+# Line prefixes written by wiktextract/kaikki dumps, where "word" comes first
+_WORD_PREFIXES = (b'{"word": "', b'{"word":"')
+
+# Ranges per worker; more ranges than workers smooths out progress reporting
+_RANGES_PER_WORKER = 4
+
+
+class BinaryIndexError(ValueError):
+    """Raised when a binary index file cannot be read"""
+
+    pass
+
+
+def write_binary_index(
+    path: Path, index: Mapping[str, list[int]], metadata: dict[str, Any]
+) -> None:
+    """Serialize a word -> offsets mapping to the binary index format
+
+    The file is written to a temporary path and atomically moved into place.
+
+    Args:
+        path: Destination index file
+        index: Word to line offsets mapping
+        metadata: Extra header fields (e.g. source fingerprint)
+    """
+    encoded = sorted((word.encode("utf-8"), offsets) for word, offsets in index.items())
+
+    key_offsets = array("Q", [0])
+    entry_starts = array("Q", [0])
+    line_offsets = array("Q")
+    blob = bytearray()
+    for key, offsets in encoded:
+        blob += key
+        key_offsets.append(len(blob))
+        line_offsets.extend(offsets)
+        entry_starts.append(len(line_offsets))
+
+    header = json.dumps(
+        {
+            **metadata,
+            "index_version": BINARY_INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "word_count": len(encoded),
+            "total_entries": len(line_offsets),
+        },
+        ensure_ascii=False,
+    ).encode("utf-8")
+    header += b" " * (-len(header) % 8)
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LENGTH.pack(len(header)))
+        f.write(header)
+        key_offsets.tofile(f)
+        entry_starts.tofile(f)
+        line_offsets.tofile(f)
+        f.write(blob)
+    os.replace(tmp_path, path)
+
+
+@dataclass
+class IndexBuildResult:
+    """Outcome of scanning a dictionary file for headwords"""
+
+    index: dict[str, list[int]]
+    lines: int
+    skipped: int
+    ranges: int
+    workers: int
+    duration: float
+
+
+def split_ranges(file_path: Path, count: int) -> list[tuple[int, int]]:
+    """Split a file into newline-aligned byte ranges
+
+    Args:
+        file_path: File to split
+        count: Desired number of ranges (fewer are returned for small files)
+
+    Returns:
+        Contiguous (start, end) pairs covering the whole file
+    """
+    size = file_path.stat().st_size
+    boundaries = [0]
+    with open(file_path, "rb") as f:
+        for i in range(1, max(count, 1)):
+            target = size * i // count
+            if target <= boundaries[-1]:
+                continue
+            f.seek(target - 1)
+            f.readline()
+            position = f.tell()
+            if boundaries[-1] < position < size:
+                boundaries.append(position)
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:], strict=False))
+
+
+def extract_word(line: bytes) -> str | None:
+    """Read the headword of a JSONL line
+
+    Lines starting with ``{"word": "`` are handled with a byte scan up to the
+    closing quote; anything else (other key order, escaped characters) falls
+    back to a full JSON parse.
+
+    Raises:
+        ValueError: If the line needs a full parse and is not valid JSON
+    """
+    for prefix in _WORD_PREFIXES:
+        if line.startswith(prefix):
+            end = line.find(b'"', len(prefix))
+            if end != -1:
+                raw = line[len(prefix) : end]
+                if b"\\" not in raw:
+                    return raw.decode("utf-8")
+            break
+
+    entry = json.loads(line)
+    word = entry.get("word") if isinstance(entry, dict) else None
+    return word if isinstance(word, str) else None
+
+
+def scan_range(
+    file_path: Path, start: int, end: int
+) -> tuple[dict[str, list[int]], int, int]:
+    """Index the lines beginning inside [start, end)
+
+    Args:
+        file_path: JSONL dictionary file
+        start: Byte offset of the first line (must be a line start)
+        end: Byte offset where the range stops
+
+    Returns:
+        Tuple of (word -> offsets, lines scanned, malformed lines skipped)
+    """
+    index: dict[str, list[int]] = {}
+    lines = skipped = 0
+    position = start
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            if line.strip():
+                lines += 1
+                try:
+                    word = extract_word(line)
+                except ValueError:
+                    skipped += 1
+                    word = None
+                if word is not None:
+                    index.setdefault(word, []).append(position)
+            position += len(line)
+    return index, lines, skipped
+
+
+def build_word_index(
+    file_path: Path,
+    workers: int = 1,
+    progress: Callable[[int, int], None] | None = None,
+) -> IndexBuildResult:
+    """Build a word -> line offsets index for a JSONL dictionary
+
+    With more than one worker the file is split into newline-aligned ranges
+    scanned in a process pool; partial indexes are merged in range order so
+    each word keeps its offsets in file order.
+
+    Args:
+        file_path: JSONL dictionary file
+        workers: Number of processes (1 scans in the current process)
+        progress: Optional callback receiving (bytes done, total bytes)
+
+    Returns:
+        IndexBuildResult with the merged index and scan statistics
+    """
+    start_time = time.perf_counter()
+    file_path = Path(file_path)
+    workers = max(workers, 1)
+    ranges = split_ranges(file_path, workers * _RANGES_PER_WORKER if workers > 1 else 1)
+    total = ranges[-1][1] if ranges else 0
+
+    parts: dict[int, tuple[dict[str, list[int]], int, int]] = {}
+    if workers == 1:
+        done = 0
+        for i, (start, end) in enumerate(ranges):
+            parts[i] = scan_range(file_path, start, end)
+            done += end - start
+            if progress:
+                progress(done, total)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(scan_range, file_path, start, end): i
+                for i, (start, end) in enumerate(ranges)
+            }
+            done = 0
+            for future in as_completed(futures):
+                i = futures[future]
+                parts[i] = future.result()
+                done += ranges[i][1] - ranges[i][0]
+                if progress:
+                    progress(done, total)
+
+    index: dict[str, list[int]] = {}
+    lines = skipped = 0
+    for i in range(len(ranges)):
+        partial, part_lines, part_skipped = parts[i]
+        lines += part_lines
+        skipped += part_skipped
+        for word, offsets in partial.items():
+            existing = index.get(word)
+            if existing is None:
+                index[word] = offsets
+            else:
+                existing.extend(offsets)
+
+    return IndexBuildResult(
+        index=index,
+        lines=lines,
+        skipped=skipped,
+        ranges=len(ranges),
+        workers=workers,
+        duration=time.perf_counter() - start_time,
+    )
+
+
+class BinaryWordIndex(Mapping[str, list[int]]):
+    """Read-only mapping over a memory-mapped binary word index
+
+    Behaves like ``dict[str, list[int]]`` for lookups. Iteration yields
+    words in sorted UTF-8 byte order.
+    """
+
+    def __init__(self, path: Path):
+        """Open and validate an index file
+
+        Args:
+            path: Index file written by write_binary_index
+
+        Raises:
+            BinaryIndexError: If the file is truncated or not a binary index
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                raise BinaryIndexError(f"Empty index file: {self.path}") from e
+
+        try:
+            self.metadata = self._read_header()
+            self._map_arrays()
+        except BinaryIndexError:
+            self._mmap.close()
+            raise
+
+    def _read_header(self) -> dict[str, Any]:
+        """Validate magic and decode the JSON header"""
+        mapped = self._mmap
+        prefix = len(MAGIC) + _HEADER_LENGTH.size
+        if len(mapped) < prefix or mapped[: len(MAGIC)] != MAGIC:
+            raise BinaryIndexError(f"Not a binary word index: {self.path}")
+
+        (header_length,) = _HEADER_LENGTH.unpack_from(mapped, len(MAGIC))
+        self._data_start = prefix + header_length
+        try:
+            header = json.loads(mapped[prefix : self._data_start].decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise BinaryIndexError(f"Corrupt index header in {self.path}: {e}") from e
+        if not isinstance(header, dict):
+            raise BinaryIndexError(f"Corrupt index header in {self.path}")
+        return header
+
+    def _map_arrays(self) -> None:
+        """Expose the offset arrays and key blob as views over the map"""
+        try:
+            word_count = int(self.metadata["word_count"])
+            total_entries = int(self.metadata["total_entries"])
+        except (KeyError, TypeError, ValueError) as e:
+            raise BinaryIndexError(f"Corrupt index header in {self.path}") from e
+        if self.metadata.get("byteorder") != sys.byteorder:
+            raise BinaryIndexError(f"Index byte order mismatch in {self.path}")
+
+        sizes = (word_count + 1, word_count + 1, total_entries)
+        self._blob_start = self._data_start + sum(sizes) * 8
+        if self._blob_start > len(self._mmap):
+            raise BinaryIndexError(f"Truncated index file: {self.path}")
+
+        self._view = memoryview(self._mmap)
+        arrays = []
+        position = self._data_start
+        for count in sizes:
+            arrays.append(self._view[position : position + count * 8].cast("Q"))
+            position += count * 8
+        self._key_offsets, self._entry_starts, self._line_offsets = arrays
+
+        if self._blob_start + self._key_offsets[-1] > len(self._mmap):
+            self._release_views()
+            raise BinaryIndexError(f"Truncated index file: {self.path}")
+
+    @property
+    def fingerprint(self) -> dict[str, Any] | None:
+        """Fingerprint of the source file recorded at build time"""
+        return self.metadata.get("fingerprint")
+
+    @property
+    def total_entries(self) -> int:
+        """Number of indexed lines"""
+        return int(self.metadata["total_entries"])
+
+    def _key_at(self, position: int) -> bytes:
+        start = self._blob_start
+        return self._mmap[
+            start + self._key_offsets[position] : start
+            + self._key_offsets[position + 1]
+        ]
+
+    def _find(self, word: str) -> int:
+        """Binary search for a word, returning its position or -1"""
+        key = word.encode("utf-8")
+        low, high = 0, len(self._key_offsets) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self._key_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._key_offsets) - 1 and self._key_at(low) == key:
+            return low
+        return -1
+
+    def __getitem__(self, word: str) -> list[int]:
+        position = self._find(word) if isinstance(word, str) else -1
+        if position == -1:
+            raise KeyError(word)
+        return self._line_offsets[
+            self._entry_starts[position] : self._entry_starts[position + 1]
+        ].tolist()
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and self._find(word) != -1
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(len(self)):
+            yield self._key_at(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return len(self._key_offsets) - 1
+
+    def _release_views(self) -> None:
+        for view in (self._key_offsets, self._entry_starts, self._line_offsets):
+            view.release()
+        self._view.release()
+
+    def close(self) -> None:
+        """Release array views and unmap the index file"""
+        self._release_views()
+        self._mmap.close()
+
+    def __repr__(self) -> str:
+        return f"BinaryWordIndex(path={self.path!r}, words={len(self)})"
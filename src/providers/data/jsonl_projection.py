@@ -0,0 +1,379 @@
+"""
+JSONL Dictionary Projection
+
+Card-ready projection of dictionary entries and the sidecar store it is
+persisted in.
+
+Word processing only reads a small part of each Español.jsonl line
+(glosses, first example, English translations, IPA, part of speech and
+gender). ``build_projection`` runs once over the dictionary and writes one
+compact JSON record per source line to a sidecar JSONL file, indexed by
+headword with a BinaryWordIndex whose header records the source file
+fingerprint. ``ProjectionStore`` serves those records so lookups parse a
+few hundred bytes instead of a multi-KB raw entry.
+"""
+
+import json
+import mmap
+import os
+import re
+import shutil
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, cast
+
+from .jsonl_index import (
+    BinaryIndexError,
+    BinaryWordIndex,
+    split_ranges,
+    write_binary_index,
+)
+
+PROJECTION_VERSION = "1.0"
+
+GENDER_TAGS = frozenset({"masculine", "feminine", "neuter"})
+
+# Scores a sounds entry's raw_tags, returning (score, tags to store). Accent
+# rules belong to the pipeline using the projection, which passes its own
+# (a module-level function or picklable callable, for worker processes).
+PronunciationScorer = Callable[[Any], tuple[int, tuple[str, ...]]]
+
+_SENSE_RANGE = re.compile(r"^(\d+)\s*[–-]\s*(\d+)$")
+
+
+def parse_sense_index(value: Any) -> list[str]:
+    """Expand a translation sense_index into individual sense numbers
+
+    Handles comma-separated lists ("1,2,4"), ranges ("1–2", "1-3") and mixes
+    of both. Unparseable parts are kept verbatim.
+
+    Args:
+        value: sense_index value from a translation
+
+    Returns:
+        List of sense index strings
+    """
+    if not isinstance(value, str):
+        return []
+
+    indexes: list[str] = []
+    for part in value.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        match = _SENSE_RANGE.match(part)
+        if match:
+            start, end = int(match.group(1)), int(match.group(2))
+            indexes.extend(str(i) for i in range(start, end + 1))
+        else:
+            indexes.append(part)
+    return indexes
+
+
+def unscored_pronunciation(raw_tags: Any) -> tuple[int, tuple[str, ...]]:
+    """Default pronunciation scorer: score 0, string raw_tags kept as they are"""
+    if isinstance(raw_tags, str):
+        return 0, (raw_tags,)
+    if isinstance(raw_tags, list):
+        return 0, tuple(tag for tag in raw_tags if isinstance(tag, str))
+    return 0, ()
+
+
+def project_entry(
+    entry: dict[str, Any], scorer: PronunciationScorer = unscored_pronunciation
+) -> dict[str, Any]:
+    """Reduce a raw dictionary entry to the fields word processing reads
+
+    Args:
+        entry: Parsed Español.jsonl line
+        scorer: Scores each pronunciation's raw_tags (default: all 0)
+
+    Returns:
+        Projection with word, pos, gender, scored ``[ipa, score, tags]``
+        candidates (best first, file order among equal scores)
+        and per-sense glosses, first example and English translations
+    """
+    translations: dict[str, list[str]] = {}
+    for translation in entry.get("translations") or []:
+        if not isinstance(translation, dict) or translation.get("lang_code") != "en":
+            continue
+        text = translation.get("word")
+        if not isinstance(text, str) or not text:
+            continue
+        for sense_index in parse_sense_index(translation.get("sense_index")):
+            targets = translations.setdefault(sense_index, [])
+            if text not in targets:
+                targets.append(text)
+
+    candidates: list[tuple[str, int, list[str]]] = []
+    for sound in entry.get("sounds") or []:
+        if not isinstance(sound, dict):
+            continue
+        ipa = sound.get("ipa")
+        if isinstance(ipa, str) and ipa:
+            score, tags = scorer(sound.get("raw_tags"))
+            candidates.append((ipa, score, list(tags)))
+    # Stable sort keeps file order among equal scores
+    candidates.sort(key=lambda candidate: -candidate[1])
+
+    senses = []
+    for sense in entry.get("senses") or []:
+        if not isinstance(sense, dict):
+            continue
+        raw_index = sense.get("sense_index")
+        sense_index = raw_index if isinstance(raw_index, str) else ""
+        example = None
+        for candidate in sense.get("examples") or []:
+            if isinstance(candidate, dict) and candidate.get("text"):
+                example = {
+                    "text": candidate["text"],
+                    "bold_text_offsets": candidate.get("bold_text_offsets", []),
+                }
+                break
+        senses.append(
+            {
+                "sense_index": sense_index,
+                "id": sense.get("id"),
+                "glosses": sense.get("glosses", []),
+                "example": example,
+                "translations": translations.get(sense_index, []),
+            }
+        )
+
+    return {
+        "word": entry.get("word"),
+        "pos": entry.get("pos"),
+        "gender": [tag for tag in entry.get("tags") or [] if tag in GENDER_TAGS],
+        "ipa": [list(candidate) for candidate in candidates],
+        "senses": senses,
+    }
+
+
+def default_projection_path(file_path: Path) -> Path:
+    """Sidecar location beside a dictionary file"""
+    return file_path.parent / f".{file_path.stem.lower()}_projection.jsonl"
+
+
+def projection_index_path(projection_path: Path) -> Path:
+    """Binary index location for a sidecar file"""
+    return projection_path.with_suffix(".bin")
+
+
+@dataclass
+class ProjectionBuildResult:
+    """Outcome of writing a projection sidecar"""
+
+    path: Path
+    words: int
+    records: int
+    skipped: int
+    size: int
+    source_size: int
+    duration: float
+
+
+def project_range(
+    file_path: Path,
+    start: int,
+    end: int,
+    part_path: Path,
+    scorer: PronunciationScorer = unscored_pronunciation,
+) -> tuple[dict[str, list[int]], int, int]:
+    """Project the lines beginning inside [start, end) into a part file
+
+    Args:
+        file_path: JSONL dictionary file
+        start: Byte offset of the first line (must be a line start)
+        end: Byte offset where the range stops
+        part_path: File the projected records are written to
+        scorer: Pronunciation scorer passed to project_entry
+
+    Returns:
+        Tuple of (word -> offsets within the part, records, skipped lines)
+    """
+    index: dict[str, list[int]] = {}
+    records = skipped = 0
+    position = start
+    written = 0
+    with open(file_path, "rb") as source, open(part_path, "wb") as part:
+        source.seek(start)
+        while position < end:
+            line = source.readline()
+            if not line:
+                break
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+                word = entry.get("word")
+            except (ValueError, AttributeError):
+                skipped += 1
+                continue
+            if not isinstance(word, str):
+                skipped += 1
+                continue
+
+            record = (
+                json.dumps(
+                    project_entry(entry, scorer),
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                ).encode("utf-8")
+                + b"\n"
+            )
+            index.setdefault(word, []).append(written)
+            part.write(record)
+            written += len(record)
+            records += 1
+    return index, records, skipped
+
+
+def build_projection(
+    file_path: Path,
+    projection_path: Path,
+    fingerprint: dict[str, Any],
+    workers: int = 1,
+    progress: Callable[[int, int], None] | None = None,
+    scorer: PronunciationScorer = unscored_pronunciation,
+) -> ProjectionBuildResult:
+    """Write the projection sidecar and its index for a dictionary file
+
+    Ranges are projected into part files (in worker processes when
+    workers > 1) and concatenated in order, shifting each part's offsets.
+
+    Args:
+        file_path: JSONL dictionary file
+        projection_path: Sidecar JSONL destination
+        fingerprint: Source file fingerprint recorded in the index header
+        workers: Number of processes
+        progress: Optional callback receiving (bytes done, total bytes)
+        scorer: Scores pronunciations (must pickle when workers > 1)
+
+    Returns:
+        ProjectionBuildResult with record counts and sizes
+    """
+    start_time = time.perf_counter()
+    workers = max(workers, 1)
+    ranges = split_ranges(file_path, workers * 4 if workers > 1 else 1)
+    total = ranges[-1][1] if ranges else 0
+    part_paths = [
+        projection_path.with_name(f"{projection_path.name}.part{i}")
+        for i in range(len(ranges))
+    ]
+
+    parts: dict[int, tuple[dict[str, list[int]], int, int]] = {}
+    try:
+        if workers == 1:
+            done = 0
+            for i, (start, end) in enumerate(ranges):
+                parts[i] = project_range(file_path, start, end, part_paths[i], scorer)
+                done += end - start
+                if progress:
+                    progress(done, total)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(
+                        project_range, file_path, start, end, part_paths[i], scorer
+                    ): i
+                    for i, (start, end) in enumerate(ranges)
+                }
+                done = 0
+                for future in as_completed(futures):
+                    i = futures[future]
+                    parts[i] = future.result()
+                    done += ranges[i][1] - ranges[i][0]
+                    if progress:
+                        progress(done, total)
+
+        index: dict[str, list[int]] = {}
+        records = skipped = 0
+        tmp_path = projection_path.with_name(projection_path.name + ".tmp")
+        with open(tmp_path, "wb") as out:
+            for i, part_path in enumerate(part_paths):
+                base = out.tell()
+                with open(part_path, "rb") as part:
+                    shutil.copyfileobj(part, out)
+                partial, part_records, part_skipped = parts[i]
+                records += part_records
+                skipped += part_skipped
+                for word, offsets in partial.items():
+                    index.setdefault(word, []).extend(base + o for o in offsets)
+        os.replace(tmp_path, projection_path)
+    finally:
+        for part_path in part_paths:
+            part_path.unlink(missing_ok=True)
+
+    write_binary_index(
+        projection_index_path(projection_path),
+        index,
+        {
+            "projection_version": PROJECTION_VERSION,
+            "source": file_path.name,
+            "source_fingerprint": fingerprint,
+        },
+    )
+    return ProjectionBuildResult(
+        path=projection_path,
+        words=len(index),
+        records=records,
+        skipped=skipped,
+        size=projection_path.stat().st_size,
+        source_size=total,
+        duration=time.perf_counter() - start_time,
+    )
+
+
+class ProjectionStore:
+    """Read-only access to a projection sidecar by headword"""
+
+    def __init__(self, projection_path: Path, fingerprint: dict[str, Any]):
+        """Open a sidecar built from the source with the given fingerprint
+
+        Args:
+            projection_path: Sidecar JSONL file
+            fingerprint: Current fingerprint of the source dictionary
+
+        Raises:
+            BinaryIndexError: If the index is unreadable, was built for another
+                version of the source file, or by another projection version
+            OSError: If the sidecar files cannot be opened
+        """
+        self.path = Path(projection_path)
+        self.index = BinaryWordIndex(projection_index_path(self.path))
+        metadata = self.index.metadata
+        if (
+            metadata.get("projection_version") != PROJECTION_VERSION
+            or metadata.get("source_fingerprint") != fingerprint
+        ):
+            self.index.close()
+            raise BinaryIndexError(f"Projection {self.path} is stale")
+
+        try:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            self.index.close()
+            raise BinaryIndexError(f"Cannot map projection {self.path}: {e}") from e
+
+    def get(self, word: str) -> list[dict[str, Any]]:
+        """Get the projected records (one per part of speech) for a word"""
+        return [self._read(offset) for offset in self.index.get(word, [])]
+
+    def __contains__(self, word: object) -> bool:
+        return word in self.index
+
+    def _read(self, offset: int) -> dict[str, Any]:
+        end = self._mmap.find(b"\n", offset)
+        if end == -1:
+            end = len(self._mmap)
+        return cast("dict[str, Any]", json.loads(self._mmap[offset:end]))
+
+    def close(self) -> None:
+        """Unmap the sidecar and its index"""
+        self.index.close()
+        self._mmap.close()
@@ -0,0 +1,496 @@
+"""
+JSONL Data Provider
+
+Provides read-only access to large JSONL dictionary files (e.g. Español.jsonl)
+through a persistent binary word -> byte offset index over a memory-mapped file.
+"""
+
+import hashlib
+import json
+import mmap
+import threading
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+from src.providers.base.data_provider import DataProvider
+from src.utils.logging_config import ICONS
+
+from .jsonl_entry import LazyEntry
+from .jsonl_index import (
+    BinaryIndexError,
+    BinaryWordIndex,
+    IndexBuildResult,
+    build_word_index,
+    write_binary_index,
+)
+from .jsonl_projection import (
+    ProjectionBuildResult,
+    ProjectionStore,
+    PronunciationScorer,
+    build_projection,
+    default_projection_path,
+    project_entry,
+    unscored_pronunciation,
+)
+
+# Bytes sampled from the head and tail of the file for the fingerprint hash
+FINGERPRINT_SAMPLE_SIZE = 1024 * 1024
+
+
+def compute_fingerprint(file_path: Path) -> dict[str, Any]:
+    """Compute a cheap fingerprint used to invalidate a persisted index
+
+    Hashing the whole 1GB+ dictionary on every start would defeat the purpose
+    of the index, so the hash covers the first and last megabyte together
+    with the exact size and modification time.
+
+    Args:
+        file_path: File to fingerprint
+
+    Returns:
+        Dictionary with size, mtime_ns and sample hash
+    """
+    stat = file_path.stat()
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+        if stat.st_size > FINGERPRINT_SAMPLE_SIZE:
+            f.seek(max(stat.st_size - FINGERPRINT_SAMPLE_SIZE, FINGERPRINT_SAMPLE_SIZE))
+            digest.update(f.read(FINGERPRINT_SAMPLE_SIZE))
+
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest.hexdigest(),
+    }
+
+
+class JSONLDataProvider(DataProvider):
+    """Memory-efficient, read-only provider for large JSONL dictionary files
+
+    Each line of the file is one dictionary entry with a ``word`` key. A
+    headword may appear on several lines (one per part of speech), so the
+    index maps each word to the byte offsets of all of its lines.
+
+    The file is memory-mapped once and lines are handed out as zero-copy
+    ``memoryview`` slices, either parsed in full or wrapped in a
+    ``LazyEntry`` that decodes only the keys a stage reads.
+
+    Card-ready projections are served from a precomputed sidecar when one
+    matching the current file exists, and computed from raw entries
+    otherwise.
+    """
+
+    def __init__(
+        self,
+        file_path: Path,
+        index_path: Path | None = None,
+        build_index: bool = True,
+        index_workers: int = 1,
+        projection_path: Path | None = None,
+        pronunciation_scorer: PronunciationScorer | None = None,
+    ):
+        """Initialize JSONL data provider
+
+        Args:
+            file_path: Path to the JSONL dictionary file
+            index_path: Where to persist the index (default: beside the file)
+            build_index: Whether to build the index when missing or stale
+            index_workers: Processes used when the index has to be built
+            projection_path: Projection sidecar location (default: beside the file)
+            pronunciation_scorer: Scores IPA candidates in projections built
+                or computed by this provider (default: unscored)
+        """
+        super().__init__()
+        self.file_path = Path(file_path)
+        self.index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self.file_path.parent / f".{self.file_path.stem.lower()}_index.bin"
+        )
+        self.build_index = build_index
+        self.index_workers = index_workers
+        self.projection_path = (
+            Path(projection_path)
+            if projection_path is not None
+            else default_projection_path(self.file_path)
+        )
+        self.pronunciation_scorer = pronunciation_scorer or unscored_pronunciation
+
+        # Dictionary files are never written through the provider
+        self.set_read_only(True)
+
+        self._index: Mapping[str, list[int]] | None = None
+        self._mmap: mmap.mmap | None = None
+        self._mmap_lock = threading.Lock()
+        self._projection: ProjectionStore | None = None
+        self._projection_checked = False
+
+    # Index management
+    @property
+    def index(self) -> Mapping[str, list[int]]:
+        """Word -> byte offsets index, loaded or built on first access"""
+        if self._index is None:
+            self._index = self._load_or_build_index()
+        return self._index
+
+    def _load_or_build_index(self) -> Mapping[str, list[int]]:
+        """Load the persisted index, rebuilding it when missing or stale
+
+        The index is served from the memory-mapped binary file; the in-memory
+        dictionary is only used when the index cannot be persisted.
+
+        Raises:
+            ValueError: If the dictionary file is missing, or the index is
+                unusable and building is disabled
+        """
+        if not self.file_path.exists():
+            raise ValueError(f"Dictionary file not found: {self.file_path}")
+
+        fingerprint = compute_fingerprint(self.file_path)
+        index = self._load_index(fingerprint)
+        if index is not None:
+            return index
+
+        if not self.build_index:
+            raise ValueError(
+                f"Index for {self.file_path} is missing or stale and build_index is disabled"
+            )
+
+        return self.rebuild_index(self.index_workers, fingerprint=fingerprint)[0]
+
+    def rebuild_index(
+        self,
+        workers: int = 1,
+        progress: Callable[[int, int], None] | None = None,
+        fingerprint: dict[str, Any] | None = None,
+    ) -> tuple[Mapping[str, list[int]], IndexBuildResult]:
+        """Build the index from the dictionary file and persist it
+
+        Args:
+            workers: Number of processes scanning the file
+            progress: Optional callback receiving (bytes done, total bytes)
+            fingerprint: Precomputed file fingerprint
+
+        Returns:
+            Tuple of (index now served by the provider, build statistics)
+        """
+        if fingerprint is None:
+            fingerprint = compute_fingerprint(self.file_path)
+
+        self.logger.info(f"{ICONS['gear']} Building word index for {self.file_path}...")
+        result = build_word_index(self.file_path, workers=workers, progress=progress)
+        if result.skipped:
+            self.logger.warning(
+                f"{ICONS['warning']} Skipped {result.skipped} malformed lines"
+            )
+        self.logger.info(
+            f"{ICONS['check']} Indexed {len(result.index)} words in {result.duration:.2f}s"
+        )
+
+        if isinstance(self._index, BinaryWordIndex):
+            self._index.close()
+        self._index = result.index
+        if self._save_index(result.index, fingerprint):
+            try:
+                self._index = BinaryWordIndex(self.index_path)
+            except (OSError, BinaryIndexError) as e:
+                self.logger.warning(
+                    f"{ICONS['warning']} Could not map index {self.index_path}: {e}"
+                )
+        return self._index, result
+
+    def _load_index(self, fingerprint: dict[str, Any]) -> BinaryWordIndex | None:
+        """Map the index from disk if it matches the current file fingerprint"""
+        if not self.index_path.exists():
+            return None
+
+        try:
+            index = BinaryWordIndex(self.index_path)
+        except (OSError, BinaryIndexError) as e:
+            self.logger.warning(
+                f"{ICONS['warning']} Index at {self.index_path} is corrupt, rebuilding: {e}"
+            )
+            return None
+
+        if index.fingerprint != fingerprint:
+            self.logger.info(
+                f"{ICONS['info']} Index at {self.index_path} is stale, rebuilding"
+            )
+            index.close()
+            return None
+        return index
+
+    def _save_index(
+        self, index: dict[str, list[int]], fingerprint: dict[str, Any]
+    ) -> bool:
+        """Persist index beside the dictionary file (best effort)"""
+        metadata = {
+            "file_path": self.file_path.name,
+            "created_at": datetime.now().isoformat(),
+            "fingerprint": fingerprint,
+        }
+        try:
+            write_binary_index(self.index_path, index, metadata)
+            return True
+        except OSError as e:
+            self.logger.warning(
+                f"{ICONS['warning']} Could not persist index to {self.index_path}: {e}"
+            )
+            return False
+
+    # Memory map
+    def _get_mmap(self) -> mmap.mmap:
+        """Map the dictionary file read-only on first use"""
+        if self._mmap is None:
+            with self._mmap_lock:
+                if self._mmap is None:
+                    with open(self.file_path, "rb") as f:
+                        self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def _line_view(self, offset: int) -> memoryview:
+        """Zero-copy view of the line starting at offset (without newline)"""
+        mapped = self._get_mmap()
+        end = mapped.find(b"\n", offset)
+        if end == -1:
+            end = len(mapped)
+        return memoryview(mapped)[offset:end]
+
+    def close(self) -> None:
+        """Unmap the dictionary file and its index
+
+        Views handed out through LazyEntry keep the map alive; in that case
+        unmapping is left to garbage collection.
+        """
+        if isinstance(self._index, BinaryWordIndex):
+            self._index.close()
+        self._index = None
+        if self._projection is not None:
+            self._projection.close()
+        self._projection = None
+        self._projection_checked = False
+
+        with self._mmap_lock:
+            if self._mmap is not None:
+                try:
+                    self._mmap.close()
+                except BufferError:
+                    self.logger.debug("Dictionary map still referenced, not closing")
+                    return
+                self._mmap = None
+
+    # Dictionary access
+    def get_word(self, word: str) -> dict[str, Any] | None:
+        """Get the first dictionary entry for a word
+
+        Args:
+            word: Headword to look up (exact match)
+
+        Returns:
+            Parsed entry, or None if the word is not in the dictionary
+        """
+        offsets = self.index.get(word)
+        return self._parse_line(offsets[0]) if offsets else None
+
+    def get_word_entries(self, word: str) -> list[dict[str, Any]]:
+        """Get every dictionary entry (one per part of speech) for a word
+
+        Args:
+            word: Headword to look up (exact match)
+
+        Returns:
+            List of parsed entries in file order (empty if not found)
+        """
+        return [self._parse_line(offset) for offset in self.index.get(word, [])]
+
+    def get_words_batch(self, words: list[str]) -> dict[str, dict[str, Any]]:
+        """Get the first entry for multiple words with sequential reads
+
+        Args:
+            words: Headwords to look up
+
+        Returns:
+            Mapping of found words to their first entry
+        """
+        index = self.index
+        positions = sorted(
+            (index[word][0], word) for word in dict.fromkeys(words) if word in index
+        )
+        return {word: self._parse_line(offset) for offset, word in positions}
+
+    def get_entries_batch(self, words: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get all entries for multiple words, reading the file in offset order
+
+        Args:
+            words: Headwords to look up
+
+        Returns:
+            Mapping of found words to their entries in file order
+        """
+        results: dict[str, list[dict[str, Any]]] = {}
+        for offset, word in self._sorted_positions(words):
+            results.setdefault(word, []).append(self._parse_line(offset))
+        return results
+
+    def get_lazy_entries(self, word: str) -> list[LazyEntry]:
+        """Get lazily decoded entries for a word
+
+        Args:
+            word: Headword to look up (exact match)
+
+        Returns:
+            LazyEntry per line in file order (empty if not found)
+        """
+        return [
+            LazyEntry(self._line_view(offset)) for offset in self.index.get(word, [])
+        ]
+
+    def get_lazy_entries_batch(self, words: list[str]) -> dict[str, list[LazyEntry]]:
+        """Get lazily decoded entries for multiple words in offset order
+
+        Args:
+            words: Headwords to look up
+
+        Returns:
+            Mapping of found words to their LazyEntry objects
+        """
+        results: dict[str, list[LazyEntry]] = {}
+        for offset, word in self._sorted_positions(words):
+            results.setdefault(word, []).append(LazyEntry(self._line_view(offset)))
+        return results
+
+    # Card-ready projection
+    @property
+    def projection(self) -> ProjectionStore | None:
+        """Projection sidecar store, or None when missing or stale"""
+        if not self._projection_checked:
+            self._projection_checked = True
+            try:
+                self._projection = ProjectionStore(
+                    self.projection_path, compute_fingerprint(self.file_path)
+                )
+            except (OSError, BinaryIndexError) as e:
+                self.logger.info(
+                    f"{ICONS['info']} No usable projection sidecar, projecting raw entries: {e}"
+                )
+        return self._projection
+
+    def get_projection(self, word: str) -> list[dict[str, Any]]:
+        """Get card-ready projections (one per part of speech) for a word
+
+        Args:
+            word: Headword to look up (exact match)
+
+        Returns:
+            Projected records in file order (empty if not found)
+        """
+        store = self.projection
+        if store is not None:
+            return store.get(word)
+        return [
+            project_entry(entry, self.pronunciation_scorer)
+            for entry in self.get_word_entries(word)
+        ]
+
+    def get_projections_batch(
+        self, words: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Get card-ready projections for multiple words
+
+        Args:
+            words: Headwords to look up
+
+        Returns:
+            Mapping of found words to their projected records
+        """
+        store = self.projection
+        if store is None:
+            return {
+                word: [
+                    project_entry(entry, self.pronunciation_scorer) for entry in entries
+                ]
+                for word, entries in self.get_entries_batch(words).items()
+            }
+
+        results: dict[str, list[dict[str, Any]]] = {}
+        for word in dict.fromkeys(words):
+            records = store.get(word)
+            if records:
+                results[word] = records
+        return results
+
+    def build_projection(
+        self,
+        workers: int = 1,
+        progress: Callable[[int, int], None] | None = None,
+    ) -> ProjectionBuildResult:
+        """Write the projection sidecar for the dictionary file
+
+        Args:
+            workers: Number of processes projecting the file
+            progress: Optional callback receiving (bytes done, total bytes)
+
+        Returns:
+            ProjectionBuildResult with record counts and sizes
+        """
+        if self._projection is not None:
+            self._projection.close()
+        self._projection = None
+        self._projection_checked = False
+
+        self.logger.info(
+            f"{ICONS['gear']} Projecting {self.file_path} to {self.projection_path}..."
+        )
+        result = build_projection(
+            self.file_path,
+            self.projection_path,
+            compute_fingerprint(self.file_path),
+            workers=workers,
+            progress=progress,
+            scorer=self.pronunciation_scorer,
+        )
+        self.logger.info(
+            f"{ICONS['check']} Projected {result.records} entries in {result.duration:.2f}s"
+        )
+        return result
+
+    def exists_word(self, word: str) -> bool:
+        """Check if a word exists without reading its entry"""
+        return word in self.index
+
+    def _sorted_positions(self, words: list[str]) -> list[tuple[int, str]]:
+        """(offset, word) pairs for every line of the given words, by offset"""
+        index = self.index
+        return sorted(
+            (offset, word)
+            for word in dict.fromkeys(words)
+            for offset in index.get(word, [])
+        )
+
+    def _parse_line(self, offset: int) -> dict[str, Any]:
+        """Fully parse the line starting at offset"""
+        view = self._line_view(offset)
+        try:
+            return cast("dict[str, Any]", json.loads(str(view, "utf-8")))
+        finally:
+            view.release()
+
+    # DataProvider interface (identifier = headword)
+    def _load_data_impl(self, identifier: str) -> dict[str, Any]:
+        """Load the first dictionary entry for a headword"""
+        return self.get_word(identifier) or {}
+
+    def _save_data_impl(self, identifier: str, data: dict[str, Any]) -> bool:
+        """Dictionary files are read-only"""
+        return False
+
+    def exists(self, identifier: str) -> bool:
+        """Check if a headword exists in the dictionary"""
+        return self.exists_word(identifier)
+
+    def list_identifiers(self) -> list[str]:
+        """List all indexed headwords"""
+        return list(self.index.keys())
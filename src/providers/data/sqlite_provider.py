@@ -0,0 +1,490 @@
+"""
+SQLite Data Provider
+
+Stores JSON documents in a SQLite database, with vocabulary-shaped documents
+(``{"words": {word: {..., "meanings": [...]}}}``) split into indexed tables
+so single cards can be found without parsing every card.
+
+Tables:
+
+    documents  one row per identifier: every top-level key except "words"
+    words      one row per word: word-level fields except "meanings"
+    meanings   one row per card, with CardID, SpanishWord and MeaningID
+               columns indexed for lookups (plus MeaningContext, so card
+               listings never decode card data)
+
+Rows are inserted in document order, so reading by rowid restores it.
+Whole-document reads filter on ``+identifier``, which keeps SQLite from
+using an index for the filter so it scans in rowid order without sorting.
+
+The database runs in WAL mode, so readers are not blocked while a save is
+in progress. ``load_data`` reassembles the original document, so the
+provider can stand in for JSONDataProvider; ``import_json`` and
+``export_json`` move documents between the two layouts.
+"""
+
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, cast
+
+from src.providers.base.data_provider import DataProvider
+from src.utils.logging_config import ICONS
+
+# Documents are split into tables only when stored under this top-level key
+WORDS_KEY = "words"
+MEANINGS_KEY = "meanings"
+
+# SQLite limits bound parameters per statement (999 on older builds)
+QUERY_BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    identifier TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    split INTEGER NOT NULL,
+    updated TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS words (
+    identifier TEXT NOT NULL,
+    word TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    has_meanings INTEGER NOT NULL,
+    PRIMARY KEY (identifier, word)
+);
+CREATE TABLE IF NOT EXISTS meanings (
+    identifier TEXT NOT NULL,
+    word TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    card_id TEXT,
+    spanish_word TEXT,
+    meaning_id TEXT,
+    meaning_context TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (identifier, word, position)
+);
+CREATE INDEX IF NOT EXISTS meanings_card_id ON meanings (identifier, card_id);
+CREATE INDEX IF NOT EXISTS meanings_spanish_word
+    ON meanings (identifier, spanish_word);
+CREATE INDEX IF NOT EXISTS meanings_meaning_id ON meanings (identifier, meaning_id);
+"""
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _column(value: Any) -> str | None:
+    """Indexed column value for a card field (blank values are not indexed)"""
+    text = str(value if value is not None else "").strip()
+    return text or None
+
+
+def _read_json(json_path: Path) -> dict[str, Any]:
+    """Read a document written by JSONDataProvider"""
+    try:
+        text = json_path.read_text(encoding="utf-8")
+        data = json.loads(text) if text.strip() else {}
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"Error importing {json_path}: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError(f"Error importing {json_path}: not a JSON object")
+    return data
+
+
+def _is_splittable(words: Any) -> bool:
+    """Whether a "words" value has the vocabulary layout"""
+    if not isinstance(words, dict):
+        return False
+    for word_data in words.values():
+        if not isinstance(word_data, dict):
+            return False
+        meanings = word_data.get(MEANINGS_KEY, [])
+        if not isinstance(meanings, list) or not all(
+            isinstance(meaning, dict) for meaning in meanings
+        ):
+            return False
+    return True
+
+
+class SQLiteDataProvider(DataProvider):
+    """Provide data from a SQLite database with indexed card lookups"""
+
+    def __init__(
+        self,
+        db_path: Path,
+        read_only: bool = False,
+        managed_files: list[str] | None = None,
+        import_path: Path | None = None,
+    ):
+        """Initialize SQLite data provider
+
+        Args:
+            db_path: Database file (created if missing)
+            read_only: Whether provider is read-only
+            managed_files: List of identifiers this provider manages (None = all)
+            import_path: Directory of JSON files; a missing identifier is
+                imported from ``{identifier}.json`` there on first access
+        """
+        super().__init__()
+        self.db_path = Path(db_path)
+        self.import_path = Path(import_path) if import_path else None
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.RLock()
+
+        # Set permissions and file management
+        self.set_read_only(read_only)
+        if managed_files is not None:
+            self.set_managed_files(managed_files)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Open the database on first use"""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements atomically on the shared connection"""
+        with self._lock, self.connection as connection:
+            yield connection
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _stored(self, identifier: str) -> bool:
+        row = self.connection.execute(
+            "SELECT 1 FROM documents WHERE identifier = ?", (identifier,)
+        ).fetchone()
+        return row is not None
+
+    def _ensure_imported(self, identifier: str) -> None:
+        """Import ``{identifier}.json`` from import_path if not stored yet"""
+        if self.import_path is None:
+            return
+        with self._lock:
+            json_path = self.import_path / f"{identifier}.json"
+            if not self._stored(identifier) and json_path.exists():
+                self.logger.info(
+                    f"{ICONS['gear']} Importing {json_path} into {self.db_path}"
+                )
+                with self._transaction() as connection:
+                    self._write_document(connection, identifier, _read_json(json_path))
+
+    def _load_data_impl(self, identifier: str) -> dict[str, Any]:
+        """Reassemble a document from its rows
+
+        Args:
+            identifier: Document name
+
+        Returns:
+            Document in its original JSON layout (empty if not stored)
+
+        Raises:
+            ValueError: If the database cannot be read
+        """
+        try:
+            self._ensure_imported(identifier)
+            with self._lock:
+                return self._read_document(identifier)
+        except sqlite3.Error as e:
+            raise ValueError(f"Error loading {identifier}: {e}") from e
+
+    def _read_document(self, identifier: str) -> dict[str, Any]:
+        row = self.connection.execute(
+            "SELECT data, split FROM documents WHERE identifier = ?", (identifier,)
+        ).fetchone()
+        if row is None:
+            return {}
+        document = cast("dict[str, Any]", json.loads(row[0]))
+        if not row[1]:
+            return document
+
+        words: dict[str, Any] = {}
+        for word, data, flag in self.connection.execute(
+            "SELECT word, data, has_meanings FROM words "
+            "WHERE +identifier = ? ORDER BY rowid",
+            (identifier,),
+        ):
+            words[word] = json.loads(data)
+            if flag:
+                words[word][MEANINGS_KEY] = []
+        for word, data in self.connection.execute(
+            "SELECT word, data FROM meanings WHERE +identifier = ? ORDER BY rowid",
+            (identifier,),
+        ):
+            words[word][MEANINGS_KEY].append(json.loads(data))
+        document[WORDS_KEY] = words
+        return document
+
+    def _save_data_impl(self, identifier: str, data: dict[str, Any]) -> bool:
+        """Replace the stored rows of a document
+
+        Args:
+            identifier: Document name
+            data: Complete document
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+        try:
+            with self._transaction() as connection:
+                self._write_document(connection, identifier, data)
+            return True
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            # TypeError can occur if data contains non-serializable objects
+            self.logger.error(f"Error saving {identifier}: {e}")
+            return False
+
+    def _write_document(
+        self, connection: sqlite3.Connection, identifier: str, data: dict[str, Any]
+    ) -> None:
+        words = data.get(WORDS_KEY)
+        split = _is_splittable(words)
+        rest = {k: v for k, v in data.items() if k != WORDS_KEY} if split else data
+
+        connection.execute("DELETE FROM words WHERE identifier = ?", (identifier,))
+        connection.execute("DELETE FROM meanings WHERE identifier = ?", (identifier,))
+        connection.execute(
+            "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?)",
+            (identifier, _dumps(rest), int(split), datetime.now().isoformat()),
+        )
+        if not split:
+            return
+
+        word_rows = []
+        meaning_rows = []
+        for position, (word, word_data) in enumerate(cast("dict", words).items()):
+            meanings = word_data.get(MEANINGS_KEY)
+            fields = {k: v for k, v in word_data.items() if k != MEANINGS_KEY}
+            word_rows.append(
+                (identifier, word, position, _dumps(fields), int(meanings is not None))
+            )
+            for index, meaning in enumerate(meanings or []):
+                meaning_rows.append(
+                    (
+                        identifier,
+                        word,
+                        index,
+                        _column(meaning.get("CardID")),
+                        _column(meaning.get("SpanishWord")),
+                        _column(meaning.get("MeaningID")),
+                        _column(meaning.get("MeaningContext")),
+                        _dumps(meaning),
+                    )
+                )
+        connection.executemany("INSERT INTO words VALUES (?, ?, ?, ?, ?)", word_rows)
+        connection.executemany(
+            "INSERT INTO meanings VALUES (?, ?, ?, ?, ?, ?, ?, ?)", meaning_rows
+        )
+
+    def find_card(
+        self, card_id: str, identifier: str = "vocabulary"
+    ) -> dict[str, Any] | None:
+        """Find a card by CardID using the CardID index
+
+        Args:
+            card_id: CardID to look up
+            identifier: Vocabulary document name
+
+        Returns:
+            Card (meaning) data, or None if not found
+        """
+        self.validate_file_access(identifier)
+        self._ensure_imported(identifier)
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT data FROM meanings WHERE identifier = ? AND card_id = ? "
+                "LIMIT 1",
+                (identifier, card_id.strip()),
+            ).fetchone()
+        return cast("dict[str, Any]", json.loads(row[0])) if row else None
+
+    def find_cards_by_word(
+        self, spanish_word: str, identifier: str = "vocabulary"
+    ) -> list[dict[str, Any]]:
+        """Find every card of a word using the SpanishWord index
+
+        Args:
+            spanish_word: SpanishWord field value
+            identifier: Vocabulary document name
+
+        Returns:
+            Card (meaning) data in document order
+        """
+        self.validate_file_access(identifier)
+        self._ensure_imported(identifier)
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT data FROM meanings WHERE identifier = ? AND spanish_word = ? "
+                "ORDER BY rowid",
+                (identifier, spanish_word.strip()),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def list_cards(self, identifier: str = "vocabulary") -> list[dict[str, str]]:
+        """List every card with its basic info without decoding card data
+
+        Args:
+            identifier: Vocabulary document name
+
+        Returns:
+            CardID, SpanishWord, MeaningID and MeaningContext of every card
+            (whitespace-trimmed, as stored in the indexed columns)
+        """
+        self.validate_file_access(identifier)
+        self._ensure_imported(identifier)
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT card_id, spanish_word, meaning_id, meaning_context "
+                "FROM meanings WHERE +identifier = ? ORDER BY rowid",
+                (identifier,),
+            ).fetchall()
+        return [
+            {
+                "CardID": card_id or "",
+                "SpanishWord": spanish_word or "",
+                "MeaningID": meaning_id or "",
+                "MeaningContext": context or "",
+            }
+            for card_id, spanish_word, meaning_id, context in rows
+        ]
+
+    def get_card_ids(
+        self, identifier: str = "vocabulary", candidates: Iterable[str] | None = None
+    ) -> set[str]:
+        """CardIDs stored in a vocabulary document (index-only scan)
+
+        Args:
+            identifier: Vocabulary document name
+            candidates: Only check these CardIDs (None = return all)
+
+        Returns:
+            Stored CardIDs (limited to candidates when given)
+        """
+        self.validate_file_access(identifier)
+        self._ensure_imported(identifier)
+        query = "SELECT card_id FROM meanings WHERE identifier = ?"
+        with self._lock:
+            if candidates is None:
+                rows = self.connection.execute(
+                    query + " AND card_id IS NOT NULL", (identifier,)
+                ).fetchall()
+                return {row[0] for row in rows}
+
+            found: set[str] = set()
+            pending = list(dict.fromkeys(candidates))
+            for start in range(0, len(pending), QUERY_BATCH_SIZE):
+                batch = pending[start : start + QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.connection.execute(
+                    f"{query} AND card_id IN ({placeholders})", (identifier, *batch)
+                ).fetchall()
+                found.update(row[0] for row in rows)
+            return found
+
+    def import_json(self, identifier: str, json_path: Path) -> bool:
+        """Load a JSON file (JSONDataProvider layout) into the database
+
+        Args:
+            identifier: Document name to store it under
+            json_path: JSON file to import
+
+        Returns:
+            True if import was successful, False otherwise
+
+        Raises:
+            ValueError: If the file is not a JSON object
+        """
+        return self.save_data(identifier, _read_json(Path(json_path)))
+
+    def export_json(self, identifier: str, json_path: Path) -> bool:
+        """Write a document as JSON in the same format as JSONDataProvider
+
+        Args:
+            identifier: Document name
+            json_path: Destination file
+
+        Returns:
+            True if export was successful, False otherwise
+        """
+        try:
+            content = json.dumps(
+                self.load_data(identifier), indent=2, ensure_ascii=False, sort_keys=True
+            )
+            json_path = Path(json_path)
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+            json_path.write_text(content + "\n", encoding="utf-8")
+            return True
+        except (OSError, ValueError) as e:
+            self.logger.error(f"Error exporting {identifier}: {e}")
+            return False
+
+    def exists(self, identifier: str) -> bool:
+        """Check if a document is stored (or importable)
+
+        Args:
+            identifier: Document name
+
+        Returns:
+            True if the document exists, False otherwise
+        """
+        self.validate_file_access(identifier)
+        if self.import_path and (self.import_path / f"{identifier}.json").exists():
+            return True
+        with self._lock:
+            return self._stored(identifier)
+
+    def list_identifiers(self) -> list[str]:
+        """List stored documents
+
+        Returns:
+            Document names (filtered by managed files if set)
+        """
+        with self._lock:
+            identifiers = [
+                row[0]
+                for row in self.connection.execute(
+                    "SELECT identifier FROM documents ORDER BY identifier"
+                )
+            ]
+        if self._managed_files:
+            return [i for i in identifiers if i in self._managed_files]
+        return identifiers
+
+    def backup_data(self, identifier: str) -> str | None:
+        """Copy a document to a timestamped identifier in the same database
+
+        Args:
+            identifier: Document name
+
+        Returns:
+            Backup identifier if successful, None if failed
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        backup_name = f"{identifier}_backup_{timestamp}"
+        try:
+            with self._lock:
+                if not self._stored(identifier):
+                    return None
+                data = self._read_document(identifier)
+                with self._transaction() as connection:
+                    self._write_document(connection, backup_name, data)
+            return backup_name
+        except (sqlite3.Error, ValueError):
+            return None
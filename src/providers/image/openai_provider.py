@@ -6,6 +6,7 @@ Clean implementation for OpenAI DALL-E image generation with config injection
 
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 try:
     import openai  # type: ignore[import-not-found]
@@ -16,6 +17,7 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 from src.providers.base.media_provider import MediaProvider, MediaRequest, MediaResult
+from src.utils.profiler import profile_span
 
 
 class OpenAIProvider(MediaProvider):
@@ -93,7 +95,14 @@ class OpenAIProvider(MediaProvider):
 
             # Make API call
             if self.client and OPENAI_AVAILABLE:
-                response = self.client.images.generate(**api_params)
+                host = urlsplit(str(self.client.base_url)).netloc
+                with profile_span(f"POST {host}", "http", service="openai") as span:
+                    # The raw response exposes the status and size for the span
+                    raw = self.client.images.with_raw_response.generate(**api_params)
+                    if span is not None:
+                        span.attributes["status_code"] = raw.status_code
+                        span.add(bytes=len(raw.content))
+                response = raw.parse()
                 image_url = response.data[0].url
                 revised_prompt = getattr(response.data[0], "revised_prompt", None)
             else:
@@ -138,18 +147,25 @@ class OpenAIProvider(MediaProvider):
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Download the image
-        response = requests.get(url, stream=True, timeout=30)
-        response.raise_for_status()
-
-        with open(output_path, "wb") as f:
-            try:
-                # Try to use streaming download
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-            except (TypeError, AttributeError):
-                # Fallback for mock responses that don't support iter_content
-                content = getattr(response, "content", b"mock_image_data")
-                f.write(content)
+        with profile_span(
+            f"GET {urlsplit(url).netloc}", "http", service="openai"
+        ) as span:
+            response = requests.get(url, stream=True, timeout=30)
+            if span is not None:
+                span.attributes["status_code"] = response.status_code
+            response.raise_for_status()
+
+            with open(output_path, "wb") as f:
+                try:
+                    # Try to use streaming download
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                        if span is not None:
+                            span.add(bytes=len(chunk))
+                except (TypeError, AttributeError):
+                    # Fallback for mock responses that don't support iter_content
+                    content = getattr(response, "content", b"mock_image_data")
+                    f.write(content)
 
         return output_path
 
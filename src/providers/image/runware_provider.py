@@ -9,10 +9,13 @@ import re
 import time
 from pathlib import Path
 from typing import Any
+from urllib.parse import urlsplit
 
 import requests
 
 from src.providers.base.media_provider import MediaProvider, MediaRequest, MediaResult
+from src.utils.profiler import profile_span
+from src.utils.rate_limiter import parse_retry_after
 
 
 class RunwareError(Exception):
@@ -34,6 +37,9 @@ class RunwareGenerationError(RunwareError):
 class RunwareProvider(MediaProvider):
     """Clean Runware media provider for AI image generation"""
 
+    # Every generate attempt, retries included, takes its own token
+    paces_own_requests = True
+
     def __init__(self, config: dict[str, Any] | None = None) -> None:
         """Initialize provider with config injection"""
         super().__init__(config)
@@ -205,20 +211,37 @@ class RunwareProvider(MediaProvider):
         if "guidance" in params:
             api_params["guidance"] = params["guidance"]
 
-        # Retry logic with exponential backoff
+        # Retry logic with exponential backoff; every attempt draws on the
+        # shared Runware budget
         max_retries = 3
         for attempt in range(max_retries):
+            self.rate_limiter.acquire()
             try:
-                response = self._session.post(
-                    f"{self.api_base_url}/generate",
-                    json=api_params,
-                    timeout=self.timeout,
-                )
+                url = f"{self.api_base_url}/generate"
+                with profile_span(
+                    f"POST {urlsplit(url).netloc}",
+                    "http",
+                    service="runware",
+                    attempt=attempt + 1,
+                ) as span:
+                    response = self._session.post(
+                        url, json=api_params, timeout=self.timeout
+                    )
+                    if span is not None:
+                        span.attributes["status_code"] = response.status_code
+                        span.add(bytes=len(response.content))
 
                 # Handle HTTP errors
                 if response.status_code == 401:
                     raise RunwareAuthError("Invalid API key or unauthorized access")
                 elif response.status_code == 429:
+                    # Hold back every Runware request until Retry-After
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                    self.rate_limiter.pause(
+                        retry_after if retry_after is not None else 2**attempt
+                    )
+                    if attempt < max_retries - 1:
+                        continue
                     raise RunwareRateLimitError("API rate limit exceeded")
                 elif response.status_code >= 500:
                     # Always call raise_for_status first to maintain compatibility with mocks
@@ -270,18 +293,27 @@ class RunwareProvider(MediaProvider):
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Download the image
-            response = self._session.get(image_url, stream=True, timeout=self.timeout)
-            response.raise_for_status()
-
-            # Verify content type
-            content_type = response.headers.get("content-type", "")
-            if "image" not in content_type:
-                return False
-
-            # Write image data
-            with open(file_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            with profile_span(
+                f"GET {urlsplit(image_url).netloc}", "http", service="runware"
+            ) as span:
+                response = self._session.get(
+                    image_url, stream=True, timeout=self.timeout
+                )
+                if span is not None:
+                    span.attributes["status_code"] = response.status_code
+                response.raise_for_status()
+
+                # Verify content type
+                content_type = response.headers.get("content-type", "")
+                if "image" not in content_type:
+                    return False
+
+                # Write image data
+                with open(file_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        f.write(chunk)
+                        if span is not None:
+                            span.add(bytes=len(chunk))
 
             return True
 
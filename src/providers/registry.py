@@ -5,10 +5,12 @@ Registry system for managing provider instances and creating provider factories.
 """
 
 import importlib
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from src.utils.logging_config import ICONS, get_logger, log_performance
+from src.utils.rate_limiter import get_rate_limiter_registry
 
 from .base.data_provider import DataProvider
 
@@ -42,6 +44,11 @@ class ProviderRegistry:
         self._sync_providers: dict[str, SyncProvider] = {}
         self._provider_pipeline_assignments: dict[str, list[str]] = {}
         self._data_provider_configs: dict[str, dict[str, Any]] = {}
+        # Media provider configs not yet instantiated, by type then name
+        self._provider_factories: dict[str, dict[str, dict[str, Any]]] = {
+            provider_type: {} for provider_type in MEDIA_PROVIDER_REGISTRY
+        }
+        self._factory_lock = threading.RLock()
         self.logger = get_logger("providers.registry")
         self.config: dict[str, Any] = {}
 
@@ -84,6 +91,7 @@ class ProviderRegistry:
             name: Provider name
             provider: MediaProvider instance that supports audio
         """
+        self._provider_factories["audio"].pop(name, None)
         self._audio_providers[name] = provider
 
     def get_audio_provider(self, name: str) -> MediaProvider | None:
@@ -92,14 +100,18 @@ class ProviderRegistry:
         Args:
             name: Provider name
 
+        Configured providers are created on first access and cached.
+
         Returns:
             MediaProvider instance if found, None otherwise
         """
+        if name not in self._audio_providers:
+            self._instantiate_provider("audio", name)
         return self._audio_providers.get(name)
 
     def list_audio_providers(self) -> list[str]:
-        """List all registered audio provider names"""
-        return list(self._audio_providers.keys())
+        """List registered and configured (not yet created) audio provider names"""
+        return [*self._audio_providers, *self._provider_factories["audio"]]
 
     # Image Provider Methods
     def register_image_provider(self, name: str, provider: MediaProvider) -> None:
@@ -109,6 +121,7 @@ class ProviderRegistry:
             name: Provider name
             provider: MediaProvider instance that supports images
         """
+        self._provider_factories["image"].pop(name, None)
         self._image_providers[name] = provider
 
     def get_image_provider(self, name: str) -> MediaProvider | None:
@@ -117,14 +130,18 @@ class ProviderRegistry:
         Args:
             name: Provider name
 
+        Configured providers are created on first access and cached.
+
         Returns:
             MediaProvider instance if found, None otherwise
         """
+        if name not in self._image_providers:
+            self._instantiate_provider("image", name)
         return self._image_providers.get(name)
 
     def list_image_providers(self) -> list[str]:
-        """List all registered image provider names"""
-        return list(self._image_providers.keys())
+        """List registered and configured (not yet created) image provider names"""
+        return [*self._image_providers, *self._provider_factories["image"]]
 
     # Sync Provider Methods
     def register_sync_provider(self, name: str, provider: SyncProvider) -> None:
@@ -134,6 +151,7 @@ class ProviderRegistry:
             name: Provider name
             provider: SyncProvider instance
         """
+        self._provider_factories["sync"].pop(name, None)
         self._sync_providers[name] = provider
 
     def get_sync_provider(self, name: str) -> SyncProvider | None:
@@ -142,14 +160,18 @@ class ProviderRegistry:
         Args:
             name: Provider name
 
+        Configured providers are created on first access and cached.
+
         Returns:
             SyncProvider instance if found, None otherwise
         """
+        if name not in self._sync_providers:
+            self._instantiate_provider("sync", name)
         return self._sync_providers.get(name)
 
     def list_sync_providers(self) -> list[str]:
-        """List all registered sync provider names"""
-        return list(self._sync_providers.keys())
+        """List registered and configured (not yet created) sync provider names"""
+        return [*self._sync_providers, *self._provider_factories["sync"]]
 
     # Utility Methods
     def clear_all(self) -> None:
@@ -160,6 +182,8 @@ class ProviderRegistry:
         self._sync_providers.clear()
         self._provider_pipeline_assignments.clear()
         self._data_provider_configs.clear()
+        for factories in self._provider_factories.values():
+            factories.clear()
 
     def get_provider_info(self) -> dict[str, Any]:
         """Get information about all registered providers
@@ -173,16 +197,16 @@ class ProviderRegistry:
                 "names": list(self._data_providers.keys()),
             },
             "audio_providers": {
-                "count": len(self._audio_providers),
-                "names": list(self._audio_providers.keys()),
+                "count": len(self.list_audio_providers()),
+                "names": self.list_audio_providers(),
             },
             "image_providers": {
-                "count": len(self._image_providers),
-                "names": list(self._image_providers.keys()),
+                "count": len(self.list_image_providers()),
+                "names": self.list_image_providers(),
             },
             "sync_providers": {
-                "count": len(self._sync_providers),
-                "names": list(self._sync_providers.keys()),
+                "count": len(self.list_sync_providers()),
+                "names": self.list_sync_providers(),
             },
         }
 
@@ -249,10 +273,12 @@ class ProviderRegistry:
     ) -> dict[str, MediaProvider]:
         """Filter audio providers by pipeline assignment."""
         filtered = {}
-        for name, provider in self._audio_providers.items():
+        for name in self.list_audio_providers():
             assignments = self.get_pipeline_assignments("audio", name)
             if "*" in assignments or pipeline_name in assignments:
-                filtered[name] = provider
+                provider = self.get_audio_provider(name)
+                if provider is not None:
+                    filtered[name] = provider
         return filtered
 
     def _get_filtered_image_providers(
@@ -260,10 +286,12 @@ class ProviderRegistry:
     ) -> dict[str, MediaProvider]:
         """Filter image providers by pipeline assignment."""
         filtered = {}
-        for name, provider in self._image_providers.items():
+        for name in self.list_image_providers():
             assignments = self.get_pipeline_assignments("image", name)
             if "*" in assignments or pipeline_name in assignments:
-                filtered[name] = provider
+                provider = self.get_image_provider(name)
+                if provider is not None:
+                    filtered[name] = provider
         return filtered
 
     def _get_filtered_sync_providers(
@@ -271,10 +299,12 @@ class ProviderRegistry:
     ) -> dict[str, SyncProvider]:
         """Filter sync providers by pipeline assignment."""
         filtered = {}
-        for name, provider in self._sync_providers.items():
+        for name in self.list_sync_providers():
             assignments = self.get_pipeline_assignments("sync", name)
             if "*" in assignments or pipeline_name in assignments:
-                filtered[name] = provider
+                provider = self.get_sync_provider(name)
+                if provider is not None:
+                    filtered[name] = provider
         return filtered
 
     def _validate_file_conflicts(self) -> None:
@@ -413,7 +443,11 @@ class ProviderRegistry:
             raise ValueError(f"Unknown provider type for registration: {provider_type}")
 
     def _setup_media_providers(self) -> None:
-        """Setup all media providers using dynamic loading and config injection."""
+        """Record media provider factories from configuration.
+
+        Providers are only created, and their modules imported, on first
+        access through ``get_*_provider`` or ``get_providers_for_pipeline``.
+        """
         provider_configs = self._extract_provider_configs()
 
         for provider_type in ["audio", "image", "sync"]:
@@ -433,29 +467,47 @@ class ProviderRegistry:
                         )
 
                     pipelines = config.get("pipelines", [])
-                    try:
-                        provider = self._create_media_provider(
-                            provider_type, provider_name, config
-                        )
-                        self._register_provider_by_type(
-                            provider_type, provider_name, provider
-                        )
-                        self.set_pipeline_assignments(
-                            provider_type, provider_name, pipelines
-                        )
+                    self._provider_factories[provider_type][provider_name] = config
+                    self.set_pipeline_assignments(
+                        provider_type, provider_name, pipelines
+                    )
 
-                        provider_type_name = config.get("type", provider_name)
-                        self.logger.info(
-                            f"{ICONS['check']} Registered {provider_type_name} {provider_type} provider '{provider_name}' for pipelines {pipelines}"
-                        )
-                    except (ValueError, TypeError) as e:
-                        # Provider configuration is incomplete or invalid
-                        # Log warning but don't fail the entire registry initialization
-                        provider_type_name = config.get("type", provider_name)
-                        self.logger.warning(
-                            f"{ICONS['warning']} Failed to register {provider_type_name} {provider_type} provider '{provider_name}': {str(e)}"
-                        )
-                        # Continue with other providers rather than failing completely
+                    provider_type_name = config.get("type", provider_name)
+                    self.logger.info(
+                        f"{ICONS['check']} Configured {provider_type_name} {provider_type} provider '{provider_name}' for pipelines {pipelines}"
+                    )
+
+    def _instantiate_provider(self, provider_type: str, provider_name: str) -> None:
+        """Create and register a configured media provider on first access.
+
+        A provider whose configuration is incomplete or invalid is logged
+        and dropped, so later lookups return None without retrying.
+
+        Args:
+            provider_type: Type of provider (audio, image, sync)
+            provider_name: Name of provider instance
+        """
+        with self._factory_lock:
+            config = self._provider_factories[provider_type].pop(provider_name, None)
+            if config is None:
+                return
+
+            provider_type_name = config.get("type", provider_name)
+            try:
+                provider = self._create_media_provider(
+                    provider_type, provider_name, config
+                )
+            except (ValueError, TypeError) as e:
+                # Provider configuration is incomplete or invalid
+                self.logger.warning(
+                    f"{ICONS['warning']} Failed to register {provider_type_name} {provider_type} provider '{provider_name}': {str(e)}"
+                )
+                return
+
+            self._register_provider_by_type(provider_type, provider_name, provider)
+            self.logger.info(
+                f"{ICONS['check']} Registered {provider_type_name} {provider_type} provider '{provider_name}'"
+            )
 
     @classmethod
     @log_performance("fluent_forever.providers.registry")
@@ -466,7 +518,8 @@ class ProviderRegistry:
             config: Config instance with provider configuration
 
         Returns:
-            ProviderRegistry instance with providers initialized
+            ProviderRegistry instance with data providers initialized and
+            media providers ready to be created on first access
 
         Raises:
             ValueError: If configuration uses old format or is invalid
@@ -477,6 +530,9 @@ class ProviderRegistry:
         registry = cls()
         registry.config = config._config_data
 
+        # Shared per-service rate limits (apis.<service>.requests_per_second)
+        get_rate_limiter_registry().configure_from(registry.config)
+
         # Get providers config - must exist
         providers_config = config.get("providers", {})
         if not providers_config:
@@ -530,6 +586,80 @@ class ProviderRegistry:
                         f"{ICONS['check']} Registered JSON data provider '{provider_name}' "
                         f"for pipelines {pipelines} (read_only={read_only}, files={files})"
                     )
+                elif provider_type == "journaled":
+                    from .data.journaled_provider import JournaledDataProvider
+
+                    base_path = Path(data_config.get("base_path", "."))
+                    journaled_provider = JournaledDataProvider(
+                        base_path,
+                        read_only=read_only,
+                        managed_files=files,
+                        compact_ratio=data_config.get("compact_ratio", 1.0),
+                    )
+
+                    registry.register_data_provider(
+                        provider_name,
+                        journaled_provider,
+                        config={"files": files, "read_only": read_only},
+                    )
+                    registry.set_pipeline_assignments("data", provider_name, pipelines)
+                    logger.info(
+                        f"{ICONS['check']} Registered journaled data provider '{provider_name}' "
+                        f"for pipelines {pipelines} (read_only={read_only}, files={files})"
+                    )
+                elif provider_type == "sqlite":
+                    from .data.sqlite_provider import SQLiteDataProvider
+
+                    if not data_config.get("db_path"):
+                        raise ValueError(
+                            f"Provider '{provider_name}' is missing required 'db_path' field"
+                        )
+
+                    import_path = data_config.get("import_path")
+                    sqlite_provider = SQLiteDataProvider(
+                        Path(data_config["db_path"]),
+                        read_only=read_only,
+                        managed_files=files,
+                        import_path=Path(import_path) if import_path else None,
+                    )
+
+                    registry.register_data_provider(
+                        provider_name,
+                        sqlite_provider,
+                        config={"files": files, "read_only": read_only},
+                    )
+                    registry.set_pipeline_assignments("data", provider_name, pipelines)
+                    logger.info(
+                        f"{ICONS['check']} Registered SQLite data provider '{provider_name}' "
+                        f"for pipelines {pipelines} (db={data_config['db_path']}, "
+                        f"read_only={read_only}, files={files})"
+                    )
+                elif provider_type == "jsonl":
+                    from .data.jsonl_provider import JSONLDataProvider
+
+                    if not data_config.get("file_path"):
+                        raise ValueError(
+                            f"Provider '{provider_name}' is missing required 'file_path' field"
+                        )
+
+                    index_path = data_config.get("index_cache_path")
+                    jsonl_provider = JSONLDataProvider(
+                        Path(data_config["file_path"]),
+                        index_path=Path(index_path) if index_path else None,
+                        build_index=data_config.get("build_index", True),
+                        index_workers=data_config.get("index_workers", 1),
+                    )
+
+                    registry.register_data_provider(
+                        provider_name,
+                        jsonl_provider,
+                        config={"files": files, "read_only": True},
+                    )
+                    registry.set_pipeline_assignments("data", provider_name, pipelines)
+                    logger.info(
+                        f"{ICONS['check']} Registered JSONL data provider '{provider_name}' "
+                        f"for pipelines {pipelines} (file={data_config['file_path']})"
+                    )
                 else:
                     raise ValueError(f"Unsupported data provider type: {provider_type}")
         else:
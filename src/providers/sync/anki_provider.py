@@ -22,7 +22,7 @@ class AnkiProvider(SyncProvider, BaseAPIClient):
 
     def __init__(self) -> None:
         SyncProvider.__init__(self)
-        BaseAPIClient.__init__(self, "AnkiConnect")
+        BaseAPIClient.__init__(self, "AnkiConnect", rate_limit_service="anki")
 
         # Handle both old and new config structure during migration
         if "apis" in self.config and "anki" in self.config["apis"]:
@@ -5,10 +5,37 @@ Common base implementations for typical stage patterns:
 - File operations (load/save JSON)
 - API interactions (external service calls)
 - Data validation (structured validation)
+- Streaming (generator steps with chunked, resumable flushes)
+- Mapping (per-item fan-out on a thread or process pool)
+- Process (chunked CPU-bound work with per-worker resources)
 """
 
 from .api_stage import APIStage
 from .file_stage import FileLoadStage, FileSaveStage
+from .map_stage import MapItemError, MapStage, MapStats
+from .process_stage import ProcessStage, worker_resource
+from .streaming_stage import (
+    StreamCheckpoint,
+    StreamingStage,
+    StreamItemError,
+    StreamStats,
+    StreamStep,
+)
 from .validation_stage import ValidationStage
 
-__all__ = ["FileLoadStage", "FileSaveStage", "APIStage", "ValidationStage"]
+__all__ = [
+    "FileLoadStage",
+    "FileSaveStage",
+    "APIStage",
+    "ValidationStage",
+    "StreamingStage",
+    "StreamStep",
+    "StreamCheckpoint",
+    "StreamStats",
+    "StreamItemError",
+    "MapStage",
+    "MapStats",
+    "MapItemError",
+    "ProcessStage",
+    "worker_resource",
+]
@@ -0,0 +1,264 @@
+"""
+Map Stages
+
+Base implementation for stages that apply one function to every item of a
+collection (cards in a word queue, media requests, notes to build) on a
+bounded worker pool.
+
+Items are read lazily from ``iter_items`` and at most ``2 * max_workers``
+are in flight at once, so large inputs are never materialized as futures.
+Each item is retried up to ``retries`` times with exponential backoff;
+raising MapItemError fails the item immediately. Failed items are reported
+per item and the stage returns PARTIAL as long as some items succeeded.
+Outputs are collected in input order regardless of completion order.
+"""
+
+import time
+from abc import abstractmethod
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.context import PipelineContext
+from src.core.stages import Stage, StageResult
+from src.utils.logging_config import ICONS
+
+DEFAULT_MAX_WORKERS = 4
+
+EXECUTOR_TYPES = ("thread", "process")
+
+# Item errors kept for the stage result; the rest are counted
+MAX_REPORTED_ERRORS = 50
+
+
+class MapItemError(Exception):
+    """Raised by an item function to fail the item without retrying"""
+
+    pass
+
+
+@dataclass
+class MapStats:
+    """Counters for one map run"""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retried: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def fail(self, message: str) -> None:
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "retried": self.retried,
+        }
+
+
+def run_item(
+    func: Callable[[Any], Any], item: Any, retries: int, retry_delay: float
+) -> tuple[Any, int]:
+    """Call an item function, retrying failures with exponential backoff
+
+    Module-level so process pools can pickle it alongside the item function.
+
+    Args:
+        func: Item function
+        item: Input item
+        retries: Extra attempts after the first failure
+        retry_delay: Wait before the first retry, doubled for each later one
+
+    Returns:
+        Tuple of (output, retries used)
+
+    Raises:
+        MapItemError: Immediately, if the item function raises it
+        Exception: The last error once retries are exhausted
+    """
+    for attempt in range(retries + 1):
+        try:
+            return func(item), attempt
+        except MapItemError:
+            raise
+        except Exception:
+            if attempt == retries:
+                raise
+            if retry_delay > 0:
+                time.sleep(retry_delay * 2**attempt)
+    raise AssertionError("unreachable")
+
+
+class MapStage(Stage):
+    """Stage that maps an item function over a collection with a worker pool"""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        executor: str = "thread",
+        retries: int = 0,
+        retry_delay: float = 0.0,
+        output_key: str | None = None,
+    ):
+        """
+        Initialize map stage
+
+        Args:
+            max_workers: Items processed concurrently (1 runs inline)
+            executor: 'thread' for I/O-bound items, 'process' for CPU-bound
+                ones (the item function and items must then be picklable)
+            retries: Extra attempts for an item that raises
+            retry_delay: Seconds before the first retry, doubled each time
+            output_key: Context key receiving the ordered outputs
+
+        Raises:
+            ValueError: If an argument is out of range
+        """
+        super().__init__()
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if executor not in EXECUTOR_TYPES:
+            raise ValueError(
+                f"executor must be one of {EXECUTOR_TYPES}, got '{executor}'"
+            )
+        if retries < 0:
+            raise ValueError(f"retries must not be negative, got {retries}")
+        self.max_workers = max_workers
+        self.executor = executor
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.output_key = output_key
+
+    @abstractmethod
+    def iter_items(self, context: PipelineContext) -> Iterable[Any]:
+        """Input items for this run, consumed lazily"""
+        pass
+
+    def item_function(self, context: PipelineContext) -> Callable[[Any], Any]:
+        """Function applied to each item
+
+        Defaults to ``process_item``. Process-pool stages should return a
+        module-level function so the stage itself is not pickled per item.
+        """
+        return self.process_item
+
+    @abstractmethod
+    def process_item(self, item: Any) -> Any:
+        """Process one item, returning its output"""
+        pass
+
+    def item_label(self, item: Any) -> str:
+        """Short description of an item for error messages"""
+        return str(item)
+
+    def store_outputs(self, context: PipelineContext, outputs: list[Any]) -> None:
+        """Hook receiving successful outputs in input order"""
+        if self.output_key:
+            context.set(self.output_key, outputs)
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        """Map the item function over every item and collect the outputs"""
+        func = self.item_function(context)
+        stats = MapStats()
+        results: dict[int, Any] = {}
+
+        if self.max_workers == 1:
+            self._map_inline(func, self.iter_items(context), results, stats)
+        else:
+            pool: Executor
+            if self.executor == "process":
+                pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            with pool:
+                self._map_pool(pool, func, self.iter_items(context), results, stats)
+
+        outputs = [results[index] for index in sorted(results)]
+        self.store_outputs(context, outputs)
+
+        data = {"stats": stats.to_dict(), "outputs": len(outputs)}
+        message = (
+            f"Processed {stats.succeeded}/{stats.total} items "
+            f"({stats.failed} failed, {stats.retried} retries)"
+        )
+        if not stats.failed:
+            return StageResult.success_result(message, data)
+        self.logger.warning(
+            f"{ICONS['warning']} '{self.name}': {stats.failed} of {stats.total} items failed"
+        )
+        if stats.succeeded:
+            return StageResult.partial(message, data, stats.errors)
+        return StageResult.failure(f"All {stats.total} items failed", stats.errors)
+
+    def _map_inline(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        results: dict[int, Any],
+        stats: MapStats,
+    ) -> None:
+        """Process items one at a time in the current thread"""
+        for index, item in enumerate(items):
+            stats.total += 1
+            try:
+                output, retried = run_item(func, item, self.retries, self.retry_delay)
+            except Exception as e:
+                stats.fail(f"{self.item_label(item)}: {e}")
+                continue
+            stats.retried += retried
+            stats.succeeded += 1
+            results[index] = output
+
+    def _map_pool(
+        self,
+        pool: Executor,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        results: dict[int, Any],
+        stats: MapStats,
+    ) -> None:
+        """Keep a bounded window of items in flight on the pool"""
+        window = self.max_workers * 2
+        pending: dict[Future[tuple[Any, int]], tuple[int, Any]] = {}
+        iterator = enumerate(items)
+        exhausted = False
+
+        while pending or not exhausted:
+            while not exhausted and len(pending) < window:
+                try:
+                    index, item = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                stats.total += 1
+                future = pool.submit(
+                    run_item, func, item, self.retries, self.retry_delay
+                )
+                pending[future] = (index, item)
+
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, item = pending.pop(future)
+                try:
+                    output, retried = future.result()
+                except Exception as e:
+                    stats.fail(f"{self.item_label(item)}: {e}")
+                    continue
+                stats.retried += retried
+                stats.succeeded += 1
+                results[index] = output
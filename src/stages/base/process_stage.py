@@ -0,0 +1,216 @@
+"""
+Process Stages
+
+Base implementation for CPU-bound stages (dictionary parsing, sense
+grouping, regex validation) that would be serialized by the GIL on a
+thread pool.
+
+Items are grouped into chunks of ``chunk_size`` and each chunk is pickled
+to a ProcessPoolExecutor worker as one task, so per-item IPC overhead is
+amortized. Read-only resources the item function needs (a compiled regex
+table, an mmap'd dictionary) are declared as loaders by
+``worker_resources`` and built once per worker by the pool initializer;
+the item function reads them with ``worker_resource``. Outputs are merged
+back in input order and handed to ``merge_outputs`` in the parent.
+
+With ``workers=1`` the same loaders and chunks run in the current thread,
+which keeps small runs and tests free of pool startup costs. Resources are
+held in a context variable, so inline stages run concurrently by the
+scheduler each see only their own.
+"""
+
+import os
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextvars import ContextVar
+from itertools import islice
+from typing import Any
+
+from src.core.context import PipelineContext
+from src.core.stages import Stage, StageResult
+from src.utils.logging_config import ICONS
+
+from .map_stage import MapStats
+
+DEFAULT_CHUNK_SIZE = 250
+
+# Loader callable and its arguments; both must be picklable
+ResourceLoader = tuple[Callable[..., Any], tuple[Any, ...]]
+
+# Resources of the worker (or inline stage run) in the current context
+_resources: ContextVar[dict[str, Any]] = ContextVar("worker_resources")
+
+
+def build_resources(loaders: dict[str, ResourceLoader]) -> dict[str, Any]:
+    """Build resources from their loaders
+
+    Args:
+        loaders: Resource name -> (loader, args)
+    """
+    return {name: loader(*args) for name, (loader, args) in loaders.items()}
+
+
+def init_worker(loaders: dict[str, ResourceLoader]) -> None:
+    """Build worker resources (used as the process pool initializer)
+
+    Args:
+        loaders: Resource name -> (loader, args)
+    """
+    _resources.set(build_resources(loaders))
+
+
+def worker_resource(name: str) -> Any:
+    """Get a resource built for the current worker
+
+    Raises:
+        RuntimeError: If the stage did not declare the resource
+    """
+    try:
+        return _resources.get({})[name]
+    except KeyError:
+        raise RuntimeError(
+            f"Worker resource '{name}' is not loaded; declare it in worker_resources()"
+        ) from None
+
+
+def run_chunk(func: Callable[[Any], Any], items: list[Any]) -> list[tuple[bool, Any]]:
+    """Apply an item function to a chunk, capturing per-item errors
+
+    Returns:
+        (True, output) or (False, error message) per item, in order
+    """
+    results: list[tuple[bool, Any]] = []
+    for item in items:
+        try:
+            results.append((True, func(item)))
+        except Exception as e:
+            results.append((False, str(e)))
+    return results
+
+
+def iter_chunks(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split items into lists of at most ``size``"""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class ProcessStage(Stage):
+    """Stage that runs a CPU-bound item function on a process pool"""
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        output_key: str | None = None,
+    ):
+        """
+        Initialize process stage
+
+        Args:
+            workers: Worker processes (defaults to the CPU count; 1 runs in
+                the current process)
+            chunk_size: Items shipped to a worker per task
+            output_key: Context key receiving the ordered outputs
+
+        Raises:
+            ValueError: If workers or chunk_size is not positive
+        """
+        super().__init__()
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.output_key = output_key
+
+    @abstractmethod
+    def iter_items(self, context: PipelineContext) -> Iterable[Any]:
+        """Picklable input items for this run, consumed lazily"""
+        pass
+
+    @abstractmethod
+    def item_function(self, context: PipelineContext) -> Callable[[Any], Any]:
+        """Module-level function applied to each item in a worker"""
+        pass
+
+    def worker_resources(self, context: PipelineContext) -> dict[str, ResourceLoader]:
+        """Read-only resources to build once per worker"""
+        return {}
+
+    def item_label(self, item: Any) -> str:
+        """Short description of an item for error messages"""
+        return str(item)
+
+    def merge_outputs(self, context: PipelineContext, outputs: list[Any]) -> None:
+        """Hook receiving successful outputs in input order"""
+        if self.output_key:
+            context.set(self.output_key, outputs)
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        """Run item chunks on the pool and merge the outputs"""
+        func = self.item_function(context)
+        loaders = self.worker_resources(context)
+        chunks = iter_chunks(self.iter_items(context), self.chunk_size)
+        stats = MapStats()
+        outputs: list[Any] = []
+
+        def collect(chunk: list[Any], results: list[tuple[bool, Any]]) -> None:
+            for item, (ok, value) in zip(chunk, results, strict=True):
+                stats.total += 1
+                if ok:
+                    stats.succeeded += 1
+                    outputs.append(value)
+                else:
+                    stats.fail(f"{self.item_label(item)}: {value}")
+
+        if self.workers == 1:
+            token = _resources.set(build_resources(loaders))
+            try:
+                for chunk in chunks:
+                    collect(chunk, run_chunk(func, chunk))
+            finally:
+                _resources.reset(token)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=self.workers, initializer=init_worker, initargs=(loaders,)
+            ) as pool:
+                self._run_pool(pool, func, chunks, collect)
+
+        self.merge_outputs(context, outputs)
+
+        data = {"stats": stats.to_dict(), "workers": self.workers}
+        message = (
+            f"Processed {stats.succeeded}/{stats.total} items "
+            f"on {self.workers} worker(s) ({stats.failed} failed)"
+        )
+        if not stats.failed:
+            return StageResult.success_result(message, data)
+        self.logger.warning(
+            f"{ICONS['warning']} '{self.name}': {stats.failed} of {stats.total} items failed"
+        )
+        if stats.succeeded:
+            return StageResult.partial(message, data, stats.errors)
+        return StageResult.failure(f"All {stats.total} items failed", stats.errors)
+
+    def _run_pool(
+        self,
+        pool: ProcessPoolExecutor,
+        func: Callable[[Any], Any],
+        chunks: Iterator[list[Any]],
+        collect: Callable[[list[Any], list[tuple[bool, Any]]], None],
+    ) -> None:
+        """Keep two chunks per worker in flight, collecting them in order"""
+        pending: deque[tuple[list[Any], Future[list[tuple[bool, Any]]]]] = deque()
+        for chunk in chunks:
+            pending.append((chunk, pool.submit(run_chunk, func, chunk)))
+            if len(pending) >= self.workers * 2:
+                done, future = pending.popleft()
+                collect(done, future.result())
+        while pending:
+            done, future = pending.popleft()
+            collect(done, future.result())
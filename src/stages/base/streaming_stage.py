@@ -0,0 +1,390 @@
+"""
+Streaming Stages
+
+Base implementation for stages that push a batch of input items through a
+chain of generator steps one item at a time and flush the results in
+bounded chunks.
+
+Chunks are appended to a JSONL spool file, each followed by a checkpoint
+line recording how many input items are fully flushed. Only the current
+item's outputs and one unflushed chunk are held in memory. When the batch
+is done the spool is read back lazily and committed to its destination in
+one pass, then removed. A run interrupted before the commit resumes the
+same batch after the last checkpoint; a spool left by a different batch is
+committed before the new batch starts, so flushed work is never lost.
+
+Spool layout (one JSON value per line):
+
+    {"batch_hash": ..., "total": ...}   header
+    {"entry": ...}                      one per output
+    {"checkpoint": flushed}             after every chunk
+"""
+
+import hashlib
+import json
+import os
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from src.core.context import PipelineContext
+from src.core.stages import Stage, StageResult
+from src.utils.logging_config import ICONS
+
+DEFAULT_CHUNK_SIZE = 100
+
+# Warnings and skip reasons kept for the stage result; the rest are counted
+MAX_REPORTED_MESSAGES = 50
+
+
+class StreamItemError(Exception):
+    """Raised by a step to drop the current input item"""
+
+    pass
+
+
+def batch_fingerprint(items: Iterable[Any]) -> str:
+    """Hash a batch of JSON-serializable input items
+
+    Args:
+        items: Input items in processing order
+
+    Returns:
+        Hex digest identifying the batch
+    """
+    digest = hashlib.sha256()
+    for item in items:
+        digest.update(json.dumps(item, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class StreamCheckpoint:
+    """Progress of a spooled batch as of its last complete chunk"""
+
+    batch_hash: str
+    flushed: int
+    total: int
+    # Spool size up to and including the last checkpoint line
+    offset: int = 0
+
+    @property
+    def complete(self) -> bool:
+        """Whether every input item has been flushed"""
+        return self.flushed >= self.total
+
+
+@dataclass
+class StreamStats:
+    """Counters for one streaming run"""
+
+    total: int = 0
+    resumed_from: int = 0
+    processed: int = 0
+    skipped: int = 0
+    emitted: int = 0
+    chunks: int = 0
+    committed: int = 0
+    warning_count: int = 0
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+    def warn(self, message: str) -> None:
+        self.warning_count += 1
+        if len(self.warnings) < MAX_REPORTED_MESSAGES:
+            self.warnings.append(message)
+
+    def skip(self, message: str) -> None:
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_MESSAGES:
+            self.errors.append(message)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total": self.total,
+            "resumed_from": self.resumed_from,
+            "processed": self.processed,
+            "skipped": self.skipped,
+            "emitted": self.emitted,
+            "chunks": self.chunks,
+            "committed": self.committed,
+            "warnings": self.warning_count,
+        }
+
+
+class StreamStep(ABC):
+    """One generator transform in a streaming stage
+
+    ``process`` receives a single item and yields zero or more items for the
+    next step. Non-fatal problems are appended to ``warnings``; raising
+    StreamItemError drops the input item that produced the current item.
+    """
+
+    def __init__(self) -> None:
+        self.warnings: list[str] = []
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Step identifier"""
+        pass
+
+    def open(self, context: PipelineContext) -> None:  # noqa: B027
+        """Prepare shared state before the first item"""
+        pass
+
+    @abstractmethod
+    def process(self, item: Any) -> Iterator[Any]:
+        """Transform one item"""
+        pass
+
+    def stream(self, items: Iterable[Any]) -> Iterator[Any]:
+        for item in items:
+            yield from self.process(item)
+
+    def close(self) -> None:  # noqa: B027
+        """Release resources after the last item"""
+        pass
+
+
+def read_checkpoint(spool_path: Path) -> StreamCheckpoint | None:
+    """Find the last complete checkpoint in a spool file
+
+    Args:
+        spool_path: Spool written by a streaming stage
+
+    Returns:
+        Checkpoint of the last complete chunk, or None if the spool is
+        missing or has no readable header
+    """
+    if not spool_path.exists():
+        return None
+    with open(spool_path, "rb") as f:
+        try:
+            header = json.loads(f.readline())
+            checkpoint = StreamCheckpoint(
+                batch_hash=str(header["batch_hash"]),
+                flushed=0,
+                total=int(header["total"]),
+                offset=f.tell(),
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
+        for line in f:
+            if not line.startswith(b'{"checkpoint"'):
+                continue
+            try:
+                checkpoint.flushed = int(json.loads(line)["checkpoint"])
+            except (ValueError, KeyError, TypeError):
+                # Torn final line; everything after the last checkpoint is dropped
+                break
+            checkpoint.offset = f.tell()
+    return checkpoint
+
+
+def read_spool(spool_path: Path, end: int) -> Iterator[Any]:
+    """Yield the entries of a spool file up to a checkpoint offset"""
+    with open(spool_path, "rb") as f:
+        f.readline()
+        while f.tell() < end:
+            line = f.readline()
+            if line.startswith(b'{"entry"'):
+                yield json.loads(line)["entry"]
+
+
+class StreamingStage(Stage):
+    """Stage that streams input items through steps and flushes in chunks"""
+
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Initialize streaming stage
+
+        Args:
+            chunk_size: Outputs buffered before a flush (chunks only end
+                between input items, so one may run slightly over)
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        super().__init__()
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+        self.chunk_size = chunk_size
+
+    @abstractmethod
+    def source(self, context: PipelineContext) -> Sequence[Any]:
+        """Input items for this run (JSON-serializable, used for the batch hash)"""
+        pass
+
+    @abstractmethod
+    def build_steps(self, context: PipelineContext) -> list[StreamStep]:
+        """Steps each input item flows through, in order"""
+        pass
+
+    @abstractmethod
+    def commit(self, context: PipelineContext, entries: Iterator[Any]) -> int:
+        """Write spooled entries to their destination
+
+        Commits may be retried with the same entries after a crash, so they
+        should skip entries already present.
+
+        Args:
+            context: Pipeline context
+            entries: Spooled outputs in order, read lazily
+
+        Returns:
+            Number of entries written
+
+        Raises:
+            OSError, ValueError: If the destination cannot be written
+        """
+        pass
+
+    def spool_path(self, context: PipelineContext) -> Path:
+        """Spool file for this stage (under the project's .cache directory)"""
+        return Path(context.project_root) / ".cache" / "stages" / f"{self.name}.jsonl"
+
+    def on_complete(self, context: PipelineContext, stats: StreamStats) -> None:
+        """Hook called after the spool is committed"""
+        pass
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        """Stream the batch into the spool, then commit it"""
+        items = self.source(context)
+        batch_hash = batch_fingerprint(items)
+        stats = StreamStats(total=len(items))
+        spool_path = self.spool_path(context)
+
+        try:
+            checkpoint = self._recover(context, spool_path, batch_hash)
+            if checkpoint is not None:
+                stats.resumed_from = min(checkpoint.flushed, len(items))
+                self.logger.info(
+                    f"{ICONS['info']} Resuming '{self.name}' after item "
+                    f"{stats.resumed_from} of {len(items)}"
+                )
+                stats.emitted = sum(
+                    1 for _ in read_spool(spool_path, checkpoint.offset)
+                )
+            self._stream(context, items, batch_hash, spool_path, stats)
+            stats.committed = self.commit(
+                context, read_spool(spool_path, spool_path.stat().st_size)
+            )
+            spool_path.unlink()
+        except (OSError, ValueError) as e:
+            self.logger.error(f"{ICONS['cross']} '{self.name}' output failed: {e}")
+            return StageResult.failure(
+                f"Failed to write output after {stats.emitted} entries "
+                f"(resume keeps flushed items in {spool_path})",
+                [f"Output error: {e}", *stats.errors],
+            )
+
+        self.on_complete(context, stats)
+        data = {"stats": stats.to_dict(), "warnings": stats.warnings}
+        message = (
+            f"Streamed {stats.processed} items into {stats.emitted} entries "
+            f"({stats.chunks} chunks, {stats.committed} committed)"
+        )
+        if not stats.skipped:
+            return StageResult.success_result(message, data)
+        if stats.emitted:
+            return StageResult.partial(message, data, stats.errors)
+        return StageResult.failure(
+            f"No entries produced from {stats.processed} items", stats.errors
+        )
+
+    def _recover(
+        self, context: PipelineContext, spool_path: Path, batch_hash: str
+    ) -> StreamCheckpoint | None:
+        """Prepare an existing spool, returning its checkpoint if it is resumable"""
+        checkpoint = read_checkpoint(spool_path)
+        if checkpoint is None:
+            spool_path.unlink(missing_ok=True)
+            return None
+
+        if checkpoint.batch_hash != batch_hash:
+            self.logger.warning(
+                f"{ICONS['warning']} Committing spooled output of an earlier batch "
+                f"({checkpoint.flushed}/{checkpoint.total} items)"
+            )
+            self.commit(context, read_spool(spool_path, checkpoint.offset))
+            spool_path.unlink()
+            return None
+
+        # Drop a chunk that was only partly written
+        with open(spool_path, "r+b") as f:
+            f.truncate(checkpoint.offset)
+        return checkpoint
+
+    def _stream(
+        self,
+        context: PipelineContext,
+        items: Sequence[Any],
+        batch_hash: str,
+        spool_path: Path,
+        stats: StreamStats,
+    ) -> None:
+        """Process items from the resume point, appending chunks to the spool"""
+        steps = self.build_steps(context)
+        for step in steps:
+            step.open(context)
+
+        spool_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(spool_path, "ab") as spool:
+                if spool.tell() == 0:
+                    header = {"batch_hash": batch_hash, "total": len(items)}
+                    spool.write(json.dumps(header).encode("utf-8") + b"\n")
+
+                buffer: list[Any] = []
+                for position in range(stats.resumed_from, len(items)):
+                    buffer.extend(self._process_item(items[position], steps, stats))
+                    if len(buffer) >= self.chunk_size or position == len(items) - 1:
+                        self._flush(spool, buffer, position + 1, stats)
+                        buffer = []
+        finally:
+            for step in steps:
+                step.close()
+
+    def _process_item(
+        self, item: Any, steps: list[StreamStep], stats: StreamStats
+    ) -> list[Any]:
+        """Run one input item through every step"""
+        stream: Iterable[Any] = (item,)
+        for step in steps:
+            stream = step.stream(stream)
+
+        stats.processed += 1
+        try:
+            outputs = list(stream)
+        except StreamItemError as e:
+            stats.skip(str(e))
+            outputs = []
+
+        for step in steps:
+            for warning in step.warnings:
+                stats.warn(warning)
+            step.warnings.clear()
+        return outputs
+
+    def _flush(
+        self, spool: Any, chunk: list[Any], flushed: int, stats: StreamStats
+    ) -> None:
+        """Append a chunk and its checkpoint, then sync the spool to disk"""
+        lines = [
+            json.dumps({"entry": entry}, ensure_ascii=False).encode("utf-8") + b"\n"
+            for entry in chunk
+        ]
+        lines.append(json.dumps({"checkpoint": flushed}).encode("utf-8") + b"\n")
+        spool.write(b"".join(lines))
+        spool.flush()
+        os.fsync(spool.fileno())
+
+        stats.emitted += len(chunk)
+        if chunk:
+            stats.chunks += 1
+        self.logger.debug(f"Flushed {len(chunk)} entries ({flushed}/{stats.total})")
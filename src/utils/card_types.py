@@ -15,6 +15,8 @@ from typing import TYPE_CHECKING, Any, cast
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from src.providers.base.data_provider import DataProvider
+
 from src.utils.logging_config import get_logger
 
 logger = get_logger("utils.card_types")
@@ -58,6 +60,21 @@ class CardType(ABC):
         """List all cards with their basic info"""
         pass
 
+    @property
+    def identifier(self) -> str:
+        """Data provider identifier of the data file (file name without extension)"""
+        return self.data_file.rsplit(".", 1)[0]
+
+    def find_card_in_provider(
+        self, provider: DataProvider, card_id: str
+    ) -> dict[str, str] | None:
+        """Find a card by its ID in a data provider's copy of the data file"""
+        return self.find_card_by_id(provider.load_data(self.identifier), card_id)
+
+    def list_provider_cards(self, provider: DataProvider) -> list[dict[str, str]]:
+        """List all cards in a data provider's copy of the data file"""
+        return self.list_cards(provider.load_data(self.identifier))
+
 
 class FluentForeverCardType(CardType):
     """Fluent Forever vocabulary cards"""
@@ -108,6 +125,26 @@ class FluentForeverCardType(CardType):
                 )
         return cards
 
+    def find_card_in_provider(
+        self, provider: DataProvider, card_id: str
+    ) -> dict[str, str] | None:
+        """Find a vocabulary card by CardID, using the CardID index if available"""
+        from src.providers.data.sqlite_provider import SQLiteDataProvider
+
+        if isinstance(provider, SQLiteDataProvider):
+            return cast(
+                "dict[str, str] | None", provider.find_card(card_id, self.identifier)
+            )
+        return super().find_card_in_provider(provider, card_id)
+
+    def list_provider_cards(self, provider: DataProvider) -> list[dict[str, str]]:
+        """List all vocabulary cards, without parsing card data if possible"""
+        from src.providers.data.sqlite_provider import SQLiteDataProvider
+
+        if isinstance(provider, SQLiteDataProvider):
+            return provider.list_cards(self.identifier)
+        return super().list_provider_cards(provider)
+
 
 class ConjugationCardType(CardType):
     """Conjugation practice cards"""
@@ -14,8 +14,6 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-from dotenv import load_dotenv
-
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
@@ -47,6 +45,14 @@ class ColoredFormatter(logging.Formatter):
         return formatted
 
 
+@functools.cache
+def load_env() -> None:
+    """Load the project .env file into the environment, once per process"""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
 def get_logging_config(
     level: int | None = None,
     log_to_file: bool = False,
@@ -66,7 +72,7 @@ def get_logging_config(
     import copy
 
     # Load environment variables
-    load_dotenv()
+    load_env()
 
     if level is None:
         level = get_log_level_from_env()
@@ -0,0 +1,177 @@
+"""
+Run Profiler
+
+Records a tree of timed spans (run -> phase -> stage -> provider call ->
+HTTP request) for one pipeline execution.
+
+The current span lives in a context variable, so code anywhere below an
+active profiler opens child spans with ``profile_span`` without being
+handed the profiler. asyncio tasks and ``asyncio.to_thread`` calls inherit
+the current span; plain thread pools need ``contextvars.copy_context()``.
+With no active profiler ``profile_span`` yields None and records nothing.
+
+CPU time is that of the thread that opened the span, so it excludes work a
+span hands to other threads or processes and, for spans held across
+``await``, includes other tasks running on the same loop.
+"""
+
+import contextvars
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+PROFILE_FORMAT_VERSION = 1
+
+DEFAULT_TOP_SPANS = 10
+
+# Active profiler and the innermost open span
+_current: contextvars.ContextVar[tuple["RunProfiler", "Span"] | None] = (
+    contextvars.ContextVar("fluent_forever_profile_span", default=None)
+)
+
+
+@dataclass
+class Span:
+    """One timed operation and the operations it contains"""
+
+    name: str
+    kind: str
+    # Seconds from the start of the run
+    start: float = 0.0
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    bytes: int = 0
+    items: int = 0
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    children: list["Span"] = field(default_factory=list)
+
+    def add(self, bytes: int = 0, items: int = 0) -> None:
+        """Count bytes transferred and items processed by this span"""
+        self.bytes += bytes
+        self.items += items
+
+    def walk(self) -> Iterator["Span"]:
+        """This span and all descendants, depth first"""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "start": round(self.start, 6),
+            "wall_time": round(self.wall_time, 6),
+            "cpu_time": round(self.cpu_time, 6),
+            "bytes": self.bytes,
+            "items": self.items,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        if self.attributes:
+            data["attributes"] = self.attributes
+        data["children"] = [child.to_dict() for child in self.children]
+        return data
+
+
+class RunProfiler:
+    """Span tree of one run"""
+
+    def __init__(self, name: str, **attributes: Any):
+        """
+        Initialize profiler
+
+        Args:
+            name: Root span name (e.g. the pipeline and phase being run)
+            **attributes: Extra fields stored on the root span
+        """
+        self.root = Span(name=name, kind="run", attributes=attributes)
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator[Span]:
+        """Make the root span current and time it"""
+        token = _current.set((self, self.root))
+        self._origin = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield self.root
+        finally:
+            self.root.wall_time = time.perf_counter() - self._origin
+            self.root.cpu_time = time.thread_time() - cpu_start
+            _current.reset(token)
+
+    def top_spans(self, count: int = DEFAULT_TOP_SPANS) -> list[Span]:
+        """Slowest spans below the root, by wall time"""
+        spans = [span for span in self.root.walk() if span is not self.root]
+        return sorted(spans, key=lambda span: span.wall_time, reverse=True)[:count]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"version": PROFILE_FORMAT_VERSION, "root": self.root.to_dict()}
+
+    def write(self, path: Path) -> None:
+        """Write the span tree as JSON
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def _open(self, parent: Span, name: str, kind: str, attributes: dict) -> Span:
+        span = Span(
+            name=name,
+            kind=kind,
+            start=time.perf_counter() - self._origin,
+            attributes=attributes,
+        )
+        # Concurrent stages and requests may share a parent
+        with self._lock:
+            parent.children.append(span)
+        return span
+
+
+@contextmanager
+def profile_span(name: str, kind: str, **attributes: Any) -> Iterator[Span | None]:
+    """Time a block as a child of the current span
+
+    Args:
+        name: Span name (e.g. stage or provider method)
+        kind: Span category: phase, stage, provider, data or http
+        **attributes: Extra fields stored on the span
+
+    Yields:
+        The new span, or None when no profiler is active
+    """
+    current = _current.get()
+    if current is None:
+        yield None
+        return
+
+    profiler, parent = current
+    span = profiler._open(parent, name, kind, attributes)
+    token = _current.set((profiler, span))
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield span
+    except BaseException as e:
+        span.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        span.wall_time = time.perf_counter() - wall_start
+        span.cpu_time = time.thread_time() - cpu_start
+        _current.reset(token)
+
+
+def current_span() -> Span | None:
+    """Innermost open span, or None when no profiler is active"""
+    current = _current.get()
+    return current[1] if current is not None else None
@@ -0,0 +1,259 @@
+"""
+Rate Limiter
+
+Token buckets shared by the threads and asyncio tasks calling one API.
+
+Callers reserve a token before each request and wait until it is due,
+instead of sleeping a fixed delay after every request: up to ``burst``
+requests start immediately, after which starts are spaced at ``rate`` per
+second however many workers are waiting. Reservations are handed out under
+a lock in arrival order, so concurrent callers queue behind each other
+rather than all waking at once.
+
+Buckets are kept per service (``forvo``, ``runware``, ...) in a global
+registry, so every provider instance and client calling a service draws on
+one budget. Rates come from ``apis.<service>.requests_per_second`` and
+``apis.<service>.rate_limit_burst`` in config.json. A 429 answer pauses the
+service's bucket for its ``Retry-After``, holding back every caller instead
+of each retrying on its own schedule.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Mapping
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from src.utils.logging_config import get_logger
+from src.utils.profiler import profile_span
+
+logger = get_logger("utils.rate_limiter")
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds to wait from a Retry-After header (delay or HTTP date)
+
+    Returns:
+        Non-negative seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def interval_to_rate(interval: float | None) -> float | None:
+    """Requests per second for a minimum delay between requests"""
+    return 1.0 / interval if interval and interval > 0 else None
+
+
+class TokenBucket:
+    """Requests-per-second limit with a burst allowance"""
+
+    def __init__(self, rate: float | None, burst: int = 1, name: str = ""):
+        """
+        Initialize bucket
+
+        Args:
+            rate: Sustained requests per second (None or 0 for no limit)
+            burst: Requests allowed back to back when the bucket is full
+            name: Service name used in logs, profiles and metrics
+
+        Raises:
+            ValueError: If rate is negative or burst is not positive
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self.configure(rate, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        # No reservation is due before this time (set by Retry-After)
+        self._paused_until = 0.0
+
+        # Metrics
+        self.requests = 0
+        self.delayed = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.throttled = 0
+        self.paused_time = 0.0
+
+    @classmethod
+    def from_interval(
+        cls, interval: float | None, burst: int = 1, name: str = ""
+    ) -> "TokenBucket":
+        """Bucket allowing one request per ``interval`` seconds"""
+        return cls(interval_to_rate(interval), burst, name)
+
+    @property
+    def limited(self) -> bool:
+        return self.rate > 0
+
+    def configure(self, rate: float | None, burst: int = 1) -> None:
+        """Change the sustained rate and burst, keeping queued reservations
+
+        Raises:
+            ValueError: If rate is negative or burst is not positive
+        """
+        if rate is not None and rate < 0:
+            raise ValueError(f"rate must not be negative, got {rate}")
+        if burst < 1:
+            raise ValueError(f"burst must be positive, got {burst}")
+        with self._lock:
+            self.rate = rate or 0.0
+            self.burst = burst
+
+    def reserve(self) -> float:
+        """Take a token, returning the seconds to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            # Reservations made during a pause are scheduled from its end
+            start = max(now, self._paused_until)
+            wait = start - now
+            if self.limited:
+                self._tokens = min(
+                    float(self.burst),
+                    self._tokens + max(0.0, start - self._updated) * self.rate,
+                )
+                self._updated = max(self._updated, start)
+                # A negative balance is the queue of callers already waiting
+                self._tokens -= 1.0
+                wait += max(0.0, -self._tokens / self.rate)
+            self.requests += 1
+            if wait > 0:
+                self.delayed += 1
+                self.wait_time += wait
+                self.max_wait = max(self.max_wait, wait)
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all reservations for ``seconds`` (e.g. after a 429)
+
+        After the pause requests resume one at a time at the sustained rate,
+        rather than with a full burst.
+        """
+        with self._lock:
+            now = time.monotonic()
+            until = now + seconds
+            self.throttled += 1
+            if until <= self._paused_until:
+                return
+            self.paused_time += until - max(now, self._paused_until)
+            self._paused_until = until
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, until)
+
+    def acquire(self) -> float:
+        """Block until a request may start
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            with profile_span(f"rate limit {self.name}", "rate_limit"):
+                time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Wait without blocking the event loop until a request may start
+
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve()
+        if wait > 0:
+            with profile_span(f"rate limit {self.name}", "rate_limit"):
+                await asyncio.sleep(wait)
+        return wait
+
+    def metrics(self) -> dict[str, Any]:
+        """Snapshot of the bucket's settings and counters"""
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "requests": self.requests,
+                "delayed": self.delayed,
+                "wait_time": round(self.wait_time, 6),
+                "max_wait": round(self.max_wait, 6),
+                "throttled": self.throttled,
+                "paused_time": round(self.paused_time, 6),
+            }
+
+
+class RateLimiterRegistry:
+    """One token bucket per service, shared process-wide"""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, service: str, rate: float | None = None, burst: int = 1
+    ) -> TokenBucket:
+        """Bucket for a service, created with ``rate`` and ``burst`` if new
+
+        An existing bucket keeps its settings, so limits from config.json
+        take precedence over a caller's defaults.
+        """
+        with self._lock:
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                bucket = TokenBucket(rate, burst, name=service)
+                self._buckets[service] = bucket
+            return bucket
+
+    def configure(
+        self, service: str, rate: float | None, burst: int = 1
+    ) -> TokenBucket:
+        """Set a service's rate and burst, creating its bucket if needed"""
+        bucket = self.get(service, rate, burst)
+        bucket.configure(rate, burst)
+        return bucket
+
+    def configure_from(self, config: Mapping[str, Any]) -> None:
+        """Apply ``requests_per_second`` / ``rate_limit_burst`` from ``apis.*``
+
+        Args:
+            config: Application configuration (config.json contents)
+        """
+        for service, api_config in (config.get("apis") or {}).items():
+            if not isinstance(api_config, dict):
+                continue
+            if "requests_per_second" not in api_config:
+                continue
+            bucket = self.configure(
+                service,
+                float(api_config["requests_per_second"]),
+                int(api_config.get("rate_limit_burst", 1)),
+            )
+            logger.debug(
+                f"Rate limit for {service}: {bucket.rate:g}/s, burst {bucket.burst}"
+            )
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """Metrics of every service's bucket"""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {service: bucket.metrics() for service, bucket in buckets.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+
+# Global registry instance
+_global_registry = RateLimiterRegistry()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Get the global rate limiter registry."""
+    return _global_registry
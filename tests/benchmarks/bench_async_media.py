@@ -0,0 +1,184 @@
+"""Benchmark: sync vs asyncio execution of a media phase.
+
+Starts a local stub of the Forvo API (every response delayed by --latency)
+and runs a one-stage "media" phase fetching pronunciation audio for --cards
+words through ForvoProvider: with a sync stage calling generate_batch() via
+Pipeline.execute_phase, the same stage via execute_phase_async (wrapped in a
+worker thread), and an AsyncStage awaiting generate_batch_async().
+
+Usage:
+    python -m tests.benchmarks.bench_async_media [--cards 100] [--concurrency 10]
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.core.context import PipelineContext
+from src.core.scheduler import run_event_loop
+from src.core.stages import AsyncStage, Stage, StageResult
+from src.providers.audio.forvo_provider import ForvoProvider
+from src.providers.base.media_provider import MediaRequest, MediaResult
+
+from tests.fixtures.pipelines import MockPipeline
+
+
+def stub_server(latency: float) -> ThreadingHTTPServer:
+    """Serve word-pronunciations JSON and MP3 bytes after a fixed delay."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            time.sleep(latency)
+            if self.path.startswith("/audio/"):
+                body = b"ID3" + bytes(4096)
+                content_type = "audio/mpeg"
+            else:
+                word = self.path.split("/word/")[1].split("/")[0]
+                host, port = self.server.server_address[:2]
+                body = json.dumps(
+                    {
+                        "items": [
+                            {
+                                "country": "Mexico",
+                                "username": "bench",
+                                "votes": 3,
+                                "pathmp3": f"http://{host}:{port}/audio/{word}.mp3",
+                            }
+                        ]
+                    }
+                ).encode()
+                content_type = "application/json"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def media_requests(context: PipelineContext) -> list[MediaRequest]:
+    media_dir = Path(context.get("media_dir"))
+    return [
+        MediaRequest(
+            type="audio", content=word, params={}, output_path=media_dir / f"{word}.mp3"
+        )
+        for word in context.get("words")
+    ]
+
+
+def media_result(results: list[MediaResult]) -> StageResult:
+    failed = [r.error or "" for r in results if not r.success]
+    if failed:
+        return StageResult.failure(f"{len(failed)} downloads failed", failed[:3])
+    return StageResult.success_result(f"Downloaded {len(results)} audio files")
+
+
+class SyncMediaStage(Stage):
+    @property
+    def name(self) -> str:
+        return "media"
+
+    @property
+    def display_name(self) -> str:
+        return "Media"
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        provider = context.get("providers")["audio"]
+        return media_result(provider.generate_batch(media_requests(context)))
+
+
+class AsyncMediaStage(AsyncStage):
+    @property
+    def name(self) -> str:
+        return "media"
+
+    @property
+    def display_name(self) -> str:
+        return "Media"
+
+    async def _execute_impl(self, context: PipelineContext) -> StageResult:
+        provider = context.get("providers")["audio"]
+        results = await provider.generate_batch_async(media_requests(context))
+        return media_result(results)
+
+
+class MediaPipeline(MockPipeline):
+    def __init__(self, stage: Stage):
+        super().__init__("media_bench", ["media"])
+        self._phases = {"media": ["media"]}
+        self.stage = stage
+
+    def get_stage(self, stage_name: str) -> Stage:
+        return self.stage
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    server = stub_server(args.latency)
+    host, port = server.server_address[:2]
+    provider = ForvoProvider(
+        {
+            "api_key": "bench",
+            "country_priorities": ["Mexico", "Spain", "Argentina"],
+            "base_url": f"http://{host}:{port}",
+            "rate_limit_delay": 0,
+            "max_concurrent_requests": args.concurrency,
+            # Every mode looks the same words up, so measure the API each time
+            "cache_enabled": False,
+        }
+    )
+    words = [f"palabra{i}" for i in range(args.cards)]
+
+    print(f"{args.cards} cards, 2 requests each, {args.latency * 1000:.0f} ms latency")
+    print(f"{'mode':<26}{'seconds':>9}{'cards/s':>9}")
+    modes = [
+        ("sync", SyncMediaStage(), False),
+        ("async (sync stage)", SyncMediaStage(), True),
+        (f"async (x{args.concurrency})", AsyncMediaStage(), True),
+    ]
+    for label, stage, use_async in modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            context = PipelineContext(
+                pipeline_name="media_bench", project_root=Path(tmp)
+            )
+            context.set("providers", {"audio": provider})
+            context.set("words", words)
+            context.set("media_dir", tmp)
+            pipeline = MediaPipeline(stage)
+
+            start = time.perf_counter()
+            if use_async:
+                results = run_event_loop(
+                    pipeline.execute_phase_async("media", context),
+                    args.concurrency * 2,
+                )
+            else:
+                results = pipeline.execute_phase("media", context)
+            elapsed = time.perf_counter() - start
+
+            assert results[0].success, results[0].message
+            print(f"{label:<26}{elapsed:>9.2f}{args.cards / elapsed:>9.1f}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
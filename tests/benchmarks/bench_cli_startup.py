@@ -0,0 +1,46 @@
+"""Benchmark: import time of CLI discovery commands.
+
+Runs ``list`` under ``python -X importtime`` in fresh interpreters and
+reports the cumulative import time of the runner's own imports (median of
+``--runs``) against the budget. About 45 ms at the time of writing; eager
+command imports took 120 ms. Exits 1 when the median is over budget.
+
+Usage:
+    python -m tests.benchmarks.bench_cli_startup [--runs 5] [--budget-ms 90]
+"""
+
+import argparse
+import statistics
+import sys
+
+from tests.e2e.test_cli_startup import import_times
+from tests.fixtures.configs import ConfigFixture, create_base_config
+
+# Cumulative import time of everything the runner imports for `list`
+IMPORT_BUDGET_MS = 90
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    totals = []
+    with ConfigFixture(create_base_config()) as config_path:
+        for _ in range(args.runs):
+            _, runner_imports = import_times(["--config", str(config_path), "list"])
+            totals.append(sum(runner_imports) / 1000)
+
+    median = statistics.median(totals)
+    print(f"list imports over {args.runs} runs (budget {args.budget_ms:g} ms)")
+    print(
+        f"  median {median:.1f} ms, min {min(totals):.1f} ms, max {max(totals):.1f} ms"
+    )
+    if median >= args.budget_ms:
+        print("Over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
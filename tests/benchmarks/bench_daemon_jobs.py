@@ -0,0 +1,114 @@
+"""Benchmark: queueing run jobs with and without the pipeline daemon.
+
+Submits the same ``run`` invocation N times as
+  cold      - one fresh CLI process per job, daemon disabled
+  forwarded - one CLI process per job, forwarded to a warm daemon
+  socket    - jobs sent straight to the daemon socket from one process
+The daemon runs as a separate ``daemon start`` process. The CLI registers
+no pipelines of its own, so every process registers the test fixtures'
+MockPipeline as ``bench`` before calling ``main``; jobs run its
+``test_stage`` against the repository config.json. Every job must exit 0,
+so the timings cover successful runs: per-job startup and registry overhead
+rather than stage work.
+
+Usage:
+    python -m tests.benchmarks.bench_daemon_jobs [--jobs 200] [--stage test_stage]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.cli.daemon import DISABLE_ENV, SOCKET_ENV, request_daemon
+
+PROJECT_ROOT = Path(__file__).parents[2]
+
+PIPELINE = "bench"
+
+# Runner entry point with the benchmark pipeline registered
+BOOTSTRAP = f"""
+import sys
+from src.cli.pipeline_runner import main
+from src.core.registry import get_pipeline_registry
+from tests.fixtures.pipelines import MockPipeline
+get_pipeline_registry().register(MockPipeline({PIPELINE!r}))
+sys.exit(main(sys.argv[1:]))
+"""
+
+
+def _runner(args: list[str]) -> list[str]:
+    return [sys.executable, "-c", BOOTSTRAP, *args]
+
+
+def _cli(args: list[str], env: dict[str, str]) -> None:
+    result = subprocess.run(
+        _runner(args), cwd=PROJECT_ROOT, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Job failed ({result.returncode}):\n{result.stdout}")
+
+
+def _wait_for_socket(path: Path, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not path.exists():
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Daemon did not start on {path}")
+        time.sleep(0.05)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=200)
+    parser.add_argument("--stage", default="test_stage")
+    args = parser.parse_args()
+
+    job = ["run", PIPELINE, "--stage", args.stage]
+    timings: dict[str, float] = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = Path(tmp) / "daemon.sock"
+        env = {**os.environ, SOCKET_ENV: str(socket_path)}
+
+        start = time.perf_counter()
+        for _ in range(args.jobs):
+            _cli(job, {**env, DISABLE_ENV: "1"})
+        timings["cold"] = time.perf_counter() - start
+
+        daemon = subprocess.Popen(
+            _runner(["daemon", "start"]),
+            cwd=PROJECT_ROOT,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            _wait_for_socket(socket_path)
+
+            start = time.perf_counter()
+            for _ in range(args.jobs):
+                _cli(job, env)
+            timings["forwarded"] = time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(args.jobs):
+                request = {"argv": job, "cwd": str(PROJECT_ROOT), "env": env}
+                events = list(request_daemon(request, socket_path))
+                if events[-1] != {"event": "exit", "code": 0}:
+                    raise RuntimeError(f"Job failed: {events}")
+            timings["socket"] = time.perf_counter() - start
+        finally:
+            daemon.terminate()
+            daemon.wait(timeout=10)
+
+    print(f"{args.jobs} x {' '.join(job)}")
+    print(f"{'mode':<12}{'total s':>10}{'per job ms':>12}")
+    for mode, seconds in timings.items():
+        print(f"{mode:<12}{seconds:>10.2f}{seconds / args.jobs * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark: journaled vs whole-file JSON saves for word queue updates.
+
+Builds a word queue of synthetic card entries, then applies one prompt
+update per save (the pattern of the prompt review loop), once through
+JSONDataProvider and once through JournaledDataProvider, and reports time
+per save, bytes written and the time to load the result from disk.
+
+Usage:
+    python -m tests.benchmarks.bench_journaled_queue [--entries 1000 10000]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from src.providers.base.data_provider import DataProvider
+from src.providers.data.journaled_provider import JournaledDataProvider
+from src.providers.data.json_provider import JSONDataProvider
+
+
+def queue_document(entries: int) -> dict:
+    """Build a word queue shaped like WordProcessingStage output."""
+    return {
+        "metadata": {"total_entries": entries, "last_updated": ""},
+        "queue": [
+            {
+                "CardID": f"palabra{i}_sense{i % 7}",
+                "SpanishWord": f"palabra{i}",
+                "MeaningID": f"sense{i % 7}",
+                "Translations": "word, term",
+                "MonolingualDef": "Unidad de la lengua con significado propio.",
+                "ExampleSentence": f"La palabra{i} aparece en la frase.",
+                "GappedSentence": "La _____ aparece en la frase.",
+                "IPA": "[paˈlaβɾa]",
+                "Prompt": "",
+                "status": "pending_prompts",
+            }
+            for i in range(entries)
+        ],
+    }
+
+
+def file_states(path: Path) -> dict[str, tuple[int, int]]:
+    return {f.name: (f.stat().st_size, f.stat().st_mtime_ns) for f in path.iterdir()}
+
+
+def bytes_written(
+    before: dict[str, tuple[int, int]], after: dict[str, tuple[int, int]]
+) -> int:
+    """Bytes written by one save: appended journal bytes plus rewritten files."""
+    written = 0
+    for name, (size, mtime) in after.items():
+        old_size, old_mtime = before.get(name, (0, -1))
+        if mtime == old_mtime:
+            continue
+        appended = name.endswith(".journal.jsonl") and size >= old_size
+        written += size - old_size if appended else size
+    return written
+
+
+def run(provider_type: type[DataProvider], entries: int, saves: int) -> tuple:
+    """Apply updates, returning (ms per save, MB written, reload ms)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        base = Path(tmp)
+        provider = provider_type(base)  # type: ignore[call-arg]
+        data = queue_document(entries)
+        provider.save_data("word_queue", data)
+
+        written = 0
+        start = time.perf_counter()
+        for i in range(saves):
+            before = file_states(base)
+            data["queue"][i * 37 % entries]["Prompt"] = f"scene {i}"
+            provider.save_data("word_queue", data)
+            written += bytes_written(before, file_states(base))
+        per_save = (time.perf_counter() - start) * 1000 / saves
+
+        start = time.perf_counter()
+        reloaded = provider_type(base).load_data("word_queue")  # type: ignore[call-arg]
+        reload_ms = (time.perf_counter() - start) * 1000
+        assert reloaded == data
+        return per_save, written / 1_048_576, reload_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--saves", type=int, default=200)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{'entries':>8}{'provider':>12}{'ms/save':>10}{'MB written':>12}{'reload ms':>11}"
+    )
+    for entries in args.entries:
+        for label, provider_type in (
+            ("json", JSONDataProvider),
+            ("journaled", JournaledDataProvider),
+        ):
+            per_save, written, reload_ms = run(provider_type, entries, args.saves)
+            print(
+                f"{entries:>8}{label:>12}{per_save:>10.2f}{written:>12.2f}"
+                f"{reload_ms:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
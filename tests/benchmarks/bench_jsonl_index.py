@@ -0,0 +1,114 @@
+"""Benchmark: binary word index vs JSON dict index.
+
+Compares cold-load time and resident memory of the memory-mapped
+BinaryWordIndex against loading the same index as a plain JSON dict.
+Each load runs in a fresh interpreter so RSS deltas are not polluted.
+
+Usage:
+    python -m tests.benchmarks.bench_jsonl_index [--words 849000]
+"""
+
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from src.providers.data.jsonl_index import BinaryWordIndex, write_binary_index
+
+
+def _rss_kb() -> int:
+    """Current resident set size in KB (Linux), falling back to max RSS."""
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _child(kind: str, path: Path, probe: str) -> None:
+    """Load an index and report timing and RSS as JSON on stdout."""
+    before = _rss_kb()
+    start = time.perf_counter()
+    if kind == "json":
+        index = json.loads(path.read_text(encoding="utf-8"))
+    else:
+        index = BinaryWordIndex(path)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        index.get(probe)
+    lookup_us = (time.perf_counter() - start) / 10_000 * 1e6
+
+    print(
+        json.dumps(
+            {
+                "load_ms": load_seconds * 1000,
+                "rss_mb": (_rss_kb() - before) / 1024,
+                "lookup_us": lookup_us,
+                "size_mb": path.stat().st_size / 1024 / 1024,
+            }
+        )
+    )
+
+
+def _run_child(kind: str, path: Path, probe: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-m", __spec__.name, "--child", kind, str(path), probe],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=849_000)
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        kind, path, probe = args.child
+        _child(kind, Path(path), probe)
+        return
+
+    # Synthetic index: ~1.3 lines per headword, offsets spread over ~1.5GB
+    index: dict[str, list[int]] = {}
+    offset = 0
+    for i in range(args.words):
+        offsets = [offset]
+        if i % 3 == 0:
+            offset += 1700
+            offsets.append(offset)
+        offset += 1700
+        index[f"palabra{i:07d}"] = offsets
+    probe = f"palabra{args.words // 2:07d}"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "index.json"
+        json_path.write_text(json.dumps(index), encoding="utf-8")
+        binary_path = Path(tmp) / "index.bin"
+        write_binary_index(binary_path, index, {})
+        del index
+
+        print(f"Index of {args.words} words")
+        print(
+            f"{'format':<8}{'file MB':>10}{'load ms':>12}{'RSS MB':>10}{'get µs':>10}"
+        )
+        for kind, path in (("json", json_path), ("binary", binary_path)):
+            result = _run_child(kind, path, probe)
+            print(
+                f"{kind:<8}{result['size_mb']:>10.1f}{result['load_ms']:>12.1f}"
+                f"{result['rss_mb']:>10.1f}{result['lookup_us']:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
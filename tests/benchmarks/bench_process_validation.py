@@ -0,0 +1,106 @@
+"""Benchmark: vocabulary validation on one core vs a process pool.
+
+Runs VocabularyValidationStage over a synthetic vocabulary.json with the
+patterns from config.json, once in the current process and once per
+requested worker count, and reports wall time and speedup. Pool timings
+include worker startup and pattern compilation.
+
+Usage:
+    python -m tests.benchmarks.bench_process_validation [--words 10000] [--workers 2 4]
+"""
+
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from src.pipelines.vocabulary.stages.vocabulary_validation import (
+    VocabularyValidationStage,
+)
+from src.providers.data.json_provider import JSONDataProvider
+
+from tests.fixtures.contexts import create_test_context
+
+CONFIG_PATH = Path(__file__).parents[2] / "config.json"
+
+
+def headword(index: int) -> str:
+    """Unique letters-only headword (CardID and file patterns reject digits)."""
+    suffix = ""
+    while True:
+        index, letter = divmod(index, 26)
+        suffix += chr(ord("a") + letter)
+        if not index:
+            return f"palabra{suffix}"
+
+
+def synthetic_vocabulary(words: int) -> dict:
+    """Three meanings per word, one word in fifty with a malformed IPA."""
+    vocabulary: dict = {"words": {}}
+    for i in range(words):
+        word = headword(i)
+        meanings = []
+        for sense in ("uno", "dos", "tres"):
+            card_id = f"{word}_{sense}"
+            meanings.append(
+                {
+                    "CardID": card_id,
+                    "SpanishWord": word,
+                    "IPA": "ˈpalaβɾa" if i % 50 == 0 else "[ˈpalaβɾa]",
+                    "MeaningContext": sense,
+                    "MonolingualDef": "Definición de la palabra.",
+                    "ExampleSentence": "La palabra está aquí.",
+                    "GappedSentence": "La _____ está aquí.",
+                    "ImageFile": f"{card_id}.png",
+                    "WordAudio": f"[sound:{word}.mp3]",
+                    "WordAudioAlt": "",
+                    "UsageNote": "",
+                    "MeaningID": sense,
+                    "prompt": "",
+                }
+            )
+        vocabulary["words"][word] = {"meanings": meanings}
+    return vocabulary
+
+
+def run(root: Path, config: dict, workers: int) -> tuple[float, dict]:
+    """Validate the vocabulary, returning (seconds, stats)."""
+    context = create_test_context(project_root=root, config=config)
+    context.set("providers", {"data": {"vocabulary_data": JSONDataProvider(root)}})
+    start = time.perf_counter()
+    result = VocabularyValidationStage(workers=workers).execute(context)
+    return time.perf_counter() - start, result.data["stats"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=10000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[os.cpu_count() or 2])
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    config = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "vocabulary.json").write_text(
+            json.dumps(synthetic_vocabulary(args.words), ensure_ascii=False),
+            encoding="utf-8",
+        )
+
+        baseline, expected = run(root, config, 1)
+        print(f"{'workers':>8}{'seconds':>10}{'speedup':>10}{'invalid':>10}")
+        print(f"{1:>8}{baseline:>10.2f}{1.0:>10.2f}{expected['failed']:>10}")
+        for workers in args.workers:
+            seconds, stats = run(root, config, workers)
+            assert stats == expected
+            print(
+                f"{workers:>8}{seconds:>10.2f}{baseline / seconds:>10.2f}"
+                f"{stats['failed']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
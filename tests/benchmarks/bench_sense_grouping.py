@@ -0,0 +1,107 @@
+"""Benchmark: bitmask sense grouping vs pairwise set comparison.
+
+Runs SenseProcessor and a straightforward set-based implementation over
+the projected senses of the example dictionary entries, repeated to
+simulate a batch of words, and over synthetic high-polysemy words.
+
+Usage:
+    python -m tests.benchmarks.bench_sense_grouping [--words 5000]
+"""
+
+import argparse
+import json
+import logging
+import random
+import time
+from pathlib import Path
+
+from src.pipelines.vocabulary.stages.word_processing import SenseProcessor
+from src.providers.data.jsonl_projection import project_entry
+
+EXAMPLES = (
+    Path(__file__).parents[2]
+    / "context"
+    / "implementation_plans"
+    / "vocabulary_pipeline_planning"
+)
+
+
+def naive_grouping(senses: list[dict]) -> list[tuple[str, ...]]:
+    """Reference implementation: frozenset groups, pairwise subset checks."""
+    groups: dict[frozenset[str], list[str]] = {}
+    for sense in senses:
+        translations = frozenset(
+            " ".join(t.lower().split()) for t in sense["translations"] if t.strip()
+        )
+        if translations:
+            groups.setdefault(translations, []).append(sense["sense_index"])
+    return [
+        tuple(sorted(group))
+        for group in groups
+        if not any(group < other for other in groups)
+    ]
+
+
+def synthetic_senses(count: int, seed: int) -> list[dict]:
+    """High-polysemy word (e.g. dar, hacer) with overlapping translations."""
+    rng = random.Random(seed)
+    pool = [f"meaning {i}" for i in range(count // 2)]
+    return [
+        {
+            "sense_index": str(i + 1),
+            "translations": rng.sample(pool, rng.randint(1, 4)),
+            "example": {"text": "Ejemplo."} if i % 3 else None,
+        }
+        for i in range(count)
+    ]
+
+
+def load_senses() -> list[list[dict]]:
+    """Projected senses per example word (all parts of speech)."""
+    words = []
+    for name in ("example_llamar_entries.json", "sombrero_entries.json"):
+        data = json.loads((EXAMPLES / name).read_text(encoding="utf-8"))
+        entries = data if isinstance(data, list) else [data]
+        words.append(
+            [sense for entry in entries for sense in project_entry(entry)["senses"]]
+        )
+    return words
+
+
+def run(label: str, batch: dict[str, list[dict]]) -> None:
+    """Time both implementations on a batch and check they agree."""
+    start = time.perf_counter()
+    expected = {word: naive_grouping(senses) for word, senses in batch.items()}
+    naive = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = SenseProcessor().process_batch(batch)
+    bitmask = time.perf_counter() - start
+
+    for word, result in results.items():
+        assert sorted(g.translations for g in result.groups) == sorted(expected[word])
+    print(f"{label:<28}{naive * 1000:>12.1f}{bitmask * 1000:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=5000)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"{'batch':<28}{'naive ms':>12}{'bitmask ms':>12}")
+    examples = load_senses()
+    run(
+        f"{args.words} x llamar/sombrero",
+        {f"word{i}": examples[i % len(examples)] for i in range(args.words)},
+    )
+    for count in (40, 120):
+        words = max(args.words // 10, 1)
+        run(
+            f"{words} x {count}-sense words",
+            {f"word{i}": synthetic_senses(count, i) for i in range(words)},
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmark: vocabulary card lookups from JSON vs SQLite.
+
+Builds a vocabulary document of synthetic words with three cards each and
+times, per provider, a single CardID lookup through FluentForeverCardType
+(load + scan for JSON, indexed query for SQLite), listing every card, and
+collecting the CardIDs used for duplicate filtering.
+
+Usage:
+    python -m tests.benchmarks.bench_vocabulary_lookup [--words 5000 20000]
+"""
+
+import argparse
+import logging
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.pipelines.vocabulary.stages.word_processing.card_generator import (
+    collect_card_ids,
+)
+from src.providers.base.data_provider import DataProvider
+from src.providers.data.json_provider import JSONDataProvider
+from src.providers.data.sqlite_provider import SQLiteDataProvider
+from src.utils.card_types import FluentForeverCardType
+
+
+def vocabulary_document(words: int) -> dict:
+    """Build a vocabulary.json-shaped document with three cards per word."""
+    return {
+        "metadata": {"total_words": words, "total_cards": words * 3},
+        "skipped_words": [],
+        "words": {
+            f"palabra{i}": {
+                "word": f"palabra{i}",
+                "processed_date": "2025-01-01T00:00:00",
+                "meanings": [
+                    {
+                        "CardID": f"palabra{i}_sense{m}",
+                        "SpanishWord": f"palabra{i}",
+                        "MeaningID": f"sense{m}",
+                        "MeaningContext": "context",
+                        "MonolingualDef": "Unidad de la lengua con significado.",
+                        "ExampleSentenceES": f"La palabra{i} aparece aquí.",
+                        "ExampleSentenceEN": "The word appears here.",
+                        "Image": f"[sound:palabra{i}_sense{m}.png]",
+                        "Audio": f"[sound:palabra{i}.mp3]",
+                        "Notes": "",
+                    }
+                    for m in range(3)
+                ],
+            }
+            for i in range(words)
+        },
+    }
+
+
+def timed(action: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1000
+
+
+def card_ids(provider: DataProvider) -> set[str]:
+    if isinstance(provider, SQLiteDataProvider):
+        return provider.get_card_ids()
+    return collect_card_ids(provider.load_data("vocabulary"), {})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, nargs="+", default=[5000, 20000])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    card_type = FluentForeverCardType()
+
+    print(f"{'cards':>7}{'provider':>10}{'find ms':>10}{'list ms':>10}{'ids ms':>10}")
+    for words in args.words:
+        with tempfile.TemporaryDirectory() as tmp:
+            document = vocabulary_document(words)
+            providers: list[tuple[str, DataProvider]] = [
+                ("json", JSONDataProvider(Path(tmp))),
+                ("sqlite", SQLiteDataProvider(Path(tmp) / "vocabulary.db")),
+            ]
+            target = f"palabra{words - 1}_sense2"
+            for label, provider in providers:
+                provider.save_data("vocabulary", document)
+                find = timed(
+                    lambda p=provider, t=target: card_type.find_card_in_provider(p, t)
+                )
+                listing = timed(lambda p=provider: card_type.list_provider_cards(p))
+                ids = timed(lambda p=provider: card_ids(p))
+                print(
+                    f"{words * 3:>7}{label:>10}{find:>10.2f}{listing:>10.1f}{ids:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
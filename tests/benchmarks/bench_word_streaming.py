@@ -0,0 +1,116 @@
+"""Benchmark: streaming word processing vs buffering the whole batch.
+
+Runs WordProcessingStage over synthetic words built from the example
+dictionary entries, once with chunked spool flushes and once with a chunk
+size larger than the batch (every entry held until one write at the end),
+and reports wall time plus peak traced memory while processing and during
+the final queue commit (the same single write in both modes).
+
+Usage:
+    python -m tests.benchmarks.bench_word_streaming [--words 1000 5000]
+"""
+
+import argparse
+import json
+import logging
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.pipelines.vocabulary.stages.word_processing import (
+    BOGOTA,
+    WordProcessingStage,
+)
+from src.providers.data.json_provider import JSONDataProvider
+from src.providers.data.jsonl_projection import project_entry
+
+from tests.fixtures.contexts import create_test_context
+
+EXAMPLES = (
+    Path(__file__).parents[2]
+    / "context"
+    / "implementation_plans"
+    / "vocabulary_pipeline_planning"
+)
+
+
+class SyntheticDictionary:
+    """Serve projections of the example entries under generated headwords."""
+
+    def __init__(self) -> None:
+        self.templates = []
+        for name in ("example_llamar_entries.json", "sombrero_entries.json"):
+            data = json.loads((EXAMPLES / name).read_text(encoding="utf-8"))
+            entries = data if isinstance(data, list) else [data]
+            self.templates.append(
+                [project_entry(entry, BOGOTA.score_raw_tags) for entry in entries]
+            )
+
+    def get_projection(self, word: str) -> list[dict]:
+        records = self.templates[int(word[4:]) % len(self.templates)]
+        # Fresh copies, as a store read would return
+        return [json.loads(json.dumps({**r, "word": word})) for r in records]
+
+
+def run(words: int, chunk_size: int) -> tuple[float, float, float, int]:
+    """Process a batch, returning (seconds, processing MB, commit MB, entries)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = JSONDataProvider(Path(tmp))
+        context = create_test_context(project_root=Path(tmp))
+        context.set(
+            "providers",
+            {
+                "data": {
+                    "spanish_dictionary": SyntheticDictionary(),
+                    "word_queue_data": queue,
+                }
+            },
+        )
+        context.set("selected_words", [f"word{i}" for i in range(words)])
+        stage = WordProcessingStage(chunk_size=chunk_size)
+        commit = stage.commit
+        processing_peak = 0
+
+        def measured_commit(context, entries):
+            nonlocal processing_peak
+            processing_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+            return commit(context, entries)
+
+        stage.commit = measured_commit  # type: ignore[method-assign]
+        tracemalloc.start()
+        start = time.perf_counter()
+        result = stage.execute(context)
+        duration = time.perf_counter() - start
+        commit_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return (
+            duration,
+            processing_peak / 1_048_576,
+            commit_peak / 1_048_576,
+            result.data["stats"]["emitted"],
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, nargs="+", default=[1000, 5000])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(
+        f"{'words':>7}{'mode':>12}{'entries':>10}{'seconds':>10}"
+        f"{'process MB':>12}{'commit MB':>11}"
+    )
+    for words in args.words:
+        for label, chunk_size in (("buffered", words * 100), ("streaming", 100)):
+            duration, processing, commit, entries = run(words, chunk_size)
+            print(
+                f"{words:>7}{label:>12}{entries:>10}{duration:>10.2f}"
+                f"{processing:>12.1f}{commit:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
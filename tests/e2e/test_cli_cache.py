@@ -0,0 +1,58 @@
+"""
+E2E Test: Pronunciation Cache Command
+
+Purpose: Validate `cache stats` and `cache clear` report on and empty the
+Forvo pronunciation cache configured for the audio providers
+"""
+
+import pytest
+from src.cli.pipeline_runner import main
+from src.providers.audio.pronunciation_cache import PronunciationCache
+
+from tests.fixtures.configs import ConfigFixture, create_base_config
+
+
+class TestCacheCommand:
+    """Test cache statistics and clearing through the CLI."""
+
+    @pytest.fixture
+    def cache_path(self, tmp_path):
+        return tmp_path / "forvo.sqlite"
+
+    @pytest.fixture
+    def config_file(self, cache_path):
+        """Create config whose Forvo provider caches under tmp_path."""
+        config = create_base_config()
+        audio = config["providers"]["audio"]["test_audio"]
+        audio["cache_path"] = str(cache_path)
+        audio["negative_cache_ttl_days"] = 0
+        with ConfigFixture(config) as config_path:
+            yield config_path
+
+    @pytest.fixture
+    def cache(self, cache_path):
+        """Fill the cache with one found and one expired not-found lookup."""
+        cache = PronunciationCache(cache_path, negative_ttl_days=0)
+        cache.put("hola", "es", None, [{"country": "Mexico"}])
+        cache.put("xyzzy", "es", None, [])
+        yield cache
+        cache.close()
+
+    def test_stats(self, config_file, cache, capsys):
+        """Test stats reports entry counts by kind."""
+        assert main(["--config", str(config_file), "cache", "stats"]) == 0
+
+        output = capsys.readouterr().out
+        assert "'test_audio'" in output
+        assert "Entries: 2" in output
+        assert "Not found: 1" in output
+        assert "Expired: 1" in output
+
+    def test_clear(self, config_file, cache):
+        """Test clear --expired keeps fresh entries and clear removes all."""
+        args = ["--config", str(config_file), "cache", "clear"]
+
+        assert main([*args, "--expired"]) == 0
+        assert cache.summary()["entries"] == 1
+        assert main(args) == 0
+        assert cache.summary()["entries"] == 0
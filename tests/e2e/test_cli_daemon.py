@@ -0,0 +1,190 @@
+"""
+E2E Test: Pipeline Daemon
+
+Purpose: Validate run commands are forwarded to a warm daemon over its Unix
+socket, stream their output back, and reuse the daemon's registries
+"""
+
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from src.cli.daemon import (
+    SOCKET_ENV,
+    PipelineDaemon,
+    forward_to_daemon,
+    request_daemon,
+)
+from src.cli.pipeline_runner import main
+from src.core.config import Config
+from src.core.registry import get_pipeline_registry
+from src.providers.registry import ProviderRegistry
+from src.utils.logging_config import get_logger
+
+from tests.fixtures.configs import ConfigFixture, create_base_config
+from tests.fixtures.pipelines import MockPipeline
+
+
+class TestPipelineDaemon:
+    """Test daemon job forwarding, warm state and control commands."""
+
+    @pytest.fixture
+    def config_file(self, tmp_path):
+        """Create temporary config file."""
+        config = create_base_config()
+        config["system"]["checkpoint_dir"] = str(tmp_path / "checkpoints")
+        with ConfigFixture(config) as config_path:
+            yield config_path
+
+    @pytest.fixture
+    def pipeline_registry(self):
+        """Register a test pipeline in the global registry."""
+        registry = get_pipeline_registry()
+        registry._pipelines.clear()
+        registry.register(MockPipeline("test_pipeline"))
+        yield registry
+        registry._pipelines.clear()
+
+    @pytest.fixture
+    def daemon(self, tmp_path, monkeypatch):
+        """Serve a daemon on a temporary socket in a background thread."""
+        socket_path = tmp_path / "daemon.sock"
+        monkeypatch.setenv(SOCKET_ENV, str(socket_path))
+        daemon = PipelineDaemon(socket_path)
+        thread = threading.Thread(target=daemon.serve, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 5
+        while not socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        yield daemon
+        daemon.stop()
+        thread.join(timeout=5)
+
+    def run_args(self, config_file):
+        return [
+            "--config",
+            str(config_file),
+            "run",
+            "test_pipeline",
+            "--stage",
+            "test_stage",
+        ]
+
+    def test_run_is_forwarded_and_streams_output(
+        self, daemon, config_file, pipeline_registry, capsys
+    ):
+        """Test main() hands a run to the daemon and prints its output."""
+        result = main(self.run_args(config_file))
+
+        assert result == 0
+        assert daemon.jobs_run == 1
+        output = capsys.readouterr().out
+        assert "Test stage completed successfully" in output
+
+    def test_jobs_reuse_registries_until_config_changes(
+        self, daemon, config_file, pipeline_registry
+    ):
+        """Test the provider registry is built once per config version."""
+        registry = ProviderRegistry.from_config(Config.load(str(config_file)))
+        with patch(
+            "src.providers.registry.ProviderRegistry.from_config",
+            return_value=registry,
+        ) as mock_from_config:
+            assert main(self.run_args(config_file)) == 0
+            assert main(self.run_args(config_file)) == 0
+            assert mock_from_config.call_count == 1
+
+            stat = config_file.stat()
+            os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert main(self.run_args(config_file)) == 0
+            assert mock_from_config.call_count == 2
+
+        assert daemon.jobs_run == 3
+
+    def test_jobs_use_client_environment(
+        self, daemon, config_file, pipeline_registry, monkeypatch
+    ):
+        """Test config values come from the client's environment, not the daemon's."""
+        monkeypatch.setenv("FORVO_API_KEY", "daemon_key")
+        configs = []
+
+        def submit(env):
+            request = {
+                "argv": self.run_args(config_file),
+                "cwd": os.getcwd(),
+                "env": env,
+            }
+            return list(request_daemon(request, daemon.socket_path))
+
+        from_config = ProviderRegistry.from_config
+        with patch(
+            "src.providers.registry.ProviderRegistry.from_config",
+            side_effect=lambda config: configs.append(config) or from_config(config),
+        ):
+            submit({**os.environ, "FORVO_API_KEY": "client_key"})
+            submit({**os.environ, "FORVO_API_KEY": "client_key"})
+            submit({**os.environ, "FORVO_API_KEY": "other_key"})
+
+        keys = [c.get("providers.audio.test_audio.api_key") for c in configs]
+        assert keys == ["client_key", "other_key"]
+        assert os.environ["FORVO_API_KEY"] == "daemon_key"
+
+    def test_verbose_job_streams_debug_logs(
+        self, daemon, config_file, pipeline_registry
+    ):
+        """Test the global --verbose flag applies to forwarded jobs."""
+
+        def execute(command, args):
+            get_logger("pipelines.test").debug("verbose marker")
+            return 0
+
+        def output(argv):
+            request = {"argv": argv, "cwd": os.getcwd()}
+            events = request_daemon(request, daemon.socket_path)
+            return "".join(e["text"] for e in events if e["event"] == "output")
+
+        with patch("src.cli.commands.RunCommand.execute", execute):
+            quiet = output(self.run_args(config_file))
+            verbose = output(["--verbose", *self.run_args(config_file)])
+
+        assert "verbose marker" not in quiet
+        assert "verbose marker" in verbose
+
+    def test_job_failure_exit_code(self, daemon, config_file, pipeline_registry):
+        """Test a failing job's exit code is returned to the client."""
+        args = self.run_args(config_file)
+        args[args.index("test_pipeline")] = "missing_pipeline"
+
+        assert main(args) == 1
+        assert daemon.jobs_run == 1
+
+    def test_other_directory_runs_locally(
+        self, daemon, config_file, tmp_path, monkeypatch
+    ):
+        """Test jobs from another working directory are rejected."""
+        monkeypatch.chdir(tmp_path)
+
+        assert forward_to_daemon(self.run_args(config_file), "run") is None
+        assert daemon.jobs_run == 0
+
+    def test_no_daemon_runs_locally(self, tmp_path, monkeypatch, config_file):
+        """Test forwarding is skipped without a listening daemon."""
+        monkeypatch.setenv(SOCKET_ENV, str(tmp_path / "missing.sock"))
+
+        assert forward_to_daemon(self.run_args(config_file), "run") is None
+
+    def test_status_and_stop(self, daemon, config_file, capsys):
+        """Test the daemon command reports status and stops the daemon."""
+        config_args = ["--config", str(config_file)]
+
+        assert main([*config_args, "daemon", "status"]) == 0
+        assert "Jobs run: 0" in capsys.readouterr().out
+
+        assert main([*config_args, "daemon", "stop"]) == 0
+        deadline = time.monotonic() + 5
+        while daemon.socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not daemon.socket_path.exists()
+        assert main([*config_args, "daemon", "status"]) == 1
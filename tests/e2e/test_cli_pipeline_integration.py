@@ -77,7 +77,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -102,7 +102,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -127,7 +127,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -152,7 +152,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -209,7 +209,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -250,7 +250,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -301,7 +301,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -317,6 +317,112 @@ class TestCLIPipelineIntegration:
         error_output = captured.err
         assert "required" in error_output.lower() or "argument" in error_output.lower()
 
+    def test_cli_index_build_command(
+        self, config_file, pipeline_registry, provider_registry, tmp_path, capsys
+    ):
+        """Test CLI index build writes the binary index and reports timings."""
+        dictionary = tmp_path / "dict.jsonl"
+        dictionary.write_text(
+            "".join(f'{{"word": "palabra{i}", "pos": "noun"}}\n' for i in range(50)),
+            encoding="utf-8",
+        )
+        index_path = tmp_path / "dict.idx"
+        test_args = [
+            "--config",
+            str(config_file),
+            "index",
+            "build",
+            str(dictionary),
+            "--workers",
+            "2",
+            "--index-path",
+            str(index_path),
+        ]
+
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            result = main(test_args)
+
+        assert result == 0
+        assert index_path.exists()
+        captured = capsys.readouterr()
+        assert_cli_output_contains(captured.out, "Headwords: 50")
+        assert_cli_output_contains(captured.out, "Total time")
+
+    def test_cli_index_project_command(
+        self, config_file, pipeline_registry, provider_registry, tmp_path, capsys
+    ):
+        """Test CLI index project writes the sidecar and its index."""
+        dictionary = tmp_path / "dict.jsonl"
+        dictionary.write_text(
+            "".join(
+                f'{{"word": "palabra{i}", "pos": "noun", "forms": [], "senses": []}}\n'
+                for i in range(20)
+            ),
+            encoding="utf-8",
+        )
+        test_args = [
+            "--config",
+            str(config_file),
+            "index",
+            "project",
+            str(dictionary),
+            "--workers",
+            "1",
+        ]
+
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            result = main(test_args)
+
+        assert result == 0
+        assert (tmp_path / ".dict_projection.jsonl").exists()
+        assert (tmp_path / ".dict_projection.bin").exists()
+        assert_cli_output_contains(capsys.readouterr().out, "Records: 20")
+
+    def test_cli_index_build_missing_file(
+        self, config_file, pipeline_registry, provider_registry, tmp_path
+    ):
+        """Test CLI index build rejects a missing dictionary file."""
+        test_args = [
+            "--config",
+            str(config_file),
+            "index",
+            "build",
+            str(tmp_path / "missing.jsonl"),
+        ]
+
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            result = main(test_args)
+
+        assert result == 1
+        assert not (tmp_path / ".missing_index.bin").exists()
+
     def test_complete_discovery_workflow(
         self, config_file, pipeline_registry, provider_registry
     ):
@@ -356,7 +462,7 @@ class TestCLIPipelineIntegration:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -0,0 +1,72 @@
+"""
+E2E Test: CLI Startup Budget
+
+Purpose: Keep discovery commands cheap to start. Scripts invoke the runner
+hundreds of times per batch, so `list` must not import the pipeline engine,
+provider clients or HTTP libraries. Checked with `python -X importtime` in a
+fresh interpreter; the import-time budget itself is timing-dependent and is
+measured by tests/benchmarks/bench_cli_startup.py instead.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from tests.fixtures.configs import ConfigFixture, create_base_config
+
+PROJECT_ROOT = Path(__file__).parents[2]
+
+# Modules only `run` (or `index`) should load
+DEFERRED_MODULES = {
+    "asyncio",
+    "requests",
+    "src.core.pipeline",
+    "src.providers.registry",
+    "src.providers.data",
+    "src.cli.commands.run_command",
+}
+
+
+def import_times(args: list[str]) -> tuple[dict[str, int], list[int]]:
+    """Run the CLI under -X importtime
+
+    Returns:
+        Tuple of (module -> cumulative microseconds, cumulative
+        microseconds of each top-level import made by the runner)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.cli.pipeline_runner", *args],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+
+    modules: dict[str, int] = {}
+    runner_imports: list[int] = []
+    started = False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        module = name.strip()
+        modules[module] = int(cumulative)
+        # Top-level entries after runpy are the runner's own imports
+        if started and not name[1:].startswith(" "):
+            runner_imports.append(int(cumulative))
+        started = started or module == "runpy"
+    return modules, runner_imports
+
+
+class TestCLIStartup:
+    """Test the imports of discovery commands."""
+
+    def test_list_defers_run_modules(self):
+        """Test `list` does not import modules only `run` needs."""
+        with ConfigFixture(create_base_config()) as config_path:
+            modules, _ = import_times(["--config", str(config_path), "list"])
+
+        assert DEFERRED_MODULES.isdisjoint(modules), sorted(
+            DEFERRED_MODULES & modules.keys()
+        )
@@ -4,6 +4,7 @@ E2E Test Scenario 3: CLI Execution Flow with Context Management
 Purpose: Validate end-to-end stage execution infrastructure
 """
 
+import json
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,12 +13,12 @@ from src.cli.pipeline_runner import main
 from src.core.config import Config
 from src.core.context import PipelineContext
 from src.core.registry import get_pipeline_registry
-from src.core.stages import StageStatus
+from src.core.stages import Stage, StageStatus
 from src.providers.registry import ProviderRegistry
 
 from tests.fixtures.configs import ConfigFixture, create_base_config
 from tests.fixtures.contexts import ContextBuilder, create_test_context
-from tests.fixtures.pipelines import MockPipeline, MultiPhasePipeline
+from tests.fixtures.pipelines import MockPipeline, MultiPhasePipeline, SuccessStage
 from tests.utils.assertions import (
     assert_cli_output_contains,
     assert_context_has_data,
@@ -27,13 +28,49 @@ from tests.utils.assertions import (
 )
 
 
+class ResumablePipeline(MockPipeline):
+    """Pipeline whose second stage fails until the class flag is cleared."""
+
+    fail_second_stage = True
+
+    def __init__(self):
+        super().__init__("resumable_pipeline", ["test_stage", "failure_stage"])
+        self._phases = {"full": ["test_stage", "failure_stage"]}
+
+    def get_stage(self, stage_name: str) -> Stage:
+        if stage_name == "failure_stage" and not self.fail_second_stage:
+            return SuccessStage()
+        return super().get_stage(stage_name)
+
+
+class CachedStage(SuccessStage):
+    """Success stage declaring its context inputs for the stage cache."""
+
+    @property
+    def cache_inputs(self) -> list[str] | None:
+        return ["cli_populated"]
+
+
+class CachedPipeline(MockPipeline):
+    """Pipeline whose phase stage is cacheable."""
+
+    def __init__(self):
+        super().__init__("cached_pipeline", ["test_stage"])
+        self._phases = {"full": ["test_stage"]}
+
+    def get_stage(self, stage_name: str) -> Stage:
+        return CachedStage()
+
+
 class TestContextExecutionFlow:
     """Test CLI execution flow with context management."""
 
     @pytest.fixture
-    def test_config(self):
+    def test_config(self, tmp_path):
         """Create test configuration."""
-        return create_base_config()
+        config = create_base_config()
+        config["system"]["checkpoint_dir"] = str(tmp_path / "checkpoints")
+        return config
 
     @pytest.fixture
     def config_file(self, test_config):
@@ -88,7 +125,7 @@ class TestContextExecutionFlow:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -120,7 +157,7 @@ class TestContextExecutionFlow:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -152,7 +189,7 @@ class TestContextExecutionFlow:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -165,6 +202,222 @@ class TestContextExecutionFlow:
         output = captured.out + captured.err
         assert "phase" in output.lower() or "completed" in output.lower()
 
+    def test_cli_run_phase_reports_timings(
+        self, config_file, pipeline_registry, provider_registry, capsys
+    ):
+        """Test CLI phase runs print stage timings and the critical path."""
+        test_args = [
+            "--config",
+            str(config_file),
+            "run",
+            "test_pipeline",
+            "--phase",
+            "full",
+        ]
+
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            result = main(test_args)
+
+        assert result == 0
+        captured = capsys.readouterr()
+        assert_cli_output_contains(captured.out, "Stage timings")
+        assert_cli_output_contains(
+            captured.out, "Critical path: test_stage -> dependency_stage"
+        )
+
+    def test_cli_run_phase_async(
+        self, config_file, pipeline_registry, provider_registry, capsys
+    ):
+        """Test --async runs the phase on an event loop with the same report."""
+        test_args = [
+            "--config",
+            str(config_file),
+            "run",
+            "test_pipeline",
+            "--phase",
+            "full",
+            "--async",
+        ]
+
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            result = main(test_args)
+
+        assert result == 0
+        captured = capsys.readouterr()
+        assert_cli_output_contains(captured.out, "completed successfully (2/2 stages)")
+        assert_cli_output_contains(
+            captured.out, "Critical path: test_stage -> dependency_stage"
+        )
+
+    def test_cli_run_profile_writes_span_tree(
+        self, config_file, pipeline_registry, provider_registry, tmp_path, capsys
+    ):
+        """Test --profile dumps phase and stage spans and prints the slowest."""
+        profile_path = tmp_path / "profile.json"
+        test_args = [
+            "--config",
+            str(config_file),
+            "run",
+            "test_pipeline",
+            "--phase",
+            "full",
+            "--profile",
+            str(profile_path),
+            "--profile-top",
+            "2",
+        ]
+
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            result = main(test_args)
+
+        assert result == 0
+        root = json.loads(profile_path.read_text())["root"]
+        (phase,) = root["children"]
+        assert phase["kind"] == "phase"
+        assert phase["name"] == "full"
+        assert [stage["name"] for stage in phase["children"]] == [
+            "test_stage",
+            "dependency_stage",
+        ]
+        assert phase["children"][0]["attributes"]["status"] == "success"
+
+        output = capsys.readouterr().out
+        assert_cli_output_contains(output, "Slowest spans")
+        assert_cli_output_contains(output, f"Profile written to {profile_path}")
+        assert len(output.split("Slowest spans")[1].splitlines()) >= 3
+
+    def test_cli_run_resume_skips_completed_stages(
+        self, config_file, pipeline_registry, provider_registry, tmp_path, capsys
+    ):
+        """Test a failed phase prints a run id that resumes after the failure."""
+        pipeline_registry.register(ResumablePipeline())
+        test_args = [
+            "--config",
+            str(config_file),
+            "run",
+            "resumable_pipeline",
+            "--phase",
+            "full",
+        ]
+
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            ResumablePipeline.fail_second_stage = True
+            assert main(test_args) == 1
+            output = capsys.readouterr().out
+            run_id = output.split("Resume with: --resume ")[1].split()[0]
+            assert (tmp_path / "checkpoints" / f"{run_id}.json").exists()
+
+            ResumablePipeline.fail_second_stage = False
+            assert main([*test_args, "--resume", run_id]) == 0
+
+        output = capsys.readouterr().out
+        assert_cli_output_contains(output, "1 stage(s) already completed")
+        assert_cli_output_contains(output, "(1/2 stages, 1 already completed)")
+        assert not (tmp_path / "checkpoints" / f"{run_id}.json").exists()
+
+    def test_cli_run_resume_unknown_run(
+        self, config_file, pipeline_registry, provider_registry, capsys
+    ):
+        """Test resuming a run without a checkpoint fails cleanly."""
+        with (
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            result = main(
+                [
+                    "--config",
+                    str(config_file),
+                    "run",
+                    "test_pipeline",
+                    "--phase",
+                    "full",
+                    "--resume",
+                    "missing-run",
+                ]
+            )
+
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "No checkpoint for run 'missing-run'" in captured.out + captured.err
+
+    def test_cli_run_replays_cached_stages(
+        self, test_config, pipeline_registry, provider_registry, tmp_path, capsys
+    ):
+        """Test system.cache_enabled caches stage outputs across runs."""
+        pipeline_registry.register(CachedPipeline())
+        test_config["system"]["cache_enabled"] = True
+        test_config["system"]["cache_dir"] = str(tmp_path / "stage_cache")
+
+        with (
+            ConfigFixture(test_config) as config_path,
+            patch(
+                "src.cli.pipeline_runner.get_pipeline_registry",
+                return_value=pipeline_registry,
+            ),
+            patch(
+                "src.providers.registry.ProviderRegistry.from_config",
+                return_value=provider_registry,
+            ),
+        ):
+            test_args = [
+                "--config",
+                str(config_path),
+                "run",
+                "cached_pipeline",
+                "--phase",
+                "full",
+            ]
+            outputs = []
+            for extra in ([], [], ["--no-cache"]):
+                assert main([*test_args, *extra]) == 0
+                outputs.append(capsys.readouterr().out)
+
+        assert "Stage cache: 0 hit(s), 1 miss(es)" in outputs[0]
+        assert "Stage cache: 1 hit(s), 0 miss(es)" in outputs[1]
+        assert "Stage cache" not in outputs[2]
+
     def test_context_creation_and_provider_injection(self, config_file, project_root):
         """Test context creation with provider injection."""
         config = Config.load(str(config_file))
@@ -349,7 +602,7 @@ class TestContextExecutionFlow:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -420,7 +673,7 @@ class TestContextExecutionFlow:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -452,7 +705,7 @@ class TestContextExecutionFlow:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -484,7 +737,7 @@ class TestContextExecutionFlow:
                 return_value=pipeline_registry,
             ),
             patch(
-                "src.cli.pipeline_runner.ProviderRegistry.from_config",
+                "src.providers.registry.ProviderRegistry.from_config",
                 return_value=provider_registry,
             ),
         ):
@@ -0,0 +1,211 @@
+"""Unit tests for event-loop execution of stages and phases."""
+
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+from src.core.context import PipelineContext
+from src.core.scheduler import PHASE_REPORT_KEY, PhaseScheduler, StageGraph
+from src.core.stages import AsyncStage, Stage, StageResult, StageStatus
+
+from tests.fixtures.contexts import create_test_context
+from tests.fixtures.pipelines import MockPipeline
+
+
+class WaitingStage(AsyncStage):
+    """Async stage that awaits an event set by another stage."""
+
+    def __init__(
+        self,
+        name: str,
+        log: list[str],
+        wait_for: asyncio.Event | None = None,
+        release: asyncio.Event | None = None,
+        fail: bool = False,
+    ):
+        super().__init__()
+        self._name = name
+        self.log = log
+        self.wait_for = wait_for
+        self.release = release
+        self.fail = fail
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def display_name(self) -> str:
+        return self._name
+
+    async def _execute_impl(self, context: PipelineContext) -> StageResult:
+        self.log.append(f"start {self.name}")
+        if self.release:
+            self.release.set()
+        if self.wait_for:
+            # Only returns if the stage setting the event runs concurrently
+            await asyncio.wait_for(self.wait_for.wait(), timeout=5)
+        self.log.append(f"end {self.name}")
+        if self.fail:
+            return StageResult.failure(f"{self.name} failed")
+        return StageResult.success_result(f"{self.name} done")
+
+
+class ThreadRecordingStage(Stage):
+    """Sync stage recording the thread it ran on."""
+
+    def __init__(self, name: str, threads: list[threading.Thread]):
+        super().__init__()
+        self._name = name
+        self.threads = threads
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def display_name(self) -> str:
+        return self._name
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        self.threads.append(threading.current_thread())
+        return StageResult.success_result(f"{self.name} done")
+
+
+class AsyncPipeline(MockPipeline):
+    """Pipeline running the given stages as one phase."""
+
+    def __init__(self, stages: dict[str, Stage], parallel: bool = False):
+        super().__init__("async_pipeline", list(stages))
+        self._stage_map = stages
+        self._phases = {"full": list(stages)}
+        self.parallel = parallel
+
+    @property
+    def supports_parallel_stages(self) -> bool:
+        return self.parallel
+
+    def get_stage(self, stage_name: str) -> Stage:
+        return self._stage_map[stage_name]
+
+
+def async_context(workers: int = 1) -> PipelineContext:
+    """Create a context with system.max_concurrent_requests set."""
+    context = create_test_context("async_pipeline", Path("/test/root"))
+    context.config = {"system": {"max_concurrent_requests": workers}}
+    return context
+
+
+class TestAsyncStage:
+    """Test AsyncStage from sync and async callers."""
+
+    def test_sync_execute_runs_coroutine(self):
+        """Test execute() still works for callers without an event loop."""
+        log: list[str] = []
+
+        result = WaitingStage("fetch", log).execute(async_context())
+
+        assert result.message == "fetch done"
+        assert log == ["start fetch", "end fetch"]
+
+    def test_sync_stage_execute_async_uses_worker_thread(self):
+        """Test sync stages do not block the event loop's thread."""
+        threads: list[threading.Thread] = []
+        stage = ThreadRecordingStage("save", threads)
+
+        result = asyncio.run(stage.execute_async(async_context()))
+
+        assert result.success
+        assert threads[0] is not threading.main_thread()
+
+
+class TestExecutePhaseAsync:
+    """Test Pipeline.execute_phase_async."""
+
+    def test_mixed_stages_run_in_order(self):
+        """Test sync and async stages run sequentially by default."""
+        log: list[str] = []
+        threads: list[threading.Thread] = []
+        stages: dict[str, Stage] = {
+            "fetch": WaitingStage("fetch", log),
+            "save": ThreadRecordingStage("save", threads),
+        }
+        context = async_context()
+
+        results = asyncio.run(
+            AsyncPipeline(stages).execute_phase_async("full", context)
+        )
+
+        assert [r.message for r in results] == ["fetch done", "save done"]
+        assert threads[0] is not threading.main_thread()
+        assert context.completed_stages == ["fetch", "save"]
+        assert context.get(PHASE_REPORT_KEY).max_workers == 1
+
+    def test_parallel_async_stages_overlap(self):
+        """Test independent async stages share the loop concurrently."""
+
+        async def run() -> list[StageResult]:
+            log: list[str] = []
+            ready = asyncio.Event()
+            stages: dict[str, Stage] = {
+                "audio": WaitingStage("audio", log, wait_for=ready),
+                "images": WaitingStage("images", log, release=ready),
+            }
+            pipeline = AsyncPipeline(stages, parallel=True)
+            return await pipeline.execute_phase_async("full", async_context(2))
+
+        results = asyncio.run(run())
+
+        assert [r.status for r in results] == [StageStatus.SUCCESS] * 2
+
+    def test_fail_fast(self):
+        """Test no stage starts after a failed stage."""
+        log: list[str] = []
+        stages: dict[str, Stage] = {
+            "fetch": WaitingStage("fetch", log, fail=True),
+            "save": WaitingStage("save", log),
+        }
+
+        results = asyncio.run(
+            AsyncPipeline(stages).execute_phase_async("full", async_context())
+        )
+
+        assert len(results) == 1
+        assert results[0].status == StageStatus.FAILURE
+        assert "start save" not in log
+
+    def test_unknown_phase_raises(self):
+        """Test unknown phases raise ValueError like execute_phase."""
+        pipeline = AsyncPipeline({"fetch": WaitingStage("fetch", [])})
+
+        with pytest.raises(ValueError, match="not found"):
+            asyncio.run(pipeline.execute_phase_async("missing", async_context()))
+
+    def test_stage_errors_become_failures(self):
+        """Test exceptions raised by async stages are reported as failures."""
+
+        class BrokenStage(WaitingStage):
+            async def _execute_impl(self, context: PipelineContext) -> StageResult:
+                raise RuntimeError("boom")
+
+        pipeline = AsyncPipeline({"broken": BrokenStage("broken", [])})
+
+        result = asyncio.run(pipeline.execute_stage_async("broken", async_context()))
+
+        assert result.status == StageStatus.FAILURE
+        assert "boom" in result.message
+
+
+def test_scheduler_run_async_orders_results():
+    """Test run_async returns results in declaration order."""
+    graph = StageGraph(["slow", "fast"], {})
+
+    async def execute(name: str) -> StageResult:
+        await asyncio.sleep(0.02 if name == "slow" else 0)
+        return StageResult.success_result(f"{name} done")
+
+    results, report = asyncio.run(PhaseScheduler(2).run_async("full", graph, execute))
+
+    assert [r.message for r in results] == ["slow done", "fast done"]
+    assert report.timings[1].end < report.timings[0].end
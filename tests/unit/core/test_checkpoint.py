@@ -0,0 +1,218 @@
+"""Unit tests for run checkpoints and resumed phase execution."""
+
+import json
+from pathlib import Path
+
+import pytest
+from src.core.checkpoint import CheckpointStore
+from src.core.context import PipelineContext
+from src.core.exceptions import CheckpointError
+from src.core.stages import Stage, StageResult, StageStatus
+
+from tests.fixtures.pipelines import MockPipeline
+
+
+class RecordingStage(Stage):
+    """Stage that records its runs, sets a context key and may fail."""
+
+    def __init__(
+        self,
+        name: str,
+        runs: list[str],
+        dependencies: list[str] | None = None,
+        fail: bool = False,
+    ):
+        super().__init__()
+        self._name = name
+        self.runs = runs
+        self._dependencies = dependencies or []
+        self.fail = fail
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def display_name(self) -> str:
+        return self._name
+
+    @property
+    def dependencies(self) -> list[str]:
+        return self._dependencies
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        self.runs.append(self.name)
+        if self.fail:
+            return StageResult.failure(f"{self.name} failed")
+        context.set(f"{self.name}_output", [self.name, len(self.runs)])
+        return StageResult.success_result(f"{self.name} done")
+
+
+class CheckpointPipeline(MockPipeline):
+    """Pipeline running the given stages as one phase."""
+
+    def __init__(self, stages: dict[str, Stage], parallel: bool = False):
+        super().__init__("checkpoint_pipeline", list(stages))
+        self._stage_map = stages
+        self._phases = {"full": list(stages)}
+        self.parallel = parallel
+
+    @property
+    def supports_parallel_stages(self) -> bool:
+        return self.parallel
+
+    def get_stage(self, stage_name: str) -> Stage:
+        return self._stage_map[stage_name]
+
+
+def run_context(store: CheckpointStore, run_id: str = "run-1") -> PipelineContext:
+    """Create a checkpointed context with a provider entry."""
+    context = PipelineContext(
+        pipeline_name="checkpoint_pipeline",
+        project_root=Path("/test/root"),
+        args={"phase": "full"},
+        config={"system": {"max_concurrent_requests": 2}},
+        run_id=run_id,
+        checkpoint_store=store,
+    )
+    context.set("providers", {"data": object()})
+    return context
+
+
+class TestCheckpointStore:
+    """Test checkpoint files."""
+
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test serializable data and completed stages are persisted."""
+        store = CheckpointStore(tmp_path)
+        context = run_context(store)
+        context.set("words", ["por", "para"])
+        context.set("media_dir", Path("/media"))
+        context.mark_stage_complete("prepare")
+
+        store.save(context)
+        checkpoint = store.load("run-1")
+
+        assert checkpoint.completed_stages == ["prepare"]
+        assert checkpoint.data == {"words": ["por", "para"]}
+        assert checkpoint.skipped_keys == ["media_dir"]
+        assert checkpoint.phase == "full"
+        assert list(tmp_path.iterdir()) == [tmp_path / "run-1.json"]
+
+    def test_restore_reinjects_providers(self, tmp_path):
+        """Test restored contexts keep their own providers and skip stages."""
+        store = CheckpointStore(tmp_path)
+        context = run_context(store)
+        context.set("words", ["por"])
+        context.mark_stage_complete("prepare")
+        store.save(context)
+
+        resumed = run_context(store)
+        providers = resumed.get("providers")
+        store.restore(store.load("run-1"), resumed)
+
+        assert resumed.get("providers") is providers
+        assert resumed.get("words") == ["por"]
+        assert resumed.resumed_stages == ["prepare"]
+        assert resumed.completed_stages == ["prepare"]
+
+    def test_restore_rejects_other_pipeline(self, tmp_path):
+        """Test a checkpoint cannot be applied to another pipeline's context."""
+        store = CheckpointStore(tmp_path)
+        store.save(run_context(store))
+        other = PipelineContext(pipeline_name="other", project_root=tmp_path)
+
+        with pytest.raises(CheckpointError, match="belongs to pipeline"):
+            store.restore(store.load("run-1"), other)
+
+    def test_missing_invalid_and_corrupt_checkpoints(self, tmp_path):
+        """Test load errors are reported as CheckpointError."""
+        store = CheckpointStore(tmp_path)
+        (tmp_path / "corrupt.json").write_text("{", encoding="utf-8")
+        (tmp_path / "old.json").write_text(
+            json.dumps(
+                {
+                    "run_id": "old",
+                    "pipeline_name": "p",
+                    "completed_stages": [],
+                    "data": {},
+                    "version": 99,
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        for run_id in ("missing", "../escape", "corrupt", "old"):
+            with pytest.raises(CheckpointError):
+                store.load(run_id)
+
+    def test_new_run_ids_are_unique_file_names(self, tmp_path):
+        """Test generated run ids are accepted by the store."""
+        store = CheckpointStore(tmp_path)
+        first = store.new_run_id("vocabulary")
+        second = store.new_run_id("vocabulary")
+
+        assert first != second
+        assert first.startswith("vocabulary-")
+        assert store.get_path(first).parent == tmp_path
+
+
+class TestResumedExecution:
+    """Test checkpointing and skipping through Pipeline.execute_phase."""
+
+    def test_failed_phase_resumes_after_last_completed_stage(self, tmp_path):
+        """Test a rerun skips completed stages and keeps their context data."""
+        store = CheckpointStore(tmp_path)
+        runs: list[str] = []
+        stages: dict[str, Stage] = {
+            "media": RecordingStage("media", runs),
+            "sync": RecordingStage("sync", runs, fail=True),
+        }
+        first = CheckpointPipeline(stages).execute_phase("full", run_context(store))
+        assert first[-1].status == StageStatus.FAILURE
+
+        stages["sync"] = RecordingStage("sync", runs)
+        context = run_context(store)
+        store.restore(store.load("run-1"), context)
+        results = CheckpointPipeline(stages).execute_phase("full", context)
+
+        assert runs == ["media", "sync", "sync"]
+        assert [r.status for r in results] == [
+            StageStatus.SKIPPED,
+            StageStatus.SUCCESS,
+        ]
+        assert context.get("media_output") == ["media", 1]
+        assert store.load("run-1").completed_stages == ["media", "sync"]
+
+    def test_skipped_stage_releases_dependents_in_parallel_mode(self, tmp_path):
+        """Test resumed dependencies count as finished for the scheduler."""
+        store = CheckpointStore(tmp_path)
+        runs: list[str] = []
+        stages: dict[str, Stage] = {
+            "select": RecordingStage("select", runs),
+            "audio": RecordingStage("audio", runs, ["select"]),
+        }
+        context = run_context(store)
+        context.resumed_stages = ["select"]
+
+        results = CheckpointPipeline(stages, parallel=True).execute_phase(
+            "full", context
+        )
+
+        assert runs == ["audio"]
+        assert [r.status for r in results] == [
+            StageStatus.SKIPPED,
+            StageStatus.SUCCESS,
+        ]
+
+    def test_unwritable_checkpoint_does_not_fail_stage(self, tmp_path):
+        """Test checkpoint write errors are logged, not raised."""
+        blocker = tmp_path / "not_a_directory"
+        blocker.write_text("", encoding="utf-8")
+        stages: dict[str, Stage] = {"media": RecordingStage("media", [])}
+
+        results = CheckpointPipeline(stages).execute_phase(
+            "full", run_context(CheckpointStore(blocker))
+        )
+
+        assert results[0].status == StageStatus.SUCCESS
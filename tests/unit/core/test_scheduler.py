@@ -0,0 +1,261 @@
+"""Unit tests for dependency-graph phase scheduling."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from src.core.context import PipelineContext
+from src.core.exceptions import StageDependencyError
+from src.core.scheduler import PHASE_REPORT_KEY, PhaseScheduler, StageGraph
+from src.core.stages import Stage, StageResult, StageStatus
+
+from tests.fixtures.contexts import create_test_context
+from tests.fixtures.pipelines import MockPipeline
+
+
+class TimedStage(Stage):
+    """Stage that records when it runs and optionally waits on a barrier."""
+
+    def __init__(
+        self,
+        name: str,
+        dependencies: list[str],
+        log: list[tuple[str, str]],
+        barrier: threading.Barrier | None = None,
+        fail: bool = False,
+        delay: float = 0.0,
+    ):
+        super().__init__()
+        self._name = name
+        self._dependencies = dependencies
+        self.log = log
+        self.barrier = barrier
+        self.fail = fail
+        self.delay = delay
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def display_name(self) -> str:
+        return self._name
+
+    @property
+    def dependencies(self) -> list[str]:
+        return self._dependencies
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        self.log.append(("start", self.name))
+        if self.barrier:
+            # Only passes if the other stages sharing the barrier run concurrently
+            self.barrier.wait(timeout=5)
+        time.sleep(self.delay)
+        self.log.append(("end", self.name))
+        if self.fail:
+            return StageResult.failure(f"{self.name} failed")
+        return StageResult.success_result(f"{self.name} done")
+
+
+class ParallelPipeline(MockPipeline):
+    """Pipeline opting in to parallel stages, built from TimedStages."""
+
+    def __init__(self, stages: dict[str, TimedStage], parallel: bool = True):
+        super().__init__("parallel_pipeline", list(stages))
+        self._stage_map = stages
+        self._phases = {"full": list(stages)}
+        self.parallel = parallel
+
+    @property
+    def supports_parallel_stages(self) -> bool:
+        return self.parallel
+
+    def get_stage(self, stage_name: str) -> Stage:
+        return self._stage_map[stage_name]
+
+
+def parallel_context(workers: int) -> PipelineContext:
+    """Create a context with system.max_concurrent_requests set."""
+    context = create_test_context("parallel_pipeline", Path("/test/root"))
+    context.config = {"system": {"max_concurrent_requests": workers}}
+    return context
+
+
+class TestStageGraph:
+    """Test graph construction, cycle detection and critical paths."""
+
+    def test_topological_order_keeps_declaration_order_for_ties(self):
+        """Test ready stages are ordered as declared."""
+        graph = StageGraph(
+            ["select", "audio", "images", "sync"],
+            {"audio": ["select"], "images": ["select"], "sync": ["audio", "images"]},
+        )
+
+        assert graph.topological_order() == ["select", "audio", "images", "sync"]
+
+    def test_dependency_declared_later_runs_first(self):
+        """Test order follows dependencies, not only the phase list."""
+        graph = StageGraph(["sync", "select"], {"sync": ["select"]})
+
+        assert graph.topological_order() == ["select", "sync"]
+
+    def test_dependencies_outside_phase_ignored(self):
+        """Test dependencies on earlier phases do not block stages."""
+        graph = StageGraph(["process"], {"process": ["word_selection"]})
+
+        assert graph.dependencies == {"process": []}
+
+    def test_cycle_detected(self):
+        """Test cyclic dependencies raise with the cycle path."""
+        with pytest.raises(StageDependencyError, match="a -> c -> b -> a"):
+            StageGraph(["a", "b", "c"], {"a": ["c"], "b": ["a"], "c": ["b"]})
+
+    def test_critical_path_uses_measured_durations(self):
+        """Test the longest dependent chain is reported."""
+        graph = StageGraph(
+            ["select", "audio", "images", "sync"],
+            {"audio": ["select"], "images": ["select"], "sync": ["audio", "images"]},
+        )
+
+        path, total = graph.critical_path(
+            {"select": 1.0, "audio": 2.0, "images": 5.0, "sync": 1.0}
+        )
+
+        assert path == ["select", "images", "sync"]
+        assert total == pytest.approx(7.0)
+
+
+class TestPhaseScheduler:
+    """Test concurrent execution, fail-fast and result ordering."""
+
+    def test_independent_stages_overlap(self):
+        """Test ready stages run concurrently up to max_workers."""
+        log: list[tuple[str, str]] = []
+        barrier = threading.Barrier(2)
+        stages = {
+            "select": TimedStage("select", [], log),
+            "audio": TimedStage("audio", ["select"], log, barrier=barrier),
+            "images": TimedStage("images", ["select"], log, barrier=barrier),
+            "sync": TimedStage("sync", ["audio", "images"], log),
+        }
+        context = parallel_context(workers=4)
+
+        results = ParallelPipeline(stages).execute_phase("full", context)
+
+        assert [r.message for r in results] == [
+            "select done",
+            "audio done",
+            "images done",
+            "sync done",
+        ]
+        assert log.index(("start", "sync")) > log.index(("end", "images"))
+        assert set(context.completed_stages) == set(stages)
+
+    def test_fail_fast_stops_new_stages(self):
+        """Test no stage starts after a failure, and dependents never run."""
+        log: list[tuple[str, str]] = []
+        stages = {
+            "select": TimedStage("select", [], log, fail=True),
+            "audio": TimedStage("audio", ["select"], log),
+            "other": TimedStage("other", [], log, delay=0.05),
+            "later": TimedStage("later", [], log),
+        }
+
+        results = ParallelPipeline(stages).execute_phase("full", parallel_context(2))
+
+        started = [name for event, name in log if event == "start"]
+        assert "audio" not in started
+        assert "later" not in started
+        assert [r.status for r in results] == [StageStatus.FAILURE, StageStatus.SUCCESS]
+
+    def test_results_in_declaration_order(self):
+        """Test results do not depend on completion order."""
+        log: list[tuple[str, str]] = []
+        stages = {
+            "slow": TimedStage("slow", [], log, delay=0.05),
+            "fast": TimedStage("fast", [], log),
+        }
+
+        results = ParallelPipeline(stages).execute_phase("full", parallel_context(2))
+
+        assert log.index(("end", "fast")) < log.index(("end", "slow"))
+        assert [r.message for r in results] == ["slow done", "fast done"]
+
+    def test_exceptions_become_failures(self):
+        """Test an exception from the stage runner fails the phase."""
+        graph = StageGraph(["a", "b"], {"b": ["a"]})
+
+        def execute(name: str) -> StageResult:
+            raise RuntimeError("boom")
+
+        results, report = PhaseScheduler(2).run("full", graph, execute)
+
+        assert len(results) == 1
+        assert "boom" in results[0].message
+        assert report.timings[0].status == "failure"
+
+    def test_max_workers_must_be_positive(self):
+        """Test invalid worker counts are rejected."""
+        with pytest.raises(ValueError):
+            PhaseScheduler(0)
+
+
+class TestPipelinePhaseScheduling:
+    """Test Pipeline.execute_phase integration."""
+
+    def test_sequential_unless_pipeline_opts_in(self):
+        """Test pipelines run stages one at a time by default."""
+        log: list[tuple[str, str]] = []
+        stages = {
+            "a": TimedStage("a", [], log),
+            "b": TimedStage("b", [], log),
+        }
+        context = parallel_context(workers=4)
+
+        ParallelPipeline(stages, parallel=False).execute_phase("full", context)
+
+        assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+        assert context.get(PHASE_REPORT_KEY).max_workers == 1
+
+    def test_width_bounded_by_max_concurrent_requests(self):
+        """Test one configured worker keeps a parallel pipeline sequential."""
+        log: list[tuple[str, str]] = []
+        stages = {
+            "a": TimedStage("a", [], log, delay=0.01),
+            "b": TimedStage("b", [], log),
+        }
+
+        ParallelPipeline(stages).execute_phase("full", parallel_context(1))
+
+        assert log == [("start", "a"), ("end", "a"), ("start", "b"), ("end", "b")]
+
+    def test_phase_report_stored_in_context(self):
+        """Test timings and the critical path are recorded for the phase."""
+        log: list[tuple[str, str]] = []
+        stages = {
+            "select": TimedStage("select", [], log),
+            "audio": TimedStage("audio", ["select"], log, delay=0.02),
+            "images": TimedStage("images", ["select"], log),
+        }
+        context = parallel_context(workers=2)
+
+        ParallelPipeline(stages).execute_phase("full", context)
+
+        report = context.get(PHASE_REPORT_KEY)
+        assert report.phase_name == "full"
+        assert [t.name for t in report.timings] == ["select", "audio", "images"]
+        assert report.critical_path == ["select", "audio"]
+        assert report.critical_path_time <= report.wall_time + 1e-6
+
+    def test_cycle_in_phase_raises(self):
+        """Test a cyclic phase is rejected before any stage runs."""
+        log: list[tuple[str, str]] = []
+        stages = {
+            "a": TimedStage("a", ["b"], log),
+            "b": TimedStage("b", ["a"], log),
+        }
+
+        with pytest.raises(StageDependencyError):
+            ParallelPipeline(stages).execute_phase("full", parallel_context(2))
+        assert log == []
@@ -0,0 +1,199 @@
+"""Unit tests for the stage output cache."""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src.core.context import PipelineContext
+from src.core.stage_cache import StageCache
+from src.core.stages import Stage, StageResult, StageStatus
+
+from tests.fixtures.pipelines import MockPipeline
+
+
+class CardStage(Stage):
+    """Cacheable stage turning context words into cards."""
+
+    def __init__(
+        self,
+        runs: list[str],
+        files: list[Path] | None = None,
+        cacheable: bool = True,
+        fail: bool = False,
+    ):
+        super().__init__()
+        self.runs = runs
+        self.files = files or []
+        self.cacheable = cacheable
+        self.fail = fail
+
+    @property
+    def name(self) -> str:
+        return "cards"
+
+    @property
+    def display_name(self) -> str:
+        return "Cards"
+
+    @property
+    def cache_inputs(self) -> list[str] | None:
+        return ["words"] if self.cacheable else None
+
+    def get_cache_files(self, context: PipelineContext) -> list[Path]:
+        return self.files
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        self.runs.append("cards")
+        if self.fail:
+            return StageResult.failure("no cards")
+        words = context.get("words")
+        context.set("cards", [f"{word}_card" for word in words])
+        context.data.pop("staging", None)
+        return StageResult.success_result("Built cards", {"count": len(words)})
+
+
+class CachePipeline(MockPipeline):
+    """Pipeline with a single stage."""
+
+    def __init__(self, stage: Stage):
+        super().__init__("cache_pipeline", ["cards"])
+        self.stage = stage
+
+    def get_stage(self, stage_name: str) -> Stage:
+        return self.stage
+
+
+def cache_context(cache: StageCache, words: list[str]) -> PipelineContext:
+    """Create a context holding words, a staging key and the cache."""
+    context = PipelineContext(
+        pipeline_name="cache_pipeline", project_root=Path("/"), stage_cache=cache
+    )
+    context.set("words", words)
+    context.set("staging", True)
+    context.set("providers", {"data": object()})
+    return context
+
+
+def run_stage(
+    cache: StageCache, words: list[str], **stage_args: Any
+) -> tuple[StageResult, PipelineContext, list[str]]:
+    """Execute the card stage once and return result, context and runs."""
+    runs: list[str] = []
+    context = cache_context(cache, words)
+    result = CachePipeline(CardStage(runs, **stage_args)).execute_stage(
+        "cards", context
+    )
+    return result, context, runs
+
+
+class TestStageCache:
+    """Test fingerprinting, replay and eviction."""
+
+    def test_unchanged_inputs_replay_output(self, tmp_path):
+        """Test a hit skips execution and replays data and context changes."""
+        cache = StageCache(tmp_path)
+        first, _, first_runs = run_stage(cache, ["por", "para"])
+
+        second, context, runs = run_stage(cache, ["por", "para"])
+
+        assert first_runs == ["cards"]
+        assert runs == []
+        assert second.data == first.data == {"count": 2}
+        assert context.get("cards") == ["por_card", "para_card"]
+        assert "staging" not in context.data
+        assert context.completed_stages == ["cards"]
+        assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+
+    def test_changed_input_misses(self, tmp_path):
+        """Test a different input value executes the stage again."""
+        cache = StageCache(tmp_path)
+        run_stage(cache, ["por"])
+
+        _, context, runs = run_stage(cache, ["para"])
+
+        assert runs == ["cards"]
+        assert context.get("cards") == ["para_card"]
+
+    def test_file_fingerprint_modes(self, tmp_path):
+        """Test mtime mode reacts to touches, content mode only to edits."""
+        source = tmp_path / "words.txt"
+        source.write_text("por", encoding="utf-8")
+        mtime_cache = StageCache(tmp_path / "mtime")
+        content_cache = StageCache(tmp_path / "content", file_hash="content")
+        for cache in (mtime_cache, content_cache):
+            run_stage(cache, ["por"], files=[source])
+
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert run_stage(mtime_cache, ["por"], files=[source])[2] == ["cards"]
+        assert run_stage(content_cache, ["por"], files=[source])[2] == []
+
+        source.write_text("para", encoding="utf-8")
+        assert run_stage(content_cache, ["por"], files=[source])[2] == ["cards"]
+
+    def test_undeclared_and_failed_stages_not_cached(self, tmp_path):
+        """Test only successful stages declaring inputs are stored."""
+        cache = StageCache(tmp_path)
+
+        run_stage(cache, ["por"], cacheable=False)
+        run_stage(cache, ["por"], fail=True)
+
+        assert cache.stats.stores == 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_non_serializable_output_not_cached(self, tmp_path):
+        """Test stages setting live objects in the context are not stored."""
+
+        class LiveStage(CardStage):
+            def _execute_impl(self, context: PipelineContext) -> StageResult:
+                context.set("connection", object())
+                return StageResult.success_result("connected")
+
+        cache = StageCache(tmp_path)
+        context = cache_context(cache, ["por"])
+
+        CachePipeline(LiveStage([])).execute_stage("cards", context)
+
+        assert cache.stats.stores == 0
+
+    def test_least_recently_used_entries_evicted(self, tmp_path):
+        """Test eviction keeps the total size under max_bytes, oldest first."""
+        cache = StageCache(tmp_path, max_bytes=10**6)
+        for i, words in enumerate((["a"], ["b"])):
+            run_stage(cache, words)
+            path = cache.get_path(
+                cache.get_key(CardStage([]), cache_context(cache, words))
+            )
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+        entry_size = cache.get_size() // 2
+
+        cache.max_bytes = entry_size * 2
+        assert run_stage(cache, ["a"])[2] == []  # hit refreshes "a"
+        run_stage(cache, ["c"])
+
+        assert cache.stats.evictions == 1
+        assert run_stage(cache, ["a"])[2] == []
+        assert run_stage(cache, ["b"])[2] == ["cards"]
+
+    def test_invalid_file_hash_rejected(self, tmp_path):
+        """Test unknown fingerprint modes are rejected."""
+        with pytest.raises(ValueError):
+            StageCache(tmp_path, file_hash="sha1")
+
+
+def test_execute_stage_async_uses_cache(tmp_path):
+    """Test execute_stage_async replays cached outputs too."""
+    cache = StageCache(tmp_path)
+    run_stage(cache, ["por"])
+    runs: list[str] = []
+    context = cache_context(cache, ["por"])
+
+    result = asyncio.run(
+        CachePipeline(CardStage(runs)).execute_stage_async("cards", context)
+    )
+
+    assert result.status == StageStatus.SUCCESS
+    assert runs == []
@@ -0,0 +1,133 @@
+"""Unit tests for IPASelector pronunciation scoring and selection."""
+
+import pytest
+from src.pipelines.vocabulary.stages.word_processing import (
+    ACCENT_PROFILES,
+    BOGOTA,
+    AccentProfile,
+    IPASelector,
+)
+from src.pipelines.vocabulary.stages.word_processing.ipa_selector import (
+    normalize_raw_tags,
+    score_pronunciation,
+)
+from src.providers.data.jsonl_projection import project_entry
+
+LLAMAR_SOUNDS = [
+    {"ipa": "[ʎaˈmaɾ]", "raw_tags": ["no yeísta"]},
+    {"ipa": "[ʃaˈmaɾ]", "raw_tags": ["sheísta"]},
+    {"ipa": "[ʝaˈmaɾ]", "raw_tags": ["yeísta"]},
+    {"ipa": "[ʒaˈmaɾ]", "raw_tags": ["zheísta"]},
+    {"rhymes": "aɾ"},
+]
+
+
+class TestIPASelector:
+    """Test the Bogotá profile and batch selection."""
+
+    @pytest.fixture
+    def selector(self):
+        """Create a selector with the default Bogotá profile."""
+        return IPASelector()
+
+    def test_compiled_table_is_frozen(self, selector):
+        """Test the precompiled table cannot be modified."""
+        assert selector.table[("seseante", "yeísta")] == 10
+        with pytest.raises(TypeError):
+            selector.table[("seseante",)] = 0  # type: ignore[index]
+
+    def test_score_handles_comma_joined_and_order(self, selector):
+        """Test raw_tags are normalized before lookup."""
+        assert selector.score(["yeísta, seseante"]) == 10
+        assert selector.score(["no seseante", "no yeísta"]) == -2
+        assert selector.score(None) == 4
+
+    def test_score_memoized_per_raw_value(self, selector, monkeypatch):
+        """Test repeated raw_tags skip normalization."""
+        selector.score(["seseante"])
+        monkeypatch.setattr(
+            selector, "_score_normalized", lambda tags: pytest.fail("re-parsed")
+        )
+
+        assert selector.score(["seseante"]) == 8
+
+    def test_select_best_ipa(self, selector):
+        """Test the highest scoring pronunciation is chosen."""
+        assert selector.select_best_ipa(LLAMAR_SOUNDS, "llamar") == "[ʝaˈmaɾ]"
+
+    def test_tie_keeps_first_occurrence(self, selector):
+        """Test equal scores select the first pronunciation."""
+        sounds = [
+            {"ipa": "[a]", "raw_tags": ["seseante"]},
+            {"ipa": "[b]", "raw_tags": ["seseante"]},
+        ]
+
+        assert selector.select_best_ipa(sounds) == "[a]"
+
+    def test_missing_sounds_return_none(self, selector):
+        """Test absent or IPA-less sounds return None."""
+        assert selector.select_best_ipa(None) is None
+        assert selector.select_best_ipa([{"rhymes": "aɾ"}]) is None
+
+    def test_negative_scores_fall_back_to_untagged(self):
+        """Test the untagged fallback when nothing reaches the minimum."""
+        selector = IPASelector(AccentProfile("strict", lambda tags: -1))
+        sounds = [{"ipa": "[x]", "raw_tags": ["sheísta"]}, {"ipa": "[y]"}]
+
+        assert selector.select_best_ipa(sounds) == "[y]"
+        assert selector.select_best_ipa(sounds[:1]) is None
+
+    def test_pronunciation_scoring(self):
+        """Test raw_tags normalization and the Bogotá scoring table."""
+        tags = normalize_raw_tags(["Seseante, yeísta"])
+
+        assert tags == ("seseante", "yeísta")
+        assert score_pronunciation(tags) == 10
+        assert score_pronunciation(("seseante",)) == 8
+        assert score_pronunciation(()) == 4
+        assert score_pronunciation(("no seseante", "no yeísta")) == -2
+        assert score_pronunciation(("yeísta", "zheísta")) == -5
+
+    def test_profile_scores_projection(self):
+        """Test a profile ranks projected IPA candidates as a scorer."""
+        projection = project_entry(
+            {"word": "llamar", "sounds": LLAMAR_SOUNDS}, BOGOTA.score_raw_tags
+        )
+
+        assert projection["ipa"][0] == ["[ʝaˈmaɾ]", 6, ["yeísta"]]
+        assert projection["ipa"][-1][1] == -5
+
+    def test_select_batch_mixed_inputs(self, selector):
+        """Test raw entries, projections and bare sounds in one batch."""
+        projection = project_entry({"word": "llamar", "sounds": LLAMAR_SOUNDS})
+
+        selected = selector.select_batch(
+            {
+                "raw": {"word": "llamar", "sounds": LLAMAR_SOUNDS},
+                "projected": projection,
+                "bare": LLAMAR_SOUNDS,
+                "empty": {"word": "x"},
+            }
+        )
+
+        assert selected == {
+            "raw": "[ʝaˈmaɾ]",
+            "projected": "[ʝaˈmaɾ]",
+            "bare": "[ʝaˈmaɾ]",
+            "empty": None,
+        }
+
+    def test_profile_by_name(self):
+        """Test registered profiles resolve by name and unknown names fail."""
+        assert IPASelector("bogota").profile is ACCENT_PROFILES["bogota"]
+        with pytest.raises(ValueError, match="Unknown accent profile"):
+            IPASelector("madrid")
+
+    def test_profiles_sharing_a_name_keep_own_tables(self):
+        """Test compiled tables are not shared between same-named profiles."""
+        lenient = IPASelector(AccentProfile("custom", lambda tags: 1))
+        strict = IPASelector(AccentProfile("custom", lambda tags: -1))
+
+        assert lenient.table[("seseante",)] == 1
+        assert strict.table[("seseante",)] == -1
+        assert strict.score(["seseante"]) == -1
@@ -0,0 +1,106 @@
+"""Unit tests for SenseProcessor sense grouping."""
+
+import pytest
+from src.pipelines.vocabulary.stages.word_processing import SenseProcessor
+
+
+def sense(index: str, translations: list[str], example: bool = False) -> dict:
+    """Build a projected sense."""
+    return {
+        "sense_index": index,
+        "translations": translations,
+        "example": {"text": "Ejemplo.", "bold_text_offsets": []} if example else None,
+    }
+
+
+class TestSenseProcessor:
+    """Test grouping, subset elimination and sense selection."""
+
+    @pytest.fixture
+    def processor(self):
+        """Create a sense processor."""
+        return SenseProcessor()
+
+    def test_identical_translation_sets_grouped(self, processor):
+        """Test senses with the same normalized translations share a group."""
+        result = processor.process_senses(
+            [
+                sense("1", ["call", "name", "refer to"]),
+                sense("2", ["Refer to", "NAME", "call "], example=True),
+                sense("3", ["summon"], example=True),
+            ],
+            "llamar",
+        )
+
+        assert [group.sense_indexes for group in result.groups] == [["1", "2"], ["3"]]
+        assert result.groups[0].translations == ("call", "name", "refer to")
+        assert result.groups[0].meaning == "call, name, refer to"
+
+    def test_subset_groups_eliminated(self, processor):
+        """Test groups contained in a larger group are dropped."""
+        result = processor.process_senses(
+            [
+                sense("1", ["call"], example=True),
+                sense("2", ["call", "name", "refer to"], example=True),
+                sense("3", ["name", "refer to"], example=True),
+                sense("4", ["knock", "ring"], example=True),
+                sense("5", ["ring"], example=True),
+            ]
+        )
+
+        assert [group.sense_indexes for group in result.groups] == [["2"], ["4"]]
+
+    def test_overlapping_groups_kept(self, processor):
+        """Test partially overlapping groups are not subsets."""
+        result = processor.process_senses(
+            [sense("1", ["call", "name"]), sense("2", ["name", "summon"])]
+        )
+
+        assert len(result.groups) == 2
+
+    def test_selects_first_sense_with_example(self, processor):
+        """Test selection prefers examples and warns when none exist."""
+        result = processor.process_senses(
+            [
+                sense("1", ["hat"]),
+                sense("2", ["hat"], example=True),
+                sense("3", ["brim"]),
+            ],
+            "sombrero",
+        )
+
+        assert result.groups[0].selected_sense == "2"
+        assert result.groups[0].has_example
+        assert result.groups[1].selected_sense == "3"
+        assert not result.groups[1].has_example
+        assert any("no example" in warning for warning in result.warnings)
+
+    def test_senses_without_translations_skipped(self, processor):
+        """Test empty or malformed senses are skipped with warnings."""
+        result = processor.process_senses(
+            [sense("1", []), "broken", sense("3", ["", " "]), sense("4", ["hat"])]
+        )
+
+        assert [group.sense_indexes for group in result.groups] == [["4"]]
+        assert len(result.warnings) == 4
+
+    def test_unhashable_translations_skipped(self, processor):
+        """Test list or dict translations are skipped instead of raising."""
+        result = processor.process_senses(
+            [{"sense_index": "1", "translations": [["hat"], {"x": 1}, "cap"]}]
+        )
+
+        assert [group.translations for group in result.groups] == [("cap",)]
+        assert len(result.warnings) == 3
+
+    def test_process_batch(self, processor):
+        """Test batch processing groups every word independently."""
+        results = processor.process_batch(
+            {
+                "llamar": [sense("1", ["call"]), sense("2", ["call", "name"])],
+                "casa": [sense("1", ["house"], example=True)],
+            }
+        )
+
+        assert results["llamar"].groups[0].translations == ("call", "name")
+        assert results["casa"].groups[0].selected_sense == "1"
@@ -0,0 +1,73 @@
+"""Unit tests for the vocabulary validation stage."""
+
+import json
+
+import pytest
+from src.core.stages import StageStatus
+from src.pipelines.vocabulary.stages.vocabulary_validation import (
+    VocabularyValidationStage,
+)
+from src.providers.data.json_provider import JSONDataProvider
+
+from tests.fixtures.contexts import create_test_context
+
+CONFIG = {
+    "validation": {
+        "vocabulary_schema": {
+            "meaning_entry": {"required_fields": ["CardID", "SpanishWord", "IPA"]}
+        },
+        "field_patterns": {
+            "CardID": "^[a-záéíóúñü_0-9]+$",
+            "IPA": "^\\[.*\\]$|^/.*/$",
+        },
+    }
+}
+
+
+def meaning(card_id: str, ipa: str = "[ˈkasa]") -> dict:
+    return {"CardID": card_id, "SpanishWord": card_id.split("_")[0], "IPA": ipa}
+
+
+class TestVocabularyValidationStage:
+    """Test meaning validation against required fields and patterns."""
+
+    @pytest.fixture
+    def context(self, tmp_path):
+        """Create a context with a vocabulary provider."""
+        vocabulary = {
+            "words": {
+                "casa": {"meanings": [meaning("casa_house"), meaning("casa_home")]},
+                "perro": {"meanings": [meaning("perro_dog", ipa="ˈpero")]},
+                "gato": {"meanings": [{"CardID": "Gato cat", "IPA": "[ˈɡato]"}]},
+            }
+        }
+        (tmp_path / "vocabulary.json").write_text(json.dumps(vocabulary))
+        context = create_test_context(project_root=tmp_path, config=CONFIG)
+        context.set(
+            "providers", {"data": {"vocabulary_data": JSONDataProvider(tmp_path)}}
+        )
+        return context
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_invalid_meanings_reported(self, context, workers):
+        """Test invalid meanings are listed and valid CardIDs stored."""
+        result = VocabularyValidationStage(workers=workers, chunk_size=2).execute(
+            context
+        )
+
+        assert result.status == StageStatus.PARTIAL
+        assert context.get("validated_card_ids") == ["casa_house", "casa_home"]
+        assert result.errors == [
+            "perro_dog: IPA 'ˈpero' does not match ^\\[.*\\]$|^/.*/$",
+            "Gato cat: missing SpanishWord; CardID 'Gato cat' does not match "
+            "^[a-záéíóúñü_0-9]+$",
+        ]
+
+    def test_missing_provider(self, tmp_path):
+        """Test the stage requires the vocabulary provider."""
+        result = VocabularyValidationStage(workers=1).execute(
+            create_test_context(project_root=tmp_path, config=CONFIG)
+        )
+
+        assert result.status == StageStatus.FAILURE
+        assert result.errors == ["vocabulary_data provider not configured"]
@@ -0,0 +1,188 @@
+"""Unit tests for the streaming word processing stage."""
+
+import pytest
+from src.core.stages import StageStatus
+from src.pipelines.vocabulary.stages.word_processing import (
+    WordProcessingStage,
+    generate_card_id,
+    generate_meaning_id,
+)
+from src.pipelines.vocabulary.stages.word_processing.card_generator import (
+    gap_sentence,
+)
+from src.providers.data.json_provider import JSONDataProvider
+from src.providers.data.sqlite_provider import SQLiteDataProvider
+
+from tests.fixtures.contexts import create_context_with_providers, create_test_context
+
+
+def record(word: str, senses: list[tuple[str, list[str]]]) -> dict:
+    """Build a projected dictionary record."""
+    return {
+        "word": word,
+        "pos": "verb",
+        "gender": [],
+        "ipa": [["[ʝaˈmaɾ]", 10, ["seseante", "yeísta"]]],
+        "senses": [
+            {
+                "sense_index": index,
+                "id": f"{word}-{index}",
+                "glosses": [f"Definición {index}."],
+                "example": {
+                    "text": f"Voy a {word} ahora.",
+                    "bold_text_offsets": [[6, 6 + len(word)]],
+                },
+                "translations": translations,
+            }
+            for index, translations in senses
+        ],
+    }
+
+
+class FakeDictionary:
+    """Dictionary provider serving projected records."""
+
+    def __init__(self, records: dict[str, list[dict]]):
+        self.records = records
+        self.requested: list[str] = []
+        self.crash_on: str | None = None
+
+    def get_projection(self, word: str) -> list[dict]:
+        if word == self.crash_on:
+            raise OSError("dictionary unavailable")
+        self.requested.append(word)
+        return self.records.get(word, [])
+
+
+class TestWordProcessingStage:
+    """Test streaming words into the word queue."""
+
+    @pytest.fixture
+    def dictionary(self):
+        """Create a dictionary with one card per word, two for llamar."""
+        words = {
+            f"palabra{i}": [record(f"palabra{i}", [("1", [f"word {i}"])])]
+            for i in range(6)
+        }
+        words["llamar"] = [
+            record("llamar", [("1", ["call", "name"]), ("2", ["summon"])])
+        ]
+        return FakeDictionary(words)
+
+    @pytest.fixture
+    def queue_provider(self, tmp_path):
+        """Create the word queue provider."""
+        return JSONDataProvider(
+            tmp_path, managed_files=["word_queue", "prompts_staging"]
+        )
+
+    def context(self, dictionary, queue_provider, words):
+        context = create_test_context(project_root=queue_provider.base_path)
+        context.set(
+            "providers",
+            {
+                "data": {
+                    "spanish_dictionary": dictionary,
+                    "word_queue_data": queue_provider,
+                }
+            },
+        )
+        context.set("selected_words", words)
+        return context
+
+    def test_entries_appended_to_queue_and_staging(self, dictionary, queue_provider):
+        """Test queue entries carry card fields and staging gets empty prompts."""
+        context = self.context(dictionary, queue_provider, ["llamar", "palabra0"])
+
+        result = WordProcessingStage(chunk_size=2).execute(context)
+
+        assert result.status == StageStatus.SUCCESS
+        queue = queue_provider.load_data("word_queue")
+        card_ids = [entry["CardID"] for entry in queue["queue"]]
+        assert card_ids == ["llamar_call_name", "llamar_summon", "palabra0_word_0"]
+        entry = queue["queue"][0]
+        assert entry["Translations"] == "call, name"
+        assert entry["GappedSentence"] == "Voy a _____ ahora."
+        assert entry["IPA"] == "[ʝaˈmaɾ]"
+        assert queue["metadata"]["total_entries"] == 3
+        assert queue_provider.load_data("prompts_staging") == dict.fromkeys(
+            card_ids, ""
+        )
+        assert context.get("processing_stats")["chunks"] == 2
+
+    def test_existing_card_ids_filtered(self, dictionary, queue_provider):
+        """Test rerunning a word only adds CardIDs not already queued."""
+        stage = WordProcessingStage()
+        stage.execute(self.context(dictionary, queue_provider, ["llamar"]))
+
+        result = stage.execute(self.context(dictionary, queue_provider, ["llamar"]))
+
+        assert result.data["stats"]["emitted"] == 0
+        assert len(queue_provider.load_data("word_queue")["queue"]) == 2
+
+    def test_vocabulary_card_ids_filtered_via_sqlite_index(
+        self, dictionary, queue_provider, tmp_path
+    ):
+        """Test completed cards in a SQLite vocabulary are not queued again."""
+        vocabulary = SQLiteDataProvider(tmp_path / "vocabulary.db")
+        vocabulary.save_data(
+            "vocabulary",
+            {"words": {"llamar": {"meanings": [{"CardID": "llamar_summon"}]}}},
+        )
+        context = self.context(dictionary, queue_provider, ["llamar"])
+        context.get("providers")["data"]["vocabulary_data"] = vocabulary
+
+        WordProcessingStage().execute(context)
+
+        queue = queue_provider.load_data("word_queue")["queue"]
+        assert [entry["CardID"] for entry in queue] == ["llamar_call_name"]
+
+    def test_interrupted_run_resumes_after_last_flushed_word(
+        self, dictionary, queue_provider
+    ):
+        """Test a crash mid-batch resumes without refetching flushed words."""
+        words = [f"palabra{i}" for i in range(6)]
+        stage = WordProcessingStage(chunk_size=2)
+        dictionary.crash_on = "palabra4"
+
+        result = stage.execute(self.context(dictionary, queue_provider, words))
+
+        assert result.status == StageStatus.FAILURE
+        assert queue_provider.load_data("word_queue") == {}
+
+        dictionary.crash_on = None
+        dictionary.requested.clear()
+        result = stage.execute(self.context(dictionary, queue_provider, words))
+
+        assert result.status == StageStatus.SUCCESS
+        assert dictionary.requested == ["palabra4", "palabra5"]
+        queue = queue_provider.load_data("word_queue")["queue"]
+        assert [entry["SpanishWord"] for entry in queue] == words
+
+    def test_missing_words_reported_as_partial(self, dictionary, queue_provider):
+        """Test unknown words are skipped while the rest are queued."""
+        context = self.context(dictionary, queue_provider, ["inexistente", "llamar"])
+
+        result = WordProcessingStage().execute(context)
+
+        assert result.status == StageStatus.PARTIAL
+        assert result.errors == ["inexistente: not found in dictionary"]
+
+    def test_validate_context_requires_words_and_providers(self):
+        """Test missing input and providers are reported."""
+        context = create_context_with_providers({"data": {}})
+
+        errors = WordProcessingStage().validate_context(context)
+
+        assert "No selected_words found in context" in errors
+        assert "spanish_dictionary provider not configured" in errors
+        assert "word_queue_data provider not configured" in errors
+
+    def test_card_id_generation(self):
+        """Test MeaningID and CardID formatting and sentence gapping."""
+        meaning_id = generate_meaning_id(("Call", "refer to"))
+
+        assert meaning_id == "call_refer_to"
+        assert generate_card_id("llamar", meaning_id) == "llamar_call_refer_to"
+        assert gap_sentence("Te llamo luego.", [[3, 8]]) == "Te _____ luego."
+        assert gap_sentence("Sin negrita.", None) == "Sin negrita."
@@ -0,0 +1,73 @@
+"""Unit tests for BaseAPIClient request handling."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from src.providers.base.api_client import BaseAPIClient
+from src.utils.rate_limiter import get_rate_limiter_registry
+
+
+class StubClient(BaseAPIClient):
+    """Client with a stubbed HTTP session."""
+
+    def __init__(self) -> None:
+        super().__init__("Stub")
+        self.session = MagicMock()
+
+    def test_connection(self) -> bool:
+        return True
+
+    def get_service_info(self) -> dict[str, Any]:
+        return {}
+
+
+def http_response(status_code: int, headers: dict[str, str] | None = None) -> Any:
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = b'{"ok": true}'
+    response.json.return_value = {"ok": True}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def rate_limiters():
+    """Give each test fresh per-service rate limiters."""
+    get_rate_limiter_registry().clear()
+    yield get_rate_limiter_registry()
+    get_rate_limiter_registry().clear()
+
+
+class TestRateLimitHandling:
+    """Test 429 responses pause the shared service budget."""
+
+    def test_retry_after_pauses_service_then_retries(self):
+        """Test a 429 pauses every client of the service before retrying."""
+        client = StubClient()
+        other = StubClient()
+        client.session.request.side_effect = [
+            http_response(429, {"Retry-After": "2"}),
+            http_response(200),
+        ]
+
+        with patch("src.utils.rate_limiter.time.sleep") as sleep:
+            response = client._make_request("GET", "https://stub.test/words")
+
+        assert response.success
+        assert other.rate_limiter is client.rate_limiter
+        [(waited,)] = [call.args for call in sleep.call_args_list]
+        assert waited == pytest.approx(2.0, abs=0.05)
+        assert client.rate_limiter.metrics()["throttled"] == 1
+
+    def test_rate_limited_on_last_attempt(self):
+        """Test the Retry-After is reported once retries run out."""
+        client = StubClient()
+        client.session.request.return_value = http_response(429, {"Retry-After": "1"})
+
+        with patch("src.utils.rate_limiter.time.sleep"):
+            response = client._make_request("GET", "https://stub.test", max_retries=2)
+
+        assert not response.success
+        assert response.status_code == 429
+        assert response.retry_after == 1
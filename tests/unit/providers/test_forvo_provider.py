@@ -0,0 +1,395 @@
+"""Unit tests for ForvoProvider HTTP handling and caching against a stub API."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src.providers.audio.forvo_provider import ForvoProvider
+from src.providers.audio.pronunciation_cache import PronunciationCache
+from src.providers.base.api_client import APIResponse
+from src.providers.base.media_provider import MediaRequest
+from src.utils.profiler import RunProfiler
+from src.utils.rate_limiter import get_rate_limiter_registry
+
+
+class StubForvo(ThreadingHTTPServer):
+    """Keep-alive Forvo stub counting connections and requests."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.connections = 0
+        self.paths: list[str] = []
+        # Status and headers to answer API lookups with
+        self.status = 200
+        self.headers: dict[str, str] = {}
+        # Words answered with no pronunciations
+        self.unknown_words: set[str] = set()
+        # Pronunciations answered for every other word (default: one Mexican)
+        self.items: list[dict[str, Any]] | None = None
+        self.lock = threading.Lock()
+
+    @property
+    def lookups(self) -> list[str]:
+        return [path for path in self.paths if not path.startswith("/audio/")]
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: StubForvo
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.paths.append(self.path)
+        status = 200
+        headers: dict[str, str] = {}
+        if self.path.startswith("/audio/"):
+            body = b"ID3" + bytes(1024)
+        else:
+            status, headers = self.server.status, self.server.headers
+            word = self.path.split("/word/")[1].split("/")[0]
+            item = {
+                "country": "Mexico",
+                "username": "stub",
+                "votes": 1,
+                "pathmp3": f"{self.server.url}/audio/{word}.mp3",
+            }
+            items = self.server.items if self.server.items is not None else [item]
+            if word in self.server.unknown_words:
+                items = []
+            body = json.dumps({"items": items}).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def stub() -> Iterator[StubForvo]:
+    server = StubForvo()
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def rate_limiters():
+    """Give each test fresh per-service rate limiters."""
+    get_rate_limiter_registry().clear()
+    yield get_rate_limiter_registry()
+    get_rate_limiter_registry().clear()
+
+
+def forvo(stub: StubForvo, **config: Any) -> ForvoProvider:
+    return ForvoProvider(
+        {
+            "api_key": "test",
+            "country_priorities": ["MX"],
+            "base_url": stub.url,
+            "rate_limit_delay": 0,
+            "cache_enabled": False,
+            **config,
+        }
+    )
+
+
+def count_tokens(provider: ForvoProvider, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+    """Count rate limit tokens taken from the provider's shared bucket."""
+    taken: list[int] = []
+    limiter = provider.rate_limiter
+    acquire = limiter.acquire
+
+    def counting_acquire() -> float:
+        taken.append(1)
+        return acquire()
+
+    monkeypatch.setattr(limiter, "acquire", counting_acquire)
+    return taken
+
+
+def audio_requests(tmp_path: Path, count: int) -> list[MediaRequest]:
+    return [
+        MediaRequest(
+            type="audio",
+            content=f"palabra{i}",
+            params={},
+            output_path=tmp_path / f"palabra{i}.mp3",
+        )
+        for i in range(count)
+    ]
+
+
+class TestForvoSession:
+    """Test pooled keep-alive connections and structured responses."""
+
+    def test_batch_reuses_pooled_connections(self, stub, tmp_path):
+        """Test lookups and downloads share a few keep-alive connections."""
+        provider = forvo(stub, max_concurrent_requests=2)
+
+        results = provider.generate_batch(audio_requests(tmp_path, 20))
+
+        assert all(result.success for result in results)
+        assert len(stub.paths) == 40
+        assert stub.connections <= 4
+
+    def test_make_request_returns_api_response(self, stub):
+        """Test lookups return the shared APIResponse dataclass."""
+        provider = forvo(stub)
+
+        response = provider._make_request("GET", f"{stub.url}/word/hola/language/es")
+
+        assert isinstance(response, APIResponse)
+        assert response.success
+        assert response.status_code == 200
+        assert response.data["items"][0]["country"] == "Mexico"
+
+    def test_client_error_is_a_failed_response(self, stub):
+        """Test HTTP errors produce failed responses instead of raising."""
+        stub.status = 403
+        provider = forvo(stub)
+
+        response = provider._make_request("GET", f"{stub.url}/word/hola/language/es")
+
+        assert not response.success
+        assert response.status_code == 403
+        assert "HTTP 403" in response.error_message
+
+    def test_lookup_and_download_spans(self, stub, tmp_path):
+        """Test the lookup and the audio download each record an http span."""
+        profiler = RunProfiler("run")
+        with profiler.activate():
+            forvo(stub).generate_media(audio_requests(tmp_path, 1)[0])
+
+        spans = [span for span in profiler.root.walk() if span.kind == "http"]
+        assert [span.attributes["status_code"] for span in spans] == [200, 200]
+        assert spans[1].bytes == 1027
+
+    def test_rate_limited_response_pauses_service(self, stub):
+        """Test a 429 pauses the shared Forvo rate limiter for Retry-After."""
+        stub.status = 429
+        stub.headers = {"Retry-After": "5"}
+        provider = forvo(stub)
+
+        response = provider._make_request("GET", f"{stub.url}/word/hola/language/es")
+
+        assert response.status_code == 429
+        assert response.retry_after == 5
+        assert provider.rate_limiter.reserve() == pytest.approx(5, abs=0.1)
+
+
+class TestForvoCache:
+    """Test persistent lookup caching, negative caching and expiry."""
+
+    def test_rerun_makes_no_lookups(self, stub, tmp_path):
+        """Test a second run over the same words is served from the cache."""
+        cache_path = tmp_path / "forvo.sqlite"
+        requests = audio_requests(tmp_path, 10)
+        forvo(stub, cache_enabled=True, cache_path=str(cache_path)).generate_batch(
+            requests
+        )
+        assert len(stub.lookups) == 10
+
+        provider = forvo(stub, cache_enabled=True, cache_path=str(cache_path))
+        results = provider.generate_batch(requests)
+
+        assert all(result.success for result in results)
+        assert len(stub.lookups) == 10
+        assert provider.cache is not None
+        assert provider.cache.stats.hits == 10
+
+    def test_cached_lookups_take_no_tokens(self, stub, tmp_path, monkeypatch):
+        """Test lookups served from the cache do not wait on the rate limit."""
+        config = {"cache_enabled": True, "cache_path": str(tmp_path / "f.sqlite")}
+        requests = audio_requests(tmp_path, 3)
+        forvo(stub, **config).generate_batch(requests)
+
+        provider = forvo(stub, **config)
+        taken = count_tokens(provider, monkeypatch)
+        provider.generate_batch(requests)
+
+        assert taken == []
+
+    def test_missing_words_are_cached(self, stub, tmp_path):
+        """Test words without pronunciations are not queried again."""
+        stub.unknown_words = {"palabra0"}
+        provider = forvo(
+            stub,
+            cache_enabled=True,
+            cache_path=str(tmp_path / "c.db"),
+            lookup_mode="country_first",
+        )
+        [request] = audio_requests(tmp_path, 1)
+        request.params["country"] = "MX"
+
+        first = provider.generate_media(request)
+        second = provider.generate_media(request)
+
+        assert not first.success and not second.success
+        # Country-filtered and unfiltered lookups, each made once
+        assert len(stub.lookups) == 2
+        assert provider.cache is not None
+        assert provider.cache.stats.negative_hits == 2
+
+    def test_failed_lookups_are_not_cached(self, stub, tmp_path):
+        """Test API errors are retried on the next run."""
+        stub.status = 403
+        provider = forvo(stub, cache_enabled=True, cache_path=str(tmp_path / "c.db"))
+        [request] = audio_requests(tmp_path, 1)
+
+        provider.generate_media(request)
+        stub.status = 200
+        result = provider.generate_media(request)
+
+        assert result.success
+        assert len(stub.lookups) == 2
+
+    def test_unusable_cache_falls_back_to_api(self, stub, tmp_path):
+        """Test a cache that cannot be opened does not fail the request."""
+        provider = forvo(stub, cache_enabled=True, cache_path=str(tmp_path))
+        [request] = audio_requests(tmp_path, 1)
+
+        result = provider.generate_media(request)
+
+        assert result.success
+        assert len(stub.lookups) == 1
+
+
+class TestForvoLookup:
+    """Test lookup modes and local country-priority ranking."""
+
+    @pytest.fixture
+    def requests_with_country(self, tmp_path):
+        requests = audio_requests(tmp_path, 5)
+        for request in requests:
+            request.params["country"] = "Spain"
+        return requests
+
+    def test_single_lookup_per_word(self, stub, requests_with_country):
+        """Test a preferred country does not cost a second lookup."""
+        results = forvo(stub).generate_batch(requests_with_country)
+
+        assert all(result.success for result in results)
+        assert len(stub.lookups) == 5
+        assert not any("/country/" in path for path in stub.lookups)
+
+    def test_country_first_lookup_mode(self, stub, requests_with_country):
+        """Test country_first falls back to an unfiltered lookup on a miss."""
+        stub.items = []
+        forvo(stub, lookup_mode="country_first").generate_batch(requests_with_country)
+
+        assert len(stub.lookups) == 10
+        assert sum("/country/Spain" in path for path in stub.lookups) == 5
+
+    def test_one_token_per_api_call(self, stub, requests_with_country, monkeypatch):
+        """Test every API lookup draws on the shared Forvo budget."""
+        stub.items = []
+        provider = forvo(stub, lookup_mode="country_first")
+        taken = count_tokens(provider, monkeypatch)
+
+        provider.generate_batch(requests_with_country)
+
+        assert len(taken) == len(stub.lookups) == 10
+
+    def test_invalid_lookup_mode_rejected(self, stub):
+        """Test unknown lookup modes fail validation."""
+        with pytest.raises(ValueError, match="lookup_mode"):
+            forvo(stub, lookup_mode="twice")
+
+    def test_rank_by_priority_then_votes(self, stub):
+        """Test groups rank in order, votes break ties, others come last."""
+        provider = forvo(
+            stub,
+            country_priorities=["Mexico", "Colombia", "Spain"],
+            priority_groups=[["Mexico", "Colombia"], ["Spain"]],
+        )
+        pronunciations = [
+            {"country": "Chile", "votes": 9},
+            {"country": "Spain", "votes": 5},
+            {"country": "Colombia", "votes": 1},
+            {"country": "Mexico", "votes": 3},
+            {"country": "Spain", "votes": 7},
+        ]
+
+        ranked = provider._rank_pronunciations(pronunciations)
+
+        assert [(p["country"], p["votes"]) for p in ranked] == [
+            ("Mexico", 3),
+            ("Colombia", 1),
+            ("Spain", 7),
+            ("Spain", 5),
+            ("Chile", 9),
+        ]
+        best = provider._select_best_pronunciation(pronunciations, "Chile")
+        assert best == {"country": "Chile", "votes": 9}
+        assert provider._select_best_pronunciation([]) == {}
+
+
+class TestPronunciationCache:
+    """Test cache expiry, summaries and clearing."""
+
+    def test_entries_expire_after_ttl(self, tmp_path):
+        """Test found and not-found entries expire on their own TTLs."""
+        cache = PronunciationCache(tmp_path / "c.db", ttl_days=1, negative_ttl_days=0.5)
+        cache.put("hola", "es", None, [{"country": "Mexico"}])
+        cache.put("xyzzy", "es", None, [])
+        day = time.time() + 86400 * 0.75
+
+        assert cache.get("hola", "es") == [{"country": "Mexico"}]
+        assert cache.get("xyzzy", "es") == []
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(time, "time", lambda: day)
+            assert cache.get("hola", "es") is not None
+            assert cache.get("xyzzy", "es") is None
+            assert cache.summary()["expired"] == 1
+        assert cache.stats.expired == 1
+
+    def test_country_is_part_of_the_key(self, tmp_path):
+        """Test filtered and unfiltered lookups are cached separately."""
+        cache = PronunciationCache(tmp_path / "c.db")
+        cache.put("hola", "es", "MX", [{"country": "Mexico"}])
+
+        assert cache.get("hola", "es") is None
+        assert cache.get("hola", "es", "MX") == [{"country": "Mexico"}]
+        assert cache.get("hola", "pt", "MX") is None
+
+    def test_summary_and_clear(self, tmp_path):
+        """Test counts by kind and clearing expired or all entries."""
+        cache = PronunciationCache(tmp_path / "c.db", negative_ttl_days=0)
+        cache.put("hola", "es", None, [{"country": "Mexico"}])
+        cache.put("xyzzy", "es", None, [])
+        time.sleep(0.01)
+
+        summary = cache.summary()
+        assert (summary["entries"], summary["found"], summary["not_found"]) == (
+            2,
+            1,
+            1,
+        )
+        assert summary["expired"] == 1
+        assert cache.clear(expired_only=True) == 1
+        assert cache.clear() == 1
+        assert cache.summary()["entries"] == 0
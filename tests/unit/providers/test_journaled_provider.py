@@ -0,0 +1,219 @@
+"""Unit tests for JournaledDataProvider snapshot and journal storage."""
+
+import json
+
+import pytest
+from src.core.config import Config
+from src.providers.data.journaled_provider import (
+    JournaledDataProvider,
+    apply_operations,
+    diff_documents,
+)
+from src.providers.registry import ProviderRegistry
+
+
+def queue_document(count: int) -> dict:
+    """Build a word queue document with count entries."""
+    return {
+        "metadata": {"total_entries": count},
+        "queue": [
+            {"CardID": f"palabra{i}_word", "Prompt": "", "status": "pending_prompts"}
+            for i in range(count)
+        ],
+    }
+
+
+class TestJournaledDataProvider:
+    """Test journaled saves, replay, crash recovery and compaction."""
+
+    @pytest.fixture
+    def provider(self, tmp_path):
+        """Create a journaled provider."""
+        return JournaledDataProvider(tmp_path)
+
+    def reopen(self, provider):
+        """Create a fresh provider over the same files (empty cache)."""
+        return JournaledDataProvider(provider.base_path)
+
+    def test_save_appends_changes_only(self, provider):
+        """Test an entry update journals one small operation."""
+        data = queue_document(50)
+        provider.save_data("word_queue", data)
+        size_after_first = provider.journal_path("word_queue").stat().st_size
+
+        data["queue"][10]["Prompt"] = "a red phone"
+        provider.save_data("word_queue", data)
+
+        lines = provider.journal_path("word_queue").read_text().splitlines()
+        assert json.loads(lines[-1]) == [
+            {"op": "set", "path": ["queue", 10, "Prompt"], "value": "a red phone"}
+        ]
+        assert (
+            provider.journal_path("word_queue").stat().st_size - size_after_first < 100
+        )
+        assert self.reopen(provider).load_data("word_queue") == data
+
+    def test_existing_json_file_used_as_snapshot(self, provider):
+        """Test a file written by JSONDataProvider loads unchanged."""
+        data = queue_document(3)
+        provider.snapshot_path("word_queue").write_text(json.dumps(data))
+
+        assert provider.load_data("word_queue") == data
+        assert provider.exists("word_queue")
+        assert provider.list_identifiers() == ["word_queue"]
+
+    def test_loaded_data_is_a_copy(self, provider):
+        """Test mutating loaded data is journaled on save, not lost in the cache."""
+        provider.save_data("word_queue", queue_document(2))
+
+        data = provider.load_data("word_queue")
+        data["queue"].pop(0)
+        provider.save_data("word_queue", data)
+
+        assert self.reopen(provider).load_data("word_queue")["queue"] == data["queue"]
+
+    def test_torn_final_line_ignored_and_trimmed(self, provider):
+        """Test a crash mid-append keeps the last complete save."""
+        data = queue_document(3)
+        provider.save_data("word_queue", data)
+        with open(provider.journal_path("word_queue"), "a") as journal:
+            journal.write('[{"op": "set", "path": ["metad')
+
+        reopened = self.reopen(provider)
+        assert reopened.load_data("word_queue") == data
+
+        data["metadata"]["total_entries"] = 99
+        reopened.save_data("word_queue", data)
+        assert self.reopen(provider).load_data("word_queue") == data
+
+    def test_final_line_without_newline_is_torn(self, provider):
+        """Test a complete line missing its newline is not replayed or extended."""
+        data = queue_document(3)
+        provider.save_data("word_queue", data)
+        with open(provider.journal_path("word_queue"), "a") as journal:
+            journal.write(
+                '[{"op":"set","path":["metadata","total_entries"],"value":7}]'
+            )
+
+        reopened = self.reopen(provider)
+        assert reopened.load_data("word_queue") == data
+
+        data["metadata"]["total_entries"] = 99
+        reopened.save_data("word_queue", data)
+        assert self.reopen(provider).load_data("word_queue") == data
+
+    def test_nested_bool_changes_saved(self, provider):
+        """Test nested 1 -> True and 0 -> False changes survive a reload."""
+        provider.save_data("doc", {"x": {"flag": 1}, "l": [[0]]})
+        provider.save_data("doc", {"x": {"flag": True}, "l": [[False]]})
+
+        reloaded = self.reopen(provider).load_data("doc")
+
+        assert json.dumps(reloaded) == json.dumps({"x": {"flag": True}, "l": [[False]]})
+
+    def test_compaction_writes_snapshot_and_resets_journal(self, tmp_path, monkeypatch):
+        """Test the journal is folded into the snapshot once it outgrows it."""
+        monkeypatch.setattr(
+            "src.providers.data.journaled_provider.MIN_COMPACT_BYTES", 0
+        )
+        provider = JournaledDataProvider(tmp_path, compact_ratio=1.0)
+        data = queue_document(3)
+
+        provider.save_data("word_queue", data)
+
+        assert json.loads(provider.snapshot_path("word_queue").read_text()) == data
+        assert not provider.journal_path("word_queue").exists()
+        assert self.reopen(provider).load_data("word_queue") == data
+
+    def test_stale_journal_after_interrupted_compaction_discarded(self, provider):
+        """Test a journal already folded into the snapshot is not replayed twice."""
+        data = queue_document(2)
+        provider.save_data("word_queue", data)
+        data["queue"].append({"CardID": "nuevo_new"})
+        provider.save_data("word_queue", data)
+        journal = provider.journal_path("word_queue").read_bytes()
+
+        provider.compact("word_queue")
+        # Simulate a crash before the journal was removed
+        provider.journal_path("word_queue").write_bytes(journal)
+
+        assert self.reopen(provider).load_data("word_queue") == data
+
+    def test_external_edit_reloaded(self, provider):
+        """Test files changed by another process are replayed again."""
+        provider.save_data("prompts_staging", {"a": ""})
+        other = self.reopen(provider)
+        other.save_data("prompts_staging", {"a": "", "b": "prompt"})
+
+        assert provider.load_data("prompts_staging") == {"a": "", "b": "prompt"}
+
+    def test_read_only_rejects_save(self, tmp_path):
+        """Test read-only providers refuse writes."""
+        provider = JournaledDataProvider(tmp_path, read_only=True)
+
+        with pytest.raises(PermissionError):
+            provider.save_data("word_queue", {"queue": []})
+
+    def test_registered_from_config(self, tmp_path):
+        """Test the journaled type is wired into ProviderRegistry.from_config."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "providers": {
+                        "data": {
+                            "word_queue_data": {
+                                "type": "journaled",
+                                "base_path": str(tmp_path / "data"),
+                                "files": ["word_queue", "prompts_staging"],
+                                "pipelines": ["vocabulary"],
+                            }
+                        }
+                    }
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        registry = ProviderRegistry.from_config(Config(str(config_path)))
+        provider = registry.get_data_provider("word_queue_data")
+
+        assert isinstance(provider, JournaledDataProvider)
+        assert provider.managed_files == ["word_queue", "prompts_staging"]
+
+
+class TestDocumentDiff:
+    """Test journal operation generation and replay."""
+
+    @pytest.mark.parametrize(
+        "old,new",
+        [
+            ({"a": 1, "b": [1, 2, 3]}, {"a": 2, "c": None, "b": [1, 2, 3, 4]}),
+            ({"q": [1, 2, 3, 4]}, {"q": [1, 4]}),
+            ({"q": [1, 2, 3]}, {"q": [0, 1, 2, 3]}),
+            ({"q": [{"x": 1}, {"x": 2}]}, {"q": [{"x": 1}, {"x": 3, "y": []}]}),
+            ({"v": 1}, {"v": True}),
+            ({"v": {"n": 1}}, {"v": [1]}),
+            ({"x": {"flag": 1}, "l": [[0]]}, {"x": {"flag": True}, "l": [[False]]}),
+        ],
+    )
+    def test_replay_reproduces_new_document(self, old, new):
+        """Test applying the diff to the old document yields the new one."""
+        ops = diff_documents(old, new)
+
+        replayed = apply_operations(json.loads(json.dumps(old)), ops)
+
+        assert json.dumps(replayed, sort_keys=True) == json.dumps(new, sort_keys=True)
+
+    def test_append_is_single_splice(self):
+        """Test appending to a list journals only the new items."""
+        ops = diff_documents({"q": [1, 2]}, {"q": [1, 2, 3]})
+
+        assert ops == [
+            {"op": "splice", "path": ["q"], "start": 2, "delete": 0, "values": [3]}
+        ]
+
+    def test_invalid_operation_rejected(self):
+        """Test operations on missing paths raise ValueError."""
+        with pytest.raises(ValueError):
+            apply_operations({}, [{"op": "del", "path": ["missing", "key"]}])
@@ -0,0 +1,534 @@
+"""Unit tests for JSONLDataProvider indexed dictionary access."""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src.core.config import Config
+from src.providers.data.jsonl_entry import LazyEntry
+from src.providers.data.jsonl_index import (
+    BinaryIndexError,
+    BinaryWordIndex,
+    build_word_index,
+    extract_word,
+    split_ranges,
+    write_binary_index,
+)
+from src.providers.data.jsonl_projection import parse_sense_index, project_entry
+from src.providers.data.jsonl_provider import JSONLDataProvider
+from src.providers.registry import ProviderRegistry
+
+ENTRIES = [
+    {"word": "casa", "pos": "noun", "senses": [{"glosses": ["Edificio."]}]},
+    {"word": "llamar", "pos": "verb", "senses": [{"glosses": ["Dar voces."]}]},
+    {"word": "perro", "pos": "noun", "senses": [{"glosses": ["Animal."]}]},
+    {"word": "llamar", "pos": "verb", "pos_title": "Verbo pronominal"},
+]
+
+
+def write_jsonl(path: Path, entries: list[dict]) -> Path:
+    """Write entries as a JSONL file."""
+    path.write_text(
+        "".join(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries),
+        encoding="utf-8",
+    )
+    return path
+
+
+class TestJSONLDataProvider:
+    """Test index building, persistence and lookups."""
+
+    @pytest.fixture
+    def dictionary_file(self, tmp_path):
+        """Create a small dictionary file."""
+        return write_jsonl(tmp_path / "Español.jsonl", ENTRIES)
+
+    @pytest.fixture
+    def provider(self, dictionary_file):
+        """Create provider over the small dictionary."""
+        return JSONLDataProvider(dictionary_file)
+
+    def test_get_word_returns_first_entry(self, provider):
+        """Test single lookup returns the first entry for a headword."""
+        entry = provider.get_word("llamar")
+
+        assert entry is not None
+        assert entry["senses"][0]["glosses"] == ["Dar voces."]
+
+    def test_get_word_missing_returns_none(self, provider):
+        """Test missing words return None instead of raising."""
+        assert provider.get_word("inexistente") is None
+
+    def test_get_word_entries_returns_all_parts_of_speech(self, provider):
+        """Test every line for a headword is indexed."""
+        entries = provider.get_word_entries("llamar")
+
+        assert len(entries) == 2
+        assert entries[1]["pos_title"] == "Verbo pronominal"
+
+    def test_get_words_batch(self, provider):
+        """Test batch lookup skips unknown words."""
+        results = provider.get_words_batch(["perro", "casa", "nada"])
+
+        assert set(results) == {"perro", "casa"}
+        assert results["casa"]["pos"] == "noun"
+
+    def test_exists_word(self, provider):
+        """Test existence checks use the index only."""
+        assert provider.exists_word("casa")
+        assert not provider.exists_word("gato")
+        assert provider.exists("perro")
+
+    def test_index_persisted_beside_file(self, provider, dictionary_file):
+        """Test the index is written next to the dictionary."""
+        provider.get_word("casa")
+
+        index_path = dictionary_file.parent / ".español_index.bin"
+        assert index_path.exists()
+        index = BinaryWordIndex(index_path)
+        assert index.total_entries == 4
+        assert index.fingerprint["size"] > 0
+        index.close()
+
+    def test_persisted_index_reused(self, provider, dictionary_file, monkeypatch):
+        """Test a fresh provider loads the index instead of rebuilding."""
+        provider.get_word("casa")
+
+        second = JSONLDataProvider(dictionary_file)
+        monkeypatch.setattr(
+            second,
+            "rebuild_index",
+            lambda *args, **kwargs: pytest.fail("index was rebuilt"),
+        )
+        assert second.exists_word("llamar")
+
+    def test_stale_index_rebuilt(self, provider, dictionary_file):
+        """Test modifying the dictionary invalidates the index."""
+        provider.get_word("casa")
+        write_jsonl(dictionary_file, [*ENTRIES, {"word": "gato", "pos": "noun"}])
+
+        fresh = JSONLDataProvider(dictionary_file)
+        assert fresh.get_word("gato") == {"word": "gato", "pos": "noun"}
+
+    def test_build_disabled_without_index_raises(self, dictionary_file):
+        """Test build_index=False refuses to build a missing index."""
+        provider = JSONLDataProvider(dictionary_file, build_index=False)
+
+        with pytest.raises(ValueError, match="build_index is disabled"):
+            provider.get_word("casa")
+
+    def test_malformed_lines_skipped(self, tmp_path):
+        """Test corrupted lines are skipped while offsets stay correct."""
+        path = tmp_path / "broken.jsonl"
+        path.write_text(
+            '{"word": "uno"}\nnot json\n{"word": "dos"}\n', encoding="utf-8"
+        )
+        provider = JSONLDataProvider(path)
+
+        assert provider.get_word("dos") == {"word": "dos"}
+        assert provider.list_identifiers() == ["dos", "uno"]
+
+    def test_corrupt_index_rebuilt(self, provider, dictionary_file):
+        """Test an unreadable index file is replaced instead of raising."""
+        provider.get_word("casa")
+        (dictionary_file.parent / ".español_index.bin").write_bytes(b"garbage")
+
+        fresh = JSONLDataProvider(dictionary_file)
+        assert fresh.get_word_entries("llamar")[1]["pos_title"] == "Verbo pronominal"
+
+    def test_provider_is_read_only(self, provider):
+        """Test writes are rejected."""
+        with pytest.raises(PermissionError):
+            provider.save_data("casa", {})
+
+    def test_registered_from_config(self, dictionary_file, tmp_path):
+        """Test the jsonl type is wired into ProviderRegistry.from_config."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "providers": {
+                        "data": {
+                            "spanish_dictionary": {
+                                "type": "jsonl",
+                                "file_path": str(dictionary_file),
+                                "pipelines": ["vocabulary"],
+                            }
+                        }
+                    }
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        registry = ProviderRegistry.from_config(Config(str(config_path)))
+        provider = registry.get_data_provider("spanish_dictionary")
+
+        assert isinstance(provider, JSONLDataProvider)
+        assert provider.is_read_only
+        assert provider.exists_word("perro")
+
+
+class TestBinaryWordIndex:
+    """Test the memory-mapped binary index format."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Write and open an index with multi-entry and non-ASCII keys."""
+        path = tmp_path / "words.bin"
+        write_binary_index(
+            path,
+            {"ñu": [40], "casa": [0], "llamar": [10, 25], "árbol": [60]},
+            {"fingerprint": {"size": 1}},
+        )
+        index = BinaryWordIndex(path)
+        yield index
+        index.close()
+
+    def test_lookup_returns_all_offsets(self, index):
+        """Test a headword maps to every line offset in order."""
+        assert index["llamar"] == [10, 25]
+        assert index.get("ñu") == [40]
+
+    def test_missing_word(self, index):
+        """Test misses behave like a dict."""
+        assert "perro" not in index
+        assert index.get("perro") is None
+        with pytest.raises(KeyError):
+            index["perro"]
+
+    def test_iteration_sorted_and_metadata(self, index):
+        """Test keys iterate in byte order and header metadata round-trips."""
+        assert list(index) == ["casa", "llamar", "árbol", "ñu"]
+        assert len(index) == 4
+        assert index.total_entries == 5
+        assert index.fingerprint == {"size": 1}
+
+    def test_empty_index(self, tmp_path):
+        """Test an index with no words can be opened."""
+        path = tmp_path / "empty.bin"
+        write_binary_index(path, {}, {})
+
+        index = BinaryWordIndex(path)
+        assert len(index) == 0
+        assert "casa" not in index
+        index.close()
+
+    def test_truncated_file_rejected(self, tmp_path):
+        """Test truncated files raise BinaryIndexError."""
+        path = tmp_path / "words.bin"
+        write_binary_index(path, {"casa": [0], "perro": [10]}, {})
+        path.write_bytes(path.read_bytes()[:-12])
+
+        with pytest.raises(BinaryIndexError):
+            BinaryWordIndex(path)
+
+
+class TestIndexBuilder:
+    """Test range splitting, headword scanning and parallel builds."""
+
+    @pytest.fixture
+    def dictionary_file(self, tmp_path):
+        """Create a dictionary with repeated, escaped and reordered entries."""
+        entries = [
+            {"word": f"palabra{i}", "pos": "noun", "senses": [{"glosses": ["x"]}]}
+            for i in range(200)
+        ]
+        entries += [
+            {"word": "palabra7", "pos": "verb"},
+            {"word": 'di "hola"', "pos": "phrase"},
+            {"pos": "noun", "word": "invertido"},
+        ]
+        return write_jsonl(tmp_path / "dict.jsonl", entries)
+
+    def test_split_ranges_newline_aligned(self, dictionary_file):
+        """Test ranges cover the file and start at line boundaries."""
+        data = dictionary_file.read_bytes()
+        ranges = split_ranges(dictionary_file, 7)
+
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(data)
+        for (_, end), (start, _) in zip(ranges, ranges[1:], strict=False):
+            assert end == start
+            assert data[start - 1 : start] == b"\n"
+
+    def test_extract_word_fast_path_and_fallback(self):
+        """Test prefix scan, escaped words and key-order fallback."""
+        assert extract_word(b'{"word": "ca\xc3\xb1a", "pos": "noun"}\n') == "caña"
+        assert extract_word(b'{"word": "a\\"b"}\n') == 'a"b'
+        assert extract_word(b'{"pos": "noun", "word": "ir"}\n') == "ir"
+        with pytest.raises(ValueError):
+            extract_word(b"not json\n")
+
+    def test_parallel_build_matches_sequential(self, dictionary_file):
+        """Test merged worker output equals a single-process scan."""
+        sequential = build_word_index(dictionary_file)
+        parallel = build_word_index(dictionary_file, workers=2)
+
+        assert parallel.index == sequential.index
+        assert parallel.ranges > 1
+        assert parallel.lines == 203
+        assert parallel.index["palabra7"] == sorted(parallel.index["palabra7"])
+        assert len(parallel.index["palabra7"]) == 2
+        assert 'di "hola"' in parallel.index
+
+    def test_progress_reaches_total(self, dictionary_file):
+        """Test the progress callback ends at the file size."""
+        calls = []
+        build_word_index(
+            dictionary_file, workers=2, progress=lambda d, t: calls.append((d, t))
+        )
+
+        assert calls[-1][0] == calls[-1][1] == dictionary_file.stat().st_size
+
+
+def tag_count_scorer(raw_tags: object) -> tuple[int, tuple[str, ...]]:
+    """Score pronunciations by their number of tags (module level, picklable)."""
+    tags = tuple(raw_tags) if isinstance(raw_tags, list) else ()
+    return len(tags), tags
+
+
+LLAMAR = {
+    "word": "llamar",
+    "pos": "verb",
+    "tags": ["transitive"],
+    "sounds": [
+        {"ipa": "[ʃaˈmaɾ]", "raw_tags": ["sheísta"]},
+        {"ipa": "[ʎaˈmaɾ]", "raw_tags": ["no seseante, no yeísta"]},
+        {"ipa": "[ʝaˈmaɾ]", "raw_tags": ["yeísta"]},
+        {"rhymes": "aɾ"},
+    ],
+    "translations": [
+        {"word": "cridar", "lang_code": "ca", "sense_index": "1"},
+        {"word": "call", "lang_code": "en", "sense_index": "1,2"},
+        {"word": "summon", "lang_code": "en", "sense_index": "2–3"},
+    ],
+    "forms": [{"form": "llamo", "tags": ["first-person"]}] * 50,
+    "senses": [
+        {
+            "glosses": ["Utilizar una palabra."],
+            "examples": [
+                {"text": "Lo llaman palta.", "bold_text_offsets": [[3, 9]]},
+                {"text": "Segundo ejemplo."},
+            ],
+            "sense_index": "1",
+        },
+        {"glosses": ["Convocar."], "sense_index": "2"},
+    ],
+}
+
+
+class TestProjection:
+    """Test card-ready projection and the sidecar store."""
+
+    @pytest.fixture
+    def dictionary_file(self, tmp_path):
+        """Create a dictionary with a multi-POS headword."""
+        entries = [
+            {"word": "casa", "pos": "noun", "tags": ["feminine"]},
+            LLAMAR,
+            {"word": "llamar", "pos": "verb", "pos_title": "Verbo pronominal"},
+        ]
+        return write_jsonl(tmp_path / "Español.jsonl", entries)
+
+    def test_parse_sense_index(self):
+        """Test comma lists and ranges expand to sense numbers."""
+        assert parse_sense_index("1,2,4") == ["1", "2", "4"]
+        assert parse_sense_index("1–3") == ["1", "2", "3"]
+        assert parse_sense_index("1-2, 5") == ["1", "2", "5"]
+        assert parse_sense_index(None) == []
+
+    def test_project_entry(self):
+        """Test the projection keeps only card fields."""
+        projection = project_entry(LLAMAR)
+
+        assert "forms" not in projection
+        # Unscored candidates keep file order and raw tags
+        assert [candidate[:2] for candidate in projection["ipa"]] == [
+            ["[ʃaˈmaɾ]", 0],
+            ["[ʎaˈmaɾ]", 0],
+            ["[ʝaˈmaɾ]", 0],
+        ]
+        assert projection["ipa"][1][2] == ["no seseante, no yeísta"]
+        assert [sense["translations"] for sense in projection["senses"]] == [
+            ["call"],
+            ["call", "summon"],
+        ]
+        assert projection["senses"][0]["example"] == {
+            "text": "Lo llaman palta.",
+            "bold_text_offsets": [[3, 9]],
+        }
+        assert projection["senses"][1]["example"] is None
+        assert projection["gender"] == []
+
+    def test_project_entry_with_scorer(self):
+        """Test candidates are ranked best first by the given scorer."""
+        entry = {
+            "word": "x",
+            "sounds": [
+                {"ipa": "[a]", "raw_tags": ["one"]},
+                {"ipa": "[b]", "raw_tags": ["one", "two"]},
+                {"ipa": "[c]"},
+                {"ipa": "[d]", "raw_tags": ["uno"]},
+            ],
+        }
+
+        projection = project_entry(entry, tag_count_scorer)
+
+        assert projection["ipa"] == [
+            ["[b]", 2, ["one", "two"]],
+            ["[a]", 1, ["one"]],
+            ["[d]", 1, ["uno"]],
+            ["[c]", 0, []],
+        ]
+
+    def test_sidecar_matches_raw_projection(self, dictionary_file):
+        """Test sidecar records equal projections of the raw entries."""
+        provider = JSONLDataProvider(dictionary_file)
+        expected = provider.get_projection("llamar")
+        assert provider.projection is None
+
+        result = provider.build_projection()
+        assert result.records == 3
+        assert result.size < dictionary_file.stat().st_size
+
+        fresh = JSONLDataProvider(dictionary_file)
+        assert fresh.projection is not None
+        assert fresh.get_projection("llamar") == expected
+        assert fresh.get_projections_batch(["casa", "nada"])["casa"][0]["gender"] == [
+            "feminine"
+        ]
+
+    def test_parallel_projection_matches_sequential(self, dictionary_file, tmp_path):
+        """Test worker part files are concatenated in order."""
+        provider = JSONLDataProvider(
+            dictionary_file, pronunciation_scorer=tag_count_scorer
+        )
+        provider.build_projection()
+        sequential = JSONLDataProvider(dictionary_file).get_projection("llamar")
+        assert sequential[0]["ipa"][0][1] == 1
+
+        parallel = JSONLDataProvider(
+            dictionary_file,
+            projection_path=tmp_path / "parallel.jsonl",
+            pronunciation_scorer=tag_count_scorer,
+        )
+        parallel.build_projection(workers=2)
+        assert parallel.get_projection("llamar") == sequential
+        assert not list(tmp_path.glob("*.part*"))
+
+    def test_stale_sidecar_ignored(self, dictionary_file):
+        """Test a sidecar from an older dictionary is not served."""
+        JSONLDataProvider(dictionary_file).build_projection()
+        write_jsonl(dictionary_file, [{"word": "gato", "pos": "noun"}])
+
+        provider = JSONLDataProvider(dictionary_file)
+        assert provider.projection is None
+        assert provider.get_projection("gato")[0]["pos"] == "noun"
+
+
+class TestLazyEntry:
+    """Test decode-on-demand access over memory-mapped lines."""
+
+    @pytest.fixture
+    def provider(self, tmp_path):
+        """Create provider over entries with nested and bracketed values."""
+        entries = [
+            {
+                "word": "gato",
+                "pos": "noun",
+                "forms": [{"form": "gatos", "tags": ["plural"]}],
+                "senses": [{"glosses": ["Felino [1]."], "tags": ["colloquial"]}],
+                "tags": ["masculine"],
+            },
+            {"word": "ir", "pos": "verb", "senses": [{"glosses": ["Moverse."]}]},
+            {"word": "raro", "glosses": "texto con ] suelto", "tags": ["rare"]},
+        ]
+        return JSONLDataProvider(write_jsonl(tmp_path / "dict.jsonl", entries))
+
+    def test_lazy_entries_decode_requested_keys(self, provider):
+        """Test top-level keys are decoded without parsing the whole line."""
+        entry = provider.get_lazy_entries("gato")[0]
+
+        assert entry.word == "gato"
+        assert entry["tags"] == ["masculine"]
+        assert entry["senses"][0]["glosses"] == ["Felino [1]."]
+        assert entry._full is None
+
+    def test_lazy_entry_missing_key(self, provider):
+        """Test absent keys behave like a mapping."""
+        entry = provider.get_lazy_entries("ir")[0]
+
+        assert "tags" not in entry
+        assert entry.get("sounds", []) == []
+        with pytest.raises(KeyError):
+            entry["translations"]
+
+    def test_lazy_entry_skips_unbalanced_strings(self, provider):
+        """Test brackets inside strings do not affect key depth."""
+        entry = provider.get_lazy_entries("raro")[0]
+
+        assert entry["tags"] == ["rare"]
+        assert entry._full is None
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            '{"word":"a]}","forms":[{"senses":5}],"senses":[1]}',
+            '{"word":"a","gloss":"\\"senses\\":5","senses":[1]}',
+            '{"word":"a","forms":[{"senses":5}],"senses" : [1]}',
+        ],
+    )
+    def test_lazy_entry_ignores_key_lookalikes(self, line):
+        """Test nested keys and key text inside strings are not matched."""
+        entry = LazyEntry(memoryview(line.encode("utf-8")))
+
+        assert entry["senses"] == [1]
+
+    def test_lazy_entry_scans_nested_keys_once(self):
+        """Test many nested copies of a missing key cost one linear scan."""
+        forms = [{"form": f"habl{i}", "tags": ["present"]} for i in range(5000)]
+        line = json.dumps({"word": "hablar", "forms": forms, "senses": [1]})
+        entry = LazyEntry(memoryview(line.encode("utf-8")))
+
+        start = time.perf_counter()
+        projected = entry.project()
+
+        assert time.perf_counter() - start < 0.5
+        assert projected == {"word": "hablar", "senses": [1]}
+        assert entry._full is None
+
+    def test_lazy_entry_deeply_nested_value(self):
+        """Test values nested past the regex depth are still skipped."""
+        value: Any = ["]"]
+        for _ in range(12):
+            value = [value, {"tags": "{"}]
+        line = json.dumps({"deep": value, "tags": ["rare"], "count": -1.5})
+        entry = LazyEntry(memoryview(line.encode("utf-8")))
+
+        assert entry["tags"] == ["rare"]
+        assert entry["count"] == -1.5
+        assert entry["deep"] == value
+
+    def test_lazy_entry_raw_view(self, provider):
+        """Test the raw line is exposed as a memoryview without newline."""
+        entry = provider.get_lazy_entries("ir")[0]
+
+        assert isinstance(entry.raw, memoryview)
+        assert json.loads(entry.raw.tobytes())["pos"] == "verb"
+
+    def test_project_skips_unrequested_keys(self, provider):
+        """Test projection returns only card keys."""
+        projected = provider.get_lazy_entries("gato")[0].project()
+
+        assert "forms" not in projected
+        assert projected["pos"] == "noun"
+
+    def test_lazy_entries_batch(self, provider):
+        """Test batch lazy lookup matches full parsing."""
+        batch = provider.get_lazy_entries_batch(["ir", "gato", "nada"])
+
+        assert set(batch) == {"ir", "gato"}
+        assert batch["gato"][0].to_dict() == provider.get_word("gato")
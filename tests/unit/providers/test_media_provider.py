@@ -0,0 +1,234 @@
+"""Unit tests for MediaProvider batch generation."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+from src.providers.base.media_provider import MediaProvider, MediaRequest, MediaResult
+from src.utils.rate_limiter import get_rate_limiter_registry
+
+
+class SlowAudioProvider(MediaProvider):
+    """Provider whose blocking requests record how many overlap."""
+
+    def __init__(self, config: dict[str, Any] | None = None, delay: float = 0.02):
+        super().__init__(config)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.starts: list[float] = []
+        self.lock = threading.Lock()
+
+    @property
+    def supported_types(self) -> list[str]:
+        return ["audio"]
+
+    def validate_config(self, config: dict[str, Any]) -> None:
+        pass
+
+    def _setup_from_config(self) -> None:
+        self._rate_limit_delay = self.config.get("rate_limit_delay", 0)
+
+    def _generate_media_impl(self, request: MediaRequest) -> MediaResult:
+        with self.lock:
+            self.starts.append(time.perf_counter())
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return MediaResult(
+            success=True,
+            file_path=request.output_path,
+            metadata={"word": request.content},
+        )
+
+    def get_cost_estimate(self, requests: list[MediaRequest]) -> dict[str, float]:
+        return {"total_cost": 0.0}
+
+
+@pytest.fixture(autouse=True)
+def rate_limiters():
+    """Give each test fresh per-service rate limiters."""
+    get_rate_limiter_registry().clear()
+    yield get_rate_limiter_registry()
+    get_rate_limiter_registry().clear()
+
+
+def audio_requests(count: int) -> list[MediaRequest]:
+    """Create audio requests for numbered words."""
+    return [
+        MediaRequest(
+            type="audio",
+            content=f"palabra{i}",
+            params={},
+            output_path=Path(f"/tmp/palabra{i}.mp3"),
+        )
+        for i in range(count)
+    ]
+
+
+class TestGenerateBatch:
+    """Test the concurrent batch engine behind generate_batch."""
+
+    def test_results_in_request_order(self):
+        """Test results correspond to requests despite concurrent completion."""
+        provider = SlowAudioProvider()
+
+        results = provider.generate_batch(audio_requests(6))
+
+        assert [r.metadata["word"] for r in results] == [
+            f"palabra{i}" for i in range(6)
+        ]
+
+    def test_concurrency_bounded(self):
+        """Test no more than max_concurrent_requests requests are in flight."""
+        provider = SlowAudioProvider({"max_concurrent_requests": 3})
+
+        provider.generate_batch(audio_requests(9))
+
+        assert provider.max_in_flight == 3
+
+    def test_worker_pool_reused_across_batches(self):
+        """Test every batch of a provider runs on the same worker pool."""
+        provider = SlowAudioProvider()
+
+        provider.generate_batch(audio_requests(2))
+        pool = provider._batch_pool
+        provider.generate_batch(audio_requests(2))
+
+        assert pool is not None
+        assert provider._batch_pool is pool
+
+    def test_rate_limit_delay_spaces_starts(self):
+        """Test request starts keep the provider's rate limit delay."""
+        provider = SlowAudioProvider({"rate_limit_delay": 0.03}, delay=0)
+
+        provider.generate_batch(audio_requests(3))
+
+        gaps = [
+            b - a for a, b in zip(provider.starts, provider.starts[1:], strict=False)
+        ]
+        assert min(gaps) >= 0.025
+
+    def test_requests_per_second_with_burst(self):
+        """Test a burst starts at once and later requests follow the rate."""
+        provider = SlowAudioProvider(
+            {"requests_per_second": 20, "rate_limit_burst": 2}, delay=0
+        )
+
+        provider.generate_batch(audio_requests(4))
+
+        starts = sorted(provider.starts)
+        # Under one 0.05s interval: the second worker's thread may start late
+        assert starts[1] - starts[0] < 0.04
+        assert starts[3] - starts[0] >= 2 * 0.05 - 0.01
+
+    def test_request_timeout_fails_slow_requests(self):
+        """Test a request over its timeout fails without blocking the batch."""
+        provider = SlowAudioProvider({"request_timeout": 0.05}, delay=0.5)
+
+        start = time.perf_counter()
+        results = provider.generate_batch(audio_requests(2))
+
+        assert time.perf_counter() - start < 0.4
+        assert [r.success for r in results] == [False, False]
+        assert "timed out" in (results[0].error or "")
+
+    def test_hung_workers_fail_later_batches(self):
+        """Test a batch fails when abandoned calls occupy every worker."""
+        provider = SlowAudioProvider(
+            {"request_timeout": 0.05, "max_concurrent_requests": 1}, delay=0.5
+        )
+        provider.generate_batch(audio_requests(1))
+
+        start = time.perf_counter()
+        results = provider.generate_batch(audio_requests(3))
+
+        assert time.perf_counter() - start < 0.3
+        assert [r.success for r in results] == [False, False, False]
+        assert "timed out" in (results[0].error or "")
+
+    def test_providers_share_service_budget(self):
+        """Test providers of one service draw on a single rate limit."""
+        configured = SlowAudioProvider({"rate_limit_delay": 0.05})
+        default = SlowAudioProvider()
+
+        assert default.rate_limit_service == "slowaudio"
+        assert default.rate_limiter is configured.rate_limiter
+        assert default.rate_limiter.rate == pytest.approx(20.0)
+
+    def test_apis_config_rate_applies(self, rate_limiters):
+        """Test a rate from config.json apis is used when not overridden."""
+        rate_limiters.configure_from(
+            {"apis": {"slowaudio": {"requests_per_second": 8}}}
+        )
+
+        assert SlowAudioProvider().rate_limiter.rate == 8.0
+
+    def test_empty_batch(self):
+        """Test an empty batch returns no results."""
+        assert SlowAudioProvider().generate_batch([]) == []
+
+
+class TestGenerateBatchAsync:
+    """Test concurrent batch generation."""
+
+    def test_results_in_request_order(self):
+        """Test results correspond to requests despite concurrent completion."""
+        provider = SlowAudioProvider()
+
+        results = asyncio.run(provider.generate_batch_async(audio_requests(6)))
+
+        assert [r.metadata["word"] for r in results] == [
+            f"palabra{i}" for i in range(6)
+        ]
+
+    def test_concurrency_bounded(self):
+        """Test no more than max_concurrency requests are in flight."""
+        provider = SlowAudioProvider({"max_concurrent_requests": 3})
+
+        asyncio.run(provider.generate_batch_async(audio_requests(9)))
+
+        assert provider.max_in_flight == 3
+
+    def test_rate_limit_delay_spaces_starts(self):
+        """Test request starts keep the provider's rate limit delay."""
+        provider = SlowAudioProvider({"rate_limit_delay": 0.03}, delay=0)
+
+        asyncio.run(provider.generate_batch_async(audio_requests(3), 3))
+
+        gaps = [
+            b - a for a, b in zip(provider.starts, provider.starts[1:], strict=False)
+        ]
+        assert min(gaps) >= 0.025
+
+    def test_request_timeout_fails_slow_requests(self):
+        """Test requests over their timeout fail instead of holding the batch."""
+        provider = SlowAudioProvider({"request_timeout": 0.05}, delay=0.3)
+
+        [result] = asyncio.run(provider.generate_batch_async(audio_requests(1)))
+
+        assert not result.success
+        assert "timed out" in (result.error or "")
+
+    def test_unsupported_request_fails_without_raising(self):
+        """Test invalid requests produce failed results like generate_media."""
+        provider = SlowAudioProvider()
+        request = MediaRequest(
+            type="image", content="casa", params={}, output_path=Path("/tmp/x.png")
+        )
+
+        [result] = asyncio.run(provider.generate_batch_async([request]))
+
+        assert not result.success
+
+    def test_invalid_concurrency_rejected(self):
+        """Test a negative concurrency limit is rejected."""
+        provider = SlowAudioProvider()
+
+        with pytest.raises(ValueError):
+            asyncio.run(provider.generate_batch_async(audio_requests(1), -1))
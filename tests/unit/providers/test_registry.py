@@ -533,8 +533,12 @@ class TestProviderRegistry:
                 # Verify data provider was registered
                 assert "main_data" in registry.list_data_providers()
 
-                # Verify media provider creation was attempted
-                mock_create.assert_called()
+                # Media providers are listed but only created on first access
+                assert "forvo" in registry.list_audio_providers()
+                mock_create.assert_not_called()
+                assert registry.get_audio_provider("forvo") is mock_audio_provider
+                assert registry.get_audio_provider("forvo") is mock_audio_provider
+                mock_create.assert_called_once()
 
     def test_unsupported_provider_type_error(self, registry):
         """Test error handling for unsupported provider types."""
@@ -634,3 +638,74 @@ class TestProviderRegistry:
         assert registry.get_pipeline_assignments("audio", "audio1") == [
             "*"
         ]  # Reset to default
+
+
+class TestLazyProviderCreation:
+    """Test configured media providers are created on first access only."""
+
+    @pytest.fixture
+    def registry(self):
+        registry = ProviderRegistry()
+        registry.config = {
+            "providers": {
+                "audio": {
+                    "forvo": {
+                        "type": "forvo",
+                        "api_key": "key",
+                        "pipelines": ["vocabulary"],
+                    }
+                },
+                "image": {"runware": {"type": "runware", "pipelines": ["conjugation"]}},
+            }
+        }
+        registry._setup_media_providers()
+        return registry
+
+    def test_setup_creates_nothing(self, registry):
+        """Test setup records names and assignments without instantiating."""
+        with patch.object(registry, "_create_media_provider") as mock_create:
+            info = registry.get_provider_info()
+
+        mock_create.assert_not_called()
+        assert info["audio_providers"] == {"count": 1, "names": ["forvo"]}
+        assert info["image_providers"] == {"count": 1, "names": ["runware"]}
+        assert registry.get_pipeline_assignments("image", "runware") == ["conjugation"]
+
+    def test_pipeline_only_creates_assigned_providers(self, registry):
+        """Test filtering a pipeline creates just the providers it can use."""
+        audio = MockAudioProvider()
+        with patch.object(
+            registry, "_create_media_provider", return_value=audio
+        ) as mock_create:
+            providers = registry.get_providers_for_pipeline("vocabulary")
+            registry.get_providers_for_pipeline("vocabulary")
+
+        assert providers["audio"] == {"forvo": audio}
+        assert providers["image"] == {}
+        mock_create.assert_called_once_with(
+            "audio", "forvo", registry.config["providers"]["audio"]["forvo"]
+        )
+
+    def test_failed_creation_is_dropped(self, registry):
+        """Test an invalid provider is logged once and then unavailable."""
+        with patch.object(
+            registry,
+            "_create_media_provider",
+            side_effect=ValueError("Missing required Runware config key: api_key"),
+        ) as mock_create:
+            assert registry.get_image_provider("runware") is None
+            assert registry.get_image_provider("runware") is None
+
+        mock_create.assert_called_once()
+        assert registry.list_image_providers() == []
+
+    def test_registered_instance_replaces_factory(self, registry):
+        """Test registering a provider by name overrides its configuration."""
+        audio = MockAudioProvider()
+        registry.register_audio_provider("forvo", audio)
+
+        with patch.object(registry, "_create_media_provider") as mock_create:
+            assert registry.get_audio_provider("forvo") is audio
+
+        mock_create.assert_not_called()
+        assert registry.list_audio_providers() == ["forvo"]
@@ -0,0 +1,254 @@
+"""Unit tests for SQLiteDataProvider tables, indexes and JSON import/export."""
+
+import json
+
+import pytest
+from src.core.config import Config
+from src.providers.data.json_provider import JSONDataProvider
+from src.providers.data.sqlite_provider import SQLiteDataProvider
+from src.providers.registry import ProviderRegistry
+from src.utils.card_types import FluentForeverCardType
+
+
+def vocabulary_document() -> dict:
+    """Build a vocabulary.json-shaped document."""
+    return {
+        "metadata": {"total_words": 2, "total_cards": 3},
+        "skipped_words": ["de"],
+        "words": {
+            "llamar": {
+                "word": "llamar",
+                "processed_date": "2025-01-01T00:00:00",
+                "meanings": [
+                    {
+                        "CardID": "llamar_call",
+                        "SpanishWord": "llamar",
+                        "MeaningID": "call",
+                        "MeaningContext": "phone",
+                    },
+                    {
+                        "CardID": "llamar_name",
+                        "SpanishWord": "llamar",
+                        "MeaningID": "name",
+                        "MeaningContext": "naming",
+                    },
+                ],
+            },
+            "casa": {
+                "word": "casa",
+                "meanings": [
+                    {
+                        "CardID": "casa_house",
+                        "SpanishWord": "casa",
+                        "MeaningID": "house",
+                    }
+                ],
+            },
+            "nada": {"word": "nada"},
+        },
+    }
+
+
+class TestSQLiteDataProvider:
+    """Test document storage and indexed card queries."""
+
+    @pytest.fixture
+    def provider(self, tmp_path):
+        """Create a provider holding the vocabulary document."""
+        provider = SQLiteDataProvider(tmp_path / "data.db")
+        provider.save_data("vocabulary", vocabulary_document())
+        yield provider
+        provider.close()
+
+    def test_roundtrip_preserves_document(self, provider):
+        """Test the split tables reassemble the original document and order."""
+        loaded = provider.load_data("vocabulary")
+
+        assert loaded == vocabulary_document()
+        assert list(loaded["words"]) == ["llamar", "casa", "nada"]
+        assert "meanings" not in loaded["words"]["nada"]
+
+    def test_other_documents_stored_whole(self, provider):
+        """Test documents without the vocabulary layout roundtrip as JSON."""
+        queue = {"queue": [{"CardID": "x"}], "words": ["not", "a", "mapping"]}
+
+        provider.save_data("word_queue", queue)
+
+        assert provider.load_data("word_queue") == queue
+        assert provider.get_card_ids("word_queue") == set()
+
+    def test_save_replaces_previous_rows(self, provider):
+        """Test removed words and cards disappear from the indexes."""
+        data = vocabulary_document()
+        del data["words"]["casa"]
+        provider.save_data("vocabulary", data)
+
+        assert provider.find_card("casa_house") is None
+        assert provider.get_card_ids() == {"llamar_call", "llamar_name"}
+
+    def test_indexed_lookups(self, provider):
+        """Test CardID and SpanishWord lookups return card data."""
+        assert provider.find_card(" llamar_name ")["MeaningContext"] == "naming"
+        assert provider.find_card("missing") is None
+        assert [c["MeaningID"] for c in provider.find_cards_by_word("llamar")] == [
+            "call",
+            "name",
+        ]
+
+    def test_lookups_use_indexes(self, provider):
+        """Test the query plans search indexes instead of scanning tables."""
+        plans = {
+            column: " ".join(
+                row[-1]
+                for row in provider.connection.execute(
+                    "EXPLAIN QUERY PLAN SELECT data FROM meanings "
+                    f"WHERE identifier = ? AND {column} = ?",
+                    ("vocabulary", "x"),
+                )
+            )
+            for column in ("card_id", "spanish_word", "meaning_id")
+        }
+
+        for column, plan in plans.items():
+            assert f"USING INDEX meanings_{column}" in plan
+
+    def test_list_cards_matches_card_type(self, provider):
+        """Test list_cards returns the same rows as the JSON card type scan."""
+        card_type = FluentForeverCardType()
+
+        assert provider.list_cards() == card_type.list_cards(vocabulary_document())
+
+    def test_existing_card_ids_filtered(self, provider):
+        """Test candidate CardIDs are checked against the index in batches."""
+        candidates = [f"new_{i}" for i in range(1200)] + ["casa_house"]
+
+        assert provider.get_card_ids(candidates=candidates) == {"casa_house"}
+
+    def test_wal_mode_enabled(self, provider):
+        """Test the database uses write-ahead logging."""
+        mode = provider.connection.execute("PRAGMA journal_mode").fetchone()[0]
+
+        assert mode == "wal"
+
+    def test_reader_sees_saved_data_from_other_connection(self, provider):
+        """Test a second provider on the same database reads committed saves."""
+        reader = SQLiteDataProvider(provider.db_path, read_only=True)
+
+        assert reader.find_card("llamar_call")["SpanishWord"] == "llamar"
+        reader.close()
+
+    def test_json_import_and_export(self, provider, tmp_path):
+        """Test files convert between the JSONDataProvider and SQLite layouts."""
+        json_provider = JSONDataProvider(tmp_path / "json")
+        json_provider.save_data("vocabulary", vocabulary_document())
+
+        target = SQLiteDataProvider(tmp_path / "imported.db")
+        assert target.import_json(
+            "vocabulary", json_provider.get_file_path("vocabulary")
+        )
+        assert target.export_json("vocabulary", tmp_path / "out" / "vocabulary.json")
+
+        exported = tmp_path / "out" / "vocabulary.json"
+        assert exported.read_text(encoding="utf-8") == json_provider.get_file_path(
+            "vocabulary"
+        ).read_text(encoding="utf-8")
+        target.close()
+
+    def test_missing_document_imported_on_first_access(self, tmp_path):
+        """Test import_path migrates JSON files lazily, even when read-only."""
+        (tmp_path / "vocabulary.json").write_text(
+            json.dumps(vocabulary_document()), encoding="utf-8"
+        )
+        provider = SQLiteDataProvider(
+            tmp_path / "data.db", read_only=True, import_path=tmp_path
+        )
+
+        assert provider.exists("vocabulary")
+        assert provider.find_card("casa_house")["MeaningID"] == "house"
+        assert provider.list_identifiers() == ["vocabulary"]
+        provider.close()
+
+    def test_read_only_rejects_save(self, tmp_path):
+        """Test read-only providers refuse writes."""
+        provider = SQLiteDataProvider(tmp_path / "data.db", read_only=True)
+
+        with pytest.raises(PermissionError):
+            provider.save_data("vocabulary", {})
+
+    def test_non_serializable_data_rolled_back(self, provider):
+        """Test a failed save leaves the previous document intact."""
+        data = vocabulary_document()
+        data["words"]["casa"]["meanings"][0]["Image"] = object()
+
+        assert provider.save_data("vocabulary", data) is False
+        assert provider.load_data("vocabulary") == vocabulary_document()
+
+    def test_backup_copies_document(self, provider):
+        """Test backups are stored as a separate identifier."""
+        backup = provider.backup_data("vocabulary")
+
+        assert backup is not None
+        assert provider.load_data(backup) == vocabulary_document()
+        assert provider.backup_data("missing") is None
+
+    def test_card_type_uses_index(self, provider, tmp_path):
+        """Test card lookups through a provider work for SQLite and JSON."""
+        card_type = FluentForeverCardType()
+        json_provider = JSONDataProvider(tmp_path / "json")
+        json_provider.save_data("vocabulary", vocabulary_document())
+
+        for data_provider in (provider, json_provider):
+            card = card_type.find_card_in_provider(data_provider, "llamar_call")
+            assert card["MeaningContext"] == "phone"
+            assert len(card_type.list_provider_cards(data_provider)) == 3
+
+    def test_registered_from_config(self, tmp_path):
+        """Test the sqlite type is wired into ProviderRegistry.from_config."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "providers": {
+                        "data": {
+                            "vocabulary_data": {
+                                "type": "sqlite",
+                                "db_path": str(tmp_path / "vocabulary.db"),
+                                "import_path": str(tmp_path),
+                                "files": ["vocabulary"],
+                                "pipelines": ["vocabulary"],
+                            }
+                        }
+                    }
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        registry = ProviderRegistry.from_config(Config(str(config_path)))
+        provider = registry.get_data_provider("vocabulary_data")
+
+        assert isinstance(provider, SQLiteDataProvider)
+        assert provider.import_path == tmp_path
+        assert provider.managed_files == ["vocabulary"]
+
+    def test_registry_requires_db_path(self, tmp_path):
+        """Test a sqlite provider without db_path is rejected."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text(
+            json.dumps(
+                {"providers": {"data": {"db": {"type": "sqlite", "pipelines": []}}}}
+            ),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValueError, match="db_path"):
+            ProviderRegistry.from_config(Config(str(config_path)))
+
+
+def test_corrupt_database_reported_as_value_error(tmp_path):
+    """Test unreadable databases surface as load errors."""
+    db_path = tmp_path / "data.db"
+    db_path.write_bytes(b"not a database" * 100)
+
+    with pytest.raises(ValueError):
+        SQLiteDataProvider(db_path).load_data("vocabulary")
@@ -0,0 +1,162 @@
+"""Unit tests for the map stage base class."""
+
+import threading
+import time
+from typing import Any
+
+import pytest
+from src.core.stages import StageStatus
+from src.stages.base import MapItemError, MapStage
+
+from tests.fixtures.contexts import create_test_context
+
+
+def square(item: int) -> int:
+    """Module-level item function usable from a process pool."""
+    if item < 0:
+        raise MapItemError(f"negative: {item}")
+    return item * item
+
+
+class SquareStage(MapStage):
+    """Map stage squaring the numbers in context['numbers']."""
+
+    def __init__(self, **kwargs: Any):
+        super().__init__(output_key="squares", **kwargs)
+        self.attempts: dict[int, int] = {}
+        self.flaky: set[int] = set()
+        self.lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return "square"
+
+    @property
+    def display_name(self) -> str:
+        return "Square"
+
+    def iter_items(self, context):
+        return iter(context.get("numbers"))
+
+    def process_item(self, item: int) -> int:
+        with self.lock:
+            self.attempts[item] = self.attempts.get(item, 0) + 1
+            attempt = self.attempts[item]
+        if item in self.flaky and attempt == 1:
+            raise ConnectionError("transient")
+        if item == 13:
+            raise ValueError("unlucky")
+        # Later items finish first, so order has to be restored
+        time.sleep(0.001 * (10 - item % 10))
+        return square(item)
+
+
+class ProcessSquareStage(SquareStage):
+    """Square stage running the module-level function on a process pool."""
+
+    def item_function(self, context):
+        return square
+
+
+class TestMapStage:
+    """Test fan-out, ordering, retries and partial results."""
+
+    @pytest.fixture
+    def context(self, tmp_path):
+        return create_test_context(
+            project_root=tmp_path, data={"numbers": list(range(12))}
+        )
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_outputs_in_input_order(self, context, workers):
+        """Test outputs follow input order regardless of completion order."""
+        result = SquareStage(max_workers=workers).execute(context)
+
+        assert result.status == StageStatus.SUCCESS
+        assert context.get("squares") == [n * n for n in range(12)]
+        assert result.data["stats"]["succeeded"] == 12
+
+    def test_failed_items_reported_as_partial(self, tmp_path):
+        """Test failing items are listed while the rest succeed."""
+        context = create_test_context(
+            project_root=tmp_path, data={"numbers": [12, 13, -1, 14]}
+        )
+        result = SquareStage(max_workers=3).execute(context)
+
+        assert result.status == StageStatus.PARTIAL
+        assert context.get("squares") == [144, 196]
+        assert sorted(result.errors) == ["-1: negative: -1", "13: unlucky"]
+        assert result.data["stats"]["failed"] == 2
+
+    def test_all_items_failing_is_failure(self, tmp_path):
+        """Test a run with no successful items fails."""
+        context = create_test_context(project_root=tmp_path, data={"numbers": [13]})
+        result = SquareStage().execute(context)
+
+        assert result.status == StageStatus.FAILURE
+
+    def test_transient_errors_retried(self, context):
+        """Test items are retried and MapItemError is not."""
+        stage = SquareStage(max_workers=4, retries=2)
+        stage.flaky = {3, 7}
+        context.set("numbers", [3, 7, 13, -2])
+        result = stage.execute(context)
+
+        assert context.get("squares") == [9, 49]
+        assert result.data["stats"]["retried"] == 2
+        assert stage.attempts[13] == 3
+        assert stage.attempts[-2] == 1
+
+    def test_bounded_in_flight_items(self, tmp_path):
+        """Test the item iterator is consumed at most a window ahead."""
+        consumed = []
+        release = threading.Event()
+
+        class GatedStage(SquareStage):
+            def iter_items(self, context):
+                for n in range(50):
+                    consumed.append(n)
+                    yield n
+
+            def process_item(self, item):
+                release.wait(5)
+                return item
+
+        stage = GatedStage(max_workers=2)
+        context = create_test_context(project_root=tmp_path)
+        worker = threading.Thread(target=stage.execute, args=(context,))
+        worker.start()
+        time.sleep(0.1)
+        assert len(consumed) == 4
+        release.set()
+        worker.join()
+        assert context.get("squares") == list(range(50))
+
+    def test_process_pool(self, context):
+        """Test a module-level item function runs on a process pool."""
+        result = ProcessSquareStage(max_workers=2, executor="process").execute(context)
+
+        assert result.status == StageStatus.SUCCESS
+        assert context.get("squares") == [n * n for n in range(12)]
+
+    def test_invalid_arguments(self):
+        """Test constructor arguments are validated."""
+        with pytest.raises(ValueError):
+            SquareStage(max_workers=0)
+        with pytest.raises(ValueError):
+            SquareStage(executor="fiber")
+        with pytest.raises(ValueError):
+            SquareStage(retries=-1)
+
+    def test_process_item_required(self):
+        """Test a stage without process_item cannot be instantiated."""
+
+        class NoItemStage(MapStage):
+            name = "no_item"
+            display_name = "No Item"
+
+            def iter_items(self, context):
+                return iter(())
+
+        with pytest.raises(TypeError, match="process_item"):
+            NoItemStage()
@@ -0,0 +1,155 @@
+"""Unit tests for the process stage base class."""
+
+import os
+import threading
+
+import pytest
+from src.core.stages import StageStatus
+from src.stages.base import ProcessStage, worker_resource
+from src.stages.base.process_stage import iter_chunks
+
+from tests.fixtures.contexts import create_test_context
+
+
+def load_table(size: int) -> dict[int, int]:
+    """Resource loader recording the process it ran in."""
+    return {"pid": os.getpid(), **{n: n * n for n in range(size)}}
+
+
+def lookup(item: int) -> tuple[int, int]:
+    """Module-level item function reading the worker's table."""
+    table = worker_resource("table")
+    if item not in table:
+        raise KeyError(f"{item} not in table")
+    return table[item], table["pid"]
+
+
+class TableStage(ProcessStage):
+    """Process stage squaring numbers through a per-worker table."""
+
+    @property
+    def name(self) -> str:
+        return "table"
+
+    @property
+    def display_name(self) -> str:
+        return "Table"
+
+    def iter_items(self, context):
+        return iter(context.get("numbers"))
+
+    def item_function(self, context):
+        return lookup
+
+    def worker_resources(self, context):
+        return {"table": (load_table, (100,))}
+
+
+# Lets two inline stages check their resources while both are running
+inline_barrier = threading.Barrier(2, timeout=5)
+
+
+def load_tag(tag: str) -> str:
+    """Resource loader returning its argument."""
+    return tag
+
+
+def read_tag(item: int) -> str:
+    """Module-level item function reading the tag once both stages run."""
+    inline_barrier.wait()
+    return worker_resource("tag")
+
+
+class TagStage(TableStage):
+    """Process stage tagging items with its own resource."""
+
+    def __init__(self, tag: str):
+        super().__init__(workers=1, output_key="tags")
+        self.tag = tag
+
+    def item_function(self, context):
+        return read_tag
+
+    def worker_resources(self, context):
+        return {"tag": (load_tag, (self.tag,))}
+
+
+class TestProcessStage:
+    """Test chunked execution, worker resources and merged outputs."""
+
+    @pytest.mark.parametrize("workers", [1, 3])
+    def test_outputs_merged_in_order(self, tmp_path, workers):
+        """Test chunk outputs are merged in input order."""
+        context = create_test_context(
+            project_root=tmp_path, data={"numbers": list(range(50))}
+        )
+        stage = TableStage(workers=workers, chunk_size=4, output_key="squares")
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.SUCCESS
+        assert [square for square, _ in context.get("squares")] == [
+            n * n for n in range(50)
+        ]
+        assert result.data["stats"]["succeeded"] == 50
+
+    def test_resources_loaded_in_workers(self, tmp_path):
+        """Test resources are built in the worker processes, not the parent."""
+        context = create_test_context(
+            project_root=tmp_path, data={"numbers": list(range(40))}
+        )
+        TableStage(workers=2, chunk_size=5, output_key="squares").execute(context)
+
+        pids = {pid for _, pid in context.get("squares")}
+        assert os.getpid() not in pids
+        assert 1 <= len(pids) <= 2
+
+    def test_item_errors_are_partial(self, tmp_path):
+        """Test a failing item does not fail its chunk."""
+        context = create_test_context(
+            project_root=tmp_path, data={"numbers": [1, 200, 3]}
+        )
+        stage = TableStage(workers=1, chunk_size=10, output_key="squares")
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.PARTIAL
+        assert [square for square, _ in context.get("squares")] == [1, 9]
+        assert result.errors == ["200: '200 not in table'"]
+
+    def test_resources_cleared_after_inline_run(self, tmp_path):
+        """Test inline runs do not leak resources into the parent process."""
+        context = create_test_context(project_root=tmp_path, data={"numbers": [2]})
+        TableStage(workers=1).execute(context)
+
+        with pytest.raises(RuntimeError, match="not loaded"):
+            worker_resource("table")
+
+    def test_concurrent_inline_stages_keep_own_resources(self, tmp_path):
+        """Test inline stages running in parallel threads do not share resources."""
+        contexts = {
+            tag: create_test_context(project_root=tmp_path, data={"numbers": [1]})
+            for tag in ("a", "b")
+        }
+        threads = [
+            threading.Thread(target=TagStage(tag).execute, args=(context,))
+            for tag, context in contexts.items()
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert {tag: c.get("tags") for tag, c in contexts.items()} == {
+            "a": ["a"],
+            "b": ["b"],
+        }
+
+    def test_iter_chunks(self):
+        """Test items are split into bounded chunks."""
+        assert list(iter_chunks(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_invalid_arguments(self):
+        """Test constructor arguments are validated."""
+        with pytest.raises(ValueError):
+            TableStage(workers=0)
+        with pytest.raises(ValueError):
+            TableStage(chunk_size=0)
@@ -0,0 +1,179 @@
+"""Unit tests for the streaming stage base class."""
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from src.core.stages import StageStatus
+from src.stages.base import StreamingStage, StreamItemError, StreamStep
+from src.stages.base.streaming_stage import read_checkpoint
+
+from tests.fixtures.contexts import create_test_context
+
+
+class SplitStep(StreamStep):
+    """Yield each character of a word, dropping words marked bad."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.seen: list[str] = []
+        self.crash_on: str | None = None
+
+    @property
+    def name(self) -> str:
+        return "split"
+
+    def process(self, item: Any) -> Iterator[Any]:
+        if item == self.crash_on:
+            raise OSError("disk full")
+        self.seen.append(item)
+        if item.startswith("bad"):
+            raise StreamItemError(f"{item}: rejected")
+        if item.startswith("warn"):
+            self.warnings.append(f"{item}: suspicious")
+        yield from item
+
+
+class MemoryStreamingStage(StreamingStage):
+    """Streaming stage committing into a list."""
+
+    def __init__(self, chunk_size: int):
+        super().__init__(chunk_size)
+        self.step = SplitStep()
+        self.committed: list[Any] = []
+        self.fail_commit = False
+
+    @property
+    def name(self) -> str:
+        return "memory_stream"
+
+    @property
+    def display_name(self) -> str:
+        return "Memory Stream"
+
+    def source(self, context):
+        return context.get("words")
+
+    def build_steps(self, context):
+        return [self.step]
+
+    def commit(self, context, entries):
+        if self.fail_commit:
+            raise OSError("destination locked")
+        added = list(entries)
+        self.committed.extend(added)
+        return len(added)
+
+
+class TestStreamingStage:
+    """Test chunked spooling, checkpoints, resume and commit."""
+
+    @pytest.fixture
+    def context(self, tmp_path):
+        """Create a context with a small batch of words."""
+        return create_test_context(
+            project_root=tmp_path, data={"words": ["ab", "cde", "f", "gh", "ij"]}
+        )
+
+    def test_chunks_spooled_then_committed(self, context):
+        """Test chunks close between items and the spool is removed on commit."""
+        stage = MemoryStreamingStage(chunk_size=3)
+
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.SUCCESS
+        assert stage.committed == list("abcdefghij")
+        assert result.data["stats"]["chunks"] == 3
+        assert result.data["stats"]["committed"] == 10
+        assert not stage.spool_path(context).exists()
+
+    def test_interrupted_run_resumes_after_last_checkpoint(self, context):
+        """Test a rerun of the same batch skips items already flushed."""
+        stage = MemoryStreamingStage(chunk_size=2)
+        stage.step.crash_on = "gh"
+
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.FAILURE
+        checkpoint = read_checkpoint(stage.spool_path(context))
+        assert checkpoint is not None
+        assert checkpoint.flushed == 2
+
+        stage.step.crash_on = None
+        stage.step.seen.clear()
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.SUCCESS
+        assert stage.step.seen == ["f", "gh", "ij"]
+        assert result.data["stats"]["resumed_from"] == 2
+        assert stage.committed == list("abcdefghij")
+
+    def test_torn_chunk_discarded_on_resume(self, context):
+        """Test entries written after the last checkpoint are not committed."""
+        stage = MemoryStreamingStage(chunk_size=2)
+        stage.step.crash_on = "gh"
+        stage.execute(context)
+        with open(stage.spool_path(context), "a", encoding="utf-8") as spool:
+            spool.write(json.dumps({"entry": "x"}) + "\n" + '{"entry": "y')
+
+        stage.step.crash_on = None
+        stage.execute(context)
+
+        assert stage.committed == list("abcdefghij")
+
+    def test_failed_commit_retried_without_reprocessing(self, context):
+        """Test a complete spool is committed by the next run of the batch."""
+        stage = MemoryStreamingStage(chunk_size=2)
+        stage.fail_commit = True
+
+        assert stage.execute(context).status == StageStatus.FAILURE
+
+        stage.fail_commit = False
+        stage.step.seen.clear()
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.SUCCESS
+        assert stage.step.seen == []
+        assert stage.committed == list("abcdefghij")
+
+    def test_spool_of_other_batch_committed_first(self, context, tmp_path):
+        """Test flushed output of an abandoned batch is not lost."""
+        stage = MemoryStreamingStage(chunk_size=2)
+        stage.step.crash_on = "gh"
+        stage.execute(context)
+
+        stage.step.crash_on = None
+        other = create_test_context(project_root=tmp_path, data={"words": ["xy"]})
+        stage.execute(other)
+
+        assert stage.committed == list("abcdexy")
+
+    def test_rejected_items_reported_as_partial(self, tmp_path):
+        """Test dropped items and warnings are collected without stopping."""
+        context = create_test_context(
+            project_root=tmp_path, data={"words": ["ab", "bad1", "warn", "c"]}
+        )
+        stage = MemoryStreamingStage(chunk_size=10)
+
+        result = stage.execute(context)
+
+        assert result.status == StageStatus.PARTIAL
+        assert result.errors == ["bad1: rejected"]
+        assert result.data["warnings"] == ["warn: suspicious"]
+        assert stage.committed == list("abwarnc")
+
+    def test_no_output_is_failure(self, tmp_path):
+        """Test a batch where every item is rejected fails."""
+        context = create_test_context(
+            project_root=tmp_path, data={"words": ["bad1", "bad2"]}
+        )
+
+        result = MemoryStreamingStage(chunk_size=10).execute(context)
+
+        assert result.status == StageStatus.FAILURE
+
+    def test_chunk_size_must_be_positive(self):
+        """Test invalid chunk sizes are rejected."""
+        with pytest.raises(ValueError):
+            MemoryStreamingStage(chunk_size=0)
@@ -0,0 +1,180 @@
+"""Unit tests for the run profiler."""
+
+import asyncio
+import json
+import time
+
+import pytest
+from src.core.context import PipelineContext
+from src.core.stages import Stage, StageResult
+from src.providers.data.json_provider import JSONDataProvider
+from src.utils.profiler import RunProfiler, current_span, profile_span
+from tests.fixtures.contexts import create_test_context
+from tests.fixtures.pipelines import MockPipeline
+
+
+class CountingStage(Stage):
+    """Stage that loads a data file inside its own span and counts items."""
+
+    def __init__(self, name: str, provider: JSONDataProvider | None = None):
+        super().__init__()
+        self._name = name
+        self.provider = provider
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def display_name(self) -> str:
+        return self._name
+
+    def _execute_impl(self, context: PipelineContext) -> StageResult:
+        if self.provider is not None:
+            self.provider.load_data("vocabulary")
+        time.sleep(0.01)
+        return StageResult.success_result("done", {"stats": {"total": 3}})
+
+
+class ProfiledPipeline(MockPipeline):
+    """Pipeline of two independent counting stages."""
+
+    def __init__(self, provider: JSONDataProvider, parallel: bool = False):
+        super().__init__("profiled_pipeline", ["load", "other"])
+        self._phases = {"full": ["load", "other"]}
+        self.stage_map = {
+            "load": CountingStage("load", provider),
+            "other": CountingStage("other"),
+        }
+        self.parallel = parallel
+
+    @property
+    def supports_parallel_stages(self) -> bool:
+        return self.parallel
+
+    def get_stage(self, stage_name: str) -> Stage:
+        return self.stage_map[stage_name]
+
+
+class TestProfileSpan:
+    """Test span nesting, timing and the inactive fast path."""
+
+    def test_no_profiler_records_nothing(self):
+        """Test spans are no-ops without an active profiler."""
+        with profile_span("call", "provider") as span:
+            assert span is None
+        assert current_span() is None
+
+    def test_nested_spans(self):
+        """Test spans nest under the innermost open span."""
+        profiler = RunProfiler("run")
+        with profiler.activate(), profile_span("outer", "stage") as outer:
+            outer.add(items=2)
+            with profile_span("inner", "http", attempt=1) as inner:
+                inner.add(bytes=100)
+                time.sleep(0.01)
+
+        (outer,) = profiler.root.children
+        (inner,) = outer.children
+        assert (outer.items, inner.bytes) == (2, 100)
+        assert inner.attributes == {"attempt": 1}
+        assert outer.wall_time >= inner.wall_time >= 0.01
+        assert profiler.root.wall_time >= outer.wall_time
+        assert current_span() is None
+
+    def test_error_recorded(self):
+        """Test an exception is stored on the span and re-raised."""
+        profiler = RunProfiler("run")
+        with (
+            profiler.activate(),
+            pytest.raises(ValueError),
+            profile_span("call", "provider"),
+        ):
+            raise ValueError("bad request")
+
+        assert profiler.root.children[0].error == "ValueError: bad request"
+
+    def test_top_spans_and_write(self, tmp_path):
+        """Test slowest spans are ranked and the tree is written as JSON."""
+        profiler = RunProfiler("run", pipeline="vocabulary")
+        with profiler.activate():
+            for delay in (0.0, 0.02, 0.01):
+                with profile_span(f"sleep {delay}", "stage"):
+                    time.sleep(delay)
+
+        assert [span.name for span in profiler.top_spans(2)] == [
+            "sleep 0.02",
+            "sleep 0.01",
+        ]
+        path = tmp_path / "out" / "profile.json"
+        profiler.write(path)
+        data = json.loads(path.read_text())
+        assert data["root"]["attributes"] == {"pipeline": "vocabulary"}
+        assert len(data["root"]["children"]) == 3
+
+    def test_async_tasks_inherit_span(self):
+        """Test spans opened in gathered tasks nest under the caller."""
+        profiler = RunProfiler("run")
+
+        async def call(index: int) -> None:
+            with profile_span(f"call {index}", "http"):
+                await asyncio.sleep(0.01)
+
+        async def main() -> None:
+            with profile_span("batch", "provider"):
+                await asyncio.gather(*(call(i) for i in range(3)))
+
+        with profiler.activate():
+            asyncio.run(main())
+
+        (batch,) = profiler.root.children
+        assert sorted(span.name for span in batch.children) == [
+            "call 0",
+            "call 1",
+            "call 2",
+        ]
+
+
+class TestPipelineProfiling:
+    """Test phases, stages and data loads are instrumented automatically."""
+
+    @pytest.fixture
+    def provider(self, tmp_path):
+        (tmp_path / "vocabulary.json").write_text(json.dumps({"words": {}, "a": 1}))
+        return JSONDataProvider(tmp_path)
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_phase_stage_and_data_spans(self, provider, tmp_path, parallel):
+        """Test the span tree follows phase -> stage -> data load."""
+        context = create_test_context(
+            project_root=tmp_path,
+            config={"system": {"max_concurrent_requests": 2}},
+        )
+        profiler = RunProfiler("run")
+        with profiler.activate():
+            ProfiledPipeline(provider, parallel).execute_phase("full", context)
+
+        (phase,) = profiler.root.children
+        assert (phase.kind, phase.name, phase.items) == ("phase", "full", 2)
+        stages = {span.name: span for span in phase.children}
+        assert set(stages) == {"load", "other"}
+        assert stages["load"].attributes["status"] == "success"
+        assert stages["load"].items == 3
+        (load,) = stages["load"].children
+        assert (load.kind, load.name, load.items) == (
+            "data",
+            "JSONDataProvider.load_data",
+            2,
+        )
+
+    def test_async_phase(self, provider, tmp_path):
+        """Test the async execution path records the same tree."""
+        context = create_test_context(project_root=tmp_path)
+        profiler = RunProfiler("run")
+        with profiler.activate():
+            asyncio.run(ProfiledPipeline(provider).execute_phase_async("full", context))
+
+        (phase,) = profiler.root.children
+        assert sorted(span.name for span in phase.children) == ["load", "other"]
+        load = next(span for span in phase.children if span.name == "load")
+        assert [span.kind for span in load.children] == ["data"]
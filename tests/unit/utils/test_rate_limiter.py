@@ -0,0 +1,191 @@
+"""Unit tests for the token bucket rate limiters."""
+
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+from src.utils.rate_limiter import (
+    RateLimiterRegistry,
+    TokenBucket,
+    parse_retry_after,
+)
+
+
+class TestTokenBucket:
+    """Test token reservation, burst and waiting."""
+
+    def test_burst_starts_immediately(self):
+        """Test a full bucket lets burst requests through without waiting."""
+        bucket = TokenBucket(rate=10, burst=3)
+
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_reservations_queue_after_burst(self):
+        """Test callers past the burst are scheduled one interval apart."""
+        bucket = TokenBucket(rate=10, burst=1)
+
+        waits = [bucket.reserve() for _ in range(4)]
+
+        assert waits[0] == 0.0
+        assert waits[1:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+    def test_tokens_refill_over_time(self):
+        """Test an idle bucket refills, but never beyond its burst."""
+        bucket = TokenBucket(rate=100, burst=2)
+        bucket.reserve()
+        bucket.reserve()
+
+        time.sleep(0.05)
+
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() > 0.0
+
+    def test_unlimited_never_waits(self):
+        """Test a bucket without a rate never delays callers."""
+        bucket = TokenBucket.from_interval(0)
+
+        assert not bucket.limited
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+    def test_from_interval(self):
+        """Test an interval converts to requests per second."""
+        assert TokenBucket.from_interval(0.5).rate == 2.0
+
+    def test_acquire_spaces_threads(self):
+        """Test concurrent threads start at most rate per second."""
+        bucket = TokenBucket(rate=50, burst=1)
+        starts: list[float] = []
+        lock = threading.Lock()
+
+        def worker() -> None:
+            bucket.acquire()
+            with lock:
+                starts.append(time.monotonic())
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        starts.sort()
+        assert starts[-1] - starts[0] >= 4 * 0.02 - 0.005
+
+    def test_acquire_async_spaces_tasks(self):
+        """Test asyncio tasks share the bucket without blocking the loop."""
+        bucket = TokenBucket(rate=50, burst=1)
+
+        async def run() -> float:
+            start = time.monotonic()
+            await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+            return time.monotonic() - start
+
+        assert asyncio.run(run()) >= 4 * 0.02 - 0.005
+
+    @pytest.mark.parametrize(("rate", "burst"), [(-1, 1), (1, 0)])
+    def test_invalid_arguments_rejected(self, rate, burst):
+        """Test negative rates and empty bursts are rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate, burst)
+
+
+class TestRetryAfter:
+    """Test Retry-After pauses and header parsing."""
+
+    def test_pause_holds_back_reservations(self):
+        """Test reservations during a pause wait for its end."""
+        bucket = TokenBucket(rate=None)
+
+        bucket.pause(0.2)
+
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+
+    def test_pause_resumes_at_sustained_rate(self):
+        """Test a full burst is not released when a pause ends."""
+        bucket = TokenBucket(rate=10, burst=5)
+
+        bucket.pause(0.1)
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits == pytest.approx([0.1, 0.2, 0.3], abs=0.02)
+
+    def test_shorter_pause_does_not_shorten(self):
+        """Test a later, shorter Retry-After keeps the longer pause."""
+        bucket = TokenBucket(rate=None)
+
+        bucket.pause(0.3)
+        bucket.pause(0.1)
+
+        assert bucket.reserve() == pytest.approx(0.3, abs=0.02)
+        assert bucket.metrics()["throttled"] == 2
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [("7", 7.0), ("1.5", 1.5), ("-3", 0.0), ("", None), (None, None), ("x", None)],
+    )
+    def test_parse_retry_after_seconds(self, header, expected):
+        """Test delay-seconds headers and invalid values."""
+        assert parse_retry_after(header) == expected
+
+    def test_parse_retry_after_http_date(self):
+        """Test HTTP-date headers become seconds from now."""
+        header = formatdate(time.time() + 30, usegmt=True)
+
+        assert parse_retry_after(header) == pytest.approx(30, abs=2)
+
+
+class TestRateLimiterRegistry:
+    """Test per-service buckets, configuration and metrics."""
+
+    def test_one_bucket_per_service(self):
+        """Test callers of a service share its bucket."""
+        registry = RateLimiterRegistry()
+
+        bucket = registry.get("forvo", 2.0)
+
+        assert registry.get("forvo", 10.0) is bucket
+        assert bucket.rate == 2.0
+        assert registry.get("runware") is not bucket
+
+    def test_configure_updates_existing_bucket(self):
+        """Test configure changes limits in place for existing callers."""
+        registry = RateLimiterRegistry()
+        bucket = registry.get("forvo", 2.0)
+
+        assert registry.configure("forvo", 5.0, burst=3) is bucket
+        assert (bucket.rate, bucket.burst) == (5.0, 3)
+
+    def test_configure_from_apis_section(self):
+        """Test rates and bursts are read from config.json apis entries."""
+        registry = RateLimiterRegistry()
+        config = {
+            "apis": {
+                "base": {"timeout": 30},
+                "forvo": {"requests_per_second": 2, "rate_limit_burst": 4},
+                "anki": {"url": "http://localhost:8765"},
+            }
+        }
+
+        registry.configure_from(config)
+
+        assert registry.metrics().keys() == {"forvo"}
+        assert registry.get("forvo").burst == 4
+
+    def test_metrics(self):
+        """Test metrics count requests, delays and throttling per service."""
+        registry = RateLimiterRegistry()
+        bucket = registry.get("forvo", 10.0)
+
+        bucket.reserve()
+        bucket.reserve()
+        bucket.pause(1.0)
+
+        metrics = registry.metrics()["forvo"]
+        assert metrics["requests"] == 2
+        assert metrics["delayed"] == 1
+        assert metrics["wait_time"] == pytest.approx(0.1, abs=0.01)
+        assert metrics["throttled"] == 1
+        assert metrics["paused_time"] == pytest.approx(1.0, abs=0.01)